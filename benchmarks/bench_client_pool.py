@@ -0,0 +1,117 @@
+"""
+Gemini 클라이언트 풀 재사용 벤치마크 스크립트
+
+요청마다 genai.Client를 새로 생성하는 방식(기존 query_with_rag 동작)과
+GeminiClientManager의 공유 클라이언트(keep-alive 커넥션 풀)를 재사용하는 방식의
+쿼리당 지연 시간을 지속 부하 상황에서 비교합니다.
+실행 전에 .env 파일에 GEMINI_API_KEY를 설정해야 하며, 실제 API 호출이 발생합니다.
+
+사용법:
+    uv run python benchmarks/bench_client_pool.py --store fileSearchStores/xxx
+    uv run python benchmarks/bench_client_pool.py --store fileSearchStores/xxx \
+        --queries 40 --concurrency 4
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from google import genai
+
+from security_chatbot.config import GEMINI_API_KEY, GEMINI_MODEL_NAME
+from security_chatbot.rag.query_handler import build_generate_content_config
+from security_chatbot.utils.api_client import GeminiClientManager
+
+DEFAULT_QUERY = "비밀번호 변경 주기에 대한 요구사항은 무엇인가요?"
+
+
+def _run_query(client_factory, store_name: str, query: str) -> float:
+    """단일 쿼리를 실행하고 경과 시간(초)을 반환합니다."""
+    start = time.perf_counter()
+    client = client_factory()
+    client.models.generate_content(
+        model=GEMINI_MODEL_NAME,
+        contents=query,
+        config=build_generate_content_config([store_name]),
+    )
+    return time.perf_counter() - start
+
+
+def _run_load(
+    label: str, client_factory, store_name: str, query: str, total: int, concurrency: int
+) -> list[float]:
+    """지정된 동시성으로 total개의 쿼리를 실행하고 지연 시간 목록을 반환합니다."""
+    print(f"\n[{label}] {total}개 쿼리 실행 중 (동시성: {concurrency})...")
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(
+            executor.map(
+                lambda _: _run_query(client_factory, store_name, query), range(total)
+            )
+        )
+    return latencies
+
+
+def _summarize(label: str, latencies: list[float]) -> dict[str, float]:
+    """지연 시간 통계(평균, p50, p95)를 출력하고 반환합니다."""
+    ordered = sorted(latencies)
+    summary = {
+        "mean": statistics.mean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+    print(
+        f"  {label:<16} 평균 {summary['mean'] * 1000:8.1f}ms | "
+        f"p50 {summary['p50'] * 1000:8.1f}ms | p95 {summary['p95'] * 1000:8.1f}ms"
+    )
+    return summary
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Gemini 클라이언트 풀 벤치마크")
+    parser.add_argument("--store", required=True, help="File Search Store 리소스 이름")
+    parser.add_argument("--query", default=DEFAULT_QUERY, help="반복 실행할 질문")
+    parser.add_argument("--queries", type=int, default=20, help="방식별 쿼리 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 실행 수")
+    args = parser.parse_args()
+
+    if not GEMINI_API_KEY:
+        print("❌ GEMINI_API_KEY가 설정되지 않았습니다.")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("Gemini 클라이언트 풀 벤치마크")
+    print("=" * 60)
+
+    # 풀 워밍업: 첫 연결 비용은 프로세스당 한 번만 발생하므로 측정에서 제외
+    GeminiClientManager.get_client()
+    _run_query(GeminiClientManager.get_client, args.store, args.query)
+
+    per_query = _run_load(
+        "쿼리마다 새 클라이언트",
+        lambda: genai.Client(api_key=GEMINI_API_KEY),
+        args.store,
+        args.query,
+        args.queries,
+        args.concurrency,
+    )
+    pooled = _run_load(
+        "공유 클라이언트 풀",
+        GeminiClientManager.get_client,
+        args.store,
+        args.query,
+        args.queries,
+        args.concurrency,
+    )
+
+    print("\n결과:")
+    baseline = _summarize("새 클라이언트", per_query)
+    improved = _summarize("공유 풀", pooled)
+    saved = (baseline["mean"] - improved["mean"]) * 1000
+    print(f"\n쿼리당 평균 절감 시간: {saved:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
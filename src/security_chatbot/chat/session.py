@@ -2,6 +2,8 @@
 
 Streamlit 세션 상태를 관리하는 모듈입니다.
 채팅 히스토리, File Search Store 정보, 업로드된 문서 메타데이터 등을 관리합니다.
+업로드된 문서 메타데이터는 세션 상태 대신 영속 문서 카탈로그(rag/document_catalog.py)에
+저장되므로 새로고침 후에도 유지되고 모든 세션이 공유합니다.
 """
 
 from datetime import datetime
@@ -10,6 +12,9 @@ from typing import Any
 import streamlit as st
 
 from security_chatbot import config
+from security_chatbot.rag.catalog_reconciler import reconcile_catalog
+from security_chatbot.rag.document_catalog import DocumentCatalog
+from security_chatbot.rag.store_shards import ShardedStore
 
 # --- Type Definitions for Clarity ---
 ChatMessage = dict[str, Any]
@@ -18,12 +23,48 @@ ChatMessage = dict[str, Any]
 FileMetadata = dict[str, Any]
 """
 Represents metadata for an uploaded file.
-Expected keys: 'name' (str), 'size' (int), 'upload_date' (str, ISO format),
+Expected keys: 'document_id' (int, 문서 카탈로그의 문서 ID), 'name' (str), 'size' (int),
+'upload_date' (str, ISO format), 'sha256' (Optional[str], 원본 파일 내용의 SHA-256),
 and 'corpus_file_resource_name' (str, Google Gemini API에서 사용하는 코퍼스 파일의 전체 리소스 이름).
+크기 제한을 넘어 분할 업로드된 문서는 'part_resource_names' (List[str], 모든 조각의
+코퍼스 파일 리소스 이름)도 가지며, 'corpus_file_resource_name'은 첫 조각을 가리킵니다.
 """
 
+
+@st.cache_resource
+def _get_document_catalog() -> DocumentCatalog:
+    """Returns the document catalog shared by all sessions of this app process.
+
+    프로세스 내 모든 세션이 공유하는 문서 카탈로그를 반환합니다.
+    """
+    return DocumentCatalog()
+
+
 # --- Session State Initialization ---
 
+# 세션이 사용하는 Store를 기록하는 URL 쿼리 파라미터 (새로고침 후 같은 Store를 다시 열기 위해)
+STORE_QUERY_PARAM = "store"
+
+
+def _restore_store_id() -> str | None:
+    """새 세션이 다시 열 Store의 리소스 이름을 반환합니다.
+
+    페이지 URL에 기록된 Store가 카탈로그에 있으면 그 Store를 엽니다. 카탈로그의 Store는
+    모든 세션이 공유하므로, 표시 이름으로 마지막에 사용된 Store를 여는 것은
+    REOPEN_LATEST_STORE를 켠 경우(단일 사용자 배포)에만 합니다.
+    """
+    catalog = _get_document_catalog()
+    store_id = st.query_params.get(STORE_QUERY_PARAM)
+    if store_id:
+        display_name = catalog.store_display_name(store_id)
+        if display_name is not None:
+            st.session_state.store_name = display_name
+            return store_id
+        del st.query_params[STORE_QUERY_PARAM]
+    if config.REOPEN_LATEST_STORE:
+        return catalog.latest_store(st.session_state.store_name)
+    return None
+
 
 def initialize_session_state() -> None:
     """Initializes Streamlit's session state with default values if they don't already exist.
@@ -41,12 +82,11 @@ def initialize_session_state() -> None:
     if "store_name" not in st.session_state:
         st.session_state.store_name: str = config.DEFAULT_STORE_DISPLAY_NAME
     if "store_id" not in st.session_state:
-        # store_id is typically generated after a store is created, so it starts as None
-        st.session_state.store_id: str | None = None
+        # store_id is generated after a store is created; a new session (e.g. after a
+        # browser refresh) reopens only the store recorded in its own page URL
+        st.session_state.store_id: str | None = _restore_store_id()
 
-    # 3. Uploaded Document Metadata
-    if "uploaded_files_metadata" not in st.session_state:
-        st.session_state.uploaded_files_metadata: list[FileMetadata] = []
+    # 3. Uploaded Document Metadata is kept in the persistent document catalog
 
     # Additional practical session states for UI/logic control
     if "processing_files" not in st.session_state:
@@ -54,7 +94,13 @@ def initialize_session_state() -> None:
         st.session_state.processing_files: bool = False
     if "rag_engine_active" not in st.session_state:
         # Indicates if a RAG query engine (with a store) is currently active and ready
-        st.session_state.rag_engine_active: bool = False
+        st.session_state.rag_engine_active: bool = bool(
+            st.session_state.store_id
+            and _get_document_catalog().count(st.session_state.store_id)
+        )
+    if "ingestion_batch_ids" not in st.session_state:
+        # Background ingestion batches queued from this session (see rag/ingestion_queue.py)
+        st.session_state.ingestion_batch_ids: list[str] = []
 
 
 # --- Chat Message History Management ---
@@ -127,27 +173,128 @@ def set_file_store_info(store_name: str, store_id: str) -> None:
     """
     st.session_state.store_name = store_name
     st.session_state.store_id = store_id
+    st.query_params[STORE_QUERY_PARAM] = store_id
+    _get_document_catalog().record_store(store_id, store_name)
 
 
 def clear_file_store_info() -> None:
     """Clears the file search store name and ID from the session state,
     resetting to default values defined in `config.py` and `None` for ID.
+    The store and its documents are also removed from the document catalog.
     """
+    if st.session_state.store_id:
+        _get_document_catalog().forget_store(st.session_state.store_id)
     st.session_state.store_name = config.DEFAULT_STORE_DISPLAY_NAME
     st.session_state.store_id = None
+    st.query_params.pop(STORE_QUERY_PARAM, None)
+
+
+def get_sharded_store() -> ShardedStore | None:
+    """Returns the current store as a ShardedStore (routes uploads/deletes to shards).
+
+    현재 Store를 shard 단위로 다루는 ShardedStore를 반환합니다 (Store가 없으면 None).
+    업로드할 shard 선택과 코퍼스 파일 삭제는 이 객체를 통해 수행합니다.
+    """
+    if not st.session_state.store_id:
+        return None
+    return ShardedStore(
+        st.session_state.store_id,
+        _get_document_catalog(),
+        display_name=st.session_state.store_name,
+    )
+
+
+def get_store_shard_names() -> list[str]:
+    """Returns the resource names of every shard of the current store (itself first).
+
+    Returns:
+        List[str]: 검색할 모든 shard Store 리소스 이름. Store가 설정되지 않았으면 빈 리스트.
+
+    """
+    store_id = st.session_state.store_id
+    return _get_document_catalog().list_shards(store_id) if store_id else []
 
 
 # --- Uploaded Document Metadata Management ---
 
 
+def _to_file_metadata(document: dict[str, Any]) -> FileMetadata:
+    """카탈로그 문서를 FileMetadata 형식으로 변환합니다."""
+    metadata = {
+        "document_id": document["id"],
+        "name": document["name"],
+        "size": document["size_bytes"],
+        "upload_date": document["upload_date"],
+        "sha256": document["sha256"],
+        "corpus_file_resource_name": document["resource_names"][0],
+    }
+    if document["split"]:
+        metadata["part_resource_names"] = document["resource_names"]
+    return metadata
+
+
 def get_uploaded_files_metadata() -> list[FileMetadata]:
-    """Retrieves the list of metadata for uploaded documents from the session state.
+    """Retrieves the metadata of the documents uploaded to the current store.
 
     Returns:
-        List[FileMetadata]: A list of dictionaries, each representing file metadata.
+        List[FileMetadata]: A list of dictionaries, each representing file metadata,
+                            in upload order. Empty if no store is set.
 
     """
-    return st.session_state.uploaded_files_metadata
+    store_id = st.session_state.store_id
+    if not store_id:
+        return []
+    return [
+        _to_file_metadata(document)
+        for document in _get_document_catalog().list_documents(store_id)
+    ]
+
+
+def get_uploaded_files_count() -> int:
+    """현재 Store에 업로드된 문서 수를 반환합니다 (문서 목록을 읽지 않음).
+
+    Returns:
+        int: 문서 수. Store가 설정되지 않았으면 0.
+
+    """
+    store_id = st.session_state.store_id
+    return _get_document_catalog().count(store_id) if store_id else 0
+
+
+def get_uploaded_files_page(
+    query: str = "",
+    sort_by: str = "upload_date",
+    descending: bool = True,
+    page: int = 0,
+    page_size: int = config.DOCUMENT_LIST_PAGE_SIZE,
+) -> tuple[list[FileMetadata], int]:
+    """현재 Store의 문서 목록 중 한 페이지를 검색·정렬하여 반환합니다.
+
+    검색과 정렬은 문서 카탈로그의 인덱스로 처리되므로 문서가 많아도 요청한 페이지만 읽습니다.
+
+    Args:
+        query (str): 파일명 검색어 (대소문자 구분 없음, 비어 있으면 전체).
+        sort_by (str): 정렬 기준 ("upload_date", "name", "size").
+        descending (bool): True이면 내림차순.
+        page (int): 0부터 시작하는 페이지 번호.
+        page_size (int): 페이지당 문서 수.
+
+    Returns:
+        tuple[List[FileMetadata], int]: (페이지의 문서 메타데이터 목록, 검색 결과 전체 수).
+
+    """
+    store_id = st.session_state.store_id
+    if not store_id:
+        return [], 0
+    documents, total = _get_document_catalog().list_page(
+        store_id,
+        query=query,
+        sort_by=sort_by,
+        descending=descending,
+        limit=page_size,
+        offset=page * page_size,
+    )
+    return [_to_file_metadata(document) for document in documents], total
 
 
 def add_uploaded_file_metadata(
@@ -155,47 +302,130 @@ def add_uploaded_file_metadata(
     file_size: int,
     upload_datetime: datetime,
     corpus_file_resource_name: str,
+    part_resource_names: list[str] | None = None,
+    sha256: str | None = None,
 ) -> None:
-    """새로 업로드된 문서의 메타데이터를 세션 상태에 추가합니다.
+    """새로 업로드된 문서의 메타데이터를 현재 Store의 문서 카탈로그에 추가합니다.
 
     Args:
         file_name (str): 업로드된 파일의 이름.
         file_size (int): 업로드된 파일의 크기(바이트).
         upload_datetime (datetime): 파일이 업로드된 시간. ISO 형식 문자열로 저장됩니다.
         corpus_file_resource_name (str): Google Gemini API에서 사용하는 코퍼스 파일의 전체 리소스 이름.
+        part_resource_names (Optional[List[str]]): 분할 업로드된 문서의 모든 조각 리소스 이름.
+        sha256 (Optional[str]): 원본 파일 내용의 SHA-256.
+
+    Raises:
+        ValueError: File Search Store가 설정되지 않은 경우.
 
     """
-    st.session_state.uploaded_files_metadata.append(
-        {
-            "name": file_name,
-            "size": file_size,
-            "upload_date": upload_datetime.isoformat(),
-            "corpus_file_resource_name": corpus_file_resource_name,
-        }
+    store_id = st.session_state.store_id
+    if not store_id:
+        raise ValueError("File Search Store가 설정되지 않아 문서를 기록할 수 없습니다.")
+    _get_document_catalog().add(
+        store_id,
+        file_name,
+        file_size,
+        upload_datetime.isoformat(),
+        list(part_resource_names or [corpus_file_resource_name]),
+        sha256=sha256,
+        split=bool(part_resource_names),
     )
 
 
-def remove_uploaded_file_metadata(file_name: str) -> bool:
-    """주어진 파일 이름과 일치하는 업로드된 문서 메타데이터를 세션 상태에서 제거합니다.
+def get_document_resource_names(metadata: FileMetadata) -> list[str]:
+    """문서 하나를 이루는 모든 코퍼스 파일 리소스 이름을 반환합니다.
 
     Args:
-        file_name (str): 제거할 파일의 이름.
+        metadata (FileMetadata): 문서 메타데이터.
 
     Returns:
-        bool: 메타데이터 제거 성공 시 True, 해당 파일을 찾을 수 없으면 False.
+        List[str]: 분할 업로드된 문서는 모든 조각, 그 외에는 코퍼스 파일 하나.
 
     """
-    initial_count = len(st.session_state.uploaded_files_metadata)
-    st.session_state.uploaded_files_metadata = [
-        f for f in st.session_state.uploaded_files_metadata if f["name"] != file_name
+    return metadata.get("part_resource_names") or [
+        metadata["corpus_file_resource_name"]
     ]
-    return len(st.session_state.uploaded_files_metadata) < initial_count
+
+
+def find_uploaded_file_metadata(corpus_file_resource_name: str) -> FileMetadata | None:
+    """코퍼스 파일(또는 조각) 리소스 이름으로 문서 메타데이터를 찾습니다.
+
+    Args:
+        corpus_file_resource_name (str): 찾을 코퍼스 파일의 리소스 이름.
+
+    Returns:
+        Optional[FileMetadata]: 해당 문서의 메타데이터 또는 없으면 None.
+
+    """
+    store_id = st.session_state.store_id
+    if not store_id:
+        return None
+    document = _get_document_catalog().find_by_resource_name(
+        store_id, corpus_file_resource_name
+    )
+    return _to_file_metadata(document) if document else None
+
+
+def update_document_resource_names(
+    metadata: FileMetadata, resource_names: list[str]
+) -> None:
+    """문서를 이루는 코퍼스 파일 목록을 바꿉니다 (일부 조각만 삭제된 경우 등).
+
+    Args:
+        metadata (FileMetadata): 갱신할 문서의 메타데이터.
+        resource_names (List[str]): 남은 코퍼스 파일 리소스 이름 (비어 있으면 문서 제거).
+
+    """
+    _get_document_catalog().set_resource_names(metadata["document_id"], resource_names)
+
+
+def remove_uploaded_file_metadata(metadata: FileMetadata) -> bool:
+    """업로드된 문서 메타데이터를 문서 카탈로그에서 제거합니다.
+
+    이름이 같은 다른 문서는 남겨 두고 해당 문서(document_id)만 제거합니다.
+
+    Args:
+        metadata (FileMetadata): 제거할 문서의 메타데이터.
+
+    Returns:
+        bool: 메타데이터 제거 성공 시 True, 이미 제거된 문서이면 False.
+
+    """
+    return _get_document_catalog().remove(metadata["document_id"])
+
+
+def reconcile_uploaded_files_metadata(
+    page_size: int = config.STORE_LIST_PAGE_SIZE,
+) -> dict[str, Any] | None:
+    """현재 Store의 실제 문서 목록과 대조하여 문서 카탈로그를 고칩니다.
+
+    다른 경로(디렉토리 동기화, 다른 배포 등)로 추가된 문서는 목록에 추가하고,
+    Store에서 사라진 문서는 목록에서 제거합니다 (rag/catalog_reconciler.py 참고).
+
+    Args:
+        page_size (int): Store 목록 요청 한 번에 받을 문서 수.
+
+    Returns:
+        Optional[Dict[str, Any]]: 대조 결과 (listed, added, removed, pages, elapsed_seconds).
+                                  Store가 설정되지 않았으면 None.
+
+    Raises:
+        GoogleAPIError: Store 목록 조회에 실패한 경우.
+        TimeoutError: 목록 요청이 시간 제한 안에 끝나지 않은 경우.
+
+    """
+    store_id = st.session_state.store_id
+    if not store_id:
+        return None
+    return reconcile_catalog(store_id, _get_document_catalog(), page_size=page_size)
 
 
 def clear_uploaded_files_metadata() -> None:
-    """Clears all uploaded document metadata from the session state.
+    """Clears all uploaded document metadata of the current store from the catalog.
     """
-    st.session_state.uploaded_files_metadata = []
+    if st.session_state.store_id:
+        _get_document_catalog().clear_store(st.session_state.store_id)
 
 
 # --- General UI/Process State Management ---
@@ -241,3 +471,37 @@ def get_rag_engine_active_status() -> bool:
 
     """
     return st.session_state.rag_engine_active
+
+
+# --- Background Ingestion Batch Management ---
+
+
+def add_ingestion_batch(batch_id: str) -> None:
+    """백그라운드 수집 큐에 넣은 배치 ID를 세션 상태에 추가합니다.
+
+    Args:
+        batch_id (str): IngestionQueue에 작업을 등록할 때 사용한 배치 ID.
+
+    """
+    st.session_state.ingestion_batch_ids.append(batch_id)
+
+
+def get_ingestion_batches() -> list[str]:
+    """진행 상황을 표시할 백그라운드 수집 배치 ID 목록을 반환합니다.
+
+    Returns:
+        List[str]: 등록 순서대로 정렬된 배치 ID 목록.
+
+    """
+    return st.session_state.ingestion_batch_ids
+
+
+def remove_ingestion_batch(batch_id: str) -> None:
+    """끝난 배치를 진행 상황 표시 대상에서 제거합니다.
+
+    Args:
+        batch_id (str): 제거할 배치 ID.
+
+    """
+    if batch_id in st.session_state.ingestion_batch_ids:
+        st.session_state.ingestion_batch_ids.remove(batch_id)
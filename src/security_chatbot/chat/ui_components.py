@@ -4,6 +4,7 @@ Streamlit 채팅 인터페이스를 위한 재사용 가능한 UI 컴포넌트
 """
 
 import time  # For simulating loading
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -53,12 +54,51 @@ def render_chat_history() -> None:
         display_message(message)
 
 
+def _render_streaming_answer(
+    events: Iterator[dict[str, Any]], placeholder: Any
+) -> dict[str, Any]:
+    """스트리밍 쿼리 이벤트를 소비하면서 부분 답변을 placeholder에 점진적으로 렌더링합니다.
+
+    Args:
+        events: stream_query_with_rag가 생성하는 이벤트 이터레이터
+        placeholder: 부분 답변을 표시할 Streamlit placeholder (st.empty())
+
+    Returns:
+        Dict[str, Any]: 스트림 마지막에 전달된 최종 응답 딕셔너리
+
+    """
+    streamed_text = ""
+    final_response: dict[str, Any] = {
+        "content": "",
+        "citations": [],
+        "success": False,
+        "error": "응답 스트림이 비정상적으로 종료되었습니다.",
+    }
+
+    with st.spinner("보안 문서를 분석하고 답변을 생성하는 중..."):
+        for event in events:
+            if event["type"] == "chunk":
+                streamed_text += event["text"]
+                placeholder.markdown(streamed_text + "▌")
+            elif event["type"] == "retry":
+                # 사용량 초과 시 오류 대신 자동 재시도까지 남은 시간을 표시
+                placeholder.info(
+                    f"⏳ API 사용량 한도에 도달했습니다. "
+                    f"{event['remaining']}초 후 자동으로 다시 시도합니다... "
+                    f"(재시도 {event['attempt']}회차)"
+                )
+            elif event["type"] == "final":
+                final_response = event["response"]
+
+    return final_response
+
+
 def process_chat_input() -> None:
     """사용자 입력을 처리하고, 유효성 검사 후 세션에 메시지를 추가하며,
     RAG 활성화 여부에 따라 실제 RAG 응답 또는 에코 봇 응답을 생성합니다.
     """
     from security_chatbot.chat import session
-    from security_chatbot.rag.query_handler import query_with_rag
+    from security_chatbot.rag.query_handler import stream_query_with_rag
 
     user_input: str | None = st.chat_input(
         "메시지를 입력하세요...", disabled=session.get_processing_files_status()
@@ -103,19 +143,24 @@ def process_chat_input() -> None:
                     role="assistant", content=error_message, timestamp=datetime.now()
                 )
             else:
-                # RAG 쿼리 실행
+                # RAG 쿼리 실행 (생성되는 답변을 청크 단위로 즉시 표시)
                 with st.chat_message("assistant"):
-                    with st.spinner("보안 문서를 분석하고 답변을 생성하는 중..."):
-                        rag_response = query_with_rag(
-                            query=user_input, store_name=store_resource_name
-                        )
+                    answer_placeholder = st.empty()
+                    rag_response = _render_streaming_answer(
+                        stream_query_with_rag(
+                            query=user_input,
+                            store_name=store_resource_name,
+                            shard_names=session.get_store_shard_names(),
+                        ),
+                        answer_placeholder,
+                    )
 
                     if rag_response["success"]:
                         # 성공적인 응답
                         assistant_response = rag_response["content"]
                         citations = rag_response["citations"]
 
-                        st.markdown(assistant_response)
+                        answer_placeholder.markdown(assistant_response)
                         st.markdown(
                             f"<p class='chat-timestamp'>{datetime.now().isoformat()}</p>",
                             unsafe_allow_html=True,
@@ -138,7 +183,8 @@ def process_chat_input() -> None:
                             citations=citations,
                         )
                     else:
-                        # 오류 발생
+                        # 오류 발생 (부분적으로 표시된 답변 제거)
+                        answer_placeholder.empty()
                         error_type = rag_response.get('error_type', '')
 
                         if error_type == 'quota_exceeded':
@@ -0,0 +1,30 @@
+"""SecurityChatbot command line interface
+
+사용법:
+    security-chatbot sync ./policies --store fileSearchStores/xxx
+"""
+
+import argparse
+
+from security_chatbot.rag import directory_sync
+
+
+def main(argv: list[str] | None = None) -> None:
+    """명령행 진입점: 하위 명령을 해당 모듈로 전달합니다."""
+    parser = argparse.ArgumentParser(
+        prog="security-chatbot", description="SecurityChatbot 관리 도구"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sync_parser = subparsers.add_parser(
+        "sync", help="문서 디렉토리를 File Search Store와 증분 동기화"
+    )
+    directory_sync.add_arguments(sync_parser)
+    sync_parser.set_defaults(handler=directory_sync.run)
+
+    args = parser.parse_args(argv)
+    raise SystemExit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -81,6 +81,135 @@ logging.getLogger().setLevel(LOG_LEVEL)
 GEMINI_API_KEY: Final[str] = os.getenv("GEMINI_API_KEY", "")
 GEMINI_MODEL_NAME: Final[str] = os.getenv("GEMINI_MODEL_NAME", "gemini-2.0-flash-exp")
 API_TIMEOUT_SECONDS: Final[int] = int(os.getenv("API_TIMEOUT_SECONDS", "60"))
+# 파일 하나의 업로드와 Store 등록(import)에 허용되는 전체 시간 (재시도 포함)
+UPLOAD_TIMEOUT_SECONDS: Final[int] = int(os.getenv("UPLOAD_TIMEOUT_SECONDS", "300"))
+
+# HTTP 커넥션 풀 설정 (프로세스 전역 Gemini 클라이언트가 재사용하는 keep-alive 연결)
+GEMINI_HTTP_POOL_SIZE: Final[int] = int(os.getenv("GEMINI_HTTP_POOL_SIZE", "20"))
+GEMINI_HTTP_KEEPALIVE_SECONDS: Final[float] = float(
+    os.getenv("GEMINI_HTTP_KEEPALIVE_SECONDS", "60")
+)
+# 시간 예산 안에서 동기 API 호출을 실행하는 스레드 수. 예산을 넘겨 포기한 호출도
+# HTTP 타임아웃까지 스레드를 점유하므로 커넥션 풀 크기와 따로, 더 넉넉하게 설정
+DEADLINE_CALL_WORKERS: Final[int] = int(os.getenv("DEADLINE_CALL_WORKERS", "64"))
+
+# 클라이언트 측 레이트 리미터 설정 (0 이하이면 해당 한도 비활성화)
+GEMINI_RPM_LIMIT: Final[int] = int(os.getenv("GEMINI_RPM_LIMIT", "60"))
+GEMINI_TPM_LIMIT: Final[int] = int(os.getenv("GEMINI_TPM_LIMIT", "1000000"))
+RATE_LIMIT_MAX_WAIT_SECONDS: Final[float] = float(
+    os.getenv("RATE_LIMIT_MAX_WAIT_SECONDS", "30")
+)
+
+# 사용량 초과(429) 시 서버가 권장한 대기 시간(RetryInfo) 후 쿼리를 자동 재시도하는 설정
+QUERY_AUTO_RETRY_ENABLED: Final[bool] = (
+    os.getenv("QUERY_AUTO_RETRY_ENABLED", "true").lower() == "true"
+)
+QUERY_RETRY_DEADLINE_SECONDS: Final[float] = float(
+    os.getenv("QUERY_RETRY_DEADLINE_SECONDS", "60")
+)
+QUERY_RETRY_JITTER_RATIO: Final[float] = float(
+    os.getenv("QUERY_RETRY_JITTER_RATIO", "0.2")
+)
+
+# RAG 응답 캐시 설정
+ANSWER_CACHE_ENABLED: Final[bool] = (
+    os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+)
+ANSWER_CACHE_MAX_ENTRIES: Final[int] = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "256"))
+ANSWER_CACHE_TTL_SECONDS: Final[int] = int(os.getenv("ANSWER_CACHE_TTL_SECONDS", "3600"))
+# 비어 있으면 메모리에만 캐시하며, 경로를 지정하면 SQLite 파일에 영속화
+# (같은 파일을 쓰는 프로세스끼리 문서 변경에 따른 캐시 무효화를 공유)
+ANSWER_CACHE_DB_PATH: Final[str] = os.getenv("ANSWER_CACHE_DB_PATH", "")
+
+# 업로드 매니페스트 설정 (내용이 같은 파일의 재업로드 방지)
+# 비어 있으면 메모리에만 기록하며, 경로를 지정하면 SQLite 파일에 영속화
+UPLOAD_MANIFEST_DB_PATH: Final[str] = os.getenv("UPLOAD_MANIFEST_DB_PATH", "")
+
+# 재개 가능한(resumable) 청크 업로드 설정 (대용량 파일의 전송 중단 시 이어서 업로드)
+# 이 크기 이상인 파일은 청크 단위로 전송하며, 0 이하이면 비활성화
+RESUMABLE_UPLOAD_THRESHOLD_BYTES: Final[int] = int(
+    os.getenv("RESUMABLE_UPLOAD_THRESHOLD_BYTES", str(20 * 1024 * 1024))
+)
+# 청크 크기 (256KB 단위로 내림)
+RESUMABLE_UPLOAD_CHUNK_BYTES: Final[int] = int(
+    os.getenv("RESUMABLE_UPLOAD_CHUNK_BYTES", str(8 * 1024 * 1024))
+)
+# 업로드 세션 URL과 전송 위치를 기록하는 체크포인트 디렉토리 (프로세스 재시작 후 재개용)
+RESUMABLE_UPLOAD_CHECKPOINT_DIR: Final[str] = os.getenv(
+    "RESUMABLE_UPLOAD_CHECKPOINT_DIR", "data/upload_checkpoints"
+)
+
+# 백그라운드 수집(ingestion) 작업 큐 설정
+# 활성화하면 업로드 버튼은 파일을 큐에 넣기만 하고, 별도 워커 프로세스
+# (python -m security_chatbot.rag.ingestion_worker)가 업로드와 Store 등록을 처리
+INGESTION_QUEUE_ENABLED: Final[bool] = (
+    os.getenv("INGESTION_QUEUE_ENABLED", "false").lower() == "true"
+)
+INGESTION_QUEUE_DB_PATH: Final[str] = os.getenv(
+    "INGESTION_QUEUE_DB_PATH", "data/ingestion_queue.db"
+)
+# 워커가 읽을 수 있도록 업로드된 파일을 보관하는 디렉토리
+INGESTION_SPOOL_DIR: Final[str] = os.getenv("INGESTION_SPOOL_DIR", "data/ingestion_spool")
+# 작업 하나의 최대 시도 횟수 (초과하면 dead-letter로 이동)
+INGESTION_MAX_ATTEMPTS: Final[int] = int(os.getenv("INGESTION_MAX_ATTEMPTS", "3"))
+# 사이드바가 진행 상황을 다시 조회하는 간격 (초)
+INGESTION_PROGRESS_POLL_SECONDS: Final[float] = float(
+    os.getenv("INGESTION_PROGRESS_POLL_SECONDS", "3")
+)
+
+# 업로드 전 텍스트 추출 설정
+# 활성화하면 PDF/HWPX/텍스트 문서에서 텍스트를 추출·정규화하여 원본 대신 text/plain으로 업로드
+# (PDF는 선택 의존성 pypdf 필요, 스캔 문서처럼 텍스트가 없으면 원본 업로드)
+TEXT_EXTRACTION_ENABLED: Final[bool] = (
+    os.getenv("TEXT_EXTRACTION_ENABLED", "false").lower() == "true"
+)
+# 추출을 실행할 프로세스 수 (0이면 업로드 스레드에서 바로 실행)
+TEXT_EXTRACTION_WORKERS: Final[int] = int(os.getenv("TEXT_EXTRACTION_WORKERS", "2"))
+
+# 크기 제한(100MB)을 넘는 문서 분할 업로드 설정
+# 활성화하면 PDF(pypdf 필요)/TXT/MD 문서를 페이지·제목·줄 경계에서 조각으로 나누어
+# 동시에 업로드하고, 하나의 문서로 관리 (비활성화하면 기존처럼 업로드 거부)
+SPLIT_OVERSIZED_DOCUMENTS: Final[bool] = (
+    os.getenv("SPLIT_OVERSIZED_DOCUMENTS", "true").lower() == "true"
+)
+# 조각 하나의 최대 크기 (바이트, 파일 크기 제한보다 크면 제한에 맞춤)
+SPLIT_PART_MAX_BYTES: Final[int] = int(
+    os.getenv("SPLIT_PART_MAX_BYTES", str(32 * 1024 * 1024))
+)
+
+# 디렉토리 동기화(security-chatbot sync) 설정
+# 파일별 크기/수정 시각/SHA-256과 등록된 코퍼스 파일을 기록하는 SQLite 파일
+DIRECTORY_SYNC_DB_PATH: Final[str] = os.getenv(
+    "DIRECTORY_SYNC_DB_PATH", "data/directory_sync.db"
+)
+
+# 업로드 문서 카탈로그 설정
+# Store별 업로드 문서 목록을 기록하는 SQLite 파일 (새로고침 후에도 유지되며,
+# 같은 파일을 가리키는 모든 세션과 레플리카가 공유)
+DOCUMENT_CATALOG_DB_PATH: Final[str] = os.getenv(
+    "DOCUMENT_CATALOG_DB_PATH", "data/document_catalog.db"
+)
+# 새 세션(다른 브라우저/사용자 포함)이 같은 표시 이름으로 마지막에 사용된 Store를 자동으로
+# 여는지 여부 (단일 사용자 배포용, 기본값: 사용 안 함 - 새로고침 시에는 URL의 Store만 다시 엶)
+REOPEN_LATEST_STORE: Final[bool] = (
+    os.getenv("REOPEN_LATEST_STORE", "false").lower() == "true"
+)
+# 사이드바 문서 목록의 페이지당 문서 수
+DOCUMENT_LIST_PAGE_SIZE: Final[int] = int(os.getenv("DOCUMENT_LIST_PAGE_SIZE", "20"))
+# Store의 문서 목록을 조회할 때 요청 한 번에 받는 문서 수 (카탈로그 대조에 사용, API 최대 20)
+STORE_LIST_PAGE_SIZE: Final[int] = int(os.getenv("STORE_LIST_PAGE_SIZE", "20"))
+# File Search Store 메타데이터(조회/목록) 캐시 유효 시간 (초, 0이면 캐시 사용 안 함)
+STORE_CACHE_TTL_SECONDS: Final[float] = float(
+    os.getenv("STORE_CACHE_TTL_SECONDS", "60")
+)
+# Store shard 기준: 현재 shard가 이 크기(바이트) 또는 문서 수에 도달하면 새 shard Store에
+# 업로드 (0이면 해당 기준 사용 안 함, 둘 다 0이면 shard를 만들지 않음)
+STORE_SHARD_MAX_BYTES: Final[int] = int(
+    os.getenv("STORE_SHARD_MAX_BYTES", str(20 * 1024 * 1024 * 1024))
+)
+STORE_SHARD_MAX_DOCUMENTS: Final[int] = int(
+    os.getenv("STORE_SHARD_MAX_DOCUMENTS", "0")
+)
 
 # 환경 변수 검증
 if not GEMINI_API_KEY:
@@ -4,17 +4,33 @@ Streamlit 기반 보안 챗봇의 메인 애플리케이션 진입점입니다.
 """
 
 import json
-import os
-import tempfile
+import uuid
 from datetime import datetime
 
-import pandas as pd
 import streamlit as st
 from google.api_core.exceptions import GoogleAPIError
 
 from security_chatbot.chat import session, ui_components
-from security_chatbot.rag.document_manager import DocumentManager
+from security_chatbot.config import (
+    DOCUMENT_LIST_PAGE_SIZE,
+    INGESTION_PROGRESS_POLL_SECONDS,
+    INGESTION_QUEUE_ENABLED,
+    UPLOAD_TIMEOUT_SECONDS,
+)
+from security_chatbot.rag.document_manager import (
+    DocumentManager,
+    apply_indexing_results,
+)
+from security_chatbot.rag.ingestion_queue import JOB_DEAD, JOB_DONE, IngestionQueue
+from security_chatbot.rag.operation_tracker import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    OperationTracker,
+)
 from security_chatbot.rag.store_manager import FileSearchStoreManager
+from security_chatbot.rag.store_shards import ShardedStore
+from security_chatbot.rag.upload_manifest import API_CALLS_PER_UPLOAD, upload_manifest
 from security_chatbot.utils.error_handler import error_handler
 
 # --- Custom CSS ---
@@ -199,6 +215,13 @@ CUSTOM_CSS = """
 SUPPORTED_FILE_TYPES: list[str] = ["pdf", "txt", "md", "hwp", "hwpx"]
 MAX_TOKENS_PER_CHUNK: int = 200
 OVERLAP_TOKENS: int = 20
+# 사이드바 문서 목록 정렬 옵션: 표시 이름 -> (정렬 기준, 내림차순 여부)
+DOCUMENT_SORT_OPTIONS: dict[str, tuple[str, bool]] = {
+    "최근 업로드순": ("upload_date", True),
+    "오래된 순": ("upload_date", False),
+    "이름순": ("name", False),
+    "큰 파일순": ("size", True),
+}
 
 # --- Helper Functions ---
 
@@ -279,20 +302,38 @@ def _handle_individual_document_deletion(
         )
         return
 
-    store_manager = FileSearchStoreManager()
+    # 코퍼스 파일이 속한 shard Store에서 삭제
+    sharded_store = session.get_sharded_store()
     try:
-        delete_success = store_manager.delete_corpus_file(
-            corpus_file_resource_name=corpus_file_resource_name
+        # 분할 업로드된 문서는 모든 조각을 함께 삭제
+        metadata = session.find_uploaded_file_metadata(corpus_file_resource_name)
+        resource_names = (
+            session.get_document_resource_names(metadata)
+            if metadata
+            else [corpus_file_resource_name]
         )
+        remaining = [
+            resource_name
+            for resource_name in resource_names
+            if not sharded_store.delete_corpus_file(resource_name)
+        ]
 
-        if delete_success:
-            session.remove_uploaded_file_metadata(file_name)
+        if not remaining:
+            if metadata:
+                session.remove_uploaded_file_metadata(metadata)
             st.success(f"✅ 문서 '{file_name}'이(가) 성공적으로 삭제되었습니다.")
 
             # 모든 문서가 삭제되면 RAG 엔진 비활성화
-            if not session.get_uploaded_files_metadata():
+            if not session.get_uploaded_files_count():
                 session.set_rag_engine_active_status(False)
                 st.info("모든 문서가 삭제되어 RAG 엔진이 비활성화되었습니다.")
+        elif metadata and len(remaining) < len(resource_names):
+            # 일부 조각만 삭제된 경우 남은 조각만 다시 삭제할 수 있도록 메타데이터 갱신
+            session.update_document_resource_names(metadata, remaining)
+            st.error(
+                f"❌ 문서 '{file_name}'의 조각 {len(remaining)}/{len(resource_names)}개를 "
+                "삭제하지 못했습니다. 다시 시도해주세요."
+            )
         else:
             st.error(f"❌ 문서 '{file_name}' 삭제에 실패했습니다. 로그를 확인해주세요.")
 
@@ -323,9 +364,9 @@ def _handle_delete_all_documents() -> None:
     """
     store_display_name, store_resource_name = session.get_file_store_info()
     if store_resource_name:
-        store_manager = FileSearchStoreManager()
         try:
-            if store_manager.delete_store(store_resource_name):
+            # 여러 shard로 나뉜 Store는 모든 shard를 삭제
+            if session.get_sharded_store().delete_all():
                 st.success(
                     f"✅ File Search Store '{store_display_name}'가 성공적으로 삭제되었습니다."
                 )
@@ -361,13 +402,67 @@ def _handle_delete_all_documents() -> None:
         del st.session_state["confirm_delete_all_docs"]
 
 
+def _format_upload_date(upload_date: str) -> str:
+    """ISO 형식의 업로드 시각을 목록 표시용 문자열로 변환합니다."""
+    return datetime.fromisoformat(upload_date).strftime("%Y-%m-%d %H:%M")
+
+
+def _change_document_list_page(delta: int) -> None:
+    """문서 목록의 현재 페이지를 delta만큼 이동합니다 (버튼 콜백)."""
+    st.session_state["document_list_page"] = max(
+        0, st.session_state.get("document_list_page", 0) + delta
+    )
+
+
+def _reconcile_document_list() -> None:
+    """현재 Store의 실제 문서 목록과 대조하여 사이드바 문서 목록을 고칩니다.
+    """
+    try:
+        with st.spinner("🔄 Store의 문서 목록과 대조 중..."):
+            summary = session.reconcile_uploaded_files_metadata()
+    except Exception as e:
+        error_info = error_handler.handle_error(e, "Store 문서 목록 대조")
+        st.warning(
+            f"⚠️ {error_info['message']}\n\n💡 해결 방법: {error_info['solution']}"
+        )
+        return
+    finally:
+        st.session_state["document_list_reconciled"] = True
+
+    if summary is None:
+        return
+    if summary["added"] or summary["removed"]:
+        st.info(
+            f"🔄 Store와 문서 목록을 맞췄습니다: 추가 {summary['added']}개, "
+            f"제거 {summary['removed']}개 (Store 문서 {summary['listed']}개)"
+        )
+    session.set_rag_engine_active_status(session.get_uploaded_files_count() > 0)
+
+
 def _display_uploaded_documents() -> None:
     """업로드된 문서 목록을 표시하고 개별/전체 삭제 버튼을 제공합니다.
     검색 기능을 통해 파일명으로 필터링할 수 있습니다.
+
+    문서가 수천 개여도 렌더링 비용이 일정하도록, 검색·정렬·페이지 나누기는 문서
+    카탈로그에서 처리하고 현재 페이지의 문서만 읽어 표시합니다.
     """
-    uploaded_files_metadata = session.get_uploaded_files_metadata()
+    _, store_resource_name = session.get_file_store_info()
+    if store_resource_name:
+        # 목록이 비어 있으면 세션마다 한 번 Store의 실제 문서로 채움 (다른 경로로 추가된 문서 등)
+        if (
+            not st.session_state.get("document_list_reconciled")
+            and not session.get_uploaded_files_count()
+        ):
+            _reconcile_document_list()
+        if st.button(
+            "🔄 Store와 목록 동기화",
+            key="reconcile_document_list",
+            help="Store의 실제 문서 목록과 대조하여 빠진 문서는 추가하고 사라진 문서는 제거합니다.",
+            disabled=session.get_processing_files_status(),
+        ):
+            _reconcile_document_list()
 
-    if not uploaded_files_metadata:
+    if not session.get_uploaded_files_count():
         st.info("업로드된 문서가 없습니다.")
         return
 
@@ -380,16 +475,37 @@ def _display_uploaded_documents() -> None:
         help="업로드된 문서 목록을 파일명으로 필터링합니다.",
         key="document_search_input",
     )
-
-    # 검색어에 따라 문서 필터링 (대소문자 구분 없음)
-    if search_query:
-        filtered_files_metadata = [
-            file_meta
-            for file_meta in uploaded_files_metadata
-            if search_query.lower() in file_meta["name"].lower()
-        ]
-    else:
-        filtered_files_metadata = uploaded_files_metadata
+    sort_label = st.selectbox(
+        "정렬", list(DOCUMENT_SORT_OPTIONS), key="document_sort_select"
+    )
+    sort_by, descending = DOCUMENT_SORT_OPTIONS[sort_label]
+
+    # 검색어나 정렬이 바뀌면 첫 페이지부터 표시
+    list_filter = (search_query.strip(), sort_label)
+    if st.session_state.get("document_list_filter") != list_filter:
+        st.session_state["document_list_filter"] = list_filter
+        st.session_state["document_list_page"] = 0
+    page = st.session_state.get("document_list_page", 0)
+
+    # 검색어에 따라 현재 페이지의 문서만 조회 (대소문자 구분 없음)
+    page_files_metadata, total = session.get_uploaded_files_page(
+        query=search_query,
+        sort_by=sort_by,
+        descending=descending,
+        page=page,
+        page_size=DOCUMENT_LIST_PAGE_SIZE,
+    )
+    page_count = max(1, -(-total // DOCUMENT_LIST_PAGE_SIZE))
+    if page >= page_count:
+        # 삭제 등으로 현재 페이지가 사라진 경우 마지막 페이지 표시
+        page = st.session_state["document_list_page"] = page_count - 1
+        page_files_metadata, total = session.get_uploaded_files_page(
+            query=search_query,
+            sort_by=sort_by,
+            descending=descending,
+            page=page,
+            page_size=DOCUMENT_LIST_PAGE_SIZE,
+        )
 
     # 개별 파일 삭제 확인 UI (맨 위에 표시)
     if "confirm_delete_file_name" in st.session_state and st.session_state.get(
@@ -413,7 +529,7 @@ def _display_uploaded_documents() -> None:
                 del st.session_state["confirm_delete_corpus_resource_name"]
 
     # 검색 결과 표시
-    if not filtered_files_metadata:
+    if not page_files_metadata:
         st.info("검색 결과가 없습니다.")
     else:
         # 문서 목록 테이블 (개별 삭제 버튼 포함)
@@ -429,25 +545,21 @@ def _display_uploaded_documents() -> None:
         with col_header4:
             st.markdown("**삭제**")
 
-        for i, file_meta in enumerate(filtered_files_metadata):
+        for file_meta in page_files_metadata:
             file_name = file_meta["name"]
-            file_size_formatted = _format_bytes(file_meta["size"])
-            upload_date_formatted = pd.to_datetime(file_meta["upload_date"]).strftime(
-                "%Y-%m-%d %H:%M"
-            )
             corpus_file_resource_name = file_meta["corpus_file_resource_name"]
 
             col1, col2, col3, col4 = st.columns([0.45, 0.15, 0.25, 0.15])
             with col1:
                 st.write(file_name)
             with col2:
-                st.write(file_size_formatted)
+                st.write(_format_bytes(file_meta["size"]))
             with col3:
-                st.write(upload_date_formatted)
+                st.write(_format_upload_date(file_meta["upload_date"]))
             with col4:
                 if st.button(
                     "🗑️",
-                    key=f"delete_doc_{i}_{file_name}",
+                    key=f"delete_doc_{file_meta['document_id']}",
                     help=f"'{file_name}' 문서 삭제",
                 ):
                     st.session_state["confirm_delete_file_name"] = file_name
@@ -455,6 +567,27 @@ def _display_uploaded_documents() -> None:
                         corpus_file_resource_name
                     )
 
+        # 페이지 이동
+        col_prev, col_page, col_next = st.columns([0.2, 0.6, 0.2])
+        with col_prev:
+            st.button(
+                "◀",
+                key="document_list_prev",
+                disabled=page == 0,
+                on_click=_change_document_list_page,
+                args=(-1,),
+            )
+        with col_page:
+            st.caption(f"{page + 1} / {page_count} 페이지 (총 {total}개)")
+        with col_next:
+            st.button(
+                "▶",
+                key="document_list_next",
+                disabled=page >= page_count - 1,
+                on_click=_change_document_list_page,
+                args=(1,),
+            )
+
     st.markdown("---")
 
     # 모든 문서 삭제 버튼 및 확인 UI
@@ -474,6 +607,135 @@ def _display_uploaded_documents() -> None:
                 del st.session_state["confirm_delete_all_docs"]
 
 
+@st.cache_resource
+def _get_ingestion_queue() -> IngestionQueue:
+    """Returns the ingestion job queue shared by all sessions of this app process.
+
+    프로세스 내 모든 세션이 공유하는 백그라운드 수집 작업 큐를 반환합니다.
+    """
+    return IngestionQueue()
+
+
+def _enqueue_document_upload(
+    uploaded_files: list[st.runtime.uploaded_file_manager.UploadedFile],
+    sharded_store: ShardedStore,
+) -> None:
+    """Queues uploaded files for the background ingestion worker.
+
+    업로드된 파일을 백그라운드 수집 큐에 등록합니다. 실제 업로드와 Store 등록은
+    별도 워커 프로세스가 처리하므로 브라우저 탭을 닫거나 새로고침해도 계속 진행됩니다.
+
+    Args:
+        uploaded_files: Streamlit file uploader에서 받은 업로드된 파일 목록
+        sharded_store: 문서를 등록할 Store (파일마다 업로드할 shard를 골라 등록)
+
+    """
+    queue = _get_ingestion_queue()
+    batch_id = uuid.uuid4().hex
+    for uploaded_file in uploaded_files:
+        queue.enqueue_upload(
+            sharded_store.select_shard(uploaded_file.size),
+            uploaded_file,
+            uploaded_file.name,
+            batch_id,
+        )
+    session.add_ingestion_batch(batch_id)
+    st.info(
+        f"📥 {len(uploaded_files)}개 파일을 백그라운드 수집 큐에 등록했습니다. "
+        "진행 상황은 사이드바에서 확인할 수 있습니다."
+    )
+
+
+def _sync_ingested_documents(queue: IngestionQueue, batch_id: str) -> int:
+    """Adds documents finished by the ingestion worker to the session.
+
+    워커가 처리를 마친 문서를 세션의 문서 목록에 추가하고, 이 프로세스의 응답 캐시와
+    업로드 매니페스트에도 반영합니다 (워커는 별도 프로세스이므로).
+
+    Returns:
+        int: 새로 추가된 문서 수
+
+    """
+    added = 0
+    sharded_store = session.get_sharded_store()
+    for job in queue.list_jobs(batch_id, status=JOB_DONE):
+        result = job["result"]
+        corpus_file_name = result["corpus_file_name"]
+        if session.find_uploaded_file_metadata(corpus_file_name):
+            continue
+        # 분할 업로드된 문서는 조각마다 캐시와 매니페스트에 반영
+        parts = result.get("parts") or [result]
+        session.add_uploaded_file_metadata(
+            file_name=job["display_name"],
+            file_size=result["file_size"],
+            upload_datetime=datetime.fromtimestamp(job["updated_at"]),
+            corpus_file_resource_name=corpus_file_name,
+            part_resource_names=(
+                [part["corpus_file_name"] for part in parts]
+                if "parts" in result
+                else None
+            ),
+            sha256=result.get("sha256"),
+        )
+        # 응답 캐시 무효화는 워커가 업로드/인덱싱하면서 이미 기록함
+        for part in parts:
+            if part["deduplicated"]:
+                continue
+            if sharded_store:
+                sharded_store.record_corpus_change(part["corpus_file_name"])
+            if part["sha256"]:
+                upload_manifest.record(
+                    job["store_name"],
+                    part["sha256"],
+                    part["corpus_file_name"],
+                    job["display_name"],
+                    part["file_size"],
+                )
+        added += 1
+    if added:
+        session.set_rag_engine_active_status(True)
+    return added
+
+
+@st.fragment(run_every=INGESTION_PROGRESS_POLL_SECONDS)
+def _display_ingestion_progress() -> None:
+    """Polls the ingestion queue and shows the progress of this session's batches.
+
+    이 세션에서 등록한 백그라운드 수집 배치의 진행 상황을 주기적으로 조회하여 표시합니다.
+    실패하여 dead-letter로 이동한 작업은 다시 시도할 수 있습니다.
+    """
+    batch_ids = session.get_ingestion_batches()
+    if not batch_ids:
+        return
+
+    queue = _get_ingestion_queue()
+    st.subheader("⏳ 백그라운드 수집")
+    documents_added = 0
+    for batch_id in list(batch_ids):
+        documents_added += _sync_ingested_documents(queue, batch_id)
+        progress = queue.get_progress(batch_id)
+        finished = progress["done"] + progress["dead"]
+        st.progress(
+            progress["percent"] / 100,
+            text=(
+                f"{finished}/{progress['total']}개 처리 "
+                f"({_format_bytes(progress['bytes_done'])}"
+                f" / {_format_bytes(progress['bytes_total'])})"
+            ),
+        )
+        for job in queue.list_jobs(batch_id, status=JOB_DEAD):
+            st.error(f"❌ '{job['display_name']}' 수집 실패: {job['last_error']}")
+            if st.button("🔁 다시 시도", key=f"retry_ingestion_{job['id']}"):
+                queue.retry_dead(job["id"])
+        if finished == progress["total"] and not progress["dead"]:
+            session.remove_ingestion_batch(batch_id)
+            st.success(f"✅ {progress['done']}개 파일 업로드 및 Store 등록 완료!")
+
+    # 새 문서가 추가되면 문서 목록이 갱신되도록 전체 화면을 다시 그림
+    if documents_added:
+        st.rerun()
+
+
 def _handle_document_upload(
     uploaded_files: list[st.runtime.uploaded_file_manager.UploadedFile],
 ) -> None:
@@ -551,12 +813,23 @@ def _handle_document_upload(
                 f"📦 기존 File Search Store 사용: '{store_display_name}' (ID: {store_resource_name.split('/')[-1]})"
             )
 
-        # 2. Upload files to the store
-        doc_manager = DocumentManager(
-            store_name=store_resource_name,
-            max_tokens_per_chunk=MAX_TOKENS_PER_CHUNK,
-            overlap_tokens=OVERLAP_TOKENS,
-        )
+        sharded_store = session.get_sharded_store()
+        if INGESTION_QUEUE_ENABLED:
+            _enqueue_document_upload(uploaded_files, sharded_store)
+            return
+
+        # 2. Upload files to the store (파일마다 크기 기준에 맞는 shard Store로 업로드)
+        doc_managers: dict[str, DocumentManager] = {}
+
+        def _doc_manager_for(file_size: int) -> DocumentManager:
+            shard_name = sharded_store.select_shard(file_size)
+            if shard_name not in doc_managers:
+                doc_managers[shard_name] = DocumentManager(
+                    store_name=shard_name,
+                    max_tokens_per_chunk=MAX_TOKENS_PER_CHUNK,
+                    overlap_tokens=OVERLAP_TOKENS,
+                )
+            return doc_managers[shard_name]
 
         total_files = len(uploaded_files)
         progress_text = "📤 파일 업로드 및 처리 중..."
@@ -564,6 +837,35 @@ def _handle_document_upload(
         files_uploaded_count = 0
         successful_uploads = []
         failed_uploads = []
+        deduplicated_uploads = []
+        dedupe_bytes_saved = 0
+        # 텍스트 추출 효과 보고용: 업로드한 파일들의 원본 크기와 실제 전송 크기 합계
+        original_bytes = 0
+        transferred_bytes = 0
+        indexing_failed = []
+        # 분할 업로드한 조각의 인덱싱 표시 이름 -> 원본 파일 이름
+        part_labels: dict[str, str] = {}
+        # 인덱싱이 끝난 뒤 문서 목록에 추가할 (파일 이름, 크기, 업로드 결과)
+        uploaded_documents: list[tuple[str, int, dict]] = []
+
+        # 업로드한 파일들의 인덱싱(import) Operation을 하나의 루프에서 추적
+        index_tracker = OperationTracker()
+
+        def _on_indexed(status: dict) -> None:
+            if status["status"] == STATUS_FAILED:
+                indexing_failed.append(status["label"])
+                st.warning(f"⚠️ '{status['label']}' 인덱싱 실패: {status['error']}")
+            else:
+                st.info(f"🔎 '{status['label']}' 인덱싱 완료")
+            index_progress = index_tracker.get_progress()
+            progress_bar.progress(
+                index_progress["percent"] / 100,
+                text=(
+                    f"🔎 문서 인덱싱 중... "
+                    f"({index_progress['total'] - index_progress['pending']}"
+                    f"/{index_progress['total']})"
+                ),
+            )
 
         with st.spinner("⚙️ 문서 처리 중..."):
             for i, uploaded_file in enumerate(uploaded_files):
@@ -571,30 +873,52 @@ def _handle_document_upload(
                     (i + 1) / total_files, text=f"{progress_text} ({i+1}/{total_files})"
                 )
                 try:
-                    # Streamlit UploadedFile needs to be saved to a temp file for DocumentManager
-                    with tempfile.NamedTemporaryFile(
-                        delete=False, suffix=os.path.splitext(uploaded_file.name)[1]
-                    ) as tmp_file:
-                        tmp_file.write(uploaded_file.getvalue())
-                        temp_file_path = tmp_file.name
-
-                    file_validation = doc_manager.validate_file(temp_file_path)
-                    if not file_validation["valid"]:
-                        raise ValueError(
-                            f"파일 검증 실패: {uploaded_file.name} - {file_validation.get('error', '알 수 없는 오류')}"
-                        )
-
+                    # UploadedFile은 seek 가능한 메모리 버퍼이므로 임시 파일 없이 그대로 업로드
+                    # (upload_stream이 검증과 콘텐츠 해시 계산을 함께 수행)
                     st.info(f"📤 '{uploaded_file.name}' 업로드 중...")
-                    upload_result = doc_manager.upload_file(
-                        temp_file_path, display_name=uploaded_file.name
+                    upload_result = _doc_manager_for(uploaded_file.size).upload_stream(
+                        uploaded_file, uploaded_file.name
                     )
 
                     if upload_result and upload_result.get("corpus_file_name"):
-                        session.add_uploaded_file_metadata(
-                            file_name=uploaded_file.name,
-                            file_size=uploaded_file.size,
-                            upload_datetime=datetime.now(),
-                            corpus_file_resource_name=upload_result["corpus_file_name"],
+                        if upload_result.get("deduplicated"):
+                            deduplicated_uploads.append(uploaded_file.name)
+                            dedupe_bytes_saved += upload_result["bytes_saved"]
+                            st.info(
+                                f"♻️ '{uploaded_file.name}'은(는) 이미 인덱싱된 "
+                                f"'{upload_result['duplicate_of']}'과(와) 내용이 같아 "
+                                "업로드를 건너뛰었습니다."
+                            )
+                        elif upload_result.get("split"):
+                            # 크기 제한을 넘어 조각으로 나누어 올린 문서
+                            parts = upload_result["parts"]
+                            original_bytes += upload_result["original_bytes"]
+                            transferred_bytes += upload_result["uploaded_bytes"]
+                            st.info(
+                                f"✂️ '{uploaded_file.name}'은(는) 크기 제한을 넘어 "
+                                f"{len(parts)}개 조각으로 나누어 업로드했습니다."
+                            )
+                            for index, part in enumerate(parts, start=1):
+                                if not part["deduplicated"]:
+                                    label = (
+                                        f"{uploaded_file.name} ({index}/{len(parts)})"
+                                    )
+                                    part_labels[label] = uploaded_file.name
+                                    index_tracker.track(
+                                        part["corpus_file"],
+                                        label=label,
+                                        on_complete=_on_indexed,
+                                    )
+                        else:
+                            original_bytes += upload_result["original_bytes"]
+                            transferred_bytes += upload_result["uploaded_bytes"]
+                            index_tracker.track(
+                                upload_result["corpus_file"],
+                                label=uploaded_file.name,
+                                on_complete=_on_indexed,
+                            )
+                        uploaded_documents.append(
+                            (uploaded_file.name, uploaded_file.size, upload_result)
                         )
                         successful_uploads.append(uploaded_file.name)
                         files_uploaded_count += 1
@@ -662,17 +986,77 @@ def _handle_document_upload(
                             f"💡 {error_info['message']}\n\n💡 해결 방법: {error_info['solution']}"
                         )
                     failed_uploads.append(uploaded_file.name)
-                finally:
-                    if "temp_file_path" in locals() and os.path.exists(temp_file_path):
-                        os.remove(temp_file_path)  # Clean up the temporary file
+
+        # 3. Wait until the uploaded documents are indexed and searchable
+        if index_tracker.get_progress()["pending"]:
+            with st.spinner("🔎 문서 인덱싱 완료 대기 중..."):
+                index_tracker.wait(timeout=UPLOAD_TIMEOUT_SECONDS)
+
+        # 4. Record the indexed documents under their document resource names
+        # (import Operation 이름이 아닌, Store 문서 목록과 삭제에 쓰이는 이름으로 기록)
+        apply_indexing_results(
+            [result for _, _, result in uploaded_documents], index_tracker
+        )
+        unlisted_count = 0
+        for file_name, file_size, upload_result in uploaded_documents:
+            if upload_result["indexing"] == STATUS_PENDING:
+                unlisted_count += 1
+            if upload_result["indexing"] != STATUS_DONE:
+                continue
+            corpus_file_name = str(upload_result["corpus_file_name"])
+            if not upload_result.get("deduplicated"):
+                for resource_name in upload_result.get("corpus_file_names") or [
+                    corpus_file_name
+                ]:
+                    sharded_store.record_corpus_change(resource_name)
+            if not session.find_uploaded_file_metadata(corpus_file_name):
+                session.add_uploaded_file_metadata(
+                    file_name=file_name,
+                    file_size=file_size,
+                    upload_datetime=datetime.now(),
+                    corpus_file_resource_name=corpus_file_name,
+                    part_resource_names=upload_result.get("corpus_file_names"),
+                    sha256=upload_result.get("sha256"),
+                )
 
         progress_bar.empty()  # Clear the progress bar
 
+        index_progress = index_tracker.get_progress()
+        indexed_count = len(successful_uploads) - len(
+            {part_labels.get(label, label) for label in indexing_failed}
+        )
         if successful_uploads:
-            st.success(
-                f"✅ {len(successful_uploads)}/{total_files}개 파일 업로드 완료!"
-            )
+            if index_progress["pending"]:
+                st.warning(
+                    f"⏳ {len(successful_uploads)}/{total_files}개 파일 업로드 완료, "
+                    f"{index_progress['pending']}개는 아직 인덱싱 중입니다."
+                )
+                if unlisted_count:
+                    st.info(
+                        f"📋 인덱싱 중인 문서 {unlisted_count}개는 완료 후 "
+                        "'🔄 Store와 목록 동기화'로 문서 목록에 추가할 수 있습니다."
+                    )
+            else:
+                st.success(
+                    f"✅ {indexed_count}/{total_files}개 파일 업로드 및 인덱싱 완료!"
+                )
             session.set_rag_engine_active_status(True)
+        if indexing_failed:
+            st.error(
+                f"❌ {len(indexing_failed)}개 파일 인덱싱 실패: {', '.join(indexing_failed)}"
+            )
+        if transferred_bytes < original_bytes:
+            st.info(
+                f"📉 텍스트 추출로 전송량 감소: {_format_bytes(original_bytes)} → "
+                f"{_format_bytes(transferred_bytes)} "
+                f"({transferred_bytes / original_bytes:.1%})"
+            )
+        if deduplicated_uploads:
+            st.info(
+                f"♻️ 중복 문서 {len(deduplicated_uploads)}개 업로드 생략: "
+                f"{_format_bytes(dedupe_bytes_saved)} 전송 및 "
+                f"API 호출 {len(deduplicated_uploads) * API_CALLS_PER_UPLOAD}회 절약"
+            )
         if failed_uploads:
             st.error(
                 f"❌ {len(failed_uploads)}개 파일 업로드 실패: {', '.join(failed_uploads)}"
@@ -753,6 +1137,9 @@ def main() -> None:
         ):
             pass  # The on_click handler will manage the state and rerun
 
+        if INGESTION_QUEUE_ENABLED:
+            _display_ingestion_progress()
+
         st.markdown("---")
 
         # 4. 업로드된 문서 목록 표시
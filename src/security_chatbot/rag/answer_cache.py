@@ -0,0 +1,333 @@
+"""RAG answer cache module
+
+Caches successful RAG answers keyed on the normalized question, the File Search
+Store resource name and a version of that store that moves forward on every
+recorded document change. Entries live in an in-memory LRU with TTL and can
+optionally be persisted to SQLite. With SQLite the store versions live in the
+shared database and are read on every lookup, so a document change recorded by
+one process (another app replica or the ingestion worker) invalidates the
+answers cached by every other process. Versions only ever increase, so the same
+change recorded twice (e.g. by the worker and again by the app) cannot bring a
+stale answer back.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from security_chatbot.config import (
+    ANSWER_CACHE_DB_PATH,
+    ANSWER_CACHE_ENABLED,
+    ANSWER_CACHE_MAX_ENTRIES,
+    ANSWER_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = "?!.。？！ "
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키 생성을 위해 질의를 정규화합니다.
+    유니코드 정규화(NFKC), 소문자 변환, 공백 축약, 끝 문장부호 제거를 수행합니다.
+
+    Args:
+        query: 사용자 질의
+
+    Returns:
+        str: 정규화된 질의 문자열
+
+    """
+    normalized = unicodedata.normalize("NFKC", query).lower()
+    normalized = _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+    return normalized.rstrip(_TRAILING_PUNCTUATION)
+
+
+def store_name_from_resource(resource_name: str) -> str | None:
+    """코퍼스 파일/문서 리소스 이름에서 상위 File Search Store 이름을 추출합니다.
+
+    Args:
+        resource_name: 예) "fileSearchStores/store-id/corpusFiles/file-id"
+
+    Returns:
+        Optional[str]: 예) "fileSearchStores/store-id", 추출할 수 없으면 None
+
+    """
+    parts = resource_name.split("/")
+    if len(parts) >= 4 and parts[0] == "fileSearchStores":
+        return "/".join(parts[:2])
+    return None
+
+
+class AnswerCache:
+    """RAG 응답을 위한 LRU + TTL 캐시 클래스
+
+    키는 (정규화된 질의, Store 이름, Store 버전)으로 구성되며, 문서가 추가/삭제되면
+    해당 Store의 버전이 올라가 기존 항목이 자동 무효화됩니다. 영속화 저장소를 사용하면
+    버전은 DB에만 두고 조회할 때마다 읽으므로, 같은 DB를 쓰는 다른 프로세스의 문서
+    변경도 이 프로세스의 메모리 항목을 무효화합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = ANSWER_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = ANSWER_CACHE_TTL_SECONDS,
+        db_path: str | None = None,
+        enabled: bool = True,
+    ):
+        """AnswerCache 초기화
+
+        Args:
+            max_entries: 메모리에 유지할 최대 항목 수
+            ttl_seconds: 항목 유효 시간 (초)
+            db_path: SQLite 영속화 파일 경로. None이면 메모리에만 저장
+            enabled: False이면 조회는 항상 miss, 저장은 무시
+
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        self._entries: OrderedDict[str, tuple[float, str, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._conn: sqlite3.Connection | None = None
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str) -> None:
+        """SQLite 영속화 저장소를 열고 만료 항목을 정리합니다."""
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS answers (
+                cache_key TEXT PRIMARY KEY,
+                store_name TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                response TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_answers_store ON answers (store_name);
+            CREATE TABLE IF NOT EXISTS store_versions (
+                store_name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            );
+            DROP TABLE IF EXISTS store_fingerprints;
+            """
+        )
+        self._conn.execute(
+            "DELETE FROM answers WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,),
+        )
+        self._conn.commit()
+        logger.info(f"응답 캐시 영속화 저장소 사용: {db_path}")
+
+    def get_version(self, store_name: str) -> int:
+        """Store의 현재 버전 (기록된 문서 변경마다 1씩 증가)을 반환합니다."""
+        with self._lock:
+            return self._version(store_name)
+
+    def _version(self, store_name: str) -> int:
+        # 영속화 저장소가 있으면 다른 프로세스의 변경이 보이도록 항상 DB에서 읽음
+        if self._conn is None:
+            return self._versions.get(store_name, 0)
+        row = self._conn.execute(
+            "SELECT version FROM store_versions WHERE store_name = ?",
+            (store_name,),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _bump_versions(self, store_name: str | None = None) -> None:
+        """Store(None이면 기록된 모든 Store)의 버전을 올립니다.
+
+        버전은 줄어들지 않으므로, 다른 프로세스가 메모리에 들고 있는 이전 버전의
+        항목은 같은 변경이 다시 기록되거나 캐시를 비워도 다시 적중하지 않습니다.
+        """
+        if self._conn is None:
+            names = [store_name] if store_name else list(self._versions)
+            for name in names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+            return
+        if store_name is None:
+            self._conn.execute("UPDATE store_versions SET version = version + 1")
+        else:
+            self._conn.execute(
+                "INSERT INTO store_versions VALUES (?, 1) ON CONFLICT(store_name) "
+                "DO UPDATE SET version = version + 1",
+                (store_name,),
+            )
+        self._conn.commit()
+
+    def _make_key(self, query: str, store_name: str) -> str:
+        version = self._version(store_name)
+        raw = f"{normalize_query(query)}\x00{store_name}\x00{version}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, query: str, store_name: str) -> dict[str, Any] | None:
+        """캐시된 응답을 조회합니다.
+
+        Args:
+            query: 사용자 질의
+            store_name: File Search Store 리소스 이름
+
+        Returns:
+            Optional[Dict[str, Any]]: 캐시된 응답 (cached=True 포함) 또는 miss 시 None
+
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            key = self._make_key(query, store_name)
+            now = time.time()
+
+            entry = self._entries.get(key)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT created_at, store_name, response FROM answers "
+                    "WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+                if row:
+                    entry = (row[0], row[1], json.loads(row[2]))
+                    self._entries[key] = entry
+
+            if entry is not None and now - entry[0] > self.ttl_seconds:
+                self._discard(key)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._evict_overflow()
+            self._hits += 1
+            return {**entry[2], "cached": True}
+
+    def put(self, query: str, store_name: str, response: dict[str, Any]) -> None:
+        """성공한 응답을 캐시에 저장합니다. 실패 응답은 저장하지 않습니다.
+
+        Args:
+            query: 사용자 질의
+            store_name: File Search Store 리소스 이름
+            response: query_with_rag 형태의 응답 딕셔너리
+
+        """
+        if not self.enabled or not response.get("success"):
+            return
+
+        with self._lock:
+            key = self._make_key(query, store_name)
+            created_at = time.time()
+            stored = {k: v for k, v in response.items() if k != "cached"}
+            self._entries[key] = (created_at, store_name, stored)
+            self._entries.move_to_end(key)
+            self._evict_overflow()
+
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?)",
+                    (key, store_name, created_at, json.dumps(stored, ensure_ascii=False)),
+                )
+                self._conn.commit()
+
+    def _discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._conn is not None:
+            self._conn.execute("DELETE FROM answers WHERE cache_key = ?", (key,))
+            self._conn.commit()
+
+    def _evict_overflow(self) -> None:
+        # 메모리 LRU만 제한하며, 영속화 저장소의 항목은 TTL로 정리됨
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def record_corpus_change(self, store_name: str, resource_name: str) -> None:
+        """Store의 문서가 추가되거나 삭제되었음을 기록하고 해당 Store의 캐시를 무효화합니다.
+
+        변경마다 Store 버전을 올리므로, 같은 변경을 여러 프로세스가 중복으로 기록해도
+        (워커가 기록한 업로드를 앱이 다시 기록하는 경우 등) 무효화가 되돌려지지 않습니다.
+        영속화 저장소에서는 버전 증가가 하나의 UPDATE이므로 동시 기록도 모두 반영됩니다.
+
+        Args:
+            store_name: 변경된 File Search Store 리소스 이름
+            resource_name: 추가/삭제된 코퍼스 파일 리소스 이름 (로그용)
+
+        """
+        with self._lock:
+            self._bump_versions(store_name)
+            self._purge_store(store_name)
+        logger.info(
+            f"문서 변경으로 응답 캐시 무효화: store={store_name}, "
+            f"resource={resource_name}"
+        )
+
+    def invalidate_store(self, store_name: str) -> None:
+        """Store의 캐시 항목을 모두 제거하고 버전을 올립니다 (Store 삭제 시 사용)."""
+        with self._lock:
+            self._bump_versions(store_name)
+            self._purge_store(store_name)
+        logger.info(f"응답 캐시 무효화: store={store_name}")
+
+    def _purge_store(self, store_name: str) -> None:
+        stale = [k for k, v in self._entries.items() if v[1] == store_name]
+        for key in stale:
+            del self._entries[key]
+        if self._conn is not None:
+            self._conn.execute(
+                "DELETE FROM answers WHERE store_name = ?", (store_name,)
+            )
+            self._conn.commit()
+
+    def invalidate_all(self) -> None:
+        """모든 Store의 캐시 항목을 제거하고 버전을 올립니다. 통계는 유지됩니다."""
+        with self._lock:
+            self._entries.clear()
+            self._bump_versions()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM answers")
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """모든 캐시 항목과 hit/miss 통계를 초기화합니다."""
+        self.invalidate_all()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """캐시 hit/miss 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: hits, misses, hit_rate, entries 키를 포함하는 딕셔너리
+
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "entries": len(self._entries),
+            }
+
+
+# 프로세스 전역에서 공유하는 응답 캐시 인스턴스
+answer_cache = AnswerCache(
+    db_path=ANSWER_CACHE_DB_PATH or None, enabled=ANSWER_CACHE_ENABLED
+)
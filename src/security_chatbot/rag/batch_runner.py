@@ -0,0 +1,267 @@
+"""SecurityChatbot Batch Question Runner
+
+컴플라이언스 점검표처럼 많은 질문을 하나의 File Search Store에 대해 일괄 실행합니다.
+질문은 CSV 또는 JSONL에서 읽고, 동시 실행 수를 제한하여 query_with_rag로 실행하며
+(프로세스 전역 레이트 리미터 공유), 결과는 완료되는 즉시 JSONL로 기록합니다.
+출력 파일에 이미 성공으로 기록된 ID는 건너뛰므로 중단된 실행을 이어서 할 수 있습니다.
+
+사용법:
+    python -m security_chatbot.rag.batch_runner questions.csv results.jsonl \\
+        --store fileSearchStores/xxx --concurrency 4
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from security_chatbot.config import QUERY_AUTO_RETRY_ENABLED
+from security_chatbot.rag.query_handler import query_with_rag
+
+logger = logging.getLogger(__name__)
+
+# 기본 동시 실행 질문 수
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+def load_questions(input_path: str) -> list[dict[str, str]]:
+    """CSV 또는 JSONL 파일에서 질문 목록을 읽습니다.
+
+    CSV는 "question" 열(필수)과 "id" 열(선택)을, JSONL은 줄마다
+    {"id": ..., "question": ...} 객체를 사용합니다. id가 없으면 행 번호로 만듭니다.
+
+    Args:
+        input_path: 질문 파일 경로 (.csv 또는 .jsonl)
+
+    Returns:
+        List[Dict[str, str]]: {"id": str, "question": str} 목록 (파일 순서 유지)
+
+    Raises:
+        ValueError: 지원하지 않는 형식, question 누락, 중복 ID가 있는 경우
+
+    """
+    path = Path(input_path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+    elif suffix in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+    else:
+        raise ValueError(f"지원하지 않는 질문 파일 형식입니다: {suffix} (.csv, .jsonl 지원)")
+
+    questions = []
+    seen_ids = set()
+    for index, row in enumerate(rows, start=1):
+        question = (row.get("question") or "").strip()
+        if not question:
+            raise ValueError(f"{index}번째 항목에 question이 없습니다.")
+        question_id = str(row.get("id") or f"q{index}").strip()
+        if question_id in seen_ids:
+            raise ValueError(f"중복된 질문 ID입니다: {question_id}")
+        seen_ids.add(question_id)
+        questions.append({"id": question_id, "question": question})
+
+    return questions
+
+
+def load_completed_ids(output_path: str) -> set[str]:
+    """결과 JSONL에서 이미 성공적으로 답변된 질문 ID를 읽습니다.
+
+    실행이 중간에 중단되어 마지막 줄이 잘린 경우(UTF-8 문자 중간에서 잘린 경우 포함)
+    그 줄은 무시합니다. 실패한 질문은 다음 실행에서 다시 시도되도록 포함하지 않습니다.
+
+    Args:
+        output_path: 결과 JSONL 파일 경로
+
+    Returns:
+        Set[str]: 성공한 질문 ID 집합 (파일이 없으면 빈 집합)
+
+    """
+    completed: set[str] = set()
+    if not os.path.exists(output_path):
+        return completed
+
+    # 잘린 멀티바이트 문자가 파일 전체 읽기를 실패시키지 않도록 줄 단위로 디코딩
+    with open(output_path, "rb") as f:
+        for raw_line in f:
+            line = raw_line.decode("utf-8", errors="replace")
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("결과 파일의 손상된 줄을 건너뜁니다.")
+                continue
+            if isinstance(record, dict) and record.get("success") and "id" in record:
+                completed.add(str(record["id"]))
+    return completed
+
+
+class _ResultWriter:
+    """여러 작업 스레드가 완료한 결과를 한 줄씩 안전하게 추가 기록합니다."""
+
+    def __init__(self, output_path: str):
+        self._lock = threading.Lock()
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        # 이전 실행이 줄 중간에서 중단되었다면 새 기록이 그 줄에 이어 붙지 않도록 개행 추가
+        # (텍스트 모드는 임의 위치로 seek할 수 없으므로 마지막 바이트는 바이너리로 확인)
+        needs_newline = False
+        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            with open(output_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b"\n"
+        self._file = open(output_path, "a", encoding="utf-8")
+        if needs_newline:
+            self._file.write("\n")
+
+    def write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _run_question(
+    item: dict[str, str], store_name: str, auto_retry: bool
+) -> dict[str, Any]:
+    """질문 하나를 실행하고 결과 레코드를 만듭니다."""
+    start = time.perf_counter()
+    response = query_with_rag(item["question"], store_name, auto_retry=auto_retry)
+    latency = time.perf_counter() - start
+
+    return {
+        "id": item["id"],
+        "question": item["question"],
+        "success": response["success"],
+        "answer": response.get("content", ""),
+        "citations": response.get("citations", []),
+        "error": response.get("error"),
+        "latency_seconds": round(latency, 3),
+        # 캐시 적중 응답은 이번 실행에서 토큰을 사용하지 않음
+        "token_usage": None if response.get("cached") else response.get("token_usage"),
+        "cached": response.get("cached", False),
+        "completed_at": datetime.now().isoformat(),
+    }
+
+
+def run_batch(
+    input_path: str,
+    output_path: str,
+    store_name: str,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    auto_retry: bool = QUERY_AUTO_RETRY_ENABLED,
+    on_result: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """질문 파일의 모든 질문을 실행하고 결과를 JSONL로 기록합니다.
+
+    Args:
+        input_path: 질문 파일 경로 (.csv 또는 .jsonl)
+        output_path: 결과 JSONL 파일 경로 (있으면 이어서 기록)
+        store_name: 검색할 File Search Store 리소스 이름
+        concurrency: 동시에 실행할 최대 질문 수
+        auto_retry: 사용량 초과 시 자동 재시도 여부
+        on_result: 질문 하나가 완료될 때마다 결과 레코드로 호출되는 콜백 (진행률 표시용)
+
+    Returns:
+        Dict[str, Any]: total, skipped(이전 실행에서 완료), succeeded, failed,
+            total_tokens, elapsed_seconds
+
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency는 1 이상이어야 합니다.")
+
+    questions = load_questions(input_path)
+    completed_ids = load_completed_ids(output_path)
+    pending = [item for item in questions if item["id"] not in completed_ids]
+    logger.info(
+        f"배치 질문 실행 시작: 전체 {len(questions)}개, "
+        f"이전 완료 {len(questions) - len(pending)}개, 실행 {len(pending)}개 "
+        f"(동시 실행 {concurrency})"
+    )
+
+    summary = {
+        "total": len(questions),
+        "skipped": len(questions) - len(pending),
+        "succeeded": 0,
+        "failed": 0,
+        "total_tokens": 0,
+    }
+    start = time.perf_counter()
+    writer = _ResultWriter(output_path)
+    try:
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="batch-query"
+        ) as executor:
+            futures = [
+                executor.submit(_run_question, item, store_name, auto_retry)
+                for item in pending
+            ]
+            for future in as_completed(futures):
+                record = future.result()
+                writer.write(record)
+                summary["succeeded" if record["success"] else "failed"] += 1
+                if record["token_usage"]:
+                    summary["total_tokens"] += record["token_usage"]["total_tokens"]
+                if on_result is not None:
+                    on_result(record)
+    finally:
+        writer.close()
+
+    summary["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    logger.info(
+        f"배치 질문 실행 완료: 성공 {summary['succeeded']}, 실패 {summary['failed']}, "
+        f"건너뜀 {summary['skipped']} ({summary['elapsed_seconds']}초)"
+    )
+    return summary
+
+
+def main() -> None:
+    """명령행에서 배치 질문 실행"""
+    parser = argparse.ArgumentParser(description="보안 문서 배치 질문 실행기")
+    parser.add_argument("input", help="질문 파일 (.csv 또는 .jsonl)")
+    parser.add_argument("output", help="결과 JSONL 파일 (있으면 이어서 실행)")
+    parser.add_argument("--store", required=True, help="File Search Store 리소스 이름")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help="동시에 실행할 최대 질문 수",
+    )
+    parser.add_argument(
+        "--no-retry", action="store_true", help="사용량 초과 시 자동 재시도하지 않음"
+    )
+    args = parser.parse_args()
+
+    def _print_progress(record: dict[str, Any]) -> None:
+        status = "✅" if record["success"] else "❌"
+        print(f"{status} [{record['id']}] {record['latency_seconds']:.2f}초")
+
+    summary = run_batch(
+        args.input,
+        args.output,
+        args.store,
+        concurrency=args.concurrency,
+        auto_retry=not args.no_retry,
+        on_result=_print_progress,
+    )
+    print(
+        f"\n완료: 성공 {summary['succeeded']}, 실패 {summary['failed']}, "
+        f"건너뜀 {summary['skipped']}, 토큰 {summary['total_tokens']}, "
+        f"{summary['elapsed_seconds']}초"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Document catalog reconciliation module
+
+Brings the local document catalog back in line with what a File Search Store
+actually contains. Documents can reach a store without going through this app
+(directory sync, other tools, other deployments) and can disappear from it, so
+the catalog drifts. Reconciliation walks the store's document listing one page
+at a time, adds documents the catalog does not know about as it goes, and once
+the whole listing has been seen removes catalog entries the store no longer
+has. A store split into shards (rag/store_shards.py) is listed shard by shard.
+Only one page of the listing is ever held in memory.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+from google.genai import types
+
+from security_chatbot.config import STORE_LIST_PAGE_SIZE
+from security_chatbot.rag.document_catalog import DocumentCatalog
+from security_chatbot.rag.store_manager import FileSearchStoreManager
+from security_chatbot.rag.upload_manifest import upload_manifest
+
+logger = logging.getLogger(__name__)
+
+
+def _iter_shard_pages(
+    store_name: str,
+    catalog: DocumentCatalog,
+    store_manager: FileSearchStoreManager,
+    page_size: int,
+) -> Iterator[list[types.Document]]:
+    """Store를 이루는 모든 shard의 문서 목록을 차례로 한 페이지씩 가져옵니다."""
+    for shard_name in catalog.list_shards(store_name):
+        yield from store_manager.iter_document_pages(shard_name, page_size)
+
+
+def reconcile_catalog(
+    store_name: str,
+    catalog: DocumentCatalog,
+    store_manager: FileSearchStoreManager | None = None,
+    page_size: int = STORE_LIST_PAGE_SIZE,
+    remove_missing: bool = True,
+) -> dict[str, Any]:
+    """Store의 실제 문서 목록과 카탈로그를 대조하여 카탈로그를 고칩니다.
+
+    여러 shard로 나뉜 Store는 모든 shard의 목록을 대조합니다.
+
+    페이지마다 카탈로그에 없는 문서를 바로 추가하므로, 중간에 실패해도 그때까지의
+    결과는 남습니다. 카탈로그에만 있는 문서는 목록을 끝까지 확인한 뒤에만 제거합니다
+    (목록이 중간에 끊기면 제거하지 않음). 대조 중에 업로드된 문서는 제거되지 않습니다.
+
+    Args:
+        store_name: File Search Store 리소스 이름
+        catalog: 고칠 문서 카탈로그
+        store_manager: 목록 조회에 사용할 FileSearchStoreManager (기본값: 새로 생성)
+        page_size: 목록 요청 한 번에 받을 문서 수
+        remove_missing: False이면 Store에 없는 카탈로그 항목을 남겨 둠
+
+    Returns:
+        Dict[str, Any]: listed(Store의 문서 수), added(추가한 문서 수),
+                        removed(제거한 코퍼스 파일 수), pages(요청한 페이지 수),
+                        elapsed_seconds
+
+    Raises:
+        GoogleAPIError: 목록 조회에 실패한 경우 (그때까지 추가한 문서는 유지)
+        TimeoutError: 페이지 요청이 시간 제한 안에 끝나지 않은 경우
+
+    """
+    store_manager = store_manager or FileSearchStoreManager()
+    started = time.time()
+    summary: dict[str, Any] = {"listed": 0, "added": 0, "removed": 0, "pages": 0}
+
+    for page in _iter_shard_pages(store_name, catalog, store_manager, page_size):
+        summary["pages"] += 1
+        summary["listed"] += len(page)
+        documents = {str(document.name): document for document in page}
+        for resource_name in catalog.mark_seen(store_name, list(documents), started):
+            document = documents[resource_name]
+            # 다른 문서와 같은 기준으로 정렬·표시되도록 현지 시각으로 기록
+            created = (
+                document.create_time.astimezone().replace(tzinfo=None)
+                if document.create_time
+                else datetime.now()
+            )
+            catalog.add(
+                store_name,
+                document.display_name or resource_name.rsplit("/", 1)[-1],
+                document.size_bytes or 0,
+                created.isoformat(),
+                [resource_name],
+            )
+            summary["added"] += 1
+
+    if remove_missing:
+        removed = catalog.remove_unseen(store_name, started)
+        # Store에서 사라진 문서로 중복 업로드가 연결되지 않도록 매니페스트에서도 제거
+        for resource_name in removed:
+            upload_manifest.forget_corpus_file(resource_name)
+        summary["removed"] = len(removed)
+
+    summary["elapsed_seconds"] = round(time.time() - started, 3)
+    logger.info(
+        f"문서 카탈로그 대조 완료: {store_name} (Store 문서 {summary['listed']}개, "
+        f"추가 {summary['added']}, 제거 {summary['removed']}, "
+        f"{summary['pages']}페이지, {summary['elapsed_seconds']}초)"
+    )
+    return summary
@@ -0,0 +1,485 @@
+"""SecurityChatbot Directory Sync
+
+로컬 디렉토리 트리를 File Search Store와 증분 동기화합니다.
+파일별 크기/수정 시각/SHA-256을 SQLite 동기화 매니페스트에 기록해 두고, 다음 실행에서는
+크기나 수정 시각이 바뀐 파일만 해시를 다시 계산합니다. 새로 생기거나 내용이 바뀐 파일만
+병렬로 업로드하고, 디렉토리에서 사라진 파일의 코퍼스 파일은 Store에서 삭제하므로
+수천 개 파일을 매일 다시 동기화해도 변경분만 API를 호출합니다.
+
+사용법:
+    security-chatbot sync ./policies --store fileSearchStores/xxx
+    python -m security_chatbot.rag.directory_sync ./policies --store fileSearchStores/xxx
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from security_chatbot.config import DIRECTORY_SYNC_DB_PATH
+from security_chatbot.rag.document_manager import (
+    DEFAULT_IMPORT_CONCURRENCY,
+    DEFAULT_UPLOAD_CONCURRENCY,
+    SUPPORTED_MIME_TYPES,
+    DocumentManager,
+    validate_path,
+)
+from security_chatbot.rag.operation_tracker import STATUS_FAILED
+from security_chatbot.rag.store_manager import FileSearchStoreManager
+
+logger = logging.getLogger(__name__)
+
+# 동시에 진행할 최대 코퍼스 파일 삭제 수
+DEFAULT_DELETE_CONCURRENCY = 4
+
+
+class SyncManifest:
+    """(Store, 동기화 루트, 상대 경로)별로 마지막으로 동기화한 파일 상태를 기록하는 클래스"""
+
+    def __init__(self, db_path: str = DIRECTORY_SYNC_DB_PATH):
+        """SyncManifest 초기화
+
+        Args:
+            db_path: SQLite 파일 경로 (":memory:"이면 메모리에만 저장)
+
+        """
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_state (
+                store_name TEXT NOT NULL,
+                root TEXT NOT NULL,
+                rel_path TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                corpus_file_name TEXT NOT NULL,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (store_name, root, rel_path)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def load(self, store_name: str, root: str) -> dict[str, dict[str, Any]]:
+        """동기화 루트의 모든 항목을 상대 경로별로 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rel_path, size_bytes, mtime_ns, sha256, corpus_file_name "
+                "FROM sync_state WHERE store_name = ? AND root = ?",
+                (store_name, root),
+            ).fetchall()
+        return {
+            rel_path: {
+                "size_bytes": size_bytes,
+                "mtime_ns": mtime_ns,
+                "sha256": sha256,
+                "corpus_file_name": corpus_file_name,
+            }
+            for rel_path, size_bytes, mtime_ns, sha256, corpus_file_name in rows
+        }
+
+    def record(
+        self,
+        store_name: str,
+        root: str,
+        rel_path: str,
+        size_bytes: int,
+        mtime_ns: int,
+        sha256: str,
+        corpus_file_name: str,
+    ) -> None:
+        """동기화가 끝난 파일의 상태를 기록합니다."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    store_name,
+                    root,
+                    rel_path,
+                    size_bytes,
+                    mtime_ns,
+                    sha256,
+                    str(corpus_file_name),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def forget(self, store_name: str, root: str, rel_path: str) -> None:
+        """삭제된 파일의 항목을 제거합니다."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM sync_state WHERE store_name = ? AND root = ? "
+                "AND rel_path = ?",
+                (store_name, root, rel_path),
+            )
+            self._conn.commit()
+
+    def is_referenced(self, store_name: str, corpus_file_name: str) -> bool:
+        """다른 파일(다른 동기화 루트 포함)이 아직 이 코퍼스 파일을 사용하는지 확인합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM sync_state WHERE store_name = ? "
+                "AND corpus_file_name = ? LIMIT 1",
+                (store_name, str(corpus_file_name)),
+            ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        """DB 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+
+def scan_directory(root: str) -> dict[str, os.stat_result]:
+    """디렉토리 트리에서 지원되는 형식의 파일을 찾습니다.
+
+    숨김 파일과 숨김 디렉토리(이름이 "."으로 시작)는 건너뜁니다.
+
+    Args:
+        root: 동기화할 디렉토리
+
+    Returns:
+        Dict[str, os.stat_result]: 루트 기준 상대 경로(POSIX 형식)별 stat 결과
+
+    """
+    files = {}
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(name for name in dir_names if not name.startswith("."))
+        for file_name in sorted(file_names):
+            if file_name.startswith("."):
+                continue
+            if Path(file_name).suffix.lower() not in SUPPORTED_MIME_TYPES:
+                continue
+            path = Path(dir_path) / file_name
+            rel_path = path.relative_to(root).as_posix()
+            files[rel_path] = path.stat()
+    return files
+
+
+def plan_sync(
+    root: str,
+    files: dict[str, os.stat_result],
+    previous: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """현재 디렉토리 상태와 매니페스트를 비교해 할 일을 정합니다.
+
+    크기와 수정 시각이 모두 같은 파일은 읽지 않고 변경 없음으로 봅니다.
+    둘 중 하나가 바뀐 파일만 validate_path()로 한 번 읽어 검증과 해시 계산을 함께 하며,
+    해시가 같으면(touch 등) 업로드 없이 매니페스트의 크기/수정 시각만 갱신합니다.
+    검증 결과는 캐시되므로 이어지는 업로드 단계는 파일을 다시 읽지 않습니다.
+
+    Args:
+        root: 동기화할 디렉토리
+        files: scan_directory() 결과
+        previous: SyncManifest.load() 결과
+
+    Returns:
+        Dict[str, Any]: upload(새 파일/변경된 파일), touch(내용은 같고 메타데이터만 바뀐 파일),
+                        delete(사라진 파일), invalid(검증 실패: rel_path, error),
+                        unchanged(변경 없는 파일 수). upload/touch 항목은 rel_path, size_bytes, mtime_ns, sha256,
+                        previous(이전 매니페스트 항목 또는 None)를 가짐
+
+    """
+    plan: dict[str, Any] = {
+        "upload": [],
+        "touch": [],
+        "delete": [],
+        "invalid": [],
+        "unchanged": 0,
+    }
+
+    for rel_path, stat in files.items():
+        entry = previous.get(rel_path)
+        if (
+            entry is not None
+            and entry["size_bytes"] == stat.st_size
+            and entry["mtime_ns"] == stat.st_mtime_ns
+        ):
+            plan["unchanged"] += 1
+            continue
+
+        try:
+            validation = validate_path(str(Path(root) / rel_path))
+        except ValueError as e:
+            plan["invalid"].append({"rel_path": rel_path, "error": str(e)})
+            continue
+
+        item = {
+            "rel_path": rel_path,
+            "size_bytes": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": validation["sha256"],
+            "previous": entry,
+        }
+        if entry is not None and entry["sha256"] == item["sha256"]:
+            plan["touch"].append(item)
+        else:
+            plan["upload"].append(item)
+
+    plan["delete"] = [
+        {"rel_path": rel_path, **entry}
+        for rel_path, entry in previous.items()
+        if rel_path not in files
+    ]
+    return plan
+
+
+def sync_directory(
+    root: str,
+    store_name: str,
+    manifest: SyncManifest,
+    document_manager: DocumentManager | None = None,
+    store_manager: FileSearchStoreManager | None = None,
+    upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    import_concurrency: int = DEFAULT_IMPORT_CONCURRENCY,
+    delete_concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+    delete_removed: bool = True,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """디렉토리 트리를 File Search Store와 증분 동기화합니다.
+
+    실패한 업로드와 삭제는 매니페스트에 반영하지 않으므로 다음 실행에서 다시 시도됩니다.
+    업로드한 파일은 인덱싱이 끝나기를 기다려 생성된 문서 이름으로 기록하며, 인덱싱에
+    실패한 파일도 업로드 실패처럼 다음 실행에서 다시 올립니다.
+    내용이 바뀐 파일은 새 버전이 등록된 뒤에 이전 코퍼스 파일을 삭제하며, 다른 파일이
+    같은 코퍼스 파일을 사용 중이면(내용이 같은 파일) 삭제하지 않습니다.
+
+    Args:
+        root: 동기화할 디렉토리
+        store_name: File Search Store 리소스 이름
+        manifest: 동기화 상태를 기록하는 매니페스트
+        document_manager: 업로드에 사용할 DocumentManager (기본값: 새로 생성)
+        store_manager: 삭제에 사용할 FileSearchStoreManager (기본값: 새로 생성)
+        upload_concurrency: 동시에 진행할 최대 files.upload 수
+        import_concurrency: 동시에 진행할 최대 import_file 수
+        delete_concurrency: 동시에 진행할 최대 코퍼스 파일 삭제 수
+        delete_removed: False이면 디렉토리에서 사라진 파일을 Store에 남겨 둠
+        dry_run: True이면 계획만 세우고 아무것도 변경하지 않음
+
+    Returns:
+        Dict[str, Any]: scanned, unchanged, uploaded, touched, deleted, failed(목록),
+                        elapsed_seconds. dry_run이면 plan도 포함
+
+    Raises:
+        ValueError: root가 디렉토리가 아닌 경우
+
+    """
+    if not Path(root).is_dir():
+        raise ValueError(f"디렉토리를 찾을 수 없습니다: {root}")
+
+    start = time.perf_counter()
+    root_key = str(Path(root).resolve())
+    files = scan_directory(root)
+    previous = manifest.load(store_name, root_key)
+    plan = plan_sync(root, files, previous)
+    if not delete_removed:
+        plan["delete"] = []
+
+    summary: dict[str, Any] = {
+        "scanned": len(files),
+        "unchanged": plan["unchanged"],
+        "uploaded": 0,
+        "touched": 0,
+        "deleted": 0,
+        "failed": [
+            {"rel_path": item["rel_path"], "action": "validate", "error": item["error"]}
+            for item in plan["invalid"]
+        ],
+    }
+    logger.info(
+        f"디렉토리 동기화 시작: {root} -> {store_name} (파일 {len(files)}개, "
+        f"업로드 {len(plan['upload'])}, 메타데이터 갱신 {len(plan['touch'])}, "
+        f"삭제 {len(plan['delete'])}, 변경 없음 {plan['unchanged']})"
+    )
+    if dry_run:
+        summary["plan"] = plan
+        summary["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+        return summary
+
+    for item in plan["touch"]:
+        manifest.record(
+            store_name,
+            root_key,
+            item["rel_path"],
+            item["size_bytes"],
+            item["mtime_ns"],
+            item["sha256"],
+            item["previous"]["corpus_file_name"],
+        )
+        summary["touched"] += 1
+
+    # 새 버전으로 대체되었거나 사라진 파일이 가리키던 코퍼스 파일 (삭제 후보)
+    stale: list[tuple[str, str]] = []
+
+    if plan["upload"]:
+        document_manager = document_manager or DocumentManager(store_name=store_name)
+        batch = document_manager.upload_files_batch(
+            [str(Path(root) / item["rel_path"]) for item in plan["upload"]],
+            upload_concurrency=upload_concurrency,
+            import_concurrency=import_concurrency,
+        )
+        failed_paths = {failure["file_path"]: failure for failure in batch["failed"]}
+        # 삭제와 Store 대조는 문서 이름으로 하므로 인덱싱이 끝난 이름을 기록
+        successes = iter(document_manager.resolve_documents(batch["success"]))
+        for item in plan["upload"]:
+            failure = failed_paths.get(str(Path(root) / item["rel_path"]))
+            if failure is not None:
+                summary["failed"].append(
+                    {
+                        "rel_path": item["rel_path"],
+                        "action": "upload",
+                        "error": failure["error"],
+                    }
+                )
+                continue
+            # upload_files_batch는 성공한 파일을 입력 순서대로 반환
+            result = next(successes)
+            if result["indexing"] == STATUS_FAILED:
+                summary["failed"].append(
+                    {
+                        "rel_path": item["rel_path"],
+                        "action": "index",
+                        "error": "문서 인덱싱 실패",
+                    }
+                )
+                continue
+            manifest.record(
+                store_name,
+                root_key,
+                item["rel_path"],
+                item["size_bytes"],
+                item["mtime_ns"],
+                item["sha256"],
+                str(result["corpus_file_name"]),
+            )
+            summary["uploaded"] += 1
+            old = item["previous"]
+            if old is not None and old["corpus_file_name"] != str(
+                result["corpus_file_name"]
+            ):
+                stale.append((item["rel_path"], old["corpus_file_name"]))
+
+    for item in plan["delete"]:
+        manifest.forget(store_name, root_key, item["rel_path"])
+        stale.append((item["rel_path"], item["corpus_file_name"]))
+
+    # 같은 코퍼스 파일을 여러 경로가 가리켰을 수 있으므로 한 번만, 더 이상 쓰이지 않을 때만 삭제
+    to_delete: dict[str, str] = {}
+    for rel_path, corpus_file_name in stale:
+        if not manifest.is_referenced(store_name, corpus_file_name):
+            to_delete.setdefault(corpus_file_name, rel_path)
+
+    if to_delete:
+        store_manager = store_manager or FileSearchStoreManager()
+        with ThreadPoolExecutor(
+            max_workers=delete_concurrency, thread_name_prefix="sync-delete"
+        ) as executor:
+            outcomes = executor.map(store_manager.delete_corpus_file, to_delete)
+            for (corpus_file_name, rel_path), deleted in zip(
+                to_delete.items(), outcomes
+            ):
+                if deleted:
+                    summary["deleted"] += 1
+                    continue
+                summary["failed"].append(
+                    {
+                        "rel_path": rel_path,
+                        "action": "delete",
+                        "error": f"코퍼스 파일 삭제 실패: {corpus_file_name}",
+                    }
+                )
+                # 다음 실행에서 다시 삭제를 시도하도록 항목을 되돌려 둠
+                if not (Path(root) / rel_path).exists():
+                    manifest.record(
+                        store_name,
+                        root_key,
+                        rel_path,
+                        -1,
+                        -1,
+                        "",
+                        corpus_file_name,
+                    )
+
+    summary["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+    logger.info(
+        f"디렉토리 동기화 완료: 업로드 {summary['uploaded']}, "
+        f"메타데이터 갱신 {summary['touched']}, 삭제 {summary['deleted']}, "
+        f"실패 {len(summary['failed'])} ({summary['elapsed_seconds']}초)"
+    )
+    return summary
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """sync 명령의 인자를 parser에 추가합니다."""
+    parser.add_argument("directory", help="동기화할 문서 디렉토리")
+    parser.add_argument("--store", required=True, help="File Search Store 리소스 이름")
+    parser.add_argument(
+        "--db", default=DIRECTORY_SYNC_DB_PATH, help="동기화 매니페스트 SQLite 파일"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_UPLOAD_CONCURRENCY,
+        help="동시에 진행할 최대 업로드 수",
+    )
+    parser.add_argument(
+        "--keep-removed",
+        action="store_true",
+        help="디렉토리에서 사라진 파일을 Store에서 삭제하지 않음",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="변경 계획만 출력하고 실행하지 않음"
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """파싱된 인자로 동기화를 실행하고 종료 코드를 반환합니다 (실패가 있으면 1)."""
+    manifest = SyncManifest(db_path=args.db)
+    try:
+        summary = sync_directory(
+            args.directory,
+            args.store,
+            manifest,
+            upload_concurrency=args.concurrency,
+            delete_removed=not args.keep_removed,
+            dry_run=args.dry_run,
+        )
+    finally:
+        manifest.close()
+
+    if args.dry_run:
+        plan = summary["plan"]
+        for label, key in (("업로드", "upload"), ("갱신", "touch"), ("삭제", "delete")):
+            for item in plan[key]:
+                print(f"[{label}] {item['rel_path']}")
+
+    for failure in summary["failed"]:
+        print(f"❌ [{failure['action']}] {failure['rel_path']}: {failure['error']}")
+    print(
+        f"\n완료: 파일 {summary['scanned']}, 업로드 {summary['uploaded']}, "
+        f"갱신 {summary['touched']}, 삭제 {summary['deleted']}, "
+        f"변경 없음 {summary['unchanged']}, 실패 {len(summary['failed'])}, "
+        f"{summary['elapsed_seconds']}초"
+    )
+    return 1 if summary["failed"] else 0
+
+
+def main() -> None:
+    """명령행에서 디렉토리 동기화 실행"""
+    parser = argparse.ArgumentParser(description="문서 디렉토리 증분 동기화")
+    add_arguments(parser)
+    raise SystemExit(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
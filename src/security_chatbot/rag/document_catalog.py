@@ -0,0 +1,550 @@
+"""Document catalog module
+
+A persistent, SQLite-backed catalog of the documents uploaded to each File
+Search Store. It replaces the per-session list of uploaded-file metadata so the
+document list survives browser refreshes and is shared by every session and
+replica that points at the same database file. Lookups by name, content hash and
+corpus file resource name (including the parts of split documents) go through
+indexes, so catalogs with tens of thousands of documents stay fast. Document
+lists are served a page at a time, sorted in SQL, and name search uses an FTS5
+trigram index (queries shorter than a trigram, such as two-syllable Korean
+terms, fall back to a substring match over the store's name index).
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from security_chatbot.config import DOCUMENT_CATALOG_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+_DOCUMENT_COLUMNS = "id, store_name, name, size_bytes, upload_date, sha256, split"
+_INSERT_PART = (
+    "INSERT OR REPLACE INTO document_parts "
+    "(resource_name, document_id, position, seen_at) VALUES (?, ?, ?, ?)"
+)
+
+# 문서 목록 정렬 기준 -> 정렬 열 (같은 값이면 id로 순서 고정)
+SORT_COLUMNS = {
+    "upload_date": "upload_date",
+    "name": "name COLLATE NOCASE",
+    "size": "size_bytes",
+}
+
+# 트라이그램 인덱스로 검색할 수 있는 최소 검색어 길이 (더 짧으면 LIKE 부분 문자열 검색)
+TRIGRAM_MIN_QUERY_LENGTH = 3
+
+
+class DocumentCatalog:
+    """Store별 업로드 문서 카탈로그 클래스
+
+    문서 하나는 documents 테이블의 행 하나이며, 문서를 이루는 코퍼스 파일(분할 업로드된
+    문서는 모든 조각)은 document_parts 테이블에 순서대로 기록됩니다. 코퍼스 파일 리소스
+    이름은 Store 안에서 유일하므로 조각 이름으로도 문서를 바로 찾을 수 있습니다.
+    """
+
+    def __init__(self, db_path: str = DOCUMENT_CATALOG_DB_PATH):
+        """DocumentCatalog 초기화
+
+        Args:
+            db_path: SQLite 파일 경로 (":memory:"이면 메모리에만 저장)
+
+        """
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # isolation_level=None: 여러 문장을 묶는 쓰기는 BEGIN IMMEDIATE로 직접 제어
+        self._conn = sqlite3.connect(
+            db_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS stores (
+                store_name TEXT PRIMARY KEY,
+                display_name TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_stores_display_name
+                ON stores (display_name, updated_at);
+            CREATE TABLE IF NOT EXISTS store_shards (
+                shard_name TEXT PRIMARY KEY,
+                store_name TEXT NOT NULL,
+                position INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_store_shards_store
+                ON store_shards (store_name, position);
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                store_name TEXT NOT NULL,
+                name TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                upload_date TEXT NOT NULL,
+                sha256 TEXT,
+                split INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_documents_name
+                ON documents (store_name, name);
+            CREATE INDEX IF NOT EXISTS idx_documents_sha256
+                ON documents (store_name, sha256);
+            CREATE TABLE IF NOT EXISTS document_parts (
+                resource_name TEXT PRIMARY KEY,
+                document_id INTEGER NOT NULL
+                    REFERENCES documents (id) ON DELETE CASCADE,
+                position INTEGER NOT NULL,
+                seen_at REAL NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_document_parts_document
+                ON document_parts (document_id, position);
+            CREATE INDEX IF NOT EXISTS idx_documents_name_nocase
+                ON documents (store_name, name COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_documents_upload_date
+                ON documents (store_name, upload_date);
+            CREATE INDEX IF NOT EXISTS idx_documents_size
+                ON documents (store_name, size_bytes);
+            """
+        )
+        columns = {
+            row["name"]
+            for row in self._conn.execute("PRAGMA table_info(document_parts)")
+        }
+        if "seen_at" not in columns:
+            # 이전 버전에서 만든 카탈로그에 Store 대조용 열 추가
+            self._conn.execute(
+                "ALTER TABLE document_parts ADD COLUMN seen_at REAL NOT NULL DEFAULT 0"
+            )
+        self._has_trigram_index = self._create_trigram_index()
+        logger.info(f"문서 카탈로그 사용: {db_path}")
+
+    def _create_trigram_index(self) -> bool:
+        """파일명 부분 문자열 검색용 FTS5 트라이그램 인덱스를 만듭니다.
+
+        SQLite가 trigram 토크나이저(3.34 이상)를 지원하지 않으면 False를 반환하며,
+        이때 검색은 LIKE로 처리됩니다.
+        """
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'documents_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            self._conn.executescript(
+                """
+                BEGIN;
+                CREATE VIRTUAL TABLE documents_fts USING fts5(
+                    name, content='documents', content_rowid='id',
+                    tokenize='trigram'
+                );
+                CREATE TRIGGER documents_fts_insert AFTER INSERT ON documents BEGIN
+                    INSERT INTO documents_fts (rowid, name) VALUES (new.id, new.name);
+                END;
+                CREATE TRIGGER documents_fts_delete AFTER DELETE ON documents BEGIN
+                    INSERT INTO documents_fts (documents_fts, rowid, name)
+                        VALUES ('delete', old.id, old.name);
+                END;
+                -- 인덱스 이전에 추가된 문서 반영
+                INSERT INTO documents_fts (documents_fts) VALUES ('rebuild');
+                COMMIT;
+                """
+            )
+        except sqlite3.OperationalError as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            logger.warning(f"트라이그램 검색 인덱스를 사용할 수 없어 LIKE 검색을 사용합니다: {e}")
+            return False
+        return True
+
+    # --- Store ---
+
+    def record_store(self, store_name: str, display_name: str) -> None:
+        """세션이 사용하는 Store를 기록합니다 (새로고침 후 같은 Store를 다시 열기 위해)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stores VALUES (?, ?, ?)",
+                (store_name, display_name, time.time()),
+            )
+
+    def latest_store(self, display_name: str) -> str | None:
+        """표시 이름이 같은 Store 중 가장 최근에 기록된 Store의 리소스 이름을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT store_name FROM stores WHERE display_name = ? "
+                "ORDER BY updated_at DESC LIMIT 1",
+                (display_name,),
+            ).fetchone()
+        return row["store_name"] if row else None
+
+    def store_display_name(self, store_name: str) -> str | None:
+        """기록된 Store의 표시 이름을 반환합니다 (기록되지 않은 Store면 None)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT display_name FROM stores WHERE store_name = ?", (store_name,)
+            ).fetchone()
+        return row["display_name"] if row else None
+
+    def forget_store(self, store_name: str) -> None:
+        """Store와 그 Store의 모든 문서, 추가 shard 기록을 카탈로그에서 제거합니다."""
+        with self._lock:
+            self._write(
+                ("DELETE FROM documents WHERE store_name = ?", (store_name,)),
+                ("DELETE FROM store_shards WHERE store_name = ?", (store_name,)),
+                ("DELETE FROM stores WHERE store_name = ?", (store_name,)),
+            )
+
+    def add_shard(self, store_name: str, shard_name: str) -> None:
+        """Store가 가득 차서 새로 만든 추가 shard Store를 기록합니다 (마지막 shard로 추가)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO store_shards VALUES (?, ?, "
+                "(SELECT COALESCE(MAX(position), 0) + 1 FROM store_shards "
+                "WHERE store_name = ?))",
+                (shard_name, store_name, store_name),
+            )
+
+    def list_shards(self, store_name: str) -> list[str]:
+        """Store를 이루는 모든 shard 리소스 이름을 반환합니다 (Store 자신이 첫 번째)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT shard_name FROM store_shards WHERE store_name = ? "
+                "ORDER BY position",
+                (store_name,),
+            ).fetchall()
+        return [store_name, *(row["shard_name"] for row in rows)]
+
+    # --- Document ---
+
+    def add(
+        self,
+        store_name: str,
+        name: str,
+        size_bytes: int,
+        upload_date: str,
+        resource_names: list[str],
+        sha256: str | None = None,
+        split: bool = False,
+    ) -> dict[str, Any]:
+        """문서를 카탈로그에 추가합니다.
+
+        Args:
+            store_name: File Search Store 리소스 이름
+            name: 문서(원본 파일) 이름
+            size_bytes: 원본 파일 크기 (바이트)
+            upload_date: 업로드 시각 (ISO 형식 문자열)
+            resource_names: 문서를 이루는 코퍼스 파일 리소스 이름 (조각 순서대로)
+            sha256: 원본 파일 내용의 SHA-256 (hex)
+            split: 크기 제한을 넘어 분할 업로드된 문서인지 여부
+
+        Returns:
+            Dict[str, Any]: 추가된 문서 (get()과 같은 형식)
+
+        Raises:
+            ValueError: resource_names가 비어 있는 경우
+
+        """
+        if not resource_names:
+            raise ValueError("문서에는 코퍼스 파일이 하나 이상 있어야 합니다.")
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "INSERT INTO documents (store_name, name, size_bytes, "
+                    "upload_date, sha256, split) VALUES (?, ?, ?, ?, ?, ?)",
+                    (store_name, name, size_bytes, upload_date, sha256, int(split)),
+                )
+                document_id = cursor.lastrowid
+                # 같은 코퍼스 파일을 가리키던 이전 항목이 있으면 새 문서로 옮김
+                previous = self._document_ids(resource_names)
+                now = time.time()
+                self._conn.executemany(
+                    _INSERT_PART,
+                    [
+                        (str(resource_name), document_id, position, now)
+                        for position, resource_name in enumerate(resource_names)
+                    ],
+                )
+                self._delete_orphans(previous)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self.get(document_id)
+
+    def get(self, document_id: int) -> dict[str, Any] | None:
+        """문서 ID로 문서를 조회합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_DOCUMENT_COLUMNS} FROM documents WHERE id = ?",
+                (document_id,),
+            ).fetchone()
+            return self._to_documents([row])[0] if row else None
+
+    def find_by_resource_name(
+        self, store_name: str, resource_name: str
+    ) -> dict[str, Any] | None:
+        """코퍼스 파일(또는 조각) 리소스 이름으로 문서를 찾습니다."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_DOCUMENT_COLUMNS} FROM documents WHERE store_name = ? "
+                "AND id = (SELECT document_id FROM document_parts "
+                "WHERE resource_name = ?)",
+                (store_name, str(resource_name)),
+            ).fetchone()
+            return self._to_documents([row])[0] if row else None
+
+    def find_by_sha256(self, store_name: str, sha256: str) -> dict[str, Any] | None:
+        """내용의 SHA-256이 같은 문서 중 가장 먼저 추가된 문서를 찾습니다."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_DOCUMENT_COLUMNS} FROM documents "
+                "WHERE store_name = ? AND sha256 = ? ORDER BY id LIMIT 1",
+                (store_name, sha256),
+            ).fetchone()
+            return self._to_documents([row])[0] if row else None
+
+    def list_documents(self, store_name: str) -> list[dict[str, Any]]:
+        """Store의 모든 문서를 추가된 순서대로 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_DOCUMENT_COLUMNS} FROM documents WHERE store_name = ? "
+                "ORDER BY id",
+                (store_name,),
+            ).fetchall()
+            return self._to_documents(rows)
+
+    def list_page(
+        self,
+        store_name: str,
+        query: str = "",
+        sort_by: str = "upload_date",
+        descending: bool = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """검색·정렬한 문서 목록의 한 페이지와 검색 결과 전체 수를 반환합니다.
+
+        파일명의 부분 문자열을 찾습니다 (대소문자 구분 없음). 검색어가
+        TRIGRAM_MIN_QUERY_LENGTH 이상이면 트라이그램 인덱스를, 더 짧으면(예: "정책"
+        같은 두 글자 한국어 검색어) Store의 파일명 인덱스만 훑는 LIKE 검색을 사용합니다.
+
+        Args:
+            store_name: File Search Store 리소스 이름
+            query: 파일명 검색어 (비어 있으면 전체)
+            sort_by: 정렬 기준 ("upload_date", "name", "size")
+            descending: True이면 내림차순
+            limit: 페이지 크기
+            offset: 건너뛸 문서 수
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: (페이지의 문서 목록, 검색 결과 전체 수)
+
+        Raises:
+            ValueError: 지원하지 않는 정렬 기준인 경우
+
+        """
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort_by}")
+        where, params = self._search_condition(store_name, query.strip())
+        direction = "DESC" if descending else "ASC"
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM documents WHERE {where}", params
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT {_DOCUMENT_COLUMNS} FROM documents WHERE {where} "
+                f"ORDER BY {SORT_COLUMNS[sort_by]} {direction}, id {direction} "
+                "LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+            return self._to_documents(rows), total
+
+    def _search_condition(self, store_name: str, query: str) -> tuple[str, tuple]:
+        """파일명 검색어에 맞는 WHERE 조건과 인자를 만듭니다."""
+        if not query:
+            return "store_name = ?", (store_name,)
+        if self._has_trigram_index and len(query) >= TRIGRAM_MIN_QUERY_LENGTH:
+            # 큰따옴표로 감싸 검색어 전체를 하나의 문자열로 검색
+            phrase = '"' + query.replace('"', '""') + '"'
+            return (
+                "store_name = ? AND id IN "
+                "(SELECT rowid FROM documents_fts WHERE documents_fts MATCH ?)",
+                (store_name, phrase),
+            )
+        # 트라이그램보다 짧은 검색어: (store_name, name) 인덱스 범위 안에서만 LIKE 검색
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        return "store_name = ? AND name LIKE ? ESCAPE '\\'", (store_name, pattern)
+
+    def count(self, store_name: str) -> int:
+        """Store의 문서 수를 반환합니다."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM documents WHERE store_name = ?", (store_name,)
+            ).fetchone()[0]
+
+    def set_resource_names(self, document_id: int, resource_names: list[str]) -> None:
+        """문서를 이루는 코퍼스 파일 목록을 바꿉니다 (일부 조각만 삭제된 경우 등)."""
+        with self._lock:
+            affected = self._document_ids(resource_names) | {document_id}
+            now = time.time()
+            self._write(
+                ("DELETE FROM document_parts WHERE document_id = ?", (document_id,)),
+                *(
+                    (_INSERT_PART, (str(resource_name), document_id, position, now))
+                    for position, resource_name in enumerate(resource_names)
+                ),
+                orphan_candidates=affected,
+            )
+
+    def remove(self, document_id: int) -> bool:
+        """문서 하나를 제거합니다."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM documents WHERE id = ?", (document_id,)
+            )
+            return cursor.rowcount > 0
+
+    def mark_seen(
+        self, store_name: str, resource_names: list[str], seen_at: float
+    ) -> list[str]:
+        """Store 목록에서 확인한 코퍼스 파일을 표시하고, 카탈로그에 없는 파일을 반환합니다.
+
+        Args:
+            store_name: File Search Store 리소스 이름
+            resource_names: Store 목록 한 페이지의 코퍼스 파일 리소스 이름
+            seen_at: 이번 대조를 시작한 시각 (remove_unseen에 같은 값을 전달)
+
+        Returns:
+            List[str]: 카탈로그에 없는 리소스 이름 (입력 순서 유지)
+
+        """
+        missing = []
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for resource_name in resource_names:
+                    cursor = self._conn.execute(
+                        "UPDATE document_parts SET seen_at = MAX(seen_at, ?) "
+                        "WHERE resource_name = ? AND document_id IN "
+                        "(SELECT id FROM documents WHERE store_name = ?)",
+                        (seen_at, str(resource_name), store_name),
+                    )
+                    if cursor.rowcount == 0:
+                        missing.append(str(resource_name))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return missing
+
+    def remove_unseen(self, store_name: str, since: float) -> list[str]:
+        """since 이후 Store 목록에서 확인되지도, 새로 추가되지도 않은 코퍼스 파일을 제거합니다.
+
+        코퍼스 파일이 모두 사라진 문서도 함께 제거되며, 대조 중에 업로드된 문서는
+        추가 시각이 since 이후이므로 제거되지 않습니다.
+
+        Returns:
+            List[str]: 제거된 코퍼스 파일 리소스 이름
+
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                stale = self._conn.execute(
+                    "SELECT resource_name, document_id FROM document_parts "
+                    "WHERE seen_at < ? AND document_id IN "
+                    "(SELECT id FROM documents WHERE store_name = ?)",
+                    (since, store_name),
+                ).fetchall()
+                self._conn.executemany(
+                    "DELETE FROM document_parts WHERE resource_name = ?",
+                    [(row["resource_name"],) for row in stale],
+                )
+                self._delete_orphans({row["document_id"] for row in stale})
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [row["resource_name"] for row in stale]
+
+    def clear_store(self, store_name: str) -> None:
+        """Store의 모든 문서를 제거합니다 (Store 기록은 유지)."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM documents WHERE store_name = ?", (store_name,)
+            )
+
+    def close(self) -> None:
+        """DB 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+    def _write(
+        self, *statements: tuple[str, tuple], orphan_candidates: set[int] | None = None
+    ) -> None:
+        """여러 쓰기 문장을 하나의 트랜잭션으로 실행합니다 (호출자가 _lock 보유)."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, params in statements:
+                self._conn.execute(sql, params)
+            self._delete_orphans(orphan_candidates or set())
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _document_ids(self, resource_names: list[str]) -> set[int]:
+        """코퍼스 파일들이 현재 속한 문서 ID를 반환합니다 (호출자가 _lock 보유)."""
+        ids: set[int] = set()
+        for resource_name in resource_names:
+            row = self._conn.execute(
+                "SELECT document_id FROM document_parts WHERE resource_name = ?",
+                (str(resource_name),),
+            ).fetchone()
+            if row:
+                ids.add(row[0])
+        return ids
+
+    def _delete_orphans(self, document_ids: set[int]) -> None:
+        """후보 문서 중 코퍼스 파일이 하나도 남지 않은 문서를 제거합니다 (트랜잭션 안에서 호출)."""
+        for document_id in document_ids:
+            self._conn.execute(
+                "DELETE FROM documents WHERE id = ? AND NOT EXISTS "
+                "(SELECT 1 FROM document_parts WHERE document_id = ?)",
+                (document_id, document_id),
+            )
+
+    def _to_documents(self, rows: list[sqlite3.Row]) -> list[dict[str, Any]]:
+        """문서 행에 조각 목록을 붙여 반환합니다 (호출자가 _lock 보유)."""
+        parts: dict[int, list[str]] = {row["id"]: [] for row in rows}
+        ids = list(parts)
+        # SQLite 변수 개수 제한을 넘지 않도록 나누어 조회
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for part in self._conn.execute(
+                "SELECT document_id, resource_name FROM document_parts "
+                f"WHERE document_id IN ({placeholders}) "
+                "ORDER BY document_id, position",
+                chunk,
+            ):
+                parts[part["document_id"]].append(part["resource_name"])
+        return [
+            {
+                "id": row["id"],
+                "store_name": row["store_name"],
+                "name": row["name"],
+                "size_bytes": row["size_bytes"],
+                "upload_date": row["upload_date"],
+                "sha256": row["sha256"],
+                "split": bool(row["split"]),
+                "resource_names": parts[row["id"]],
+            }
+            for row in rows
+        ]
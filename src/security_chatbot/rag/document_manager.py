@@ -1,26 +1,60 @@
 """Document upload and indexing management module for Google Gemini File Search API
 
 Handles file validation, upload to File Search Store, batch operations,
-and indexing management with chunking configuration.
+and indexing management with chunking configuration. AsyncDocumentManager does
+the work on the SDK's async client; DocumentManager is its synchronous wrapper.
 """
 
+import asyncio
+import hashlib
+import io
 import logging
+import os
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from stat import S_ISREG
+from typing import Any, BinaryIO
 
 from google import genai
 from google.api_core.exceptions import (
     GoogleAPIError,
     InternalServerError,
     InvalidArgument,
-    NotFound,
     PermissionDenied,
     ResourceExhausted,
     ServiceUnavailable,
 )
-
+from google.genai import errors as genai_errors
+from google.genai import types
+
+from security_chatbot.config import (
+    RESUMABLE_UPLOAD_THRESHOLD_BYTES,
+    SPLIT_OVERSIZED_DOCUMENTS,
+    SPLIT_PART_MAX_BYTES,
+    TEXT_EXTRACTION_ENABLED,
+    UPLOAD_TIMEOUT_SECONDS,
+)
+from security_chatbot.rag.answer_cache import answer_cache, store_name_from_resource
+from security_chatbot.rag.document_splitter import can_split, split_document
+from security_chatbot.rag.operation_tracker import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    OperationTracker,
+)
+from security_chatbot.rag.query_handler import extract_retry_delay
+from security_chatbot.rag.resumable_upload import ResumableUploader
+from security_chatbot.rag.store_manager import AsyncFileSearchStoreManager
+from security_chatbot.rag.text_extraction import text_extractor
+from security_chatbot.rag.upload_manifest import upload_manifest
 from security_chatbot.utils.api_client import GeminiClientManager
+from security_chatbot.utils.deadline import Deadline
+from security_chatbot.utils.event_loop import run_sync
+from security_chatbot.utils.rate_limiter import parse_duration, rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +70,25 @@ SUPPORTED_MIME_TYPES = {
 # 파일 크기 제한 (100MB)
 MAX_FILE_SIZE_BYTES = 100 * 1024 * 1024
 
+# 콘텐츠 해시 계산 시 한 번에 읽는 크기 (1MB)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 확장자와 실제 내용이 일치하는지 확인하는 파일 시그니처
+# (텍스트 형식은 고정된 시그니처가 없어, 이 시그니처나 NUL 바이트가 없는지로 확인)
+MAGIC_BYTES = {
+    ".pdf": (b"%PDF-",),
+    ".hwp": (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),  # OLE2 복합 문서
+    ".hwpx": (b"PK\x03\x04",),  # ZIP 컨테이너
+}
+
+# 텍스트 파일에 바이너리 내용(NUL 바이트)이 있는지 확인하는 앞부분 크기
+SNIFF_LENGTH = 8192
+# NUL 바이트가 있어도 텍스트로 인정하는 UTF-16 BOM
+UTF16_BOMS = (b"\xff\xfe", b"\xfe\xff")
+
+# 경로별 검증 결과 캐시의 최대 항목 수
+VALIDATION_CACHE_MAX_ENTRIES = 4096
+
 # 재시도 설정
 MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 1.0
@@ -45,13 +98,375 @@ MAX_RETRY_DELAY = 32.0
 DEFAULT_MAX_TOKENS_PER_CHUNK = 200
 DEFAULT_OVERLAP_TOKENS = 20
 
+# 파이프라인 배치 업로드의 단계별 동시 실행 수 (files.upload / import_file)
+DEFAULT_UPLOAD_CONCURRENCY = 4
+DEFAULT_IMPORT_CONCURRENCY = 2
 
-class DocumentManager:
-    """Google Gemini File Search Store에 문서를 업로드하고 관리하는 클래스
+
+class _MemoryviewReader(io.RawIOBase):
+    """memoryview를 복사하지 않고 읽는 seek 가능한 읽기 전용 스트림
+
+    files.upload는 seek 가능한 파일 객체를 요구하므로, 버퍼 전체를 bytes로
+    복사하는 대신 요청된 조각만 호출자 버퍼로 옮깁니다.
+    """
+
+    def __init__(self, view: memoryview):
+        """_MemoryviewReader 초기화
+
+        Args:
+            view: 읽을 버퍼
+
+        """
+        super().__init__()
+        self._view = view.cast("B") if view.format != "B" else view
+        self._position = 0
+
+    def readable(self) -> bool:
+        """읽기 가능 여부"""
+        return True
+
+    def seekable(self) -> bool:
+        """seek 가능 여부"""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """현재 위치부터 buffer 크기만큼 읽어 채웁니다."""
+        chunk = self._view[self._position : self._position + len(buffer)]
+        buffer[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """읽기 위치를 이동합니다."""
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self._view.nbytes + offset
+        else:
+            raise ValueError(f"지원되지 않는 whence 값입니다: {whence}")
+        self._position = max(self._position, 0)
+        return self._position
+
+    def tell(self) -> int:
+        """현재 읽기 위치"""
+        return self._position
+
+
+class ValidationCache:
+    """파일 경로별 검증 결과 캐시
+
+    같은 파일을 여러 단계(동기화 계획, 배치 업로드, 재시도 등)에서 검증할 때, 크기와
+    수정 시각(mtime)이 그대로면 파일을 다시 읽지 않고 이전 검증 결과를 재사용합니다.
+    """
+
+    def __init__(self, max_entries: int = VALIDATION_CACHE_MAX_ENTRIES):
+        """ValidationCache 초기화
+
+        Args:
+            max_entries: 보관할 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목 제거)
+
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[int, int, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, path: str, stat: os.stat_result) -> dict[str, Any] | None:
+        """크기와 수정 시각이 같을 때만 저장된 검증 결과를 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[:2] != (stat.st_size, stat.st_mtime_ns):
+                return None
+            self._entries.move_to_end(path)
+            return dict(entry[2])
+
+    def put(
+        self, path: str, stat: os.stat_result, validation: dict[str, Any]
+    ) -> None:
+        """검증 결과를 읽기 전 stat 기준으로 저장합니다."""
+        with self._lock:
+            self._entries[path] = (stat.st_size, stat.st_mtime_ns, dict(validation))
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+
+
+# 프로세스 전역에서 공유하는 파일 검증 결과 캐시
+validation_cache = ValidationCache()
+
+
+def sniff_mime_type(head: bytes) -> str | None:
+    """파일 앞부분의 시그니처로 실제 형식을 판별합니다 (알려진 바이너리 형식이 아니면 None)."""
+    for file_ext, signatures in MAGIC_BYTES.items():
+        if head.startswith(signatures):
+            return SUPPORTED_MIME_TYPES[file_ext]
+    return None
+
+
+def _check_size(file_size: int) -> None:
+    """파일 크기가 제한을 넘으면 ValueError를 발생시킵니다."""
+    if file_size > MAX_FILE_SIZE_BYTES:
+        raise ValueError(
+            f"파일 크기가 제한을 초과했습니다: {file_size / (1024*1024):.2f}MB > "
+            f"{MAX_FILE_SIZE_BYTES / (1024*1024):.0f}MB"
+        )
+
+
+def _mime_type_for(file_name: str) -> str:
+    """확장자로 MIME 타입을 판별하고, 지원하지 않는 형식이면 ValueError를 발생시킵니다."""
+    file_ext = Path(file_name).suffix.lower()
+    mime_type = SUPPORTED_MIME_TYPES.get(file_ext)
+
+    if not mime_type:
+        supported = ", ".join(SUPPORTED_MIME_TYPES.keys())
+        raise ValueError(
+            f"지원되지 않는 파일 형식입니다: {file_ext}\n" f"지원 형식: {supported}"
+        )
+    return mime_type
+
+
+def _check_content(file_name: str, head: bytes) -> None:
+    """파일 앞부분이 확장자가 나타내는 형식과 맞는지 확인합니다.
+
+    바이너리 형식은 시그니처를 확인하고, 텍스트 형식은 다른 문서 형식의 시그니처나
+    NUL 바이트가 없는지 확인합니다 (UTF-16 BOM으로 시작하는 텍스트는 허용).
+    """
+    file_ext = Path(file_name).suffix.lower()
+    signatures = MAGIC_BYTES.get(file_ext)
+    if signatures:
+        if not head.startswith(signatures):
+            detected = sniff_mime_type(head)
+            raise ValueError(
+                f"파일 내용이 형식과 일치하지 않습니다: {file_name} ({file_ext}"
+                + (f", 실제 형식: {detected})" if detected else ")")
+            )
+        return
+
+    detected = sniff_mime_type(head)
+    if detected:
+        raise ValueError(
+            f"파일 내용이 형식과 일치하지 않습니다: {file_name} "
+            f"({file_ext}, 실제 형식: {detected})"
+        )
+    if b"\x00" in head and not head.startswith(UTF16_BOMS):
+        raise ValueError(f"텍스트 파일이 아닙니다 (바이너리 내용): {file_name}")
+
+
+def _scan(read: Callable[[int], bytes], file_name: str) -> dict[str, Any]:
+    """내용을 HASH_CHUNK_SIZE 블록으로 한 번만 읽으며 크기, SHA-256, 형식을 함께 검증합니다.
+
+    첫 블록에서 형식을 확인하고, 읽는 동안 크기 제한을 넘으면 바로 중단합니다.
+
+    Args:
+        read: 최대 n바이트를 읽는 함수 (끝이면 빈 값 반환)
+        file_name: 원본 파일 이름 (확장자로 형식 판별)
+
+    Returns:
+        검증 결과 딕셔너리 (valid, file_size, mime_type, file_name, sha256)
+
+    """
+    mime_type = _mime_type_for(file_name)
+    digest = hashlib.sha256()
+    file_size = 0
+    checked = False
+
+    while True:
+        block = read(HASH_CHUNK_SIZE)
+        if not block:
+            break
+        if not checked:
+            _check_content(file_name, bytes(block[:SNIFF_LENGTH]))
+            checked = True
+        file_size += len(block)
+        _check_size(file_size)
+        digest.update(block)
+
+    if not checked:
+        _check_content(file_name, b"")
+
+    return {
+        "valid": True,
+        "file_size": file_size,
+        "mime_type": mime_type,
+        "file_name": Path(file_name).name,
+        "sha256": digest.hexdigest(),
+    }
+
+
+def validate_path(file_path: str) -> dict[str, Any]:
+    """파일을 한 번 읽어 검증하고, 결과를 validation_cache에 보관합니다.
+
+    크기와 수정 시각이 같은 파일을 다시 검증하면 stat 한 번으로 캐시된 결과를 반환합니다.
+
+    Args:
+        file_path: 검증할 파일의 경로
+
+    Returns:
+        검증 결과 딕셔너리 (valid, file_size, mime_type, file_name, sha256)
+
+    Raises:
+        ValueError: 파일이 없거나, 크기가 초과하거나, 지원되지 않는 형식이거나,
+            내용이 확장자와 맞지 않는 경우
+
+    """
+    key = os.path.abspath(file_path)
+    try:
+        stat = os.stat(key)
+    except FileNotFoundError:
+        raise ValueError(f"파일을 찾을 수 없습니다: {file_path}") from None
+    if not S_ISREG(stat.st_mode):
+        raise ValueError(f"올바른 파일이 아닙니다: {file_path}")
+
+    cached = validation_cache.get(key, stat)
+    if cached is not None:
+        return cached
+
+    file_name = Path(file_path).name
+    # 읽기 전에 stat 크기로 먼저 확인하여 제한을 넘는 파일은 읽지 않음
+    _mime_type_for(file_name)
+    _check_size(stat.st_size)
+    with open(key, "rb") as f:
+        validation = _scan(f.read, file_name)
+
+    logger.info(
+        f"파일 검증 성공: {file_name} "
+        f"({validation['file_size'] / 1024:.2f}KB, {validation['mime_type']})"
+    )
+    validation_cache.put(key, stat, validation)
+    return validation
+
+
+def _is_retryable(error: Exception) -> bool:
+    """일시적인 서버 오류(5xx)나 할당량 초과(429)처럼 재시도할 만한 오류인지 확인합니다.
+
+    SDK 호출과 재개 가능 업로드는 genai.errors를 발생시키며,
+    google.api_core 예외도 같은 기준으로 처리합니다.
+    """
+    if isinstance(error, genai_errors.ServerError):
+        return True
+    if isinstance(error, genai_errors.ClientError):
+        return error.code == 429
+    return isinstance(
+        error, (InternalServerError, ServiceUnavailable, ResourceExhausted)
+    )
+
+
+def _pause_on_quota_error(error: Exception, delay: float) -> float:
+    """할당량 초과(429)이면 레이트 리미터 전체를 멈추고 재시도 전 대기 시간을 반환합니다.
+
+    할당량은 다른 호출도 같이 쓰므로 리미터 전체를 멈추며, 서버가 RetryInfo로
+    권장한 대기 시간이 있으면 그 시간을, 없으면 백오프 대기 시간(delay)을 사용합니다.
+
+    Returns:
+        float: 재시도 전에 기다릴 시간 (초, delay 이상)
+    """
+    if isinstance(error, genai_errors.ClientError) and error.code == 429:
+        retry_delay = parse_duration(extract_retry_delay(error))
+        pause = retry_delay if retry_delay is not None else delay
+    elif isinstance(error, ResourceExhausted):
+        pause = delay
+    else:
+        return delay
+    rate_limiter.pause(pause)
+    return max(delay, pause)
+
+
+def _upload_entries(result: dict[str, Any]) -> list[dict[str, Any]]:
+    """업로드 결과의 코퍼스 파일 항목 (분할 업로드면 조각별 결과)"""
+    return result["parts"] if result.get("split") else [result]
+
+
+def _record_document_name(operation_name: str, document_name: str) -> None:
+    """import Operation 이름으로 기록한 코퍼스 파일을 생성된 문서 이름으로 바꿉니다."""
+    upload_manifest.rename_corpus_file(operation_name, document_name)
+    # 문서가 검색 가능해졌으므로 import 시작 후 캐시된 답변도 무효화
+    store_name = store_name_from_resource(document_name)
+    if store_name:
+        answer_cache.record_corpus_change(store_name, document_name)
+
+
+def apply_indexing_results(
+    results: list[dict[str, Any]], tracker: OperationTracker
+) -> list[dict[str, Any]]:
+    """인덱싱이 끝난 업로드 결과의 corpus_file_name을 생성된 문서 이름으로 바꿉니다.
+
+    import_file은 Operation을 반환하므로 업로드 직후의 corpus_file_name은 import
+    Operation 이름입니다. tracker에서 끝난 Operation은 응답의 문서 리소스 이름
+    (documents.list/documents.delete가 쓰는 이름)으로 결과와 업로드 매니페스트를
+    바꾸고, 인덱싱에 실패한 업로드는 다시 올릴 수 있도록 매니페스트에서 제거합니다.
+
+    각 결과에는 indexing(STATUS_DONE, STATUS_FAILED, STATUS_PENDING)이 추가됩니다.
+    분할 업로드는 조각 하나라도 실패하면 실패, 끝나지 않은 조각이 있으면 pending이며,
+    중복으로 건너뛴 결과가 아직 추적 중인 Operation을 가리키면 그 결과를 따릅니다.
+
+    Args:
+        results: upload_file/upload_stream/upload_files_batch의 성공 결과 리스트
+            (제자리에서 수정)
+        tracker: 결과의 import Operation을 추적한 OperationTracker
+
+    Returns:
+        List[Dict[str, Any]]: 수정한 results
+
+    """
+    recorded: set[str] = set()
+    for result in results:
+        entries = _upload_entries(result)
+        states = []
+        for entry in entries:
+            status = tracker.get_status(str(entry["corpus_file_name"]))
+            if status is None:
+                # 이미 문서 이름을 가리키는 결과 (기존 문서를 재사용한 중복 등)
+                states.append(STATUS_DONE)
+                continue
+            states.append(status["status"])
+            if status["status"] == STATUS_FAILED and status["name"] not in recorded:
+                upload_manifest.forget_corpus_file(status["name"])
+            elif status["status"] == STATUS_DONE and status["document_name"]:
+                if status["name"] not in recorded:
+                    _record_document_name(status["name"], status["document_name"])
+                entry["corpus_file_name"] = status["document_name"]
+            recorded.add(status["name"])
+
+        if STATUS_FAILED in states:
+            result["indexing"] = STATUS_FAILED
+        elif STATUS_PENDING in states:
+            result["indexing"] = STATUS_PENDING
+        else:
+            result["indexing"] = STATUS_DONE
+        if result.get("split"):
+            result["corpus_file_names"] = [
+                str(entry["corpus_file_name"]) for entry in entries
+            ]
+            result["corpus_file_name"] = result["corpus_file_names"][0]
+    return results
+
+
+class AsyncDocumentManager:
+    """Google Gemini File Search Store에 문서를 업로드하고 관리하는 클래스 (asyncio)
 
     파일 유효성 검증, 단일/배치 업로드, 청킹 설정, 재시도 로직을 제공합니다.
+    Gemini 호출은 SDK의 비동기 클라이언트(client.aio)로 하고 파일 검증, 텍스트 추출,
+    문서 분할, 재개 가능 업로드처럼 막히는 작업은 작업자 스레드에서 실행하므로,
+    하나의 이벤트 루프에서 여러 업로드를 동시에 진행할 수 있습니다.
+    동기 코드에서는 DocumentManager를 사용합니다.
     """
 
+    # 대용량 파일의 청크 업로드를 담당 (인스턴스별로 교체 가능)
+    resumable_uploader = ResumableUploader()
+    # 업로드 전 텍스트 추출 여부와 추출기 (인스턴스별로 교체 가능)
+    extract_text = TEXT_EXTRACTION_ENABLED
+    text_extractor = text_extractor
+    # 크기 제한을 넘는 문서를 조각으로 나누어 올릴지 여부 (인스턴스별로 교체 가능)
+    split_oversized = SPLIT_OVERSIZED_DOCUMENTS
+
     def __init__(
         self,
         store_name: str,
@@ -59,11 +474,11 @@ class DocumentManager:
         max_tokens_per_chunk: int = DEFAULT_MAX_TOKENS_PER_CHUNK,
         overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
     ):
-        """DocumentManager 초기화
+        """AsyncDocumentManager 초기화
 
         Args:
             store_name: File Search Store의 전체 리소스 이름
-            client: 초기화된 Gemini API 클라이언트. None이면 새로 생성
+            client: 초기화된 Gemini API 클라이언트 (client.aio로 호출). None이면 새로 생성
             max_tokens_per_chunk: 청크당 최대 토큰 수 (기본값: 200, 최대: 2043)
             overlap_tokens: 청크 간 오버랩 토큰 수 (기본값: 20)
 
@@ -90,64 +505,280 @@ class DocumentManager:
         self.overlap_tokens = overlap_tokens
 
         logger.info(
-            f"DocumentManager 초기화 완료: store={store_name}, "
+            f"{type(self).__name__} 초기화 완료: store={store_name}, "
             f"chunk_size={max_tokens_per_chunk}, overlap={overlap_tokens}"
         )
 
     def validate_file(self, file_path: str) -> dict[str, Any]:
-        """파일 유효성 검증 (파일 형식, 크기)
+        """파일 유효성 검증 (형식, 크기, 시그니처) 및 콘텐츠 해시 계산
+
+        파일을 고정 크기 블록으로 한 번만 읽으며 크기, SHA-256, 시그니처 검사를 함께 수행합니다.
+        같은 파일(크기와 수정 시각이 같은 경우)을 다시 검증하면 파일을 읽지 않고
+        캐시된 검증 결과를 재사용합니다 (validate_path 참고).
 
         Args:
             file_path: 검증할 파일의 경로
 
         Returns:
-            검증 결과 딕셔너리 (valid, file_size, mime_type, file_name)
+            검증 결과 딕셔너리 (valid, file_size, mime_type, file_name, sha256)
+            - sha256: 파일 내용의 SHA-256 (중복 업로드 판별용)
 
         Raises:
-            ValueError: 파일이 존재하지 않거나, 크기가 초과하거나, 지원되지 않는 형식인 경우
+            ValueError: 파일이 존재하지 않거나, 크기가 초과하거나, 지원되지 않는 형식이거나,
+                내용이 확장자와 맞지 않는 경우
 
         """
-        path = Path(file_path)
+        return validate_path(file_path)
 
-        if not path.exists():
-            raise ValueError(f"파일을 찾을 수 없습니다: {file_path}")
+    def validate_stream(
+        self, source: BinaryIO | memoryview, file_name: str
+    ) -> dict[str, Any]:
+        """메모리 버퍼나 파일 객체의 유효성 검증 (형식, 크기, 시그니처) 및 콘텐츠 해시 계산
 
-        if not path.is_file():
-            raise ValueError(f"올바른 파일이 아닙니다: {file_path}")
+        디스크에 쓰지 않고 버퍼를 한 번만 읽으며 크기, SHA-256, 시그니처 검사를 함께 수행합니다.
+        파일 객체는 검증 후 처음 위치로 되돌려 놓습니다.
 
-        file_size = path.stat().st_size
-        if file_size > MAX_FILE_SIZE_BYTES:
-            raise ValueError(
-                f"파일 크기가 제한을 초과했습니다: {file_size / (1024*1024):.2f}MB > "
-                f"{MAX_FILE_SIZE_BYTES / (1024*1024):.0f}MB"
-            )
+        Args:
+            source: 검증할 내용 (seek 가능한 바이너리 파일 객체 또는 memoryview)
+            file_name: 원본 파일 이름 (확장자로 형식 판별)
 
-        file_ext = path.suffix.lower()
-        mime_type = SUPPORTED_MIME_TYPES.get(file_ext)
+        Returns:
+            검증 결과 딕셔너리 (validate_file과 동일: valid, file_size, mime_type, file_name, sha256)
 
-        if not mime_type:
-            supported = ", ".join(SUPPORTED_MIME_TYPES.keys())
-            raise ValueError(
-                f"지원되지 않는 파일 형식입니다: {file_ext}\n" f"지원 형식: {supported}"
-            )
+        Raises:
+            ValueError: 크기가 초과하거나, 지원되지 않는 형식이거나, 내용이 확장자와 맞지 않는 경우
+
+        """
+        if isinstance(source, memoryview):
+            view = source.cast("B") if source.format != "B" else source
+            _mime_type_for(file_name)
+            _check_size(view.nbytes)
+            offset = 0
+
+            def _read(size: int) -> memoryview:
+                # memoryview 조각은 복사 없이 그대로 해시에 전달
+                nonlocal offset
+                block = view[offset : offset + size]
+                offset += len(block)
+                return block
+
+            validation = _scan(_read, file_name)
+        else:
+            source.seek(0)
+            try:
+                validation = _scan(source.read, file_name)
+            finally:
+                source.seek(0)
+
+        logger.info(
+            f"스트림 검증 성공: {file_name} "
+            f"({validation['file_size'] / 1024:.2f}KB, {validation['mime_type']})"
+        )
+        return validation
+
+    def _find_duplicate(self, validation: dict[str, Any]) -> dict[str, Any] | None:
+        """같은 내용의 파일이 이미 이 Store에 있으면 재사용 결과를 반환합니다."""
+        entry = upload_manifest.lookup(self.store_name, validation["sha256"])
+        if entry is None:
+            return None
+        return self._relink(validation, entry["corpus_file_name"], entry["file_name"])
 
+    def _relink(
+        self,
+        validation: dict[str, Any],
+        corpus_file_name: str,
+        existing_file_name: str,
+    ) -> dict[str, Any]:
+        """업로드를 건너뛰고 기존 코퍼스 파일을 가리키는 결과를 만듭니다."""
+        upload_manifest.record_duplicate(validation["file_size"])
         logger.info(
-            f"파일 검증 성공: {path.name} " f"({file_size / 1024:.2f}KB, {mime_type})"
+            f"중복 파일 업로드 생략: {validation['file_name']} "
+            f"(기존 문서: {existing_file_name}, corpus_file={corpus_file_name})"
+        )
+        return {
+            "file": None,
+            "corpus_file": None,
+            "corpus_file_name": corpus_file_name,
+            "sha256": validation["sha256"],
+            "deduplicated": True,
+            "duplicate_of": existing_file_name,
+            "bytes_saved": validation["file_size"],
+        }
+
+    def _record_upload(self, validation: dict[str, Any], corpus_file_name: str) -> None:
+        """업로드가 완료된 파일의 해시를 매니페스트에 기록합니다."""
+        upload_manifest.record(
+            self.store_name,
+            validation["sha256"],
+            corpus_file_name,
+            validation["file_name"],
+            validation["file_size"],
         )
 
+    def _chunking_config(self) -> dict[str, Any]:
+        """import_file에 전달할 청킹 설정을 생성합니다."""
         return {
-            "valid": True,
-            "file_size": file_size,
-            "mime_type": mime_type,
-            "file_name": path.name,
+            "white_space_config": {
+                "max_tokens_per_chunk": self.max_tokens_per_chunk,
+                "max_overlap_tokens": self.overlap_tokens,
+            }
+        }
+
+    def _needs_split(self, file_size: int, file_name: str) -> bool:
+        """크기 제한을 넘어 조각으로 나누어 올려야 하는 문서인지 확인합니다."""
+        return (
+            self.split_oversized
+            and file_size > MAX_FILE_SIZE_BYTES
+            and can_split(file_name)
+        )
+
+    async def _upload_split(
+        self, source: str | BinaryIO, file_name: str
+    ) -> dict[str, Any]:
+        """크기 제한을 넘는 문서를 조각으로 나누어 동시에 업로드합니다.
+
+        조각은 임시 디렉토리에 쓰고 upload_files_batch 파이프라인으로 올립니다.
+        조각 하나라도 실패하면 이미 올라간 조각을 삭제하여 문서 일부만 남지 않게 하며,
+        삭제하지 못한 조각이 있으면 오류 메시지에 그 리소스 이름을 함께 알립니다.
+
+        Returns:
+            업로드 결과 딕셔너리 (upload_file과 같은 키에 split, parts, corpus_file_names 추가)
+            - corpus_file_name: 첫 조각의 CorpusFile 리소스 이름
+            - corpus_file_names: 모든 조각의 CorpusFile 리소스 이름 (삭제 시 사용)
+            - parts: upload_files_batch의 조각별 성공 결과
+
+        Raises:
+            ValueError: 분할할 수 없는 경우 (한 페이지가 조각 크기보다 큰 경우 등)
+            GoogleAPIError: 조각 업로드 실패
+
+        """
+        max_part_bytes = min(SPLIT_PART_MAX_BYTES, MAX_FILE_SIZE_BYTES)
+        with tempfile.TemporaryDirectory(prefix="split-upload-") as part_dir:
+            part_paths = await asyncio.to_thread(
+                split_document, source, file_name, part_dir, max_part_bytes
+            )
+            batch = await self.upload_files_batch(part_paths)
+
+        if batch["failed"]:
+            leftover = await self._discard_parts(batch["success"])
+            errors = "; ".join(
+                f"{Path(failure['file_path']).name}: {failure['error']}"
+                for failure in batch["failed"]
+            )
+            message = (
+                f"분할 업로드 실패 ({len(batch['failed'])}/{batch['total']}개 조각): "
+                f"{errors}"
+            )
+            if leftover:
+                message += (
+                    f" (이미 등록된 조각 {len(leftover)}개를 삭제하지 못해 Store에 남아 "
+                    f"있습니다: {', '.join(leftover)})"
+                )
+            raise GoogleAPIError(message)
+
+        parts = batch["success"]
+        logger.info(
+            f"분할 업로드 성공: {file_name} ({len(parts)}개 조각) -> {self.store_name}"
+        )
+        return {
+            "file": None,
+            "corpus_file": None,
+            "corpus_file_name": parts[0]["corpus_file_name"],
+            "corpus_file_names": [str(part["corpus_file_name"]) for part in parts],
+            "parts": parts,
+            "split": True,
+            "sha256": None,
+            "deduplicated": False,
+            "original_bytes": batch["original_bytes"],
+            "uploaded_bytes": batch["uploaded_bytes"],
+            "text_extracted": any(part.get("text_extracted") for part in parts),
+        }
+
+    async def _discard_parts(self, parts: list[dict[str, Any]]) -> list[str]:
+        """실패한 분할 업로드에서 이미 등록된 조각을 삭제합니다.
+
+        중복으로 재사용한 기존 CorpusFile은 다른 문서의 것이므로 삭제하지 않습니다.
+
+        Returns:
+            삭제하지 못해 Store에 남은 조각의 리소스 이름 리스트
+        """
+        uploaded = [part for part in parts if not part.get("deduplicated")]
+        # 삭제는 문서 이름으로만 가능하므로 조각의 인덱싱이 끝나기를 기다림
+        # (인덱싱에 실패한 조각은 Store에 문서가 생기지 않아 삭제할 것이 없음)
+        await self.resolve_documents(uploaded)
+        store_manager = AsyncFileSearchStoreManager(client=self.client)
+        leftover = [
+            str(part["corpus_file_name"])
+            for part in uploaded
+            if part["indexing"] != STATUS_FAILED
+            and (
+                part["indexing"] == STATUS_PENDING
+                or not await store_manager.delete_corpus_file(
+                    str(part["corpus_file_name"])
+                )
+            )
+        ]
+        if leftover:
+            logger.error(
+                f"분할 업로드 롤백 실패: 조각 {len(leftover)}개가 Store에 남아 있습니다 "
+                f"({', '.join(leftover)})"
+            )
+        return leftover
+
+    def _prepare_upload(
+        self, source: str | BinaryIO, validation: dict[str, Any]
+    ) -> tuple[str | BinaryIO, dict[str, Any], dict[str, Any]]:
+        """업로드할 내용을 정합니다 (텍스트 추출이 켜져 있으면 추출한 텍스트).
+
+        추출한 텍스트가 원본보다 작을 때만 text/plain으로 바꿔 올리며, 추출할 수 없는
+        형식이나 텍스트 레이어가 없는 문서는 원본을 그대로 올립니다.
+        중복 판별과 매니페스트 기록은 계속 원본 내용의 해시를 기준으로 합니다.
+
+        Returns:
+            (업로드할 source, 업로드용 검증 결과, 크기 보고서) 튜플
+            - 크기 보고서: original_bytes, uploaded_bytes, text_extracted
+        """
+        report = {
+            "original_bytes": validation["file_size"],
+            "uploaded_bytes": validation["file_size"],
+            "text_extracted": False,
         }
+        if not self.extract_text:
+            return source, validation, report
+
+        text = self.text_extractor.extract(source, validation["file_name"])
+        if not text:
+            return source, validation, report
+        data = text.encode("utf-8")
+        if len(data) >= validation["file_size"]:
+            return source, validation, report
+
+        report["uploaded_bytes"] = len(data)
+        report["text_extracted"] = True
+        logger.info(
+            f"텍스트 추출: {validation['file_name']} "
+            f"{validation['file_size'] / 1024:.2f}KB -> {len(data) / 1024:.2f}KB "
+            f"({len(data) / validation['file_size']:.1%})"
+        )
+        upload_validation = {
+            **validation,
+            "file_size": len(data),
+            "mime_type": SUPPORTED_MIME_TYPES[".txt"],
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+        return io.BytesIO(data), upload_validation, report
 
-    def _retry_with_backoff(self, func, *args, **kwargs):
+    async def _retry_with_backoff(
+        self, func, *args, deadline: Deadline | None = None, **kwargs
+    ):
         """Exponential backoff을 사용한 재시도 로직
 
         Args:
-            func: 실행할 함수
+            func: 실행할 코루틴 함수 (시도마다 새로 호출)
             *args: 함수에 전달할 위치 인자
+            deadline: 모든 시도와 대기에 적용할 전체 시간 예산 (없으면 제한 없음).
+                각 시도는 남은 예산이 끝나면 취소되며,
+                백오프 대기 후 예산이 남지 않으면 재시도하지 않습니다.
             **kwargs: 함수에 전달할 키워드 인자
 
         Returns:
@@ -161,26 +792,98 @@ class DocumentManager:
         last_exception = None
 
         for attempt in range(MAX_RETRIES):
+            # 모든 시도는 프로세스 전역 호출 한도(RPM) 안에서 실행
+            await rate_limiter.acquire_async(
+                max_wait=deadline.remaining() if deadline else None
+            )
             try:
-                return func(*args, **kwargs)
-            except (InternalServerError, ServiceUnavailable, ResourceExhausted) as e:
+                if deadline is not None:
+                    return await deadline.run_async(func(*args, **kwargs))
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if not _is_retryable(e):
+                    logger.error(f"재시도 불가능한 에러 발생: {e}")
+                    raise
                 last_exception = e
+                wait = _pause_on_quota_error(e, delay)
+                if deadline is not None and not deadline.allows(wait):
+                    logger.error(f"남은 시간 예산 안에 재시도할 수 없어 중단: {e}")
+                    raise
                 if attempt < MAX_RETRIES - 1:
                     logger.warning(
                         f"API 호출 실패 (시도 {attempt + 1}/{MAX_RETRIES}): {e}. "
-                        f"{delay:.1f}초 후 재시도..."
+                        f"{wait:.1f}초 후 재시도..."
                     )
-                    time.sleep(delay)
+                    await asyncio.sleep(wait)
                     delay = min(delay * 2, MAX_RETRY_DELAY)
                 else:
                     logger.error(f"최대 재시도 횟수 도달. 실패: {e}")
-            except Exception as e:
-                logger.error(f"재시도 불가능한 에러 발생: {e}")
-                raise
 
         raise last_exception
 
-    def upload_file(
+    async def _upload_stage(
+        self,
+        source: str | BinaryIO,
+        validation: dict[str, Any],
+        display_name: str,
+        deadline: Deadline,
+    ) -> types.File:
+        """파일을 Files API에 업로드합니다 (업로드 1단계).
+
+        source가 경로면 파일을 열어 보내고, 파일 객체면 재시도마다 처음으로 되돌려 그대로 보냅니다.
+        RESUMABLE_UPLOAD_THRESHOLD_BYTES 이상인 파일은 청크 단위로 보내며,
+        연결이 끊기면 처음부터 다시 보내지 않고 서버가 받은 위치부터 이어서 전송합니다
+        (재개 가능 업로드는 작업자 스레드에서 실행).
+        """
+        if 0 < RESUMABLE_UPLOAD_THRESHOLD_BYTES <= validation["file_size"]:
+            await rate_limiter.acquire_async(max_wait=deadline.remaining())
+            return await asyncio.to_thread(
+                self.resumable_uploader.upload,
+                source,
+                validation,
+                display_name,
+                deadline,
+            )
+
+        async def _send(f: BinaryIO) -> types.File:
+            return await self.client.aio.files.upload(
+                file=f,
+                config={
+                    "display_name": display_name,
+                    "mime_type": validation["mime_type"],
+                    "http_options": deadline.http_options(),
+                },
+            )
+
+        async def _upload():
+            if isinstance(source, str):
+                with open(source, "rb") as f:
+                    return await _send(f)
+            source.seek(0)
+            return await _send(source)
+
+        return await self._retry_with_backoff(_upload, deadline=deadline)
+
+    async def _import_stage(self, uploaded_file: types.File, deadline: Deadline) -> Any:
+        """업로드된 파일을 File Search Store에 등록(import)합니다 (업로드 2단계)."""
+        chunking_config = self._chunking_config()
+
+        async def _add_to_store():
+            return await self.client.aio.file_search_stores.import_file(
+                file_search_store_name=self.store_name,
+                file_name=uploaded_file.name,
+                config={
+                    "chunking_config": chunking_config,
+                    "http_options": deadline.http_options(),
+                },
+            )
+
+        corpus_file = await self._retry_with_backoff(_add_to_store, deadline=deadline)
+        # 문서 집합이 바뀌었으므로 이 Store의 캐시된 답변을 무효화
+        answer_cache.record_corpus_change(self.store_name, corpus_file.name)
+        return corpus_file
+
+    async def upload_file(
         self, file_path: str, display_name: str | None = None
     ) -> dict[str, Any] | None:
         """단일 파일을 File Search Store에 업로드
@@ -189,52 +892,102 @@ class DocumentManager:
             file_path: 업로드할 파일의 경로
             display_name: 파일의 표시 이름 (기본값: 파일명)
 
+        Store에 같은 내용(SHA-256)의 파일이 이미 있으면 업로드와 import를 건너뛰고
+        기존 CorpusFile을 재사용합니다. 크기 제한을 넘는 PDF/TXT/MD 문서는
+        SPLIT_OVERSIZED_DOCUMENTS가 켜져 있으면 조각으로 나누어 업로드합니다
+        (결과 형식은 _upload_split 참고).
+
         Returns:
             업로드된 파일 정보 딕셔너리 (file, corpus_file) 또는 실패 시 None
-            - file: 업로드된 File 객체
-            - corpus_file: Store에 추가된 CorpusFile 객체
+            - file: 업로드된 File 객체 (중복으로 건너뛴 경우 None)
+            - corpus_file: Store에 추가된 CorpusFile 객체 (중복으로 건너뛴 경우 None)
             - corpus_file_name: CorpusFile의 리소스 이름 (삭제 시 사용)
+            - sha256: 파일 내용의 SHA-256
+            - deduplicated: 중복으로 업로드를 건너뛰었는지 여부
+            - duplicate_of, bytes_saved: 중복인 경우 기존 파일 이름과 절약한 업로드 바이트
+            - original_bytes, uploaded_bytes, text_extracted: 업로드한 경우 원본 크기,
+              실제 전송한 크기, 텍스트 추출본을 올렸는지 여부
 
         Raises:
             ValueError: 파일 유효성 검증 실패
             GoogleAPIError: API 호출 실패
 
         """
-        validation = self.validate_file(file_path)
+        path = Path(file_path)
+        if path.is_file() and self._needs_split(path.stat().st_size, path.name):
+            return await self._upload_split(file_path, path.name)
+        validation = await asyncio.to_thread(self.validate_file, file_path)
+        return await self._upload_validated(file_path, validation, display_name)
 
-        file_name = validation["file_name"]
-        display_name = display_name or file_name
+    async def upload_stream(
+        self,
+        source: BinaryIO | memoryview,
+        file_name: str,
+        display_name: str | None = None,
+    ) -> dict[str, Any] | None:
+        """메모리 버퍼나 파일 객체를 임시 파일 없이 File Search Store에 업로드
 
-        logger.info(f"파일 업로드 시작: {file_name} -> {self.store_name}")
+        Streamlit UploadedFile처럼 이미 메모리에 있는 내용을 디스크에 다시 쓰거나
+        bytes로 복사하지 않고 그대로 files.upload에 전달합니다.
+        중복 판별, 크기 제한을 넘는 문서의 분할 업로드, 결과 형식은 upload_file과 같습니다.
 
-        try:
-            chunking_config = {
-                "white_space_config": {
-                    "max_tokens_per_chunk": self.max_tokens_per_chunk,
-                    "max_overlap_tokens": self.overlap_tokens,
-                }
-            }
+        Args:
+            source: 업로드할 내용 (seek 가능한 바이너리 파일 객체 또는 memoryview)
+            file_name: 원본 파일 이름 (확장자로 형식 판별)
+            display_name: 파일의 표시 이름 (기본값: 파일명)
 
-            def _upload():
-                with open(file_path, "rb") as f:
-                    return self.client.files.upload(
-                        file=f,
-                        config={
-                            "display_name": display_name,
-                            "mime_type": validation["mime_type"],
-                        },
-                    )
+        Returns:
+            upload_file과 같은 업로드 결과 딕셔너리 또는 실패 시 None
+
+        Raises:
+            ValueError: 유효성 검증 실패
+            GoogleAPIError: API 호출 실패
 
-            uploaded_file = self._retry_with_backoff(_upload)
+        """
+        if isinstance(source, memoryview):
+            file_size = source.nbytes
+        else:
+            source.seek(0, io.SEEK_END)
+            file_size = source.tell()
+            source.seek(0)
+        if self._needs_split(file_size, file_name):
+            if isinstance(source, memoryview):
+                source = _MemoryviewReader(source)
+            return await self._upload_split(source, Path(file_name).name)
+
+        validation = await asyncio.to_thread(self.validate_stream, source, file_name)
+        if isinstance(source, memoryview):
+            source = _MemoryviewReader(source)
+        return await self._upload_validated(source, validation, display_name)
+
+    async def _upload_validated(
+        self,
+        source: str | BinaryIO,
+        validation: dict[str, Any],
+        display_name: str | None,
+    ) -> dict[str, Any] | None:
+        """검증이 끝난 파일을 중복 확인 후 업로드하고 Store에 등록합니다."""
+        duplicate = self._find_duplicate(validation)
+        if duplicate is not None:
+            return duplicate
 
-            def _add_to_store():
-                return self.client.file_search_stores.import_file(
-                    file_search_store_name=self.store_name,
-                    file_name=uploaded_file.name,
-                    config={"chunking_config": chunking_config},
-                )
+        file_name = validation["file_name"]
+        display_name = display_name or file_name
 
-            corpus_file = self._retry_with_backoff(_add_to_store)
+        logger.info(f"파일 업로드 시작: {file_name} -> {self.store_name}")
+
+        # 업로드와 import의 모든 재시도가 하나의 시간 예산을 공유
+        deadline = Deadline(UPLOAD_TIMEOUT_SECONDS, "파일 업로드")
+
+        try:
+            upload_source, upload_validation, size_report = await asyncio.to_thread(
+                self._prepare_upload, source, validation
+            )
+            uploaded_file = await self._upload_stage(
+                upload_source, upload_validation, display_name, deadline
+            )
+            corpus_file = await self._import_stage(uploaded_file, deadline)
+            self._record_upload(validation, corpus_file.name)
 
             logger.info(
                 f"파일 업로드 성공: {file_name} "
@@ -245,6 +998,9 @@ class DocumentManager:
                 "file": uploaded_file,
                 "corpus_file": corpus_file,
                 "corpus_file_name": corpus_file.name,
+                "sha256": validation["sha256"],
+                "deduplicated": False,
+                **size_report,
             }
 
         except ValueError as e:
@@ -260,47 +1016,245 @@ class DocumentManager:
             logger.error(f"파일 업로드 중 알 수 없는 오류: {e}")
             raise
 
-    def upload_files_batch(self, file_paths: list[str]) -> dict[str, Any]:
-        """여러 파일을 배치로 업로드
+    async def upload_files_batch(
+        self,
+        file_paths: list[str],
+        upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        import_concurrency: int = DEFAULT_IMPORT_CONCURRENCY,
+    ) -> dict[str, Any]:
+        """여러 파일을 업로드/import 파이프라인으로 배치 업로드
+
+        파일마다 하나의 작업(task)으로 files.upload 단계와 import_file 단계를 차례로
+        진행하며, 단계별 동시 실행 수는 각 단계의 세마포어로 제한되므로 앞 파일이
+        Store에 등록되는 동안 다음 파일의 업로드가 진행됩니다.
+        업로드는 끝났지만 아직 import되지 않은 파일 수는 import_concurrency의 2배로
+        제한되어(backpressure), import가 밀리면 업로드도 기다립니다.
+        Store에 이미 있거나 같은 배치 안에서 먼저 올라가는 파일과 내용이 같은 파일은
+        업로드하지 않고 그 CorpusFile을 재사용합니다.
 
         Args:
             file_paths: 업로드할 파일 경로 리스트
+            upload_concurrency: 동시에 진행할 최대 files.upload 수
+            import_concurrency: 동시에 진행할 최대 import_file 수
 
         Returns:
-            업로드 결과 딕셔너리 (success, failed, total)
-            - success: 성공한 파일 정보 리스트 (각 항목은 upload_file의 반환값)
+            업로드 결과 딕셔너리 (success, failed, total, original_bytes, uploaded_bytes)
+            - original_bytes, uploaded_bytes: 실제로 업로드한 파일들의 원본 크기 합계와
+              전송한 크기 합계 (텍스트 추출 효과 확인용)
+            - success: 성공한 파일 정보 리스트 (upload_file의 반환값에 timings 추가,
+              중복으로 건너뛴 파일은 timings가 비어 있음)
+            - failed: {"file_path", "error", "stage", "timings"} 리스트
+            - timings: 파일별 단계 소요 시간 (초) - extract(텍스트 추출, 추출본을 올린 경우),
+              upload, import_wait(import 대기), import, total(업로드 시작부터)
 
         """
-        logger.info(f"배치 업로드 시작: {len(file_paths)}개 파일")
+        if upload_concurrency < 1 or import_concurrency < 1:
+            raise ValueError("단계별 동시 실행 수는 1 이상이어야 합니다.")
+
+        logger.info(
+            f"배치 업로드 시작: {len(file_paths)}개 파일 "
+            f"(업로드 동시성: {upload_concurrency}, import 동시성: {import_concurrency})"
+        )
 
         results = {"success": [], "failed": [], "total": len(file_paths)}
+        outcomes: dict[int, dict[str, Any]] = {}
+        # 업로드 단계에서 실패한 경우 어느 단계였는지 기록 (validate 또는 upload)
+        failed_stage: dict[int, str] = {}
+        upload_slots = asyncio.Semaphore(upload_concurrency)
+        import_slots = asyncio.Semaphore(import_concurrency)
+        pending_imports = asyncio.BoundedSemaphore(import_concurrency * 2)
+        # 배치 안에서 같은 내용을 처음 업로드하는 파일의 인덱스 (SHA-256 -> index)
+        claimed_hashes: dict[str, int] = {}
+        # 배치 안의 앞선 파일과 내용이 같아 그 결과를 재사용할 파일 (index -> (원본 index, 검증 결과))
+        in_batch_duplicates: dict[int, tuple[int, dict[str, Any]]] = {}
+        validations: dict[int, dict[str, Any]] = {}
+        size_reports: dict[int, dict[str, Any]] = {}
+
+        async def _upload_one(
+            index: int, file_path: str
+        ) -> tuple[types.File, Deadline, dict[str, float]] | None:
+            failed_stage[index] = "validate"
+            validation = await asyncio.to_thread(self.validate_file, file_path)
+            validations[index] = validation
+
+            duplicate = self._find_duplicate(validation)
+            if duplicate is not None:
+                outcomes[index] = {**duplicate, "timings": {}}
+                return None
+            first_index = claimed_hashes.setdefault(validation["sha256"], index)
+            if first_index != index:
+                in_batch_duplicates[index] = (first_index, validation)
+                return None
+
+            failed_stage[index] = "upload"
+            # 텍스트 추출은 프로세스 풀에서 실행되어 다른 파일의 업로드와 겹쳐 진행됨
+            extract_start = time.perf_counter()
+            upload_source, upload_validation, size_reports[index] = (
+                await asyncio.to_thread(self._prepare_upload, file_path, validation)
+            )
+            extract_time = time.perf_counter() - extract_start
+            # 다음 단계가 밀려 있으면 업로드를 시작하지 않고 대기 (backpressure)
+            await pending_imports.acquire()
+            try:
+                timings = {"started": time.perf_counter()}
+                if size_reports[index]["text_extracted"]:
+                    timings["extract"] = extract_time
+                deadline = Deadline(UPLOAD_TIMEOUT_SECONDS, "파일 업로드")
+                uploaded_file = await self._upload_stage(
+                    upload_source, upload_validation, validation["file_name"], deadline
+                )
+                timings["upload"] = time.perf_counter() - timings["started"]
+                return uploaded_file, deadline, timings
+            except BaseException:
+                pending_imports.release()
+                raise
 
-        for file_path in file_paths:
+        async def _import_one(
+            uploaded_file: types.File, deadline: Deadline, timings: dict[str, float]
+        ) -> Any:
+            try:
+                async with import_slots:
+                    import_start = time.perf_counter()
+                    timings["import_wait"] = (
+                        import_start - timings["started"] - timings["upload"]
+                    )
+                    corpus_file = await self._import_stage(uploaded_file, deadline)
+                    timings["import"] = time.perf_counter() - import_start
+                    return corpus_file
+            finally:
+                pending_imports.release()
+
+        def _finish_timings(timings: dict[str, float]) -> dict[str, float]:
+            started = timings.pop("started", None)
+            if started is not None:
+                timings["total"] = time.perf_counter() - started
+            return {key: round(value, 3) for key, value in timings.items()}
+
+        async def _process(index: int, file_path: str) -> None:
+            try:
+                async with upload_slots:
+                    uploaded = await _upload_one(index, file_path)
+            except Exception as e:
+                outcomes[index] = {
+                    "error": e,
+                    "stage": failed_stage.get(index, "upload"),
+                    "timings": {},
+                }
+                return
+            if uploaded is None:
+                # 중복 파일: 업로드/import 없이 결과가 정해짐
+                return
+            uploaded_file, deadline, timings = uploaded
             try:
-                upload_result = self.upload_file(file_path)
-                if upload_result:
-                    results["success"].append(upload_result)
+                corpus_file = await _import_one(uploaded_file, deadline, timings)
             except Exception as e:
-                logger.warning(f"파일 업로드 실패: {file_path} - {e}")
-                results["failed"].append({"file_path": file_path, "error": str(e)})
+                outcomes[index] = {
+                    "error": e,
+                    "stage": "import",
+                    "timings": _finish_timings(timings),
+                }
+                return
+            self._record_upload(validations[index], corpus_file.name)
+            outcomes[index] = {
+                "file": uploaded_file,
+                "corpus_file": corpus_file,
+                "corpus_file_name": corpus_file.name,
+                "sha256": validations[index]["sha256"],
+                "deduplicated": False,
+                **size_reports[index],
+                "timings": _finish_timings(timings),
+            }
+
+        await asyncio.gather(
+            *(_process(index, path) for index, path in enumerate(file_paths))
+        )
+
+        for index, (first_index, validation) in in_batch_duplicates.items():
+            first = outcomes[first_index]
+            if "error" in first:
+                # 원본 파일이 실패했으면 같은 내용의 파일도 같은 이유로 실패 처리
+                outcomes[index] = {**first, "timings": {}}
+            else:
+                duplicate = self._relink(
+                    validation,
+                    first["corpus_file_name"],
+                    validations[first_index]["file_name"],
+                )
+                outcomes[index] = {**duplicate, "timings": {}}
+
+        for index, file_path in enumerate(file_paths):
+            outcome = outcomes[index]
+            if "error" in outcome:
+                logger.warning(
+                    f"파일 업로드 실패 ({outcome['stage']} 단계): {file_path} - {outcome['error']}"
+                )
+                results["failed"].append(
+                    {
+                        "file_path": file_path,
+                        "error": str(outcome["error"]),
+                        "stage": outcome["stage"],
+                        "timings": outcome["timings"],
+                    }
+                )
+            else:
+                results["success"].append(outcome)
+
+        uploaded = [
+            outcome for outcome in results["success"] if "uploaded_bytes" in outcome
+        ]
+        results["original_bytes"] = sum(item["original_bytes"] for item in uploaded)
+        results["uploaded_bytes"] = sum(item["uploaded_bytes"] for item in uploaded)
 
         logger.info(
             f"배치 업로드 완료: "
             f"성공 {len(results['success'])}/{results['total']}, "
-            f"실패 {len(results['failed'])}"
+            f"실패 {len(results['failed'])}, "
+            f"전송 {results['uploaded_bytes'] / 1024:.2f}KB"
+            f"/원본 {results['original_bytes'] / 1024:.2f}KB"
         )
 
         return results
 
-    def wait_for_indexing(
-        self, operation_name: str, timeout: int = 300, poll_interval: int = 5
+    async def resolve_documents(
+        self, results: list[dict[str, Any]], timeout: float = UPLOAD_TIMEOUT_SECONDS
+    ) -> list[dict[str, Any]]:
+        """업로드 결과의 인덱싱이 끝나기를 기다려 corpus_file_name을 문서 이름으로 바꿉니다.
+
+        결과의 모든 import Operation(분할 업로드는 조각별)을 하나의 OperationTracker로
+        기다린 뒤 apply_indexing_results로 결과와 매니페스트를 고칩니다.
+
+        Args:
+            results: upload_file/upload_stream/upload_files_batch의 성공 결과 리스트
+                (제자리에서 수정)
+            timeout: 인덱싱 최대 대기 시간 (초)
+
+        Returns:
+            List[Dict[str, Any]]: indexing이 추가되고 corpus_file_name이 문서 이름으로
+                바뀐 results (apply_indexing_results 참고)
+
+        """
+        tracker = OperationTracker(client=self.client)
+        for result in results:
+            for entry in _upload_entries(result):
+                if entry.get("corpus_file") is not None:
+                    tracker.track(entry["corpus_file"])
+        if tracker.get_progress()["pending"]:
+            await tracker.wait_async(timeout=timeout)
+        return apply_indexing_results(results, tracker)
+
+    async def wait_for_indexing(
+        self, operation_name: Any, timeout: int = 300, poll_interval: int = 5
     ) -> bool:
         """Operation 폴링을 통해 인덱싱 완료 대기 (Optional)
 
+        여러 Operation을 한꺼번에 기다릴 때는 OperationTracker에 모두 등록하여
+        하나의 루프에서 기다리는 것이 효율적입니다.
+
         Args:
-            operation_name: 대기할 Operation의 리소스 이름
+            operation_name: 대기할 Operation 객체 또는 Operation의 리소스 이름
             timeout: 최대 대기 시간 (초, 기본값: 300)
-            poll_interval: 폴링 간격 (초, 기본값: 5)
+            poll_interval: 최대 폴링 간격 (초, 기본값: 5). 처음에는 더 짧은 간격으로
+                확인하고 끝나지 않으면 이 값까지 간격을 늘립니다.
 
         Returns:
             인덱싱 완료 시 True, 타임아웃 또는 실패 시 False
@@ -308,28 +1262,119 @@ class DocumentManager:
         """
         logger.info(f"인덱싱 완료 대기 시작: {operation_name}")
 
-        elapsed = 0
-        while elapsed < timeout:
-            try:
-                operation = self.client.operations.get(name=operation_name)
-
-                if operation.done:
-                    if operation.error:
-                        logger.error(f"인덱싱 실패: {operation.error}")
-                        return False
-                    logger.info(f"인덱싱 완료: {operation_name}")
-                    return True
-
-                logger.debug(f"인덱싱 진행 중... (경과: {elapsed}초)")
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-
-            except NotFound:
-                logger.warning(f"Operation을 찾을 수 없습니다: {operation_name}")
-                return False
-            except GoogleAPIError as e:
-                logger.error(f"Operation 조회 중 API 오류: {e}")
-                return False
-
-        logger.warning(f"인덱싱 대기 타임아웃: {timeout}초 경과")
-        return False
+        tracker = OperationTracker(client=self.client, max_interval=poll_interval)
+        tracker.track(operation_name)
+        return await tracker.wait_async(timeout=timeout)
+
+
+class _EngineAttribute:
+    """동기 래퍼의 속성을 비동기 엔진의 같은 이름 속성으로 읽고 쓰는 디스크립터"""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return getattr(instance.engine, self.name)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        setattr(instance.engine, self.name, value)
+
+
+class DocumentManager:
+    """Google Gemini File Search Store에 문서를 업로드하고 관리하는 클래스
+
+    AsyncDocumentManager를 공유 이벤트 루프에서 실행하는 동기 래퍼이므로 업로드/재시도/
+    매니페스트/인덱싱 처리는 비동기 버전과 같습니다 (각 메서드 설명은 비동기 버전 참고).
+    청킹 설정과 교체 가능한 속성(resumable_uploader, extract_text, text_extractor,
+    split_oversized)은 엔진의 속성을 그대로 읽고 씁니다.
+    """
+
+    store_name = _EngineAttribute()
+    client = _EngineAttribute()
+    max_tokens_per_chunk = _EngineAttribute()
+    overlap_tokens = _EngineAttribute()
+    resumable_uploader = _EngineAttribute()
+    extract_text = _EngineAttribute()
+    text_extractor = _EngineAttribute()
+    split_oversized = _EngineAttribute()
+
+    def __init__(
+        self,
+        store_name: str,
+        client: genai.Client | None = None,
+        max_tokens_per_chunk: int = DEFAULT_MAX_TOKENS_PER_CHUNK,
+        overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    ):
+        """DocumentManager 초기화 (인자는 AsyncDocumentManager와 같음)
+
+        Raises:
+            ValueError: client를 초기화할 수 없거나 store_name이 비어있는 경우
+
+        """
+        self.engine = AsyncDocumentManager(
+            store_name,
+            client=client,
+            max_tokens_per_chunk=max_tokens_per_chunk,
+            overlap_tokens=overlap_tokens,
+        )
+
+    def validate_file(self, file_path: str) -> dict[str, Any]:
+        """파일 유효성 검증 (형식, 크기, 시그니처) 및 콘텐츠 해시 계산"""
+        return self.engine.validate_file(file_path)
+
+    def validate_stream(
+        self, source: BinaryIO | memoryview, file_name: str
+    ) -> dict[str, Any]:
+        """메모리 버퍼나 파일 객체의 유효성 검증 및 콘텐츠 해시 계산"""
+        return self.engine.validate_stream(source, file_name)
+
+    def upload_file(
+        self, file_path: str, display_name: str | None = None
+    ) -> dict[str, Any] | None:
+        """단일 파일을 File Search Store에 업로드"""
+        return run_sync(self.engine.upload_file(file_path, display_name=display_name))
+
+    def upload_stream(
+        self,
+        source: BinaryIO | memoryview,
+        file_name: str,
+        display_name: str | None = None,
+    ) -> dict[str, Any] | None:
+        """메모리 버퍼나 파일 객체를 임시 파일 없이 File Search Store에 업로드"""
+        return run_sync(
+            self.engine.upload_stream(source, file_name, display_name=display_name)
+        )
+
+    def upload_files_batch(
+        self,
+        file_paths: list[str],
+        upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        import_concurrency: int = DEFAULT_IMPORT_CONCURRENCY,
+    ) -> dict[str, Any]:
+        """여러 파일을 업로드/import 파이프라인으로 배치 업로드"""
+        return run_sync(
+            self.engine.upload_files_batch(
+                file_paths,
+                upload_concurrency=upload_concurrency,
+                import_concurrency=import_concurrency,
+            )
+        )
+
+    def resolve_documents(
+        self, results: list[dict[str, Any]], timeout: float = UPLOAD_TIMEOUT_SECONDS
+    ) -> list[dict[str, Any]]:
+        """업로드 결과의 인덱싱이 끝나기를 기다려 corpus_file_name을 문서 이름으로 바꿉니다."""
+        return run_sync(self.engine.resolve_documents(results, timeout=timeout))
+
+    def wait_for_indexing(
+        self, operation_name: Any, timeout: int = 300, poll_interval: int = 5
+    ) -> bool:
+        """Operation 폴링을 통해 인덱싱 완료 대기"""
+        return run_sync(
+            self.engine.wait_for_indexing(
+                operation_name, timeout=timeout, poll_interval=poll_interval
+            )
+        )
+
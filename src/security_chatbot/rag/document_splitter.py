@@ -0,0 +1,201 @@
+"""Oversized document splitter module
+
+Splits documents larger than the per-file upload limit into size-bounded parts
+on natural boundaries so they can still be ingested: PDFs by page ranges,
+Markdown preferably before headings, and plain text by lines. Text is streamed
+line by line and parts are written straight to disk, so the whole document is
+never held in memory.
+
+PDF splitting uses the optional ``pypdf`` package (``pip install
+security-chatbot[extract]``).
+"""
+
+import io
+import logging
+from pathlib import Path
+from typing import BinaryIO
+
+from security_chatbot.config import SPLIT_PART_MAX_BYTES
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # pragma: no cover - 선택 의존성
+    PdfReader = PdfWriter = None
+
+logger = logging.getLogger(__name__)
+
+# 분할할 수 있는 형식 (HWP/HWPX는 구조를 유지한 채 나눌 수 없어 지원하지 않음)
+SPLITTABLE_EXTENSIONS = (".pdf", ".txt", ".md")
+
+# 예상 페이지 수로 만든 PDF 조각이 예산을 넘지 않도록 두는 여유 비율
+# (조각마다 글꼴 등 공유 리소스가 복사되어 페이지 비율보다 커짐)
+PDF_SIZE_SAFETY_RATIO = 0.9
+
+
+def can_split(file_name: str) -> bool:
+    """분할할 수 있는 형식인지 확인합니다 (PDF는 pypdf가 설치된 경우만)."""
+    suffix = Path(file_name).suffix.lower()
+    if suffix == ".pdf":
+        return PdfReader is not None
+    return suffix in SPLITTABLE_EXTENSIONS
+
+
+def part_file_name(file_name: str, index: int) -> str:
+    """조각 파일 이름을 만듭니다 (예: audit.md -> audit.part002.md)."""
+    path = Path(file_name)
+    return f"{path.stem}.part{index:03d}{path.suffix}"
+
+
+def _utf8_boundary(data: bytes) -> int:
+    """data를 자를 때 UTF-8 문자가 깨지지 않는 가장 뒤쪽 위치를 반환합니다."""
+    index = len(data)
+    while index > 0 and data[index - 1] & 0xC0 == 0x80:
+        index -= 1
+    if index == 0:
+        return len(data)
+    lead = data[index - 1]
+    if lead < 0xC0:
+        return len(data)
+    width = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+    return len(data) if index - 1 + width <= len(data) else index - 1
+
+
+def _split_text(
+    source: BinaryIO, file_name: str, output_dir: Path, max_part_bytes: int
+) -> list[str]:
+    """텍스트를 줄 단위로 읽어 조각 파일에 바로 씁니다.
+
+    Markdown은 조각이 절반 이상 찼을 때 제목(#) 줄을 만나면 그 앞에서 나누어
+    절(section)이 여러 조각에 걸치지 않도록 합니다. 예산보다 긴 줄은 UTF-8 문자
+    경계에서 나눕니다.
+    """
+    prefer_headings = Path(file_name).suffix.lower() == ".md"
+    paths: list[str] = []
+    part = None
+    written = 0
+    carry = b""
+    try:
+        while True:
+            line = carry + source.readline(max_part_bytes - len(carry))
+            carry = b""
+            if not line:
+                break
+            if len(line) == max_part_bytes and not line.endswith(b"\n"):
+                cut = _utf8_boundary(line)
+                line, carry = line[:cut], line[cut:]
+
+            at_heading = (
+                prefer_headings
+                and line.startswith(b"#")
+                and written >= max_part_bytes // 2
+            )
+            if part is None or written + len(line) > max_part_bytes or at_heading:
+                if part is not None:
+                    part.close()
+                path = output_dir / part_file_name(file_name, len(paths) + 1)
+                part = open(path, "wb")
+                paths.append(str(path))
+                written = 0
+            part.write(line)
+            written += len(line)
+    finally:
+        if part is not None:
+            part.close()
+    return paths
+
+
+def _split_pdf(
+    source: BinaryIO,
+    file_name: str,
+    file_size: int,
+    output_dir: Path,
+    max_part_bytes: int,
+) -> list[str]:
+    """PDF를 페이지 범위로 나눕니다.
+
+    원본 크기 대비 예산 비율로 조각당 페이지 수를 추정하고, 써 본 조각이 예산을
+    넘으면 페이지 수를 절반으로 줄여 다시 만듭니다.
+    """
+    reader = PdfReader(source)
+    total_pages = len(reader.pages)
+    pages_per_part = max(
+        1, int(total_pages * max_part_bytes / file_size * PDF_SIZE_SAFETY_RATIO)
+    )
+
+    paths: list[str] = []
+    start = 0
+    while start < total_pages:
+        count = min(pages_per_part, total_pages - start)
+        while True:
+            writer = PdfWriter()
+            for page_index in range(start, start + count):
+                writer.add_page(reader.pages[page_index])
+            buffer = io.BytesIO()
+            writer.write(buffer)
+            if buffer.tell() <= max_part_bytes or count == 1:
+                break
+            count = max(1, count // 2)
+        if buffer.tell() > max_part_bytes:
+            raise ValueError(
+                f"한 페이지가 조각 크기 제한을 초과하여 분할할 수 없습니다: "
+                f"{file_name} {start + 1}페이지"
+            )
+        path = output_dir / part_file_name(file_name, len(paths) + 1)
+        path.write_bytes(buffer.getvalue())
+        paths.append(str(path))
+        start += count
+    return paths
+
+
+def split_document(
+    source: str | BinaryIO,
+    file_name: str,
+    output_dir: str,
+    max_part_bytes: int = SPLIT_PART_MAX_BYTES,
+) -> list[str]:
+    """문서를 max_part_bytes 이하의 조각 파일들로 나눕니다.
+
+    Args:
+        source: 파일 경로 또는 seek 가능한 바이너리 파일 객체
+        file_name: 원본 파일 이름 (확장자로 형식 판별, 조각 이름의 기준)
+        output_dir: 조각 파일을 쓸 디렉토리
+        max_part_bytes: 조각 하나의 최대 크기 (바이트)
+
+    Returns:
+        List[str]: 순서대로 정렬된 조각 파일 경로 목록
+
+    Raises:
+        ValueError: 분할할 수 없는 형식이거나 한 페이지가 제한보다 큰 경우
+
+    """
+    if not can_split(file_name):
+        suffix = Path(file_name).suffix.lower()
+        if suffix == ".pdf":
+            raise ValueError(
+                "PDF 분할에는 pypdf가 필요합니다: pip install 'security-chatbot[extract]'"
+            )
+        raise ValueError(f"이 형식은 분할할 수 없습니다: {suffix}")
+    if max_part_bytes <= 0:
+        raise ValueError("max_part_bytes는 0보다 커야 합니다.")
+
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return split_document(f, file_name, output_dir, max_part_bytes)
+
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    source.seek(0, io.SEEK_END)
+    file_size = source.tell()
+    source.seek(0)
+
+    if Path(file_name).suffix.lower() == ".pdf":
+        paths = _split_pdf(source, file_name, file_size, output, max_part_bytes)
+    else:
+        paths = _split_text(source, file_name, output, max_part_bytes)
+    source.seek(0)
+
+    logger.info(
+        f"문서 분할: {file_name} ({file_size / (1024 * 1024):.2f}MB) -> "
+        f"{len(paths)}개 조각 (조각당 최대 {max_part_bytes / (1024 * 1024):.2f}MB)"
+    )
+    return paths
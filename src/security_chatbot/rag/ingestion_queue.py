@@ -0,0 +1,450 @@
+"""Ingestion job queue module
+
+A durable, SQLite-backed queue of document ingestion jobs shared by the
+Streamlit app (producer) and one or more worker processes (consumers). Jobs
+survive page reloads and process restarts, failed jobs are retried with backoff,
+and jobs that keep failing are moved to a dead-letter state for inspection.
+"""
+
+import json
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from security_chatbot.config import (
+    INGESTION_MAX_ATTEMPTS,
+    INGESTION_QUEUE_DB_PATH,
+    INGESTION_SPOOL_DIR,
+)
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_DEAD = "dead"
+
+# 재시도 대기 시간 (초): 시도할 때마다 2배, 상한까지
+RETRY_BASE_DELAY = 5.0
+RETRY_MAX_DELAY = 300.0
+
+# 실행 중인 작업을 다른 워커가 가져갈 수 있게 되는 시간 (워커가 죽은 경우 복구용).
+# 워커는 작업을 처리하는 동안 renew()로 임대를 계속 갱신하므로 업로드와 인덱싱에
+# 걸리는 시간과 관계없이, 갱신이 멈춘 뒤 이 시간이 지나야 다시 가져갈 수 있음
+JOB_LEASE_SECONDS = 60.0
+
+# 임대 시간이 지나도록 끝나지 않은 채 시도 횟수를 모두 쓴 작업의 오류 메시지
+LEASE_EXPIRED_ERROR = "임대 시간 안에 끝나지 않은 채 최대 시도 횟수에 도달했습니다."
+
+_JOB_COLUMNS = (
+    "id, batch_id, store_name, file_path, display_name, file_size, status, "
+    "attempts, max_attempts, last_error, result, cleanup, created_at, updated_at"
+)
+
+
+class IngestionQueue:
+    """SQLite 기반 문서 수집 작업 큐 클래스
+
+    여러 프로세스가 같은 DB 파일을 공유하며, claim()은 트랜잭션으로 작업 하나를
+    원자적으로 가져가므로 워커를 여러 개 실행해도 같은 작업이 중복 처리되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str = INGESTION_QUEUE_DB_PATH,
+        max_attempts: int = INGESTION_MAX_ATTEMPTS,
+        lease_seconds: float = JOB_LEASE_SECONDS,
+    ):
+        """IngestionQueue 초기화
+
+        Args:
+            db_path: 큐 SQLite 파일 경로
+            max_attempts: 작업 하나의 최대 시도 횟수 (초과하면 dead-letter)
+            lease_seconds: 실행 중인 작업을 다른 워커가 다시 가져갈 수 있게 되는 시간 (초)
+
+        """
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: 트랜잭션을 BEGIN IMMEDIATE로 직접 제어
+        self._conn = sqlite3.connect(
+            db_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS ingestion_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                batch_id TEXT NOT NULL,
+                store_name TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                display_name TEXT NOT NULL,
+                file_size INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                last_error TEXT,
+                result TEXT,
+                cleanup INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL,
+                locked_by TEXT,
+                locked_at REAL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_status
+                ON ingestion_jobs (status, available_at);
+            CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_batch
+                ON ingestion_jobs (batch_id);
+            """
+        )
+
+    def enqueue(
+        self,
+        store_name: str,
+        file_path: str,
+        display_name: str | None = None,
+        batch_id: str | None = None,
+        cleanup: bool = False,
+    ) -> int:
+        """수집 작업 하나를 큐에 넣습니다.
+
+        Args:
+            store_name: 업로드할 File Search Store 리소스 이름
+            file_path: 워커가 읽을 파일 경로
+            display_name: 파일의 표시 이름 (기본값: 파일명)
+            batch_id: 진행 상황을 묶어 조회할 배치 ID (기본값: 새 ID)
+            cleanup: True이면 작업이 성공한 뒤 file_path를 삭제 (스풀 파일용)
+
+        Returns:
+            int: 작업 ID
+
+        """
+        path = Path(file_path)
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO ingestion_jobs (batch_id, store_name, file_path, "
+                "display_name, file_size, status, max_attempts, cleanup, "
+                "available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    batch_id or uuid.uuid4().hex,
+                    store_name,
+                    str(path),
+                    display_name or path.name,
+                    path.stat().st_size if path.exists() else 0,
+                    JOB_QUEUED,
+                    self.max_attempts,
+                    int(cleanup),
+                    now,
+                    now,
+                    now,
+                ),
+            )
+        logger.info(f"수집 작업 등록: #{cursor.lastrowid} {display_name or path.name}")
+        return cursor.lastrowid
+
+    def enqueue_upload(
+        self,
+        store_name: str,
+        source: BinaryIO,
+        file_name: str,
+        batch_id: str,
+        spool_dir: str = INGESTION_SPOOL_DIR,
+    ) -> int:
+        """메모리의 업로드 파일을 스풀 디렉토리에 저장하고 작업을 등록합니다.
+
+        워커는 별도 프로세스이므로 Streamlit UploadedFile을 직접 읽을 수 없습니다.
+        스풀 파일은 작업이 성공하면 워커가 삭제합니다.
+
+        Args:
+            store_name: 업로드할 File Search Store 리소스 이름
+            source: 업로드된 파일 객체
+            file_name: 원본 파일 이름 (표시 이름으로 사용)
+            batch_id: 배치 ID
+            spool_dir: 스풀 디렉토리
+
+        Returns:
+            int: 작업 ID
+
+        """
+        # 같은 배치에 이름이 같은 파일이 있어도 덮어쓰지 않도록 파일마다 디렉토리를 분리
+        spool_path = (
+            Path(spool_dir) / batch_id / uuid.uuid4().hex / Path(file_name).name
+        )
+        spool_path.parent.mkdir(parents=True, exist_ok=True)
+        source.seek(0)
+        with open(spool_path, "wb") as f:
+            shutil.copyfileobj(source, f)
+        return self.enqueue(
+            store_name, str(spool_path), file_name, batch_id=batch_id, cleanup=True
+        )
+
+    def claim(self, worker_id: str) -> dict[str, Any] | None:
+        """실행할 작업 하나를 원자적으로 가져갑니다.
+
+        대기 중이며 재시도 시각이 지난 작업, 또는 임대 시간이 지나도록 끝나지 않은
+        실행 중 작업(워커가 죽은 경우)을 오래된 순서로 가져갑니다. 임대 시간이 지난
+        작업 중 이미 최대 시도 횟수를 쓴 작업은 다시 가져가지 않고 dead-letter로
+        옮깁니다 (워커를 매번 죽게 만드는 작업이 끝없이 재시도되지 않도록).
+
+        Args:
+            worker_id: 작업을 가져가는 워커 식별자
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 딕셔너리 (attempts는 이번 시도를 포함) 또는 없으면 None
+
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                expired = self._conn.execute(
+                    "UPDATE ingestion_jobs SET status = ?, last_error = ?, "
+                    "locked_by = NULL, updated_at = ? "
+                    "WHERE status = ? AND locked_at < ? AND attempts >= max_attempts",
+                    (
+                        JOB_DEAD,
+                        LEASE_EXPIRED_ERROR,
+                        now,
+                        JOB_RUNNING,
+                        now - self.lease_seconds,
+                    ),
+                ).rowcount
+                row = self._conn.execute(
+                    "SELECT id FROM ingestion_jobs "
+                    "WHERE (status = ? AND available_at <= ?) "
+                    "OR (status = ? AND locked_at < ?) "
+                    "ORDER BY id LIMIT 1",
+                    (JOB_QUEUED, now, JOB_RUNNING, now - self.lease_seconds),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE ingestion_jobs SET status = ?, attempts = attempts + 1, "
+                    "locked_by = ?, locked_at = ?, updated_at = ? WHERE id = ?",
+                    (JOB_RUNNING, worker_id, now, now, row["id"]),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if expired:
+            logger.error(
+                f"임대 시간이 지난 수집 작업 {expired}개를 dead-letter로 이동: "
+                f"{LEASE_EXPIRED_ERROR}"
+            )
+        return self.get_job(row["id"])
+
+    def renew(self, job_id: int, worker_id: str) -> bool:
+        """실행 중인 작업의 임대를 지금부터 다시 lease_seconds 동안 연장합니다.
+
+        Args:
+            job_id: 작업 ID
+            worker_id: 작업을 가져간 워커 식별자 (claim()에 전달한 값)
+
+        Returns:
+            bool: 연장했으면 True, 작업이 더 이상 이 워커의 것이 아니면 False
+
+        """
+        return self._update(job_id, worker_id, locked_at=time.time())
+
+    def complete(self, job_id: int, worker_id: str, result: dict[str, Any]) -> bool:
+        """작업을 성공으로 기록합니다.
+
+        임대 시간이 지나 다른 워커가 가져갔거나 dead-letter로 옮겨진 작업은
+        기록하지 않습니다 (지금 작업을 가진 워커의 기록을 덮어쓰지 않도록).
+
+        Args:
+            job_id: 작업 ID
+            worker_id: 작업을 가져간 워커 식별자 (claim()에 전달한 값)
+            result: 업로드 결과 중 JSON으로 저장할 값 (corpus_file_name 등)
+
+        Returns:
+            bool: 기록했으면 True, 작업이 더 이상 이 워커의 것이 아니면 False
+
+        """
+        recorded = self._update(
+            job_id,
+            worker_id,
+            status=JOB_DONE,
+            result=json.dumps(result, ensure_ascii=False),
+            last_error=None,
+            locked_by=None,
+        )
+        if not recorded:
+            logger.warning(
+                f"수집 작업 완료를 기록하지 않음: #{job_id} (임대가 만료되어 "
+                f"{worker_id}의 작업이 아님)"
+            )
+            return False
+        logger.info(f"수집 작업 완료: #{job_id}")
+        return True
+
+    def fail(
+        self, job_id: int, worker_id: str, error: str, retryable: bool = True
+    ) -> str:
+        """작업 실패를 기록하고 재시도하거나 dead-letter로 옮깁니다.
+
+        complete()와 마찬가지로 더 이상 이 워커의 작업이 아니면 기록하지 않습니다.
+
+        Args:
+            job_id: 작업 ID
+            worker_id: 작업을 가져간 워커 식별자 (claim()에 전달한 값)
+            error: 오류 메시지
+            retryable: False이면 남은 시도 횟수와 관계없이 dead-letter로 이동
+
+        Returns:
+            str: 변경된 작업 상태 (queued 또는 dead). 기록하지 않았으면 작업의
+                현재 상태
+
+        """
+        job = self.get_job(job_id)
+        if not retryable or job["attempts"] >= job["max_attempts"]:
+            if not self._update(
+                job_id, worker_id, status=JOB_DEAD, last_error=error, locked_by=None
+            ):
+                return self._lost_lease(job_id, worker_id)
+            logger.error(
+                f"수집 작업 dead-letter 이동: #{job_id} "
+                f"({job['attempts']}회 시도) - {error}"
+            )
+            return JOB_DEAD
+
+        delay = min(RETRY_BASE_DELAY * 2 ** (job["attempts"] - 1), RETRY_MAX_DELAY)
+        if not self._update(
+            job_id,
+            worker_id,
+            status=JOB_QUEUED,
+            last_error=error,
+            locked_by=None,
+            available_at=time.time() + delay,
+        ):
+            return self._lost_lease(job_id, worker_id)
+        logger.warning(
+            f"수집 작업 실패, {delay:.0f}초 후 재시도: #{job_id} "
+            f"({job['attempts']}/{job['max_attempts']}) - {error}"
+        )
+        return JOB_QUEUED
+
+    def retry_dead(self, job_id: int) -> bool:
+        """dead-letter 작업을 시도 횟수를 초기화하여 다시 큐에 넣습니다.
+
+        Returns:
+            bool: 다시 큐에 넣었으면 True (dead 상태가 아니면 False)
+
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE ingestion_jobs SET status = ?, attempts = 0, available_at = ?, "
+                "updated_at = ? WHERE id = ? AND status = ?",
+                (JOB_QUEUED, now, now, job_id, JOB_DEAD),
+            )
+        return cursor.rowcount == 1
+
+    def get_job(self, job_id: int) -> dict[str, Any] | None:
+        """작업 하나를 조회합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_JOB_COLUMNS} FROM ingestion_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def list_jobs(
+        self, batch_id: str | None = None, status: str | None = None
+    ) -> list[dict[str, Any]]:
+        """작업 목록을 등록 순서로 조회합니다.
+
+        Args:
+            batch_id: 지정하면 해당 배치의 작업만 조회
+            status: 지정하면 해당 상태의 작업만 조회 (예: JOB_DEAD로 dead-letter 목록)
+
+        """
+        clauses, params = [], []
+        if batch_id is not None:
+            clauses.append("batch_id = ?")
+            params.append(batch_id)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_JOB_COLUMNS} FROM ingestion_jobs {where} ORDER BY id", params
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def get_progress(self, batch_id: str | None = None) -> dict[str, Any]:
+        """배치(또는 전체 큐)의 진행 상황을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: total, queued, running, done, dead, bytes_total, bytes_done,
+                            percent(끝난 작업 비율, 0~100)
+
+        """
+        where, params = ("WHERE batch_id = ?", (batch_id,)) if batch_id else ("", ())
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT status, COUNT(*) AS count, SUM(file_size) AS size "
+                f"FROM ingestion_jobs {where} GROUP BY status",
+                params,
+            ).fetchall()
+        counts = {row["status"]: row["count"] for row in rows}
+        sizes = {row["status"]: row["size"] or 0 for row in rows}
+        total = sum(counts.values())
+        finished = counts.get(JOB_DONE, 0) + counts.get(JOB_DEAD, 0)
+        return {
+            "total": total,
+            "queued": counts.get(JOB_QUEUED, 0),
+            "running": counts.get(JOB_RUNNING, 0),
+            "done": counts.get(JOB_DONE, 0),
+            "dead": counts.get(JOB_DEAD, 0),
+            "bytes_total": sum(sizes.values()),
+            "bytes_done": sizes.get(JOB_DONE, 0),
+            "percent": finished / total * 100 if total else 100.0,
+        }
+
+    def close(self) -> None:
+        """DB 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+    def _update(self, job_id: int, worker_id: str, **fields: Any) -> bool:
+        """worker_id가 임대 중인 작업이면 fields를 기록하고 True를 반환합니다."""
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE ingestion_jobs SET {assignments} "
+                "WHERE id = ? AND locked_by = ?",
+                (*fields.values(), job_id, worker_id),
+            )
+        return cursor.rowcount == 1
+
+    def _lost_lease(self, job_id: int, worker_id: str) -> str:
+        """임대를 잃은 워커의 실패 기록을 건너뛰고 작업의 현재 상태를 반환합니다."""
+        status = self.get_job(job_id)["status"]
+        logger.warning(
+            f"수집 작업 실패를 기록하지 않음: #{job_id} (임대가 만료되어 "
+            f"{worker_id}의 작업이 아님, 현재 상태 {status})"
+        )
+        return status
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> dict[str, Any]:
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["cleanup"] = bool(job["cleanup"])
+        return job
@@ -0,0 +1,245 @@
+"""SecurityChatbot Ingestion Worker
+
+백그라운드 수집 작업 큐(IngestionQueue)를 소비하는 워커 프로세스입니다.
+Streamlit 앱과 별도로 실행되므로 브라우저 탭이 닫히거나 새로고침되어도 업로드와
+Store 등록이 계속 진행됩니다. 같은 큐 파일을 공유하는 워커를 여러 개 실행할 수 있습니다.
+
+사용법:
+    python -m security_chatbot.rag.ingestion_worker --poll-interval 2
+"""
+
+import argparse
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from security_chatbot.config import INGESTION_QUEUE_DB_PATH
+from security_chatbot.rag.document_manager import DocumentManager
+from security_chatbot.rag.ingestion_queue import JOB_DEAD, JOB_QUEUED, IngestionQueue
+from security_chatbot.rag.operation_tracker import STATUS_FAILED, STATUS_PENDING
+
+logger = logging.getLogger(__name__)
+
+# 처리할 작업이 없을 때 큐를 다시 확인하는 간격 (초)
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+def _is_retryable(error: Exception) -> bool:
+    """다시 시도해도 결과가 같은 오류(파일 검증 실패, 파일 없음)인지 판별합니다."""
+    return not isinstance(error, (ValueError, FileNotFoundError))
+
+
+def process_job(
+    job: dict[str, Any], managers: dict[str, DocumentManager]
+) -> dict[str, Any]:
+    """작업 하나를 DocumentManager로 업로드하고 큐에 저장할 결과를 반환합니다.
+
+    인덱싱이 끝날 때까지 기다려 결과의 corpus_file_name이 Store 문서 목록과 같은
+    문서 리소스 이름을 가리키게 합니다. 인덱싱에 실패하면 재시도할 수 있도록 오류를
+    내고, 시간 안에 끝나지 않으면 import Operation 이름을 그대로 남깁니다 (카탈로그
+    동기화에서 문서 이름으로 바로잡힘).
+
+    Args:
+        job: IngestionQueue.claim()이 반환한 작업
+        managers: Store 이름별 DocumentManager 캐시
+
+    Returns:
+        Dict[str, Any]: corpus_file_name, sha256, deduplicated, file_size
+            (크기 제한을 넘어 분할 업로드한 경우 조각별 같은 키를 담은 parts 추가)
+
+    Raises:
+        ValueError: 파일 검증 실패
+        GoogleAPIError: API 호출 실패
+        RuntimeError: 업로드 결과가 없거나 인덱싱에 실패한 경우
+
+    """
+    store_name = job["store_name"]
+    if store_name not in managers:
+        managers[store_name] = DocumentManager(store_name=store_name)
+
+    upload_result = managers[store_name].upload_file(
+        job["file_path"], display_name=job["display_name"]
+    )
+    if not upload_result or not upload_result.get("corpus_file_name"):
+        raise RuntimeError("업로드 결과에 corpus_file_name이 없습니다.")
+    upload_result = managers[store_name].resolve_documents([upload_result])[0]
+    if upload_result["indexing"] == STATUS_FAILED:
+        raise RuntimeError(f"문서 인덱싱 실패: {job['display_name']}")
+    if upload_result["indexing"] == STATUS_PENDING:
+        logger.warning(
+            f"인덱싱이 시간 안에 끝나지 않아 Operation 이름으로 기록합니다: "
+            f"{job['display_name']}"
+        )
+
+    result = {
+        "corpus_file_name": str(upload_result["corpus_file_name"]),
+        "sha256": upload_result.get("sha256"),
+        "deduplicated": upload_result.get("deduplicated", False),
+        "file_size": job["file_size"],
+    }
+    if upload_result.get("split"):
+        result["parts"] = [
+            {
+                "corpus_file_name": str(part["corpus_file_name"]),
+                "sha256": part["sha256"],
+                "deduplicated": part["deduplicated"],
+                "file_size": part.get("original_bytes", part.get("bytes_saved", 0)),
+            }
+            for part in upload_result["parts"]
+        ]
+    return result
+
+
+def _remove_spool_file(file_path: str) -> None:
+    """성공한 작업의 스풀 파일과 그 파일 전용 디렉토리를 삭제합니다."""
+    path = Path(file_path)
+    path.unlink(missing_ok=True)
+    try:
+        path.parent.rmdir()
+    except OSError:
+        pass
+
+
+@contextmanager
+def _lease_renewal(
+    queue: IngestionQueue, job_id: int, worker_id: str, interval: float
+) -> Iterator[None]:
+    """with 블록이 실행되는 동안 백그라운드 스레드에서 작업의 임대를 갱신합니다.
+
+    블록을 벗어나면 갱신 스레드가 끝날 때까지 기다리므로, 이후의 complete()/fail()
+    뒤에 임대가 다시 갱신되지 않습니다.
+    """
+    stopped = threading.Event()
+
+    def renew() -> None:
+        while not stopped.wait(interval):
+            if not queue.renew(job_id, worker_id):
+                logger.warning(
+                    f"수집 작업 임대 갱신 실패: #{job_id} (이미 다른 워커가 가져감)"
+                )
+                return
+
+    thread = threading.Thread(
+        target=renew, name=f"lease-renewal-{job_id}", daemon=True
+    )
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
+
+
+def run_worker(
+    queue: IngestionQueue,
+    worker_id: str | None = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    once: bool = False,
+    stop_event: threading.Event | None = None,
+    renew_interval: float | None = None,
+) -> dict[str, int]:
+    """큐에서 작업을 하나씩 가져와 처리합니다.
+
+    작업을 처리하는 동안에는 임대를 주기적으로 갱신하므로, 업로드와 인덱싱이 임대
+    시간보다 오래 걸려도 다른 워커가 같은 작업을 가져가지 않습니다.
+
+    Args:
+        queue: 소비할 수집 작업 큐
+        worker_id: 워커 식별자 (기본값: 호스트명-PID)
+        poll_interval: 처리할 작업이 없을 때 대기 간격 (초)
+        once: True이면 지금 처리할 수 있는 작업이 없어지는 즉시 종료
+        stop_event: 설정되면 현재 작업을 마친 뒤 종료
+        renew_interval: 임대 갱신 간격 (초, 기본값: 큐 임대 시간의 1/3)
+
+    Returns:
+        Dict[str, int]: processed(성공), retried(재시도 예약), dead(dead-letter 이동)
+
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    stop_event = stop_event or threading.Event()
+    managers: dict[str, DocumentManager] = {}
+    summary = {"processed": 0, "retried": 0, "dead": 0}
+    if renew_interval is None:
+        renew_interval = queue.lease_seconds / 3
+
+    logger.info(f"수집 워커 시작: {worker_id}")
+    while not stop_event.is_set():
+        job = queue.claim(worker_id)
+        if job is None:
+            if once:
+                break
+            stop_event.wait(poll_interval)
+            continue
+
+        logger.info(
+            f"수집 작업 처리 시작: #{job['id']} {job['display_name']} "
+            f"(시도 {job['attempts']}/{job['max_attempts']})"
+        )
+        started = time.perf_counter()
+        try:
+            with _lease_renewal(queue, job["id"], worker_id, renew_interval):
+                result = process_job(job, managers)
+        except Exception as e:
+            status = queue.fail(
+                job["id"], worker_id, str(e), retryable=_is_retryable(e)
+            )
+            if status == JOB_DEAD:
+                summary["dead"] += 1
+            elif status == JOB_QUEUED:
+                summary["retried"] += 1
+            continue
+
+        # 임대가 만료되어 다른 워커가 가져간 작업이면 그 워커가 스풀 파일을 사용함
+        if not queue.complete(job["id"], worker_id, result):
+            continue
+        summary["processed"] += 1
+        if job["cleanup"]:
+            _remove_spool_file(job["file_path"])
+        logger.info(
+            f"수집 작업 처리 완료: #{job['id']} {job['display_name']} "
+            f"({time.perf_counter() - started:.2f}초)"
+        )
+
+    logger.info(f"수집 워커 종료: {worker_id} {summary}")
+    return summary
+
+
+def main() -> None:
+    """명령행에서 수집 워커 실행"""
+    parser = argparse.ArgumentParser(description="보안 문서 백그라운드 수집 워커")
+    parser.add_argument(
+        "--db", default=INGESTION_QUEUE_DB_PATH, help="수집 작업 큐 SQLite 파일"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help="처리할 작업이 없을 때 큐를 다시 확인하는 간격 (초)",
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="대기 중인 작업을 모두 처리하면 종료"
+    )
+    args = parser.parse_args()
+
+    queue = IngestionQueue(db_path=args.db)
+    try:
+        summary = run_worker(queue, poll_interval=args.poll_interval, once=args.once)
+    except KeyboardInterrupt:
+        print("\n워커를 종료합니다.")
+        return
+    finally:
+        queue.close()
+    print(
+        f"완료: 성공 {summary['processed']}, 재시도 예약 {summary['retried']}, "
+        f"dead-letter {summary['dead']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
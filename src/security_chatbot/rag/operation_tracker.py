@@ -0,0 +1,339 @@
+"""Indexing operation tracker module
+
+Watches many File Search import operations in a single polling loop instead of
+one sleep loop per operation. Each operation is polled on its own adaptive
+schedule that starts fast and backs off exponentially up to a cap, completion
+callbacks fire as soon as an operation finishes, and aggregate progress is
+available at any time. Operations are polled through the SDK's async client;
+wait_async() runs on the caller's event loop and wait() is its synchronous form.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from google import genai
+from google.api_core.exceptions import GoogleAPIError, NotFound
+from google.genai import errors as genai_errors
+from google.genai import types
+
+from security_chatbot.utils.api_client import GeminiClientManager
+from security_chatbot.utils.event_loop import run_sync
+from security_chatbot.utils.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# 적응형 폴링 간격 (초): 처음에는 빠르게 확인하고, 끝나지 않으면 배수로 늘려 상한까지
+INITIAL_POLL_INTERVAL = 0.5
+POLL_BACKOFF_FACTOR = 2.0
+MAX_POLL_INTERVAL = 10.0
+
+# 작업 상태
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+OperationCallback = Callable[[dict[str, Any]], None]
+
+
+def _document_name(operation: Any) -> str | None:
+    """끝난 import Operation의 응답에서 생성된 문서 리소스 이름을 꺼냅니다."""
+    response = getattr(operation, "response", None)
+    document_name = getattr(response, "document_name", None)
+    return document_name if isinstance(document_name, str) else None
+
+
+class OperationTracker:
+    """여러 인덱싱(import) Operation을 하나의 루프에서 추적하는 클래스
+
+    track()으로 Operation을 등록하고 wait()(또는 wait_async())를 호출하면, 가장 먼저
+    확인할 시점이 된 Operation만 조회하며 나머지 시간은 대기합니다. 각 Operation의
+    폴링 간격은 INITIAL_POLL_INTERVAL에서 시작하여 끝나지 않을 때마다
+    POLL_BACKOFF_FACTOR배씩 늘어나며 max_interval을 넘지 않습니다.
+
+    조회는 비동기 클라이언트(client.aio)로 하며, 같은 시점에 확인할 Operation들은
+    동시에 조회합니다. 완료 콜백은 track()/poll_once()/wait()를 호출한 스레드에서
+    실행되므로 Streamlit 스크립트 스레드에서 UI를 갱신해도 됩니다.
+    """
+
+    def __init__(
+        self,
+        client: genai.Client | None = None,
+        initial_interval: float = INITIAL_POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+        backoff_factor: float = POLL_BACKOFF_FACTOR,
+    ):
+        """OperationTracker 초기화
+
+        Args:
+            client: 초기화된 Gemini API 클라이언트. None이면 공유 클라이언트 사용
+            initial_interval: 첫 폴링 간격 (초)
+            max_interval: 폴링 간격 상한 (초)
+            backoff_factor: 끝나지 않은 Operation의 폴링 간격 증가 배수
+
+        """
+        self.client = client if client else GeminiClientManager.get_client()
+        self.initial_interval = min(initial_interval, max_interval)
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+
+        self._lock = threading.Lock()
+        self._operations: dict[str, dict[str, Any]] = {}
+        self._callbacks: dict[str, list[OperationCallback]] = {}
+        # 끝난 Operation의 (콜백, 상태) 목록. 호출자 스레드에서 _run_callbacks()로 실행
+        self._ready: list[tuple[OperationCallback, dict[str, Any]]] = []
+        # 추적 시작 시각 (monotonic). 폴링 예정 시각은 이 시각부터의 경과 시간 기준
+        self._started = time.monotonic()
+
+    def track(
+        self,
+        operation: Any,
+        label: str | None = None,
+        on_complete: OperationCallback | None = None,
+    ) -> str:
+        """Operation을 추적 대상으로 등록합니다.
+
+        Args:
+            operation: import_file이 반환한 Operation 객체 또는 Operation 리소스 이름
+                (이름만 주면 ImportFileOperation으로 감싸서 조회)
+            label: 진행 상황 표시에 사용할 이름 (기본값: Operation 이름)
+            on_complete: 완료 또는 실패 시 상태 딕셔너리를 인자로 호출할 콜백
+
+        Returns:
+            str: 등록된 Operation 이름
+
+        """
+        if isinstance(operation, str):
+            name = operation
+            tracked = types.ImportFileOperation(name=name)
+        else:
+            name = str(operation.name)
+            tracked = operation
+        status = {
+            "name": name,
+            "label": label or name,
+            "status": STATUS_PENDING,
+            "error": None,
+            "document_name": None,
+            "polls": 0,
+            "elapsed": 0.0,
+            "_interval": self.initial_interval,
+            "_next_poll": self._elapsed(),
+            # SDK의 operations.get은 이름이 아닌 Operation 객체를 받음
+            "_operation": tracked,
+        }
+        with self._lock:
+            self._operations[name] = status
+            if on_complete is not None:
+                self._callbacks.setdefault(name, []).append(on_complete)
+
+        # 이미 끝난 Operation 객체는 조회 없이 바로 완료 처리
+        if not isinstance(operation, str) and getattr(operation, "done", False) is True:
+            self._finish(
+                name, getattr(operation, "error", None), _document_name(operation)
+            )
+            self._run_callbacks()
+        return name
+
+    def poll_once(self) -> int:
+        """폴링 시점이 된 Operation을 한 번씩 조회합니다.
+
+        Returns:
+            int: 아직 끝나지 않은 Operation 수
+
+        """
+        run_sync(self._poll_due())
+        self._run_callbacks()
+        return self.get_progress()["pending"]
+
+    async def poll_once_async(self) -> int:
+        """poll_once()의 asyncio 버전입니다.
+
+        Returns:
+            int: 아직 끝나지 않은 Operation 수
+
+        """
+        await self._poll_due()
+        self._run_callbacks()
+        return self.get_progress()["pending"]
+
+    def wait(self, timeout: float = 300) -> bool:
+        """모든 Operation이 끝나거나 timeout이 지날 때까지 하나의 루프에서 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, 기본값: 300)
+
+        Returns:
+            bool: 시간 안에 모든 Operation이 성공했으면 True
+
+        """
+        deadline = self._elapsed() + timeout
+        while self.poll_once() > 0:
+            delay = self._next_delay(deadline, timeout)
+            if delay is None:
+                return False
+            time.sleep(delay)
+
+        return self.get_progress()["failed"] == 0
+
+    async def wait_async(self, timeout: float = 300) -> bool:
+        """wait()의 asyncio 버전입니다. 이벤트 루프를 막지 않고 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, 기본값: 300)
+
+        Returns:
+            bool: 시간 안에 모든 Operation이 성공했으면 True
+
+        """
+        deadline = self._elapsed() + timeout
+        while await self.poll_once_async() > 0:
+            delay = self._next_delay(deadline, timeout)
+            if delay is None:
+                return False
+            await asyncio.sleep(delay)
+
+        return self.get_progress()["failed"] == 0
+
+    def get_status(self, name: str) -> dict[str, Any] | None:
+        """Operation 하나의 상태를 반환합니다.
+
+        Returns:
+            name, label, status, error, polls, elapsed, document_name(인덱싱이 끝나
+            생성된 문서의 리소스 이름) 딕셔너리 또는 추적하지 않는 Operation이면 None
+
+        """
+        with self._lock:
+            status = self._operations.get(name)
+            return self._public(status) if status else None
+
+    def get_progress(self) -> dict[str, Any]:
+        """전체 진행 상황을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: total, done, failed, pending, percent(끝난 비율, 0~100)
+
+        """
+        with self._lock:
+            statuses = [status["status"] for status in self._operations.values()]
+        total = len(statuses)
+        done = statuses.count(STATUS_DONE)
+        failed = statuses.count(STATUS_FAILED)
+        return {
+            "total": total,
+            "done": done,
+            "failed": failed,
+            "pending": total - done - failed,
+            "percent": (done + failed) / total * 100 if total else 100.0,
+        }
+
+    def _elapsed(self) -> float:
+        """추적 시작 이후 실제로 흐른 시간 (초, 조회 호출에 걸린 시간 포함)"""
+        return time.monotonic() - self._started
+
+    def _next_poll_at(self) -> float:
+        with self._lock:
+            return min(
+                status["_next_poll"]
+                for status in self._operations.values()
+                if status["status"] == STATUS_PENDING
+            )
+
+    def _next_delay(self, deadline: float, timeout: float) -> float | None:
+        """다음 폴링까지 기다릴 시간 (초). 다음 폴링이 deadline 이후이면 None"""
+        next_poll = self._next_poll_at()
+        if next_poll >= deadline:
+            logger.warning(
+                f"인덱싱 대기 타임아웃: {timeout}초 경과 "
+                f"(남은 작업 {self.get_progress()['pending']}개)"
+            )
+            return None
+        return max(0.0, next_poll - self._elapsed())
+
+    async def _poll_due(self) -> None:
+        """폴링 시점이 된 Operation을 동시에 조회합니다."""
+        with self._lock:
+            due = [
+                status["name"]
+                for status in self._operations.values()
+                if status["status"] == STATUS_PENDING
+                and status["_next_poll"] <= self._elapsed()
+            ]
+
+        await asyncio.gather(*(self._poll(name) for name in due))
+
+    async def _poll(self, name: str) -> None:
+        """Operation 하나를 조회하고, 끝나지 않았으면 다음 폴링을 늦춥니다."""
+        with self._lock:
+            tracked = self._operations[name]["_operation"]
+        try:
+            await rate_limiter.acquire_async()
+            operation = await self.client.aio.operations.get(tracked)
+        except NotFound:
+            logger.warning(f"Operation을 찾을 수 없습니다: {name}")
+            self._finish(name, "Operation을 찾을 수 없습니다.")
+            return
+        except genai_errors.ClientError as e:
+            if e.code == 404:
+                logger.warning(f"Operation을 찾을 수 없습니다: {name}")
+                self._finish(name, "Operation을 찾을 수 없습니다.")
+            else:
+                logger.error(f"Operation 조회 중 API 오류: {e}")
+                self._finish(name, str(e))
+            return
+        except (genai_errors.APIError, GoogleAPIError) as e:
+            logger.error(f"Operation 조회 중 API 오류: {e}")
+            self._finish(name, str(e))
+            return
+
+        with self._lock:
+            status = self._operations[name]
+            status["polls"] += 1
+            status["_operation"] = operation
+
+        if operation.done:
+            self._finish(name, operation.error, _document_name(operation))
+            return
+
+        with self._lock:
+            status["_next_poll"] = self._elapsed() + status["_interval"]
+            status["_interval"] = min(
+                status["_interval"] * self.backoff_factor, self.max_interval
+            )
+        logger.debug(f"인덱싱 진행 중: {name} (경과: {self._elapsed():.1f}초)")
+
+    def _finish(self, name: str, error: Any, document_name: str | None = None) -> None:
+        """Operation을 완료/실패로 표시하고 등록된 콜백을 실행 대기열에 넣습니다."""
+        with self._lock:
+            status = self._operations[name]
+            status["status"] = STATUS_FAILED if error else STATUS_DONE
+            status["error"] = str(error) if error else None
+            status["document_name"] = None if error else document_name
+            status["elapsed"] = self._elapsed()
+            snapshot = self._public(status)
+            self._ready.extend(
+                (callback, snapshot) for callback in self._callbacks.pop(name, [])
+            )
+
+        if error:
+            logger.error(f"인덱싱 실패: {snapshot['label']} - {error}")
+        else:
+            logger.info(f"인덱싱 완료: {snapshot['label']}")
+
+    def _run_callbacks(self) -> None:
+        """끝난 Operation의 완료 콜백을 호출한 스레드에서 실행합니다."""
+        with self._lock:
+            ready, self._ready = self._ready, []
+
+        for callback, snapshot in ready:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error(f"인덱싱 완료 콜백 실행 중 오류: {e}")
+
+    @staticmethod
+    def _public(status: dict[str, Any]) -> dict[str, Any]:
+        return {key: value for key, value in status.items() if not key.startswith("_")}
@@ -1,4 +1,9 @@
+import asyncio
 import logging
+import math
+import random
+import time
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 import google.genai as genai
@@ -6,13 +11,36 @@ from google.api_core.exceptions import GoogleAPIError
 
 from security_chatbot.config import (
     API_TIMEOUT_SECONDS,
-    GEMINI_API_KEY,
     GEMINI_MODEL_NAME,
+    QUERY_AUTO_RETRY_ENABLED,
+    QUERY_RETRY_DEADLINE_SECONDS,
+    QUERY_RETRY_JITTER_RATIO,
 )
-from security_chatbot.utils.error_handler import QueryError, error_handler
+from security_chatbot.rag.answer_cache import answer_cache, normalize_query
+from security_chatbot.utils.api_client import GeminiClientManager
+from security_chatbot.utils.deadline import Deadline
+from security_chatbot.utils.error_handler import (
+    QueryError,
+    RateLimitError,
+    error_handler,
+)
+from security_chatbot.utils.event_loop import run_sync
+from security_chatbot.utils.rate_limiter import (
+    estimate_tokens,
+    parse_duration,
+    rate_limiter,
+)
+from security_chatbot.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# 동시에 들어온 동일 (질의, Store) 요청을 하나의 Gemini 호출로 합치는 프로세스 전역 인스턴스.
+# query_coalescer.get_stats()로 합쳐진 요청 수를 확인할 수 있습니다.
+query_coalescer = SingleFlight()
+
+# 429 응답에 RetryInfo가 없을 때 레이트 리미터를 일시정지할 기본 시간 (초)
+DEFAULT_QUOTA_PAUSE_SECONDS = 10.0
+
 # 보안 특화 시스템 프롬프트
 SECURITY_SYSTEM_PROMPT = """
 당신은 보안 전문 챗봇입니다. 제공된 보안 문서, 위협 인텔리전스 데이터, 보안 정책 등을 분석하여 사용자 질문에 정확하고 심층적인 답변을 제공해야 합니다. 다음 지침을 따르세요:
@@ -87,6 +115,62 @@ def parse_grounding_metadata(response: genai.types.GenerateContentResponse) -> l
     return list(set(citations)) if citations else []
 
 
+def parse_store_citations(
+    response: genai.types.GenerateContentResponse, default_store: str | None = None
+) -> list[dict[str, Any]]:
+    """Grounding chunk마다 출처 문서와 그 문서를 검색한 File Search Store를 추출합니다.
+
+    Args:
+        response: Gemini API로부터 받은 응답 객체
+        default_store: 응답에 Store 정보가 없을 때 사용할 Store 이름
+
+    Returns:
+        List[Dict[str, Any]]: {"source": 출처 이름, "store": Store 이름 또는 None} 목록
+            (중복 포함, merge_citations로 병합)
+
+    """
+    tagged = []
+    try:
+        candidate = response.candidates[0] if response.candidates else None
+        grounding_metadata = getattr(candidate, "grounding_metadata", None)
+        for chunk in getattr(grounding_metadata, "grounding_chunks", None) or []:
+            context = getattr(chunk, "retrieved_context", None)
+            if not context:
+                continue
+            source = context.title or context.uri
+            if source:
+                tagged.append(
+                    {
+                        "source": source,
+                        "store": context.file_search_store or default_store,
+                    }
+                )
+    except Exception as e:
+        logger.warning(f"Store별 출처 파싱 중 오류 발생: {e}")
+
+    return tagged
+
+
+def merge_citations(tagged_citations: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """여러 Store에서 나온 출처를 출처 이름 기준으로 병합하고 중복을 제거합니다.
+
+    Args:
+        tagged_citations: {"source": str, "store": Optional[str]} 항목들
+
+    Returns:
+        List[Dict[str, Any]]: 처음 나온 순서대로 정렬된 {"source": str, "stores": List[str]} 목록.
+            같은 문서가 여러 Store에서 검색되면 stores에 모두 기록됩니다.
+
+    """
+    merged: dict[str, list[str]] = {}
+    for citation in tagged_citations:
+        stores = merged.setdefault(citation["source"], [])
+        store = citation.get("store")
+        if store and store not in stores:
+            stores.append(store)
+    return [{"source": source, "stores": stores} for source, stores in merged.items()]
+
+
 def format_response(
     response: genai.types.GenerateContentResponse, citations: list[str]
 ) -> dict[str, Any]:
@@ -138,144 +222,706 @@ def format_response(
     }
 
 
-def query_with_rag(query: str, store_name: str) -> dict[str, Any]:
-    """RAG 기반 쿼리 실행 및 응답 반환.
+def build_generate_content_config(
+    store_names: list[str],
+    http_options: genai.types.HttpOptions | None = None,
+) -> genai.types.GenerateContentConfig:
+    """File Search 도구가 설정된 모델 생성 설정을 만듭니다.
+
+    Args:
+        store_names: 검색할 File Search Store 리소스 이름 목록
+        http_options: 이 호출에만 적용할 HTTP 옵션 (남은 시간 예산을 타임아웃으로 전달)
+
+    Returns:
+        genai.types.GenerateContentConfig: 보안 시스템 프롬프트와 File Search 도구가 적용된 설정
+
+    """
+    # File Search Tool을 genai.types.Tool 객체로 정의
+    file_search_tool = genai.types.Tool(
+        file_search=genai.types.FileSearch(file_search_store_names=store_names)
+    )
+
+    # 모델 생성 설정
+    return genai.types.GenerateContentConfig(
+        system_instruction=SECURITY_SYSTEM_PROMPT,
+        temperature=0.2,  # RAG에서는 사실 기반 답변을 위해 낮은 temperature 사용
+        tools=[file_search_tool],
+        http_options=http_options,
+    )
+
+
+def _lookup_cached_response(query: str, store_name: str) -> dict[str, Any] | None:
+    """캐시된 응답이 있으면 반환합니다 (동기/비동기 쿼리 경로 공용)."""
+    cached_response = answer_cache.get(query, store_name)
+    if cached_response is not None:
+        logger.info(f"RAG 쿼리 캐시 적중: '{query[:50]}...' (Store: {store_name})")
+    return cached_response
+
+
+def _finalize_response(
+    query: str, store_name: str, response: genai.types.GenerateContentResponse
+) -> dict[str, Any]:
+    """Gemini 응답을 파싱/포맷팅하고 성공 시 캐시에 저장합니다 (동기/비동기 쿼리 경로 공용)."""
+    citations = parse_grounding_metadata(response)
+    formatted_response = format_response(response, citations)
+    formatted_response["token_usage"] = _token_usage(response)
+
+    if formatted_response["success"]:
+        logger.info(f"RAG 쿼리 성공: {len(citations)}개의 출처 발견")
+        answer_cache.put(query, store_name, formatted_response)
+    else:
+        logger.warning(
+            f"RAG 쿼리 실패: {formatted_response.get('error', '알 수 없는 오류')}"
+        )
+
+    return formatted_response
+
+
+def _estimate_query_tokens(query: str) -> int:
+    """레이트 리미터의 TPM 계산을 위해 쿼리의 입력 토큰 수를 추정합니다."""
+    return estimate_tokens(SECURITY_SYSTEM_PROMPT + query)
+
+
+def _token_usage(response: Any) -> dict[str, int] | None:
+    """응답의 usage_metadata에서 토큰 사용량을 추출합니다 (없으면 None)."""
+    usage = getattr(response, "usage_metadata", None)
+    counts = {
+        "prompt_tokens": getattr(usage, "prompt_token_count", None),
+        "output_tokens": getattr(usage, "candidates_token_count", None),
+        "total_tokens": getattr(usage, "total_token_count", None),
+    }
+    if not isinstance(counts["total_tokens"], int):
+        return None
+    return {key: value if isinstance(value, int) else 0 for key, value in counts.items()}
+
+
+def _settle_token_usage(estimated_tokens: int, response: Any) -> None:
+    """응답의 실제 토큰 사용량으로 레이트 리미터의 TPM 추정치를 보정합니다."""
+    usage = _token_usage(response)
+    if usage is not None:
+        rate_limiter.settle(estimated_tokens, usage["total_tokens"])
+
+
+def _pause_on_quota_error(error: Exception) -> None:
+    """429 오류이면 서버가 권장한 시간(RetryInfo.retryDelay) 동안 레이트 리미터를 멈춥니다."""
+    if isinstance(error, genai.errors.ClientError) and error.code == 429:
+        delay = parse_duration(extract_retry_delay(error))
+        rate_limiter.pause(delay if delay is not None else DEFAULT_QUOTA_PAUSE_SECONDS)
+
+
+def _quota_retry_delay(error: BaseException) -> float | None:
+    """사용량 초과 오류이면 서버(또는 레이트 리미터)가 권장한 대기 시간(초)을 반환합니다."""
+    if isinstance(error, RateLimitError):
+        return error.retry_after
+    if isinstance(error, genai.errors.ClientError) and error.code == 429:
+        delay = parse_duration(extract_retry_delay(error))
+        return delay if delay is not None else DEFAULT_QUOTA_PAUSE_SECONDS
+    return None
+
+
+def _query_deadline(auto_retry: bool) -> Deadline:
+    """쿼리 전체의 시간 예산을 만듭니다.
+
+    자동 재시도가 켜져 있으면 재시도 대기를 포함한 QUERY_RETRY_DEADLINE_SECONDS,
+    꺼져 있으면 단일 호출 예산인 API_TIMEOUT_SECONDS를 사용합니다.
+    """
+    if auto_retry:
+        return Deadline(QUERY_RETRY_DEADLINE_SECONDS, "RAG 쿼리")
+    return Deadline(API_TIMEOUT_SECONDS, "RAG 쿼리")
+
+
+def _next_retry_wait(
+    error: BaseException, deadline: Deadline, auto_retry: bool
+) -> float | None:
+    """자동 재시도 전에 기다릴 시간(지터 포함)을 계산합니다.
+
+    Args:
+        error: 쿼리 실행 중 발생한 예외
+        deadline: 쿼리 전체의 시간 예산
+        auto_retry: 자동 재시도 여부 (False이면 항상 None)
+
+    Returns:
+        Optional[float]: 대기 시간 (초). 재시도할 수 없는 오류이거나
+            대기 후 남은 예산이 없으면 None
+
+    """
+    if not auto_retry:
+        return None
+    delay = _quota_retry_delay(error)
+    if delay is None:
+        return None
+    # 여러 세션이 같은 시각에 한꺼번에 재시도하지 않도록 지터 추가
+    wait = delay + random.uniform(0, delay * QUERY_RETRY_JITTER_RATIO)
+    if not deadline.allows(wait):
+        logger.warning(f"재시도 대기({wait:.1f}초)가 쿼리 마감 시각을 넘어 재시도하지 않음")
+        return None
+    return wait
+
+
+def _search_store_names(store_name: str, shard_names: list[str] | None) -> list[str]:
+    """실제로 검색할 Store 목록을 반환합니다 (여러 shard로 나뉜 Store는 모든 shard)."""
+    return list(dict.fromkeys(shard_names)) if shard_names else [store_name]
+
+
+def _coalescing_key(query: str, store_name: str) -> tuple[str, str]:
+    """동시에 들어온 동일 요청을 식별하는 키 (정규화된 질의, Store 이름)"""
+    return normalize_query(query), store_name
+
+
+async def _generate_answer(
+    query: str,
+    store_name: str,
+    deadline: Deadline,
+    shard_names: list[str] | None = None,
+) -> dict[str, Any]:
+    """Gemini에 실제 RAG 쿼리를 보내고 포맷팅된 응답을 반환합니다."""
+    # 프로세스 전역 클라이언트를 재사용하여 커넥션 풀(keep-alive)을 공유
+    client = GeminiClientManager.get_async_client()
+
+    # 호출 한도 안에서 실행되도록 레이트 리미터의 허가를 받은 뒤 쿼리 실행
+    estimated_tokens = _estimate_query_tokens(query)
+    await rate_limiter.acquire_async(
+        tokens=estimated_tokens, max_wait=deadline.remaining()
+    )
+    logger.info(f"RAG 쿼리 실행 중: '{query[:50]}...' (Store: {store_name})")
+    # 단일 호출은 API_TIMEOUT_SECONDS와 쿼리의 남은 예산 중 짧은 시간 안에 끝나야 함
+    call_deadline = deadline.child(API_TIMEOUT_SECONDS)
+    try:
+        response = await call_deadline.run_async(
+            client.models.generate_content(
+                model=GEMINI_MODEL_NAME,
+                contents=query,
+                config=build_generate_content_config(
+                    _search_store_names(store_name, shard_names),
+                    http_options=call_deadline.http_options(),
+                ),
+            )
+        )
+    except genai.errors.ClientError as e:
+        _pause_on_quota_error(e)
+        raise
+    _settle_token_usage(estimated_tokens, response)
+
+    # 응답 처리 및 포맷팅
+    return _finalize_response(query, store_name, response)
+
+
+async def _generate_answer_with_retry(
+    query: str,
+    store_name: str,
+    deadline: Deadline,
+    auto_retry: bool,
+    on_retry: Callable[[float, int], None] | None = None,
+    shard_names: list[str] | None = None,
+) -> dict[str, Any]:
+    """사용량 초과 시 권장 대기 시간만큼 기다렸다가 남은 예산 안에서 쿼리를 재시도합니다."""
+    attempt = 0
+    while True:
+        try:
+            return await _generate_answer(query, store_name, deadline, shard_names)
+        except (genai.errors.ClientError, RateLimitError) as e:
+            wait = _next_retry_wait(e, deadline, auto_retry)
+            if wait is None:
+                raise
+            attempt += 1
+            logger.warning(f"API 사용량 초과로 {wait:.1f}초 후 쿼리 자동 재시도 ({attempt}회차)")
+            if on_retry is not None:
+                on_retry(wait, attempt)
+            await asyncio.sleep(wait)
+
+
+async def query_with_rag_async(
+    query: str,
+    store_name: str,
+    auto_retry: bool = QUERY_AUTO_RETRY_ENABLED,
+    on_retry: Callable[[float, int], None] | None = None,
+    shard_names: list[str] | None = None,
+) -> dict[str, Any]:
+    """RAG 기반 쿼리 실행 및 응답 반환 (asyncio 엔진).
     Gemini File Search API를 사용하여 보안 문서에서 정보를 검색하고 답변을 생성합니다.
+    SDK의 비동기 클라이언트(client.aio)를 사용하므로 하나의 이벤트 루프에서 여러 쿼리를
+    동시에 실행할 수 있습니다. 같은 이벤트 루프에서 같은 (질의, Store) 요청이 이미 진행
+    중이면 새로 호출하지 않고 그 결과를 공유합니다.
 
     Args:
         query: 사용자 질의
         store_name: Gemini File Search Store의 리소스 이름 (예: "corpora/...")
+        auto_retry: 사용량 초과(429) 시 RetryInfo의 대기 시간 후 자동 재시도할지 여부.
+            재시도는 QUERY_RETRY_DEADLINE_SECONDS 안에서만 수행됩니다.
+        on_retry: 재시도 대기 직전에 (대기 시간(초), 재시도 회차)로 호출되는 콜백
+            (이벤트 루프 스레드에서 호출되므로 오래 걸리는 작업을 하지 않아야 함)
+        shard_names: store_name이 여러 shard Store로 나뉘어 있으면 모든 shard의 리소스
+            이름 (rag/store_shards.py). 모든 shard를 한 번의 호출로 함께 검색하며, 캐시와
+            요청 합치기는 store_name 기준입니다. None이면 store_name만 검색합니다.
 
     Returns:
-        Dict[str, Any]: AI 생성 응답, 출처, 성공 여부, 에러 메시지를 포함하는 딕셔너리
+        Dict[str, Any]: AI 생성 응답, 출처, 성공 여부, 에러 메시지, 토큰 사용량(token_usage)을
+            포함하는 딕셔너리
+
+    """
+    try:
+        cached_response = _lookup_cached_response(query, store_name)
+        if cached_response is not None:
+            return cached_response
+
+        deadline = _query_deadline(auto_retry)
+        response = await query_coalescer.do_async(
+            _coalescing_key(query, store_name),
+            lambda: _generate_answer_with_retry(
+                query, store_name, deadline, auto_retry, on_retry, shard_names
+            ),
+        )
+        # 동시 대기자들이 같은 딕셔너리를 공유하지 않도록 복사본 반환
+        return dict(response)
+
+    except Exception as e:
+        return build_error_response(e)
+
 
+def query_with_rag(
+    query: str,
+    store_name: str,
+    auto_retry: bool = QUERY_AUTO_RETRY_ENABLED,
+    on_retry: Callable[[float, int], None] | None = None,
+    shard_names: list[str] | None = None,
+) -> dict[str, Any]:
+    """query_with_rag_async를 공유 이벤트 루프에서 실행하는 동기 래퍼입니다.
+
+    모든 동기 호출이 같은 이벤트 루프에서 실행되므로, 여러 스레드에서 동시에 들어온
+    같은 (질의, Store) 요청도 하나의 Gemini 호출로 합쳐집니다. 인자와 반환값은
+    query_with_rag_async와 같습니다 (on_retry는 이벤트 루프 스레드에서 호출됨).
     """
+    return run_sync(
+        query_with_rag_async(query, store_name, auto_retry, on_retry, shard_names)
+    )
+
+
+def _stream_answer(
+    query: str,
+    store_name: str,
+    deadline: Deadline,
+    shard_names: list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Gemini 스트리밍 호출의 청크 이벤트와 최종 이벤트를 생성합니다."""
+    client = GeminiClientManager.get_client()
+
+    estimated_tokens = _estimate_query_tokens(query)
+    rate_limiter.acquire(tokens=estimated_tokens, max_wait=deadline.remaining())
+    logger.info(f"RAG 스트리밍 쿼리 실행 중: '{query[:50]}...' (Store: {store_name})")
+    call_deadline = deadline.child(API_TIMEOUT_SECONDS)
+
+    text_parts: list[str] = []
+    last_chunk = None
+    grounded_chunk = None
     try:
-        if not GEMINI_API_KEY:
-            raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
-        client = genai.Client(api_key=GEMINI_API_KEY)
-
-        # File Search Tool을 genai.types.Tool 객체로 정의
-        file_search_tool = genai.types.Tool(
-            file_search=genai.types.FileSearch(
-                file_search_store_names=[store_name]
+        with call_deadline.guard():
+            stream = client.models.generate_content_stream(
+                model=GEMINI_MODEL_NAME,
+                contents=query,
+                config=build_generate_content_config(
+                    _search_store_names(store_name, shard_names),
+                    http_options=call_deadline.http_options(),
+                ),
             )
+            for chunk in stream:
+                # 청크 사이 대기는 HTTP 타임아웃이, 전체 스트림 시간은 예산 확인이 제한
+                call_deadline.check()
+                last_chunk = chunk
+                if chunk.candidates and getattr(
+                    chunk.candidates[0], "grounding_metadata", None
+                ):
+                    grounded_chunk = chunk
+                if chunk.text:
+                    text_parts.append(chunk.text)
+                    yield {"type": "chunk", "text": chunk.text}
+    except genai.errors.ClientError as e:
+        _pause_on_quota_error(e)
+        raise
+
+    if last_chunk is None:
+        raise QueryError("Gemini 모델로부터 스트리밍 응답을 받지 못했습니다.")
+    _settle_token_usage(estimated_tokens, last_chunk)
+
+    # 출처 정보는 스트림이 끝난 뒤 한 번만 파싱
+    citations = parse_grounding_metadata(grounded_chunk or last_chunk)
+    if text_parts:
+        formatted_response = {
+            "content": "".join(text_parts),
+            "citations": citations,
+            "success": True,
+            "error": None,
+            "token_usage": _token_usage(last_chunk),
+        }
+        logger.info(f"RAG 스트리밍 쿼리 성공: {len(citations)}개의 출처 발견")
+        answer_cache.put(query, store_name, formatted_response)
+    else:
+        formatted_response = format_response(last_chunk, citations)
+        logger.warning(
+            f"RAG 스트리밍 쿼리 실패: {formatted_response.get('error', '알 수 없는 오류')}"
         )
 
-        # 모델 생성 설정
-        generate_content_config = genai.types.GenerateContentConfig(
-            system_instruction=SECURITY_SYSTEM_PROMPT,
-            temperature=0.2,  # RAG에서는 사실 기반 답변을 위해 낮은 temperature 사용
-            tools=[file_search_tool],
+    yield {"type": "final", "response": formatted_response}
+
+
+def _retry_countdown(wait: float, attempt: int) -> Iterator[dict[str, Any]]:
+    """재시도 대기 시간 동안 1초마다 남은 시간을 알리는 이벤트를 생성합니다."""
+    resume_at = time.monotonic() + wait
+    while (remaining := resume_at - time.monotonic()) > 0:
+        yield {"type": "retry", "remaining": math.ceil(remaining), "attempt": attempt}
+        time.sleep(min(1.0, remaining))
+
+
+def _stream_answer_with_retry(
+    query: str,
+    store_name: str,
+    deadline: Deadline,
+    auto_retry: bool,
+    shard_names: list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """_stream_answer를 실행하되, 답변이 나오기 전에 사용량 초과가 발생하면
+    카운트다운 이벤트를 전달하며 기다렸다가 남은 예산 안에서 재시도합니다."""
+    attempt = 0
+    while True:
+        streamed = False
+        try:
+            for event in _stream_answer(query, store_name, deadline, shard_names):
+                streamed = streamed or event["type"] == "chunk"
+                yield event
+            return
+        except (genai.errors.ClientError, RateLimitError) as e:
+            # 이미 일부 답변을 전달했다면 중복 출력을 막기 위해 재시도하지 않음
+            wait = None if streamed else _next_retry_wait(e, deadline, auto_retry)
+            if wait is None:
+                raise
+            attempt += 1
+            logger.warning(
+                f"API 사용량 초과로 {wait:.1f}초 후 스트리밍 쿼리 자동 재시도 ({attempt}회차)"
+            )
+            yield from _retry_countdown(wait, attempt)
+
+
+def stream_query_with_rag(
+    query: str,
+    store_name: str,
+    auto_retry: bool = QUERY_AUTO_RETRY_ENABLED,
+    shard_names: list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """RAG 기반 쿼리를 스트리밍 방식으로 실행합니다.
+    답변 텍스트는 생성되는 즉시 부분 청크 단위로 전달되며, 출처(grounding metadata)는
+    마지막 청크를 받은 뒤 한 번만 파싱합니다.
+    같은 (질의, Store) 요청이 이미 스트리밍 중이면 그 요청이 끝날 때까지 기다렸다가
+    완성된 답변을 하나의 청크로 전달합니다.
+
+    Args:
+        query: 사용자 질의
+        store_name: Gemini File Search Store의 리소스 이름
+        auto_retry: 사용량 초과(429) 시 RetryInfo의 대기 시간 후 자동 재시도할지 여부
+        shard_names: 함께 검색할 모든 shard Store 리소스 이름 (query_with_rag와 동일)
+
+    Yields:
+        Dict[str, Any]: 다음 세 종류의 이벤트
+            - {"type": "chunk", "text": str}: 새로 생성된 부분 텍스트
+            - {"type": "retry", "remaining": int, "attempt": int}: 자동 재시도까지 남은
+              시간(초). 대기 중 1초마다 전달
+            - {"type": "final", "response": Dict[str, Any]}: query_with_rag와 동일한 형태의
+              최종 응답 (항상 마지막에 정확히 한 번 전달)
+
+    """
+    try:
+        cached_response = _lookup_cached_response(query, store_name)
+        if cached_response is not None:
+            yield {"type": "chunk", "text": cached_response["content"]}
+            yield {"type": "final", "response": cached_response}
+            return
+
+        key = _coalescing_key(query, store_name)
+        call, is_leader = query_coalescer.begin(key)
+        if not is_leader:
+            logger.info(f"진행 중인 동일 RAG 쿼리에 합류: '{query[:50]}...'")
+            shared_response = dict(call.wait())
+            if shared_response.get("content"):
+                yield {"type": "chunk", "text": shared_response["content"]}
+            yield {"type": "final", "response": shared_response}
+            return
+
+        final_response = None
+        error: BaseException | None = None
+        try:
+            for event in _stream_answer_with_retry(
+                query, store_name, _query_deadline(auto_retry), auto_retry, shard_names
+            ):
+                if event["type"] == "final":
+                    final_response = event["response"]
+                yield event
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if final_response is None and error is None:
+                # 소비자가 스트림을 중간에 닫았거나(GeneratorExit) 스크립트 실행이
+                # 중단된 경우: 그 제어 흐름 예외를 대기자에게 다시 던지지 않고 실패를 알림
+                error = QueryError("스트리밍 쿼리가 완료되기 전에 중단되었습니다.")
+            query_coalescer.finish(
+                key,
+                call,
+                result=final_response,
+                error=None if final_response is not None else error,
+            )
+
+    except Exception as e:
+        yield {"type": "final", "response": build_error_response(e)}
+
+
+def _store_label(store_name: str) -> str:
+    """Store 리소스 이름에서 표시용 ID를 추출합니다 (예: "fileSearchStores/policies" -> "policies")."""
+    return store_name.rsplit("/", 1)[-1]
+
+
+async def _timed_query(
+    query: str, store_name: str, auto_retry: bool
+) -> tuple[dict[str, Any], float]:
+    """단일 Store 쿼리를 실행하고 (응답, 소요 시간(초))을 반환합니다."""
+    start = time.perf_counter()
+    response = await query_with_rag_async(query, store_name, auto_retry=auto_retry)
+    return response, time.perf_counter() - start
+
+
+async def _fan_out_query(
+    query: str, store_names: list[str], auto_retry: bool
+) -> dict[str, Any]:
+    """Store마다 쿼리를 동시에 실행하고 답변과 출처를 병합합니다."""
+    timed = await asyncio.gather(
+        *(_timed_query(query, store_name, auto_retry) for store_name in store_names)
+    )
+    results = dict(zip(store_names, timed, strict=True))
+
+    sections = []
+    tagged = []
+    errors = []
+    per_store = {}
+    for store_name, (response, latency) in results.items():
+        per_store[store_name] = {
+            "success": response["success"],
+            "error": response.get("error"),
+            "latency": latency,
+            "cached": response.get("cached", False),
+        }
+        if response["success"]:
+            sections.append((store_name, response["content"]))
+            tagged.extend(
+                {"source": source, "store": store_name}
+                for source in response["citations"]
+            )
+        else:
+            errors.append(f"{_store_label(store_name)}: {response.get('error')}")
+
+    if len(sections) == 1:
+        content = sections[0][1]
+    else:
+        content = "\n\n".join(
+            f"**[{_store_label(store_name)}]**\n\n{text}" for store_name, text in sections
         )
 
-        # 쿼리 실행
-        logger.info(f"RAG 쿼리 실행 중: '{query[:50]}...' (Store: {store_name})")
-        response = client.models.generate_content(
-            model=GEMINI_MODEL_NAME,
-            contents=query,
-            config=generate_content_config,
+    return {
+        "content": content,
+        "tagged_citations": merge_citations(tagged),
+        "per_store": per_store,
+        "store_latencies": {name: info["latency"] for name, info in per_store.items()},
+        "success": bool(sections),
+        "error": "; ".join(errors) if errors else None,
+    }
+
+
+async def _single_call_query(query: str, store_names: list[str]) -> dict[str, Any]:
+    """모든 Store를 하나의 File Search 도구에 넣어 한 번의 호출로 쿼리합니다."""
+    client = GeminiClientManager.get_async_client()
+    deadline = Deadline(API_TIMEOUT_SECONDS, "멀티 Store RAG 쿼리")
+
+    estimated_tokens = _estimate_query_tokens(query)
+    await rate_limiter.acquire_async(
+        tokens=estimated_tokens, max_wait=deadline.remaining()
+    )
+    logger.info(f"멀티 Store RAG 쿼리 실행 중: '{query[:50]}...' ({len(store_names)}개 Store)")
+    start = time.perf_counter()
+    try:
+        response = await deadline.run_async(
+            client.models.generate_content(
+                model=GEMINI_MODEL_NAME,
+                contents=query,
+                config=build_generate_content_config(
+                    store_names, http_options=deadline.http_options()
+                ),
+            )
         )
+    except genai.errors.ClientError as e:
+        _pause_on_quota_error(e)
+        raise
+    latency = time.perf_counter() - start
+    _settle_token_usage(estimated_tokens, response)
+
+    tagged_citations = merge_citations(parse_store_citations(response))
+    formatted_response = format_response(
+        response, [citation["source"] for citation in tagged_citations]
+    )
+    formatted_response["tagged_citations"] = tagged_citations
+    formatted_response["token_usage"] = _token_usage(response)
+    # 한 번의 호출이므로 Store별 지연 시간은 구분할 수 없어 전체 호출 시간을 기록
+    formatted_response["store_latencies"] = dict.fromkeys(store_names, latency)
+    return formatted_response
+
+
+async def query_multi_store_with_rag_async(
+    query: str,
+    store_names: list[str],
+    fan_out: bool = True,
+    auto_retry: bool = QUERY_AUTO_RETRY_ENABLED,
+) -> dict[str, Any]:
+    """여러 File Search Store(예: 정책, 사고 보고서, 위협 인텔리전스)를 함께 검색합니다.
 
-        # 응답 처리 및 포맷팅
-        citations = parse_grounding_metadata(response)
-        formatted_response = format_response(response, citations)
+    Args:
+        query: 사용자 질의
+        store_names: 검색할 File Search Store 리소스 이름 목록
+        fan_out: True이면 Store마다 query_with_rag_async를 동시에 실행하고 답변을 Store별로
+            묶어 반환합니다 (캐시, 요청 합치기, 자동 재시도가 Store별로 적용됨).
+            False이면 모든 Store를 한 번의 Gemini 호출로 검색하여 하나의 통합 답변을 만듭니다.
+        auto_retry: 사용량 초과 시 자동 재시도 여부 (fan_out 모드에만 적용)
+
+    Returns:
+        Dict[str, Any]: query_with_rag 응답 형태에 다음 키가 추가된 딕셔너리
+            - tagged_citations: 출처별로 병합된 [{"source": str, "stores": List[str]}]
+            - store_latencies: Store별 응답 시간 (초)
+            - per_store: Store별 성공 여부/오류/응답 시간 (fan_out 모드)
+            citations에는 중복이 제거된 출처 이름만 담깁니다.
+
+    """
+    store_names = list(dict.fromkeys(store_names))
+    if not store_names:
+        return build_error_response(ValueError("검색할 File Search Store가 없습니다."))
 
-        if formatted_response["success"]:
-            logger.info(f"RAG 쿼리 성공: {len(citations)}개의 출처 발견")
+    try:
+        if fan_out:
+            response = await _fan_out_query(query, store_names, auto_retry)
         else:
-            logger.warning(
-                f"RAG 쿼리 실패: {formatted_response.get('error', '알 수 없는 오류')}"
-            )
+            response = await _single_call_query(query, store_names)
+    except Exception as e:
+        return build_error_response(e)
+
+    response["citations"] = [c["source"] for c in response["tagged_citations"]]
+    latencies = response["store_latencies"]
+    slowest = max(latencies, key=latencies.get)
+    logger.info(
+        f"멀티 Store RAG 쿼리 완료: {len(store_names)}개 Store, "
+        f"출처 {len(response['citations'])}개, "
+        f"가장 느린 Store {_store_label(slowest)} ({latencies[slowest]:.2f}초)"
+    )
+    return response
+
+
+def query_multi_store_with_rag(
+    query: str,
+    store_names: list[str],
+    fan_out: bool = True,
+    auto_retry: bool = QUERY_AUTO_RETRY_ENABLED,
+) -> dict[str, Any]:
+    """query_multi_store_with_rag_async를 공유 이벤트 루프에서 실행하는 동기 래퍼입니다.
 
-        return formatted_response
+    인자와 반환값은 query_multi_store_with_rag_async와 같습니다.
+    """
+    return run_sync(
+        query_multi_store_with_rag_async(query, store_names, fan_out, auto_retry)
+    )
 
-    except genai.errors.ClientError as e:
+
+def extract_retry_delay(error: genai.errors.ClientError) -> str | None:
+    """429 오류의 RetryInfo 상세 정보에서 서버가 권장한 재시도 대기 시간을 추출합니다.
+
+    Args:
+        error: Gemini API ClientError 객체
+
+    Returns:
+        Optional[str]: 재시도 대기 시간 문자열 (예: "17s") 또는 정보가 없으면 None
+
+    """
+    try:
+        # RetryInfo에서 재시도 대기 시간 추출
+        error_dict = error.details if hasattr(error, "details") else {}
+        if isinstance(error_dict, dict):
+            # SDK는 응답 본문 전체({"error": {...}})를 details에 담음
+            error_dict = error_dict.get("error", error_dict)
+            for detail in error_dict.get("details", []):
+                if detail.get("@type") == "type.googleapis.com/google.rpc.RetryInfo":
+                    return detail.get("retryDelay")
+    except Exception:
+        pass
+    return None
+
+
+def build_error_response(e: Exception) -> dict[str, Any]:
+    """쿼리 실행 중 발생한 예외를 표준화된 실패 응답 딕셔너리로 변환합니다.
+
+    Args:
+        e: 쿼리 실행 중 발생한 예외 객체
+
+    Returns:
+        Dict[str, Any]: success=False와 에러 메시지, 해결 방법을 포함하는 응답 딕셔너리
+
+    """
+    if isinstance(e, genai.errors.ClientError):
         # Gemini API ClientError 처리 (429 에러 포함)
         if e.code == 429:
             # API 사용량 초과 에러 특별 처리
             logger.error(f"Gemini API 사용량 초과: {e}")
-            retry_delay = "잠시 후"
-            try:
-                # RetryInfo에서 재시도 대기 시간 추출
-                error_dict = e.details if hasattr(e, "details") else {}
-                if isinstance(error_dict, dict):
-                    for detail in error_dict.get("details", []):
-                        if (
-                            detail.get("@type")
-                            == "type.googleapis.com/google.rpc.RetryInfo"
-                        ):
-                            retry_delay = detail.get("retryDelay", "잠시 후")
-                            break
-            except Exception:
-                pass
-
             return {
                 "content": "",
                 "citations": [],
                 "success": False,
                 "error": "API 사용량 초과",
                 "error_type": "quota_exceeded",
-                "retry_delay": retry_delay,
+                "retry_delay": extract_retry_delay(e) or "잠시 후",
                 "solution": "Gemini API의 무료 사용량을 초과했습니다. 잠시 후 다시 시도해주세요.",
             }
-        else:
-            # 기타 ClientError 처리
-            logger.error(f"Gemini API 오류 발생: {e}")
-            error_info = error_handler.handle_error(e, "RAG 쿼리 실행")
-            return {
-                "content": "",
-                "citations": [],
-                "success": False,
-                "error": error_info["message"],
-                "solution": error_info["solution"],
-            }
-    except GoogleAPIError as e:
-        # 기타 Gemini API 관련 오류 처리
+        # 기타 ClientError 처리
         logger.error(f"Gemini API 오류 발생: {e}")
         error_info = error_handler.handle_error(e, "RAG 쿼리 실행")
+    elif isinstance(e, RateLimitError):
+        # 클라이언트 측 레이트 리미터 대기 예산 초과는 사용량 초과와 같은 형태로 안내
+        logger.warning(f"레이트 리미터 대기 예산 초과: {e}")
+        error_info = error_handler.handle_error(e, "RAG 쿼리 실행")
         return {
             "content": "",
             "citations": [],
             "success": False,
             "error": error_info["message"],
+            "error_type": "quota_exceeded",
+            "retry_delay": f"{e.retry_after:.0f}s",
             "solution": error_info["solution"],
         }
-    except TimeoutError as e:
+    elif isinstance(e, GoogleAPIError):
+        # 기타 Gemini API 관련 오류 처리
+        logger.error(f"Gemini API 오류 발생: {e}")
+        error_info = error_handler.handle_error(e, "RAG 쿼리 실행")
+    elif isinstance(e, TimeoutError):
         # API 호출 타임아웃 오류 처리, QueryError로 래핑하여 error_handler 사용
-        logger.error(f"Gemini API 호출 타임아웃 발생 (초: {API_TIMEOUT_SECONDS}): {e}")
+        logger.error(f"Gemini API 호출 타임아웃 발생: {e}")
         error_info = error_handler.handle_error(
-            QueryError(f"API 호출 타임아웃 발생 (초: {API_TIMEOUT_SECONDS}): {e}"),
+            QueryError(f"API 호출 타임아웃 발생: {e}"),
             "RAG 쿼리 실행",
         )
-        return {
-            "content": "",
-            "citations": [],
-            "success": False,
-            "error": error_info["message"],
-            "solution": error_info["solution"],
-        }
-    except ValueError as e:
+    elif isinstance(e, ValueError):
         # Gemini API 클라이언트 초기화 오류 등 ValueError 처리, QueryError로 래핑하여 error_handler 사용
         logger.error(f"설정 또는 입력 값 오류 발생: {e}")
         error_info = error_handler.handle_error(
             QueryError(f"설정 또는 입력 값 오류: {e}"), "RAG 쿼리 실행"
         )
-        return {
-            "content": "",
-            "citations": [],
-            "success": False,
-            "error": error_info["message"],
-            "solution": error_info["solution"],
-        }
-    except Exception as e:
+    else:
         # 그 외 예상치 못한 오류 처리
         logger.error(f"예상치 못한 오류 발생: {e}", exc_info=True)
         error_info = error_handler.handle_error(e, "RAG 쿼리 실행")
-        return {
-            "content": "",
-            "citations": [],
-            "success": False,
-            "error": error_info["message"],
-            "solution": error_info["solution"],
-        }
+
+    return {
+        "content": "",
+        "citations": [],
+        "success": False,
+        "error": error_info["message"],
+        "solution": error_info["solution"],
+    }
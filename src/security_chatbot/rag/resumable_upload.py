@@ -0,0 +1,385 @@
+"""Resumable chunked upload module
+
+Uploads large documents to the Gemini Files API in chunks using the resumable
+upload protocol. The upload session URL and the last offset acknowledged by the
+server are checkpointed to disk, so a dropped connection or even a process
+restart continues the transfer instead of re-sending the file from byte zero.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import httpx
+from google.genai import errors as genai_errors
+from google.genai import types
+
+from security_chatbot.config import (
+    GEMINI_API_KEY,
+    RESUMABLE_UPLOAD_CHECKPOINT_DIR,
+    RESUMABLE_UPLOAD_CHUNK_BYTES,
+)
+from security_chatbot.utils.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# Files API의 resumable 업로드 엔드포인트
+UPLOAD_ENDPOINT = "https://generativelanguage.googleapis.com/upload/v1beta/files"
+
+# 마지막 청크를 제외한 모든 청크는 이 크기의 배수여야 함 (256KB)
+CHUNK_GRANULARITY = 256 * 1024
+
+# 연결이 끊겼을 때 서버에 받은 위치를 조회하고 이어서 보내는 최대 횟수
+MAX_RESUME_ATTEMPTS = 5
+INITIAL_RESUME_DELAY = 1.0
+MAX_RESUME_DELAY = 16.0
+
+# 재개 대상이 되는 일시적 HTTP 상태 코드
+_RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class _ResumableError(Exception):
+    """서버에 받은 위치를 조회한 뒤 이어서 보낼 수 있는 전송 오류"""
+
+
+def _server_error(code: int, message: str) -> genai_errors.ServerError:
+    """SDK 업로드와 같은 예외 타입으로 처리되도록 genai ServerError를 만듭니다."""
+    return genai_errors.ServerError(code, {"error": {"code": code, "message": message}})
+
+
+class UploadCheckpointStore:
+    """업로드 세션 URL과 서버가 확인한 전송 위치(offset)를 디스크에 기록하는 클래스
+
+    체크포인트는 파일 내용의 SHA-256 이름의 JSON 파일로 저장되므로,
+    같은 파일을 다시 업로드하면 프로세스가 재시작된 뒤에도 이어서 전송할 수 있습니다.
+    """
+
+    def __init__(self, directory: str = RESUMABLE_UPLOAD_CHECKPOINT_DIR):
+        """UploadCheckpointStore 초기화
+
+        Args:
+            directory: 체크포인트 파일을 저장할 디렉토리
+
+        """
+        self.directory = Path(directory)
+
+    def _path(self, sha256: str) -> Path:
+        return self.directory / f"{sha256}.json"
+
+    def load(self, sha256: str) -> dict[str, Any] | None:
+        """체크포인트를 읽습니다. 없거나 손상되었으면 None을 반환합니다."""
+        path = self._path(sha256)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"업로드 체크포인트를 읽을 수 없어 무시합니다: {path} - {e}")
+            return None
+
+    def save(self, sha256: str, checkpoint: dict[str, Any]) -> None:
+        """체크포인트를 원자적으로 기록합니다 (쓰는 도중 중단되어도 이전 내용이 유지됨)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(sha256)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({**checkpoint, "updated_at": time.time()}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def delete(self, sha256: str) -> None:
+        """완료되었거나 더 이상 쓸 수 없는 체크포인트를 삭제합니다."""
+        self._path(sha256).unlink(missing_ok=True)
+
+
+class ResumableUploader:
+    """Files API resumable 업로드 프로토콜로 파일을 청크 단위로 전송하는 클래스
+
+    연결이 끊기거나 일시적인 서버 오류가 나면 서버에 받은 위치를 조회(query)하여
+    그 위치부터 다시 보냅니다. 세션 URL과 위치는 청크마다 체크포인트에 기록됩니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str = GEMINI_API_KEY,
+        endpoint: str = UPLOAD_ENDPOINT,
+        chunk_size: int = RESUMABLE_UPLOAD_CHUNK_BYTES,
+        checkpoints: UploadCheckpointStore | None = None,
+        max_attempts: int = MAX_RESUME_ATTEMPTS,
+    ):
+        """ResumableUploader 초기화
+
+        Args:
+            api_key: Gemini API 키
+            endpoint: resumable 업로드 시작 엔드포인트
+            chunk_size: 청크 크기 (256KB 단위로 내림, 최소 256KB)
+            checkpoints: 체크포인트 저장소 (기본값: RESUMABLE_UPLOAD_CHECKPOINT_DIR)
+            max_attempts: 한 번의 upload 호출에서 연결 끊김 후 재개하는 최대 횟수
+
+        """
+        self.api_key = api_key
+        self.endpoint = endpoint
+        self.chunk_size = max(
+            CHUNK_GRANULARITY, chunk_size // CHUNK_GRANULARITY * CHUNK_GRANULARITY
+        )
+        self.checkpoints = checkpoints or UploadCheckpointStore()
+        self.max_attempts = max_attempts
+
+    def upload(
+        self,
+        source: str | BinaryIO,
+        validation: dict[str, Any],
+        display_name: str,
+        deadline: Deadline,
+    ) -> types.File:
+        """파일을 청크 단위로 업로드하고 완료된 File 객체를 반환합니다.
+
+        같은 내용(SHA-256)의 체크포인트가 있으면 새 세션을 만들지 않고
+        서버가 확인한 위치부터 이어서 전송합니다.
+
+        Args:
+            source: 업로드할 파일 경로 또는 seek 가능한 바이너리 파일 객체
+            validation: validate_file/validate_stream의 결과 (file_size, mime_type, sha256)
+            display_name: 파일의 표시 이름
+            deadline: 업로드 전체에 적용할 시간 예산
+
+        Returns:
+            types.File: 업로드가 완료된 파일
+
+        Raises:
+            genai.errors.APIError: 재개할 수 없는 HTTP 오류 또는 재개 횟수 초과
+                (SDK의 files.upload와 같은 예외 타입)
+            TimeoutError: 시간 예산 초과
+
+        """
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                return self._upload(f, validation, display_name, deadline)
+        return self._upload(source, validation, display_name, deadline)
+
+    def _upload(
+        self,
+        stream: BinaryIO,
+        validation: dict[str, Any],
+        display_name: str,
+        deadline: Deadline,
+    ) -> types.File:
+        sha256 = validation["sha256"]
+        file_size = validation["file_size"]
+
+        with httpx.Client() as http, deadline.guard():
+            session_url, offset = self._resume_or_start(
+                http, validation, display_name, deadline
+            )
+            if isinstance(offset, types.File):
+                return self._finish(sha256, display_name, file_size, offset)
+            attempts = 0
+            delay = INITIAL_RESUME_DELAY
+
+            while True:
+                try:
+                    result = self._send_chunk(
+                        http, stream, session_url, offset, file_size, deadline
+                    )
+                except _ResumableError as e:
+                    attempts += 1
+                    if attempts >= self.max_attempts or not deadline.allows(delay):
+                        logger.error(
+                            f"청크 업로드 재개 포기 ({attempts}회 실패, offset={offset}): {e}"
+                        )
+                        raise _server_error(503, f"청크 업로드 실패: {e}") from e
+                    logger.warning(
+                        f"청크 업로드 중단 (offset={offset}/{file_size}): {e}. "
+                        f"{delay:.1f}초 후 이어서 전송..."
+                    )
+                    time.sleep(delay)
+                    delay = min(delay * 2, MAX_RESUME_DELAY)
+                    try:
+                        offset = self._query_offset(http, session_url, deadline)
+                    except _ResumableError as query_error:
+                        logger.warning(f"업로드 위치 조회 실패: {query_error}")
+                        continue
+                    if isinstance(offset, types.File):
+                        # 마지막 청크는 도착했지만 응답을 받기 전에 연결이 끊긴 경우
+                        return self._finish(sha256, display_name, file_size, offset)
+                    if offset is None:
+                        # 세션이 만료되었으면 처음부터 새 세션으로 시작
+                        self.checkpoints.delete(sha256)
+                        session_url, offset = self._start(
+                            http, validation, display_name, deadline
+                        )
+                    self._checkpoint(sha256, session_url, offset, file_size)
+                    continue
+
+                if isinstance(result, types.File):
+                    return self._finish(sha256, display_name, file_size, result)
+
+                offset = result
+                self._checkpoint(sha256, session_url, offset, file_size)
+
+    def _finish(
+        self, sha256: str, display_name: str, file_size: int, file: types.File
+    ) -> types.File:
+        """완료된 업로드의 체크포인트를 지우고 File을 반환합니다."""
+        self.checkpoints.delete(sha256)
+        logger.info(
+            f"청크 업로드 완료: {display_name} "
+            f"({file_size / (1024 * 1024):.2f}MB, file={file.name})"
+        )
+        return file
+
+    def _resume_or_start(
+        self,
+        http: httpx.Client,
+        validation: dict[str, Any],
+        display_name: str,
+        deadline: Deadline,
+    ) -> tuple[str, int | types.File]:
+        """체크포인트로 이전 세션을 이어가거나 새 업로드 세션을 시작합니다.
+
+        이전 세션의 업로드가 이미 끝났으면 위치 대신 완료된 File을 반환합니다.
+        """
+        sha256 = validation["sha256"]
+        checkpoint = self.checkpoints.load(sha256)
+        if checkpoint and checkpoint.get("file_size") == validation["file_size"]:
+            session_url = checkpoint["upload_url"]
+            try:
+                offset = self._query_offset(http, session_url, deadline)
+            except _ResumableError as e:
+                logger.warning(f"이전 업로드 세션 조회 실패, 새로 시작합니다: {e}")
+                offset = None
+            if isinstance(offset, types.File):
+                logger.info(f"이전 업로드 세션이 이미 완료됨: {validation['file_name']}")
+                return session_url, offset
+            if offset is not None:
+                logger.info(
+                    f"이전 업로드 세션에서 재개: {validation['file_name']} "
+                    f"(offset={offset}/{validation['file_size']})"
+                )
+                return session_url, offset
+            self.checkpoints.delete(sha256)
+        return self._start(http, validation, display_name, deadline)
+
+    def _start(
+        self,
+        http: httpx.Client,
+        validation: dict[str, Any],
+        display_name: str,
+        deadline: Deadline,
+    ) -> tuple[str, int]:
+        """새 resumable 업로드 세션을 시작하고 세션 URL을 체크포인트에 기록합니다."""
+        response = self._request(
+            http,
+            self.endpoint,
+            deadline,
+            headers={
+                "X-Goog-Upload-Protocol": "resumable",
+                "X-Goog-Upload-Command": "start",
+                "X-Goog-Upload-Header-Content-Length": str(validation["file_size"]),
+                "X-Goog-Upload-Header-Content-Type": validation["mime_type"],
+                "Content-Type": "application/json",
+            },
+            content=json.dumps({"file": {"display_name": display_name}}),
+        )
+        session_url = response.headers.get("x-goog-upload-url")
+        if not session_url:
+            raise _server_error(502, "업로드 세션 URL이 응답에 없습니다.")
+        self._checkpoint(validation["sha256"], session_url, 0, validation["file_size"])
+        return session_url, 0
+
+    def _query_offset(
+        self, http: httpx.Client, session_url: str, deadline: Deadline
+    ) -> int | types.File | None:
+        """서버가 받은 바이트 수를 조회합니다.
+
+        세션의 업로드가 이미 끝났으면(상태 final) 응답에 담긴 File을, 세션이 더 이상
+        유효하지 않으면 None을 반환합니다.
+        """
+        try:
+            response = self._request(
+                http, session_url, deadline, headers={"X-Goog-Upload-Command": "query"}
+            )
+        except genai_errors.APIError:
+            return None
+        status = response.headers.get("x-goog-upload-status")
+        if status == "final":
+            try:
+                return types.File.model_validate(response.json()["file"])
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"완료된 업로드 세션의 File을 읽을 수 없습니다: {e}")
+                return None
+        if status != "active":
+            return None
+        return int(response.headers.get("x-goog-upload-size-received", "0"))
+
+    def _send_chunk(
+        self,
+        http: httpx.Client,
+        stream: BinaryIO,
+        session_url: str,
+        offset: int,
+        file_size: int,
+        deadline: Deadline,
+    ) -> int | types.File:
+        """offset부터 청크 하나를 보냅니다. 마지막 청크면 File을, 아니면 다음 offset을 반환합니다."""
+        stream.seek(offset)
+        chunk = stream.read(self.chunk_size)
+        final = offset + len(chunk) >= file_size
+        response = self._request(
+            http,
+            session_url,
+            deadline,
+            headers={
+                "X-Goog-Upload-Command": "upload, finalize" if final else "upload",
+                "X-Goog-Upload-Offset": str(offset),
+                "Content-Length": str(len(chunk)),
+            },
+            content=chunk,
+        )
+        if final:
+            return types.File.model_validate(response.json()["file"])
+        return offset + len(chunk)
+
+    def _request(
+        self,
+        http: httpx.Client,
+        url: str,
+        deadline: Deadline,
+        headers: dict[str, str],
+        content: bytes | str | None = None,
+    ) -> httpx.Response:
+        """남은 시간 예산을 타임아웃으로 요청을 보냅니다.
+
+        Raises:
+            _ResumableError: 연결 끊김 또는 일시적 서버 오류 (이어서 전송 가능)
+            genai.errors.APIError: 재개할 수 없는 HTTP 오류
+
+        """
+        try:
+            response = http.post(
+                url,
+                headers={"x-goog-api-key": self.api_key, **headers},
+                content=content,
+                timeout=deadline.check(),
+            )
+        except httpx.TimeoutException:
+            raise
+        except httpx.TransportError as e:
+            raise _ResumableError(f"연결 오류: {e!r}") from e
+        if response.status_code in _RETRYABLE_STATUS_CODES:
+            raise _ResumableError(f"HTTP {response.status_code}")
+        if response.status_code >= 400:
+            genai_errors.APIError.raise_for_response(response)
+        return response
+
+    def _checkpoint(
+        self, sha256: str, session_url: str, offset: int, file_size: int
+    ) -> None:
+        self.checkpoints.save(
+            sha256, {"upload_url": session_url, "offset": offset, "file_size": file_size}
+        )
@@ -1,10 +1,17 @@
 """Google Gemini File Search Store management module
 
-Provides FileSearchStoreManager class to handle File Search Store operations
-including create, retrieve, list, and delete.
+Provides AsyncFileSearchStoreManager, built on the SDK's async client, to handle
+File Search Store operations including create, retrieve, list, and delete, and
+lazily paged listing of stores and of the documents in a store.
+FileSearchStoreManager is its synchronous wrapper for non-async callers. Store
+metadata is served from a short-lived process-wide cache that create/delete
+invalidate.
 """
 
 import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
 
 from google import genai
 from google.api_core.exceptions import (
@@ -14,20 +21,113 @@ from google.api_core.exceptions import (
     NotFound,
     PermissionDenied,
 )
+from google.genai import errors as genai_errors
 from google.genai import types
 
-from security_chatbot.config import DEFAULT_STORE_DISPLAY_NAME
+from security_chatbot.config import (
+    API_TIMEOUT_SECONDS,
+    DEFAULT_STORE_DISPLAY_NAME,
+    STORE_CACHE_TTL_SECONDS,
+    STORE_LIST_PAGE_SIZE,
+)
+from security_chatbot.rag.answer_cache import answer_cache, store_name_from_resource
+from security_chatbot.rag.upload_manifest import upload_manifest
 from security_chatbot.utils.api_client import GeminiClientManager
+from security_chatbot.utils.deadline import Deadline
+from security_chatbot.utils.event_loop import iterate_sync, run_sync
+from security_chatbot.utils.rate_limiter import rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# 문서 삭제 설정: 인덱싱된 청크가 있는 문서도 청크와 함께 삭제
+DELETE_DOCUMENT_CONFIG = {"force": True}
 
-class FileSearchStoreManager:
+
+class StoreCache:
+    """File Search Store 메타데이터의 TTL 캐시 클래스
+
+    get_store()의 Store별 조회 결과와 list_stores()의 전체 목록을 ttl_seconds 동안
+    보관합니다. 앱에서 Store를 생성/삭제하면 즉시 무효화되며, 다른 경로의 변경이나
+    문서 수 등의 변화는 최대 ttl_seconds 늦게 반영됩니다. 찾을 수 없는 Store는
+    캐시하지 않습니다.
+    """
+
+    def __init__(self, ttl_seconds: float = STORE_CACHE_TTL_SECONDS):
+        """StoreCache 초기화
+
+        Args:
+            ttl_seconds: 항목 유효 시간 (초). 0 이하이면 아무것도 보관하지 않음
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self._stores: dict[str, tuple[float, types.FileSearchStore]] = {}
+        self._listing: tuple[float, list[types.FileSearchStore]] | None = None
+        self._lock = threading.Lock()
+
+    def get_store(self, store_name: str) -> types.FileSearchStore | None:
+        """캐시된 Store를 반환합니다 (없거나 만료되면 None)."""
+        with self._lock:
+            entry = self._stores.get(store_name)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._stores[store_name]
+                return None
+            return entry[1]
+
+    def put_store(self, store: types.FileSearchStore) -> None:
+        """조회한 Store 하나를 TTL 동안 보관합니다."""
+        if self.ttl_seconds <= 0 or not store.name:
+            return
+        with self._lock:
+            self._stores[store.name] = (time.monotonic() + self.ttl_seconds, store)
+
+    def get_listing(self) -> list[types.FileSearchStore] | None:
+        """캐시된 전체 Store 목록의 사본을 반환합니다 (없거나 만료되면 None)."""
+        with self._lock:
+            if self._listing is None or self._listing[0] <= time.monotonic():
+                self._listing = None
+                return None
+            return list(self._listing[1])
+
+    def put_listing(self, stores: list[types.FileSearchStore]) -> None:
+        """전체 Store 목록을 보관하고, 각 Store의 조회 결과도 함께 채웁니다."""
+        if self.ttl_seconds <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._listing = (expires_at, list(stores))
+            for store in stores:
+                if store.name:
+                    self._stores[store.name] = (expires_at, store)
+
+    def invalidate(self, store_name: str | None = None) -> None:
+        """Store 하나(와 전체 목록) 또는 store_name이 None이면 모든 항목을 무효화합니다."""
+        with self._lock:
+            self._listing = None
+            if store_name is None:
+                self._stores.clear()
+            else:
+                self._stores.pop(store_name, None)
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        self.invalidate()
+
+
+# 프로세스 전역에서 공유하는 Store 메타데이터 캐시
+# (Store 매니저는 호출마다 새로 만들어지므로 인스턴스가 아닌 모듈 수준에 둠)
+store_cache = StoreCache()
+
+
+class AsyncFileSearchStoreManager:
     """Google Gemini File Search Store의 생성, 조회, 목록 조회, 삭제를 관리하는 클래스입니다.
+    SDK의 비동기 클라이언트(client.aio)로 호출하므로 하나의 이벤트 루프에서 여러 Store
+    작업을 동시에 진행할 수 있습니다. 동기 코드에서는 FileSearchStoreManager를 사용합니다.
     """
 
     def __init__(self, client: genai.Client | None = None):
-        """FileSearchStoreManager의 생성자입니다.
+        """AsyncFileSearchStoreManager의 생성자입니다.
 
         Args:
             client (Optional[genai.Client]): 초기화된 Gemini API 클라이언트.
@@ -37,9 +137,9 @@ class FileSearchStoreManager:
         self.client = client if client else GeminiClientManager.get_client()
         if not self.client:
             raise ValueError("Gemini API 클라이언트를 초기화할 수 없습니다.")
-        logger.info("FileSearchStoreManager가 초기화되었습니다.")
+        logger.info("AsyncFileSearchStoreManager가 초기화되었습니다.")
 
-    def create_store(
+    async def create_store(
         self, display_name: str = DEFAULT_STORE_DISPLAY_NAME
     ) -> types.FileSearchStore | None:
         """새로운 File Search Store를 생성합니다.
@@ -53,9 +153,14 @@ class FileSearchStoreManager:
         """
         logger.info(f"File Search Store 생성 시도: display_name='{display_name}'")
         try:
-            store = self.client.file_search_stores.create(
-                config={"display_name": display_name}
+            await rate_limiter.acquire_async()
+            store = await Deadline(API_TIMEOUT_SECONDS, "Store 생성").run_async(
+                self.client.aio.file_search_stores.create(
+                    config={"display_name": display_name}
+                )
             )
+            store_cache.invalidate()
+            store_cache.put_store(store)
             logger.info(
                 f"File Search Store 생성 성공: name='{store.name}', display_name='{display_name}'"
             )
@@ -76,19 +181,30 @@ class FileSearchStoreManager:
             )
             return None
 
-    def get_store(self, store_name: str) -> types.FileSearchStore | None:
+    async def get_store(self, store_name: str) -> types.FileSearchStore | None:
         """지정된 이름의 File Search Store를 조회합니다.
 
         Args:
             store_name (str): 조회할 File Search Store의 전체 리소스 이름 (예: "fileSearchStores/store-id").
 
+        최근 STORE_CACHE_TTL_SECONDS 안에 조회한 Store는 API를 호출하지 않고 캐시에서 반환합니다.
+
         Returns:
             Optional[types.FileSearchStore]: 조회된 File Search Store 객체 또는 찾을 수 없거나 실패 시 None.
 
         """
+        cached = store_cache.get_store(store_name)
+        if cached is not None:
+            logger.debug(f"File Search Store 캐시 사용: name='{store_name}'")
+            return cached
+
         logger.info(f"File Search Store 조회 시도: name='{store_name}'")
         try:
-            store = self.client.file_search_stores.get(name=store_name)
+            await rate_limiter.acquire_async()
+            store = await Deadline(API_TIMEOUT_SECONDS, "Store 조회").run_async(
+                self.client.aio.file_search_stores.get(name=store_name)
+            )
+            store_cache.put_store(store)
             logger.info(
                 f"File Search Store 조회 성공: name='{store.name}', display_name='{store.display_name}'"
             )
@@ -109,16 +225,59 @@ class FileSearchStoreManager:
             )
             return None
 
-    def list_stores(self) -> list[types.FileSearchStore]:
+    async def iter_stores(
+        self, page_size: int = STORE_LIST_PAGE_SIZE
+    ) -> AsyncIterator[types.FileSearchStore]:
+        """File Search Store를 하나씩 가져옵니다 (필요할 때 다음 페이지를 요청).
+
+        호출자가 멈추면 남은 페이지는 요청하지 않으며, 페이지마다 속도 제한과 시간
+        제한(API_TIMEOUT_SECONDS)을 적용합니다. 캐시를 거치지 않습니다.
+
+        Args:
+            page_size (int): 요청 한 번에 받을 Store 수.
+
+        Yields:
+            types.FileSearchStore: File Search Store 객체.
+
+        Raises:
+            GoogleAPIError: 조회에 실패한 경우.
+            TimeoutError: 페이지 요청이 시간 제한 안에 끝나지 않은 경우.
+
+        """
+        page_token = None
+        while True:
+            config = {"page_size": page_size}
+            if page_token:
+                config["page_token"] = page_token
+            await rate_limiter.acquire_async()
+            pager = await Deadline(API_TIMEOUT_SECONDS, "Store 목록 조회").run_async(
+                self.client.aio.file_search_stores.list(config=config)
+            )
+            for store in pager.page:
+                yield store
+            page_token = pager.config.get("page_token")
+            if not page_token:
+                return
+
+    async def list_stores(self) -> list[types.FileSearchStore]:
         """모든 File Search Store 목록을 조회합니다.
 
+        최근 STORE_CACHE_TTL_SECONDS 안에 조회한 목록은 API를 호출하지 않고 캐시에서
+        반환합니다. 일부만 필요하면 iter_stores()를 사용하세요.
+
         Returns:
             List[types.FileSearchStore]: File Search Store 객체 목록. 오류 발생 시 빈 리스트 반환.
 
         """
+        cached = store_cache.get_listing()
+        if cached is not None:
+            logger.debug(f"File Search Store 목록 캐시 사용: {len(cached)}개")
+            return cached
+
         logger.info("File Search Store 목록 조회 시도.")
         try:
-            stores = list(self.client.file_search_stores.list())
+            stores = [store async for store in self.iter_stores()]
+            store_cache.put_listing(stores)
             logger.info(
                 f"File Search Store 목록 조회 성공. 총 {len(stores)}개의 스토어 발견."
             )
@@ -130,7 +289,72 @@ class FileSearchStoreManager:
             logger.error(f"File Search Store 목록 조회 중 알 수 없는 오류 발생: {e}")
             return []
 
-    def delete_store(self, store_name: str) -> bool:
+    async def iter_document_pages(
+        self, store_name: str, page_size: int = STORE_LIST_PAGE_SIZE
+    ) -> AsyncIterator[list[types.Document]]:
+        """Store의 문서 목록을 한 페이지씩 가져옵니다.
+
+        다음 페이지는 호출자가 이전 페이지를 처리한 뒤 요청하므로, 문서가 많아도 한 번에
+        한 페이지만 메모리에 올라옵니다. 페이지마다 별도 요청이며 각각 속도 제한과
+        시간 제한(API_TIMEOUT_SECONDS)을 적용합니다.
+
+        Args:
+            store_name (str): 문서를 조회할 File Search Store의 전체 리소스 이름.
+            page_size (int): 요청 한 번에 받을 문서 수.
+
+        Yields:
+            List[types.Document]: 문서 목록 한 페이지 (name은 코퍼스 파일 리소스 이름).
+
+        Raises:
+            GoogleAPIError: 조회에 실패한 경우. 목록이 중간에 끊기면 일부만 본 것이므로
+                            다른 목록 조회 메서드와 달리 빈 결과 대신 예외를 전달합니다.
+            TimeoutError: 페이지 요청이 시간 제한 안에 끝나지 않은 경우.
+
+        """
+        page_token = None
+        page_number = 0
+        while True:
+            config = {"page_size": page_size}
+            if page_token:
+                config["page_token"] = page_token
+            await rate_limiter.acquire_async()
+            pager = await Deadline(API_TIMEOUT_SECONDS, "문서 목록 조회").run_async(
+                self.client.aio.file_search_stores.documents.list(
+                    parent=store_name, config=config
+                )
+            )
+            page_number += 1
+            logger.debug(
+                f"문서 목록 {page_number}페이지 조회: name='{store_name}', "
+                f"{len(pager.page)}개"
+            )
+            yield list(pager.page)
+            page_token = pager.config.get("page_token")
+            if not page_token:
+                return
+
+    async def iter_documents(
+        self, store_name: str, page_size: int = STORE_LIST_PAGE_SIZE
+    ) -> AsyncIterator[types.Document]:
+        """Store의 문서를 하나씩 가져옵니다 (필요할 때 다음 페이지를 요청).
+
+        Args:
+            store_name (str): 문서를 조회할 File Search Store의 전체 리소스 이름.
+            page_size (int): 요청 한 번에 받을 문서 수.
+
+        Yields:
+            types.Document: Store의 문서.
+
+        Raises:
+            GoogleAPIError: 조회에 실패한 경우.
+            TimeoutError: 페이지 요청이 시간 제한 안에 끝나지 않은 경우.
+
+        """
+        async for page in self.iter_document_pages(store_name, page_size):
+            for document in page:
+                yield document
+
+    async def delete_store(self, store_name: str) -> bool:
         """지정된 이름의 File Search Store를 삭제합니다.
 
         Args:
@@ -142,7 +366,13 @@ class FileSearchStoreManager:
         """
         logger.info(f"File Search Store 삭제 시도: name='{store_name}'")
         try:
-            self.client.file_search_stores.delete(name=store_name)
+            await rate_limiter.acquire_async()
+            await Deadline(API_TIMEOUT_SECONDS, "Store 삭제").run_async(
+                self.client.aio.file_search_stores.delete(name=store_name)
+            )
+            store_cache.invalidate(store_name)
+            answer_cache.invalidate_store(store_name)
+            upload_manifest.forget_store(store_name)
             logger.info(f"File Search Store 삭제 성공: name='{store_name}'")
             return True
         except NotFound:
@@ -161,12 +391,14 @@ class FileSearchStoreManager:
             )
             return False
 
-    def delete_corpus_file(self, corpus_file_resource_name: str) -> bool:
+    async def delete_corpus_file(self, corpus_file_resource_name: str) -> bool:
         """지정된 File Search Store에서 개별 코퍼스 파일(corpus file)을 삭제합니다.
 
+        File Search Store의 문서(documents) 리소스를 청크와 함께 삭제합니다.
+
         Args:
-            corpus_file_resource_name (str): 삭제할 코퍼스 파일의 전체 리소스 이름
-                                              (예: "fileSearchStores/store-id/corpusFiles/file-id")
+            corpus_file_resource_name (str): 삭제할 코퍼스 파일(문서)의 전체 리소스 이름
+                                              (예: "fileSearchStores/store-id/documents/doc-id")
 
         Returns:
             bool: 삭제 성공 시 True, 실패 시 False.
@@ -176,14 +408,32 @@ class FileSearchStoreManager:
             f"코퍼스 파일 삭제 시도: corpus_file_resource_name='{corpus_file_resource_name}'"
         )
         try:
-            self.client.file_search_stores.delete_corpus_file(
-                name=corpus_file_resource_name
+            await rate_limiter.acquire_async()
+            await Deadline(API_TIMEOUT_SECONDS, "문서 삭제").run_async(
+                self.client.aio.file_search_stores.documents.delete(
+                    name=corpus_file_resource_name, config=DELETE_DOCUMENT_CONFIG
+                )
             )
+            # 문서 집합이 바뀌었으므로 해당 Store의 캐시된 답변을 무효화
+            store_name = store_name_from_resource(corpus_file_resource_name)
+            if store_name:
+                # Store의 문서 수/크기가 바뀌었으므로 캐시된 메타데이터도 무효화
+                store_cache.invalidate(store_name)
+                answer_cache.record_corpus_change(store_name, corpus_file_resource_name)
+            else:
+                answer_cache.invalidate_all()
+            # 삭제된 문서와 같은 내용의 파일은 다시 업로드되어야 함
+            upload_manifest.forget_corpus_file(corpus_file_resource_name)
             logger.info(
                 f"코퍼스 파일 삭제 성공: corpus_file_resource_name='{corpus_file_resource_name}'"
             )
             return True
-        except NotFound:
+        except (NotFound, genai_errors.ClientError) as e:
+            if isinstance(e, genai_errors.ClientError) and e.code != 404:
+                logger.error(
+                    f"코퍼스 파일 삭제 중 API 오류 발생 (corpus_file_resource_name='{corpus_file_resource_name}'): {e}"
+                )
+                return False
             logger.warning(
                 f"코퍼스 파일 삭제 실패: '{corpus_file_resource_name}'을(를) 찾을 수 없습니다. 이미 삭제되었거나 존재하지 않습니다."
             )
@@ -203,3 +453,61 @@ class FileSearchStoreManager:
                 f"코퍼스 파일 삭제 중 알 수 없는 오류 발생 (corpus_file_resource_name='{corpus_file_resource_name}'): {e}"
             )
             return False
+
+
+class FileSearchStoreManager:
+    """Google Gemini File Search Store의 생성, 조회, 목록 조회, 삭제를 관리하는 클래스입니다.
+    AsyncFileSearchStoreManager를 공유 이벤트 루프에서 실행하는 동기 래퍼이므로, 반환값/에러
+    처리/캐시 무효화 규칙은 비동기 버전과 같습니다 (각 메서드 설명은 비동기 버전 참고).
+    """
+
+    def __init__(self, client: genai.Client | None = None):
+        """FileSearchStoreManager의 생성자입니다.
+
+        Args:
+            client (Optional[genai.Client]): 초기화된 Gemini API 클라이언트.
+                                             제공되지 않으면 GeminiClientManager를 통해 새로 가져옵니다.
+
+        """
+        self.engine = AsyncFileSearchStoreManager(client=client)
+        self.client = self.engine.client
+
+    def create_store(
+        self, display_name: str = DEFAULT_STORE_DISPLAY_NAME
+    ) -> types.FileSearchStore | None:
+        """새로운 File Search Store를 생성합니다."""
+        return run_sync(self.engine.create_store(display_name))
+
+    def get_store(self, store_name: str) -> types.FileSearchStore | None:
+        """지정된 이름의 File Search Store를 조회합니다 (캐시 사용)."""
+        return run_sync(self.engine.get_store(store_name))
+
+    def iter_stores(
+        self, page_size: int = STORE_LIST_PAGE_SIZE
+    ) -> Iterator[types.FileSearchStore]:
+        """File Search Store를 하나씩 가져옵니다 (필요할 때 다음 페이지를 요청)."""
+        return iterate_sync(self.engine.iter_stores(page_size))
+
+    def list_stores(self) -> list[types.FileSearchStore]:
+        """모든 File Search Store 목록을 조회합니다 (캐시 사용)."""
+        return run_sync(self.engine.list_stores())
+
+    def iter_document_pages(
+        self, store_name: str, page_size: int = STORE_LIST_PAGE_SIZE
+    ) -> Iterator[list[types.Document]]:
+        """Store의 문서 목록을 한 페이지씩 가져옵니다."""
+        return iterate_sync(self.engine.iter_document_pages(store_name, page_size))
+
+    def iter_documents(
+        self, store_name: str, page_size: int = STORE_LIST_PAGE_SIZE
+    ) -> Iterator[types.Document]:
+        """Store의 문서를 하나씩 가져옵니다 (필요할 때 다음 페이지를 요청)."""
+        return iterate_sync(self.engine.iter_documents(store_name, page_size))
+
+    def delete_store(self, store_name: str) -> bool:
+        """지정된 이름의 File Search Store를 삭제합니다."""
+        return run_sync(self.engine.delete_store(store_name))
+
+    def delete_corpus_file(self, corpus_file_resource_name: str) -> bool:
+        """File Search Store에서 개별 코퍼스 파일(문서)을 청크와 함께 삭제합니다."""
+        return run_sync(self.engine.delete_corpus_file(corpus_file_resource_name))
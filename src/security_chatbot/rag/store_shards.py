@@ -0,0 +1,175 @@
+"""Sharded File Search Store module
+
+Spreads one logical File Search Store over several stores ("shards") so the
+corpus can keep growing past per-store size and document limits. The store the
+app created first stays the logical store's identity (session, catalog, answer
+cache); additional shards are created on demand once the newest shard reaches
+a size or document-count threshold and are recorded in the document catalog.
+Uploads go to the newest shard, deletes are routed by the shard prefix of the
+corpus file resource name, and queries search every shard at once.
+"""
+
+import logging
+import threading
+
+from security_chatbot.config import STORE_SHARD_MAX_BYTES, STORE_SHARD_MAX_DOCUMENTS
+from security_chatbot.rag.answer_cache import answer_cache, store_name_from_resource
+from security_chatbot.rag.document_catalog import DocumentCatalog
+from security_chatbot.rag.store_manager import FileSearchStoreManager, store_cache
+
+logger = logging.getLogger(__name__)
+
+# 같은 프로세스의 여러 세션이 동시에 shard를 만들지 않도록 하는 잠금
+_shard_creation_lock = threading.Lock()
+
+
+class ShardedStore:
+    """여러 File Search Store(shard)로 나뉜 하나의 논리 Store를 다루는 클래스
+
+    shard 목록의 첫 번째는 항상 논리 Store 자신입니다. shard가 하나뿐이면 기존
+    단일 Store와 똑같이 동작합니다.
+    """
+
+    def __init__(
+        self,
+        store_name: str,
+        catalog: DocumentCatalog,
+        display_name: str | None = None,
+        store_manager: FileSearchStoreManager | None = None,
+        max_bytes: int = STORE_SHARD_MAX_BYTES,
+        max_documents: int = STORE_SHARD_MAX_DOCUMENTS,
+    ):
+        """ShardedStore 초기화
+
+        Args:
+            store_name: 논리 Store(첫 번째 shard)의 리소스 이름
+            catalog: shard 목록을 기록하는 문서 카탈로그
+            display_name: 새 shard의 표시 이름 기준 (기본값: store_name의 ID)
+            store_manager: shard 조회/생성/삭제에 사용할 FileSearchStoreManager
+                (기본값: 처음 필요할 때 생성)
+            max_bytes: shard 하나의 최대 크기 (바이트, 0이면 제한 없음)
+            max_documents: shard 하나의 최대 문서 수 (0이면 제한 없음)
+
+        """
+        self.store_name = store_name
+        self.catalog = catalog
+        self.display_name = display_name or store_name.rsplit("/", 1)[-1]
+        self.max_bytes = max_bytes
+        self.max_documents = max_documents
+        self._store_manager = store_manager
+
+    @property
+    def store_manager(self) -> FileSearchStoreManager:
+        if self._store_manager is None:
+            self._store_manager = FileSearchStoreManager()
+        return self._store_manager
+
+    @property
+    def shard_names(self) -> list[str]:
+        """모든 shard 리소스 이름 (생성 순서, 논리 Store가 첫 번째)"""
+        return self.catalog.list_shards(self.store_name)
+
+    def _is_full(self, shard_name: str, incoming_bytes: int) -> bool:
+        """shard에 incoming_bytes 크기의 문서를 더하면 기준을 넘는지 확인합니다.
+
+        비어 있는 shard는 문서가 기준보다 커도 받아들입니다 (새 shard를 만들어도
+        마찬가지이므로). Store 정보를 조회할 수 없으면 가득 차지 않은 것으로 봅니다.
+        """
+        if self.max_bytes <= 0 and self.max_documents <= 0:
+            return False
+        store = self.store_manager.get_store(shard_name)
+        if store is None:
+            return False
+        used_bytes = store.size_bytes or 0
+        documents = (store.active_documents_count or 0) + (
+            store.pending_documents_count or 0
+        )
+        if self.max_documents > 0 and documents >= self.max_documents:
+            return True
+        return (
+            self.max_bytes > 0
+            and used_bytes > 0
+            and used_bytes + incoming_bytes > self.max_bytes
+        )
+
+    def select_shard(self, incoming_bytes: int = 0) -> str:
+        """새 문서를 업로드할 shard를 반환합니다.
+
+        마지막 shard가 기준에 도달했으면 새 shard Store를 만들어 카탈로그에 기록합니다.
+        새 shard를 만들지 못하면 마지막 shard를 그대로 사용합니다.
+
+        Args:
+            incoming_bytes: 업로드할 문서 크기 (바이트)
+
+        Returns:
+            str: 업로드할 shard의 리소스 이름
+
+        """
+        with _shard_creation_lock:
+            shard_names = self.shard_names
+            current = shard_names[-1]
+            if not self._is_full(current, incoming_bytes):
+                return current
+
+            display_name = f"{self.display_name} (shard {len(shard_names) + 1})"
+            store = self.store_manager.create_store(display_name=display_name)
+            if store is None or not store.name:
+                logger.error(
+                    f"새 shard Store를 만들지 못해 가득 찬 shard를 계속 사용합니다: {current}"
+                )
+                return current
+            self.catalog.add_shard(self.store_name, store.name)
+            logger.info(
+                f"Store shard 추가: {self.store_name} -> {store.name} "
+                f"({len(shard_names) + 1}번째 shard)"
+            )
+            return store.name
+
+    def shard_of(self, resource_name: str) -> str | None:
+        """코퍼스 파일이 속한 shard를 반환합니다 (이 Store의 shard가 아니면 None)."""
+        shard_name = store_name_from_resource(resource_name)
+        return shard_name if shard_name in self.shard_names else None
+
+    def record_corpus_change(self, resource_name: str) -> None:
+        """shard의 문서가 추가/삭제되었음을 논리 Store에 반영합니다.
+
+        응답 캐시는 논리 Store 이름으로 저장되므로 다른 shard의 변경도 논리 Store의
+        버전에 반영하고, shard의 크기/문서 수가 바뀌었으므로 캐시된 Store 정보도
+        무효화합니다 (shard 자신의 버전은 업로드/삭제 경로에서 올라감).
+        """
+        shard_name = store_name_from_resource(resource_name)
+        if shard_name:
+            store_cache.invalidate(shard_name)
+        if shard_name != self.store_name:
+            answer_cache.record_corpus_change(self.store_name, resource_name)
+
+    def delete_corpus_file(self, resource_name: str) -> bool:
+        """코퍼스 파일을 그 파일이 속한 shard에서 삭제합니다.
+
+        Returns:
+            bool: 삭제 성공 시 True, 이 Store의 shard가 아니거나 실패하면 False
+
+        """
+        if self.shard_of(resource_name) is None:
+            logger.warning(
+                f"코퍼스 파일이 Store '{self.store_name}'의 shard에 속하지 않습니다: "
+                f"{resource_name}"
+            )
+            return False
+        if not self.store_manager.delete_corpus_file(resource_name):
+            return False
+        self.record_corpus_change(resource_name)
+        return True
+
+    def delete_all(self) -> bool:
+        """모든 shard Store를 삭제합니다.
+
+        Returns:
+            bool: 모든 shard를 삭제했으면 True
+
+        """
+        deleted = [
+            self.store_manager.delete_store(shard_name)
+            for shard_name in self.shard_names
+        ]
+        return all(deleted)
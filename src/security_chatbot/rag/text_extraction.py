@@ -0,0 +1,204 @@
+"""Pre-upload text extraction module
+
+Extracts and normalizes the text of a document locally so it can be uploaded as
+a small text/plain file instead of the raw binary. Scanned PDFs and embedded
+images make files tens of megabytes while the indexed text is a few hundred
+kilobytes, so upload and indexing time then track content size, not file size.
+Extraction is CPU-bound and runs in a process pool.
+
+PDF extraction uses the optional ``pypdf`` package (``pip install
+security-chatbot[extract]``); without it PDFs are uploaded unchanged.
+"""
+
+import io
+import logging
+import multiprocessing
+import re
+import threading
+import unicodedata
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import BinaryIO
+
+from security_chatbot.config import TEXT_EXTRACTION_WORKERS
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # pragma: no cover - 선택 의존성
+    PdfReader = None
+
+logger = logging.getLogger(__name__)
+
+# 페이지당 평균 글자 수가 이보다 적은 PDF는 스캔 문서로 보고 원본을 업로드
+# (텍스트 레이어가 없으면 추출 결과가 비어 내용이 사라지므로)
+MIN_PDF_CHARS_PER_PAGE = 50
+
+# 일반 텍스트 파일을 읽을 때 시도하는 인코딩 (순서대로)
+TEXT_ENCODINGS = ("utf-8-sig", "cp949")
+
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f\ufeff]")
+_HORIZONTAL_SPACE = re.compile(r"[ \t\u00a0\u3000]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+_HWPX_SECTION = re.compile(r"Contents/section(\d+)\.xml$")
+
+
+def normalize_text(text: str) -> str:
+    """추출한 텍스트를 인덱싱에 필요한 형태로 정규화합니다.
+
+    유니코드 NFC 정규화, 제어 문자와 BOM 제거, 줄바꿈 통일, 연속 공백 축약,
+    줄 끝 공백 제거, 세 줄 이상의 빈 줄을 한 줄로 축약합니다.
+    """
+    text = unicodedata.normalize("NFC", text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _CONTROL_CHARS.sub("", text)
+    lines = [_HORIZONTAL_SPACE.sub(" ", line).strip() for line in text.split("\n")]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def _extract_pdf(data: bytes) -> str | None:
+    if PdfReader is None:
+        logger.warning("pypdf가 설치되어 있지 않아 PDF 텍스트 추출을 건너뜁니다.")
+        return None
+    reader = PdfReader(io.BytesIO(data))
+    pages = [page.extract_text() or "" for page in reader.pages]
+    text = "\n\n".join(pages)
+    if len(text.strip()) < MIN_PDF_CHARS_PER_PAGE * max(len(pages), 1):
+        # 텍스트 레이어가 거의 없는 스캔 문서
+        return None
+    return text
+
+
+def _extract_hwpx(data: bytes) -> str | None:
+    """HWPX(OWPML) 본문 섹션 XML에서 문단 단위로 텍스트를 읽습니다."""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        sections = sorted(
+            (int(match.group(1)), name)
+            for name in archive.namelist()
+            if (match := _HWPX_SECTION.search(name))
+        )
+        parts = []
+        for _, name in sections:
+            with archive.open(name) as f:
+                for _, element in ET.iterparse(f, events=("end",)):
+                    tag = element.tag.rsplit("}", 1)[-1]
+                    if tag == "t":
+                        parts.append("".join(element.itertext()))
+                    elif tag == "p":
+                        parts.append("\n")
+                        element.clear()
+    return "".join(parts)
+
+
+def _extract_plain(data: bytes) -> str | None:
+    for encoding in TEXT_ENCODINGS:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+_EXTRACTORS = {
+    ".pdf": _extract_pdf,
+    ".hwpx": _extract_hwpx,
+    ".txt": _extract_plain,
+    ".md": _extract_plain,
+}
+
+
+def extract_text(source: str | bytes, file_name: str) -> str | None:
+    """문서에서 텍스트를 추출하고 정규화합니다 (프로세스 풀 작업 함수).
+
+    Args:
+        source: 파일 경로 또는 파일 내용
+        file_name: 원본 파일 이름 (확장자로 형식 판별)
+
+    Returns:
+        Optional[str]: 정규화된 텍스트. 지원하지 않는 형식(HWP 등)이거나 추출할 수 없으면 None
+
+    """
+    extractor = _EXTRACTORS.get(Path(file_name).suffix.lower())
+    if extractor is None:
+        return None
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            source = f.read()
+    text = extractor(source)
+    if text is None:
+        return None
+    return normalize_text(text) or None
+
+
+class TextExtractor:
+    """업로드 전 텍스트 추출을 프로세스 풀에서 실행하는 클래스
+
+    여러 업로드 스레드가 동시에 extract()를 호출하면 추출이 풀의 프로세스들에서
+    병렬로 실행됩니다. 추출 중 오류가 나면 None을 반환하여 원본을 업로드하게 합니다.
+    풀 프로세스는 spawn으로 시작합니다. 여러 스레드(Streamlit, gRPC/HTTP 클라이언트)가
+    도는 프로세스를 fork하면 다른 스레드가 잡고 있던 잠금이 복제되어 자식이 멈출 수 있습니다.
+    """
+
+    def __init__(self, max_workers: int = TEXT_EXTRACTION_WORKERS):
+        """TextExtractor 초기화
+
+        Args:
+            max_workers: 추출 프로세스 수. 0 이하이면 호출한 스레드에서 바로 실행
+
+        """
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def extract(self, source: str | BinaryIO, file_name: str) -> str | None:
+        """문서의 정규화된 텍스트를 반환합니다.
+
+        Args:
+            source: 파일 경로 또는 seek 가능한 바이너리 파일 객체 (읽은 뒤 처음으로 되돌림)
+            file_name: 원본 파일 이름
+
+        Returns:
+            Optional[str]: 정규화된 텍스트 또는 추출할 수 없으면 None
+
+        """
+        if Path(file_name).suffix.lower() not in _EXTRACTORS:
+            return None
+        if not isinstance(source, str):
+            source.seek(0)
+            data = source.read()
+            source.seek(0)
+            source = data
+
+        try:
+            if self.max_workers <= 0:
+                return extract_text(source, file_name)
+            return self._get_pool().submit(extract_text, source, file_name).result()
+        except BrokenProcessPool as e:
+            logger.error(f"텍스트 추출 프로세스가 비정상 종료되어 풀을 다시 만듭니다: {e}")
+            self.shutdown()
+            return None
+        except Exception as e:
+            logger.warning(f"텍스트 추출 실패, 원본을 업로드합니다: {file_name} - {e}")
+            return None
+
+    def shutdown(self) -> None:
+        """프로세스 풀을 종료합니다 (다음 extract() 호출 시 다시 생성)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# 프로세스 전역에서 공유하는 텍스트 추출기
+text_extractor = TextExtractor()
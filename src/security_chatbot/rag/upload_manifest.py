@@ -0,0 +1,233 @@
+"""Upload manifest module
+
+Keeps a per-store manifest mapping the SHA-256 of uploaded file contents to the
+corpus file they were indexed as, so identical documents are never uploaded
+and indexed twice. The manifest lives in memory, or in SQLite when a database
+path is configured; SQLite is then read on every lookup so that entries written
+or removed by another process (the ingestion worker or another replica) are
+seen immediately.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from security_chatbot.config import UPLOAD_MANIFEST_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+# 중복으로 건너뛴 파일 하나당 절약되는 API 호출 수 (files.upload + import_file)
+API_CALLS_PER_UPLOAD = 2
+
+
+class UploadManifest:
+    """Store별 (콘텐츠 SHA-256 -> 코퍼스 파일) 매니페스트 클래스
+
+    같은 Store에 내용이 같은 파일을 다시 올리면 업로드하지 않고 기존 코퍼스 파일을
+    재사용(relink)할 수 있도록 해시를 조회합니다. 문서나 Store가 삭제되면 해당 항목도 제거됩니다.
+    """
+
+    def __init__(self, db_path: str | None = None):
+        """UploadManifest 초기화
+
+        Args:
+            db_path: SQLite 영속화 파일 경로. None이면 메모리에만 저장
+                (지정하면 항목을 메모리에 두지 않고 항상 DB에서 조회)
+
+        """
+        self._entries: dict[tuple[str, str], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._duplicates = 0
+        self._bytes_saved = 0
+
+        self._conn: sqlite3.Connection | None = None
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str) -> None:
+        """SQLite 영속화 저장소를 엽니다."""
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS upload_manifest (
+                store_name TEXT NOT NULL,
+                sha256 TEXT NOT NULL,
+                corpus_file_name TEXT NOT NULL,
+                file_name TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                uploaded_at REAL NOT NULL,
+                PRIMARY KEY (store_name, sha256)
+            )
+            """
+        )
+        self._conn.commit()
+        logger.info(f"업로드 매니페스트 영속화 저장소 사용: {db_path}")
+
+    def lookup(self, store_name: str, sha256: str) -> dict[str, Any] | None:
+        """Store에 같은 내용의 파일이 이미 인덱싱되어 있는지 조회합니다.
+
+        Args:
+            store_name: File Search Store 리소스 이름
+            sha256: 파일 내용의 SHA-256 (hex)
+
+        Returns:
+            Optional[Dict[str, Any]]: corpus_file_name, file_name, size_bytes, uploaded_at
+                또는 없으면 None
+
+        """
+        with self._lock:
+            # 영속화 저장소가 있으면 다른 프로세스의 변경이 보이도록 항상 DB에서 읽음
+            if self._conn is None:
+                entry = self._entries.get((store_name, sha256))
+                return dict(entry) if entry else None
+            row = self._conn.execute(
+                "SELECT corpus_file_name, file_name, size_bytes, uploaded_at "
+                "FROM upload_manifest WHERE store_name = ? AND sha256 = ?",
+                (store_name, sha256),
+            ).fetchone()
+            if row is None:
+                return None
+            corpus_file_name, file_name, size_bytes, uploaded_at = row
+            return {
+                "corpus_file_name": corpus_file_name,
+                "file_name": file_name,
+                "size_bytes": size_bytes,
+                "uploaded_at": uploaded_at,
+            }
+
+    def record(
+        self,
+        store_name: str,
+        sha256: str,
+        corpus_file_name: str,
+        file_name: str,
+        size_bytes: int,
+    ) -> None:
+        """업로드가 완료된 파일을 매니페스트에 기록합니다.
+
+        Args:
+            store_name: File Search Store 리소스 이름
+            sha256: 파일 내용의 SHA-256 (hex)
+            corpus_file_name: Store에 등록된 코퍼스 파일 리소스 이름
+            file_name: 원본 파일 이름
+            size_bytes: 파일 크기 (바이트)
+
+        """
+        entry = {
+            "corpus_file_name": str(corpus_file_name),
+            "file_name": file_name,
+            "size_bytes": size_bytes,
+            "uploaded_at": time.time(),
+        }
+        with self._lock:
+            if self._conn is None:
+                self._entries[(store_name, sha256)] = entry
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO upload_manifest VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        store_name,
+                        sha256,
+                        entry["corpus_file_name"],
+                        file_name,
+                        size_bytes,
+                        entry["uploaded_at"],
+                    ),
+                )
+                self._conn.commit()
+
+    def record_duplicate(self, size_bytes: int) -> None:
+        """중복으로 업로드를 건너뛴 파일의 절약량을 통계에 반영합니다."""
+        with self._lock:
+            self._duplicates += 1
+            self._bytes_saved += size_bytes
+
+    def forget_corpus_file(self, corpus_file_name: str) -> None:
+        """삭제된 코퍼스 파일을 가리키는 항목을 제거합니다."""
+        corpus_file_name = str(corpus_file_name)
+        with self._lock:
+            if self._conn is None:
+                for key in [
+                    key
+                    for key, entry in self._entries.items()
+                    if entry["corpus_file_name"] == corpus_file_name
+                ]:
+                    del self._entries[key]
+            else:
+                self._conn.execute(
+                    "DELETE FROM upload_manifest WHERE corpus_file_name = ?",
+                    (corpus_file_name,),
+                )
+                self._conn.commit()
+
+    def rename_corpus_file(self, old_name: str, new_name: str) -> None:
+        """코퍼스 파일을 가리키는 항목의 리소스 이름을 바꿉니다.
+
+        import Operation 이름으로 기록된 항목을 인덱싱이 끝난 뒤 생성된 문서의
+        리소스 이름으로 바꿀 때 사용합니다.
+        """
+        old_name, new_name = str(old_name), str(new_name)
+        with self._lock:
+            if self._conn is None:
+                for entry in self._entries.values():
+                    if entry["corpus_file_name"] == old_name:
+                        entry["corpus_file_name"] = new_name
+            else:
+                self._conn.execute(
+                    "UPDATE upload_manifest SET corpus_file_name = ? "
+                    "WHERE corpus_file_name = ?",
+                    (new_name, old_name),
+                )
+                self._conn.commit()
+
+    def forget_store(self, store_name: str) -> None:
+        """삭제된 Store의 모든 항목을 제거합니다."""
+        with self._lock:
+            if self._conn is None:
+                for key in [key for key in self._entries if key[0] == store_name]:
+                    del self._entries[key]
+            else:
+                self._conn.execute(
+                    "DELETE FROM upload_manifest WHERE store_name = ?", (store_name,)
+                )
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """모든 항목과 통계를 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._duplicates = 0
+            self._bytes_saved = 0
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM upload_manifest")
+                self._conn.commit()
+
+    def get_stats(self) -> dict[str, int]:
+        """중복 제거 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: entries(매니페스트 항목 수), duplicates_skipped(건너뛴 파일 수),
+                            bytes_saved(절약한 업로드 바이트), api_calls_saved(절약한 API 호출 수)
+
+        """
+        with self._lock:
+            if self._conn is None:
+                entries = len(self._entries)
+            else:
+                entries = self._conn.execute(
+                    "SELECT COUNT(*) FROM upload_manifest"
+                ).fetchone()[0]
+            return {
+                "entries": entries,
+                "duplicates_skipped": self._duplicates,
+                "bytes_saved": self._bytes_saved,
+                "api_calls_saved": self._duplicates * API_CALLS_PER_UPLOAD,
+            }
+
+
+# 프로세스 전역에서 공유하는 업로드 매니페스트 인스턴스
+upload_manifest = UploadManifest(db_path=UPLOAD_MANIFEST_DB_PATH or None)
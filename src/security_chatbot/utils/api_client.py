@@ -2,11 +2,20 @@
 """
 
 import logging
+import threading
 
+import httpx
 from google import genai
 from google.api_core.exceptions import GoogleAPIError
+from google.genai import types
+from google.genai.client import AsyncClient
 
-from security_chatbot.config import GEMINI_API_KEY
+from security_chatbot.config import (
+    API_TIMEOUT_SECONDS,
+    GEMINI_API_KEY,
+    GEMINI_HTTP_KEEPALIVE_SECONDS,
+    GEMINI_HTTP_POOL_SIZE,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,14 +23,48 @@ logger = logging.getLogger(__name__)
 class GeminiClientManager:
     """Google Gemini API 클라이언트를 초기화하고 관리하는 클래스입니다.
     API 키를 사용하여 클라이언트를 생성하고, 연결 상태를 검증합니다.
+
+    클라이언트는 프로세스당 하나만 생성되어 모든 Streamlit 세션과 스레드가 공유하며,
+    내부 HTTP 커넥션 풀(keep-alive)을 재사용하므로 요청마다 TLS 핸드셰이크가 반복되지 않습니다.
     """
 
     _client: genai.Client | None = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def build_http_options(
+        pool_size: int = GEMINI_HTTP_POOL_SIZE,
+        keepalive_seconds: float = GEMINI_HTTP_KEEPALIVE_SECONDS,
+        timeout_seconds: float = API_TIMEOUT_SECONDS,
+    ) -> types.HttpOptions:
+        """커넥션 풀과 기본 타임아웃 설정이 적용된 HttpOptions를 생성합니다.
+
+        Args:
+            pool_size: 동시에 유지할 최대 HTTP 연결 수 (keep-alive 연결 수와 동일).
+            keepalive_seconds: 유휴 keep-alive 연결을 유지할 시간 (초).
+            timeout_seconds: 개별 HTTP 요청의 기본 타임아웃 (초). 호출별 http_options로
+                더 짧은 남은 예산이 전달되면 그 값이 우선합니다.
+
+        Returns:
+            types.HttpOptions: 동기/비동기 httpx 클라이언트에 적용할 HTTP 옵션.
+
+        """
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=keepalive_seconds,
+        )
+        return types.HttpOptions(
+            timeout=int(timeout_seconds * 1000),
+            client_args={"limits": limits},
+            async_client_args={"limits": limits},
+        )
 
     @classmethod
     def get_client(cls) -> genai.Client:
         """Gemini API 클라이언트 인스턴스를 반환합니다.
         클라이언트가 아직 초기화되지 않았다면, GEMINI_API_KEY를 사용하여 초기화합니다.
+        여러 스레드에서 동시에 호출되어도 클라이언트는 한 번만 생성됩니다.
 
         Returns:
             genai.Client: 초기화된 Gemini API 클라이언트 인스턴스.
@@ -31,29 +74,53 @@ class GeminiClientManager:
             GoogleAPIError: 클라이언트 초기화 중 오류가 발생했을 경우 발생합니다.
 
         """
-        if cls._client is None:
-            if not GEMINI_API_KEY:
-                logger.error(
-                    "GEMINI_API_KEY가 설정되지 않아 Gemini API 클라이언트를 초기화할 수 없습니다."
-                )
-                raise ValueError("GEMINI_API_KEY 환경 변수를 설정해야 합니다.")
-            try:
-                cls._client = genai.Client(api_key=GEMINI_API_KEY)
-                logger.info("Gemini API 클라이언트가 성공적으로 초기화되었습니다.")
-            except GoogleAPIError as e:
-                logger.error(f"Gemini API 인증 오류: {e}")
-                raise GoogleAPIError(f"API 키 인증에 실패했습니다: {e}") from e
-            except Exception as e:
-                logger.error(
-                    f"Gemini API 클라이언트 초기화 중 알 수 없는 오류 발생: {e}"
-                )
-                raise Exception(f"클라이언트 초기화 실패: {e}") from e
+        if cls._client is not None:
+            return cls._client
+
+        with cls._lock:
+            if cls._client is None:
+                if not GEMINI_API_KEY:
+                    logger.error(
+                        "GEMINI_API_KEY가 설정되지 않아 Gemini API 클라이언트를 초기화할 수 없습니다."
+                    )
+                    raise ValueError("GEMINI_API_KEY 환경 변수를 설정해야 합니다.")
+                try:
+                    cls._client = genai.Client(
+                        api_key=GEMINI_API_KEY,
+                        http_options=cls.build_http_options(),
+                    )
+                    logger.info(
+                        f"Gemini API 클라이언트가 성공적으로 초기화되었습니다. "
+                        f"(pool_size={GEMINI_HTTP_POOL_SIZE})"
+                    )
+                except GoogleAPIError as e:
+                    logger.error(f"Gemini API 인증 오류: {e}")
+                    raise GoogleAPIError(f"API 키 인증에 실패했습니다: {e}") from e
+                except Exception as e:
+                    logger.error(
+                        f"Gemini API 클라이언트 초기화 중 알 수 없는 오류 발생: {e}"
+                    )
+                    raise Exception(f"클라이언트 초기화 실패: {e}") from e
         return cls._client
 
+    @classmethod
+    def get_async_client(cls) -> AsyncClient:
+        """공유 클라이언트의 asyncio 인터페이스(client.aio)를 반환합니다.
+        동기 클라이언트와 같은 설정(API 키, 커넥션 풀 크기)을 사용합니다.
+
+        Returns:
+            AsyncClient: 비동기 Gemini API 클라이언트.
+
+        Raises:
+            ValueError: GEMINI_API_KEY가 설정되지 않았을 경우 발생합니다.
+
+        """
+        return cls.get_client().aio
+
     @classmethod
     def verify_connection(cls) -> bool:
         """Gemini API 클라이언트의 연결 상태를 검증합니다.
-        실제 API 호출을 통해 연결 유효성을 확인합니다.
+        Store 목록의 첫 페이지(1개)만 요청하여, Store가 많아도 요청 한 번으로 확인합니다.
 
         Returns:
             bool: 연결이 유효하면 True, 그렇지 않으면 False.
@@ -61,9 +128,8 @@ class GeminiClientManager:
         """
         try:
             client = cls.get_client()
-            # 가벼운 API 호출을 통해 연결 검증
-            # File Search Store 목록 조회로 연결 확인
-            _ = list(client.file_search_stores.list())
+            # Pager는 생성 시 첫 페이지만 요청하므로 순회하지 않고 버림
+            client.file_search_stores.list(config={"page_size": 1})
             logger.info("Gemini API 연결이 성공적으로 검증되었습니다.")
             return True
         except (ValueError, GoogleAPIError) as e:
@@ -0,0 +1,217 @@
+"""SecurityChatbot Call Deadlines
+
+하나의 논리적 작업(쿼리, 업로드, Store 작업)에 주어진 전체 시간 예산을 추적하고,
+남은 예산을 HTTP 타임아웃과 취소 가능한 future로 각 API 호출에 전달합니다.
+타임아웃은 작업 종류별로 별도 지표(timeout_metrics)에 기록됩니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+import httpx
+from google.genai import types
+
+from security_chatbot.config import API_TIMEOUT_SECONDS, DEADLINE_CALL_WORKERS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP 요청에 전달하는 최소 타임아웃 (밀리초). 0은 SDK에서 "타임아웃 없음"으로 해석됨
+_MIN_HTTP_TIMEOUT_MS = 1000
+
+
+class TimeoutMetrics:
+    """작업 종류별 타임아웃 발생 횟수를 집계합니다."""
+
+    def __init__(self):
+        """TimeoutMetrics 초기화"""
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+
+    def record(self, operation: str) -> None:
+        """타임아웃 1건을 기록합니다.
+
+        Args:
+            operation: 타임아웃이 발생한 작업 이름
+
+        """
+        with self._lock:
+            self._counts[operation] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """타임아웃 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: total(전체 타임아웃 수), by_operation(작업별 타임아웃 수)
+
+        """
+        with self._lock:
+            return {
+                "total": sum(self._counts.values()),
+                "by_operation": dict(self._counts),
+            }
+
+    def reset(self) -> None:
+        """타임아웃 통계를 초기화합니다."""
+        with self._lock:
+            self._counts.clear()
+
+
+# 프로세스 전역 타임아웃 지표
+timeout_metrics = TimeoutMetrics()
+
+# 동기 API 호출을 취소 가능한 future로 실행하기 위한 공유 스레드 풀
+# (HTTP 커넥션 풀과 크기를 따로 설정: 포기한 호출도 HTTP 타임아웃까지 스레드를 점유)
+_executor = ThreadPoolExecutor(
+    max_workers=DEADLINE_CALL_WORKERS, thread_name_prefix="gemini-call"
+)
+
+
+class Deadline:
+    """작업 전체에 주어진 시간 예산
+
+    재시도가 있더라도 모든 시도와 대기 시간의 합이 처음 주어진 예산을 넘지 않도록
+    각 호출에는 남은 예산(remaining())만 전달합니다.
+    """
+
+    def __init__(
+        self,
+        seconds: float = API_TIMEOUT_SECONDS,
+        operation: str = "API 호출",
+        _expires_at: float | None = None,
+    ):
+        """Deadline 초기화
+
+        Args:
+            seconds: 작업 전체의 시간 예산 (초)
+            operation: 로그와 타임아웃 지표에 사용할 작업 이름
+
+        """
+        self.seconds = seconds
+        self.operation = operation
+        self._expires_at = (
+            _expires_at if _expires_at is not None else time.monotonic() + seconds
+        )
+
+    def remaining(self) -> float:
+        """남은 시간 예산(초)을 반환합니다 (0 이상)."""
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """시간 예산을 모두 사용했는지 여부"""
+        return self.remaining() <= 0
+
+    def allows(self, wait: float) -> bool:
+        """wait초를 기다린 뒤에도 예산이 남는지 여부 (재시도 대기 판단용)"""
+        return wait < self.remaining()
+
+    def child(self, seconds: float, operation: str | None = None) -> "Deadline":
+        """이 예산 안에서 최대 seconds초를 쓰는 하위 예산을 만듭니다.
+
+        Args:
+            seconds: 하위 작업(단일 호출)의 최대 시간 (초)
+            operation: 하위 작업 이름 (기본값: 상위 작업 이름)
+
+        Returns:
+            Deadline: 상위 예산의 마감 시각을 넘지 않는 하위 예산
+
+        """
+        expires_at = min(self._expires_at, time.monotonic() + seconds)
+        return Deadline(seconds, operation or self.operation, _expires_at=expires_at)
+
+    def timeout_error(self) -> TimeoutError:
+        """타임아웃 지표를 기록하고 던질 TimeoutError를 생성합니다."""
+        timeout_metrics.record(self.operation)
+        logger.warning(f"{self.operation} 시간 예산({self.seconds}초) 초과")
+        return TimeoutError(f"{self.operation} 시간 예산({self.seconds}초)을 초과했습니다.")
+
+    def check(self) -> float:
+        """예산이 남아 있으면 남은 시간을 반환하고, 없으면 TimeoutError를 발생시킵니다."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.timeout_error()
+        return remaining
+
+    def http_options(self) -> types.HttpOptions:
+        """남은 예산을 HTTP 타임아웃으로 가지는 HttpOptions를 생성합니다.
+
+        Raises:
+            TimeoutError: 예산이 이미 소진된 경우
+
+        """
+        remaining_ms = int(self.check() * 1000)
+        return types.HttpOptions(timeout=max(_MIN_HTTP_TIMEOUT_MS, remaining_ms))
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """블록 안에서 발생한 HTTP 타임아웃을 TimeoutError로 변환하고 지표에 기록합니다."""
+        try:
+            yield
+        except httpx.TimeoutException as e:
+            raise self.timeout_error() from e
+
+    def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """동기 API 호출을 남은 예산 안에서 실행합니다.
+
+        호출은 공유 스레드 풀의 future로 실행되며, 풀이 가득 차 대기열에서 기다린
+        시간도 예산에 포함됩니다. 대기열과 실행 시간을 합쳐 원래 마감 시각을 넘으면
+        호출자는 즉시 TimeoutError를 받고, 마감 시각까지 시작하지도 못한 호출은
+        취소합니다.
+
+        Raises:
+            TimeoutError: 남은 예산 안에 호출이 시작되지 않았거나 끝나지 않은 경우
+
+        """
+        remaining = self.check()
+        started = threading.Event()
+
+        def _call() -> T:
+            started.set()
+            return func(*args, **kwargs)
+
+        future = _executor.submit(_call)
+        with self.guard():
+            if not started.wait(timeout=remaining) and future.cancel():
+                logger.warning(
+                    f"{self.operation}: 호출 스레드가 모두 사용 중이라 예산 안에 "
+                    "시작하지 못했습니다."
+                )
+                raise self.timeout_error()
+            # 대기열에서 보낸 시간을 빼고 원래 마감 시각까지만 기다림
+            remaining = self.remaining()
+            if remaining <= 0 and not future.done():
+                raise self.timeout_error()
+            try:
+                return future.result(timeout=max(remaining, 0))
+            except FutureTimeoutError:
+                raise self.timeout_error() from None
+
+    async def run_async(self, awaitable: Awaitable[T]) -> T:
+        """비동기 API 호출을 남은 예산 안에서 실행하고, 예산이 끝나면 취소합니다.
+
+        Raises:
+            TimeoutError: 남은 예산 안에 호출이 끝나지 않은 경우
+
+        """
+        try:
+            remaining = self.check()
+        except TimeoutError:
+            # 실행하지 않는 코루틴이 "never awaited" 경고를 남기지 않도록 닫음
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+        with self.guard():
+            try:
+                return await asyncio.wait_for(awaitable, timeout=remaining)
+            except asyncio.TimeoutError:
+                raise self.timeout_error() from None
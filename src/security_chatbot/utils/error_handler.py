@@ -43,6 +43,14 @@ class ConfigurationError(Exception):
     pass
 
 
+class RateLimitError(Exception):
+    """클라이언트 측 레이트 리미터의 대기 예산을 초과했을 때 발생하는 사용자 정의 예외."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 # --- 2. 로깅 설정 (config.py 참조) ---
 # config.py에서 로깅이 설정되어 있다고 가정하고, 해당 로거를 가져옵니다.
 logger = logging.getLogger(__name__)
@@ -101,6 +109,12 @@ class ErrorHandler:
             "severity": "ERROR",
             "solution": "질의 내용을 다시 확인하거나, 시스템에 일시적인 오류가 발생했을 수 있습니다. 잠시 후 다시 시도해주세요.",
         },
+        # 클라이언트 측 호출 한도 대기 초과
+        RateLimitError: {
+            "message": "요청이 많아 API 호출 대기 시간이 초과되었습니다.",
+            "severity": "WARNING",
+            "solution": "잠시 후 다시 시도해주세요. 반복될 경우 관리자에게 API 사용량 한도 설정을 확인하도록 요청하세요.",
+        },
         # 설정 관련 오류
         ConfigurationError: {
             "message": "애플리케이션 설정 오류가 발생했습니다.",
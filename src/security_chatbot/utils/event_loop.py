@@ -0,0 +1,109 @@
+"""SecurityChatbot Shared Event Loop
+
+asyncio 기반 Gemini 엔진(client.aio를 쓰는 쿼리, Store/문서 매니저, 인덱싱 추적)을
+동기 코드(Streamlit 스크립트 스레드, 배치 실행 스레드, 수집 워커)에서 호출할 수 있도록
+프로세스 전역 이벤트 루프 하나를 백그라운드 스레드에서 실행합니다. 모든 동기 래퍼가
+같은 루프를 쓰므로 client.aio의 HTTP 커넥션 풀과 요청 합치기(single-flight)가 호출과
+스레드 사이에서 공유되고, 동시에 진행되는 호출 수가 스레드 풀 크기에 묶이지 않습니다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+# 루프를 시작한 프로세스 (fork된 자식 프로세스에는 루프 스레드가 없으므로 새로 시작)
+_loop_pid: int | None = None
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """공유 이벤트 루프를 반환합니다 (처음 호출할 때 백그라운드 스레드에서 시작).
+
+    Returns:
+        asyncio.AbstractEventLoop: 동기 래퍼가 코루틴을 실행하는 이벤트 루프
+
+    """
+    global _loop, _loop_pid
+    with _lock:
+        if _loop is None or _loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="gemini-event-loop", daemon=True
+            ).start()
+            _loop, _loop_pid = loop, os.getpid()
+            logger.debug("공유 이벤트 루프 시작")
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """코루틴을 공유 이벤트 루프에서 실행하고 끝날 때까지 기다려 결과를 반환합니다.
+
+    호출 스레드가 KeyboardInterrupt 등으로 기다리기를 멈추면 코루틴도 취소합니다.
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        코루틴의 반환값
+
+    Raises:
+        RuntimeError: 공유 이벤트 루프 안에서 호출한 경우 (교착 상태 방지, await 사용)
+        코루틴에서 발생한 예외
+
+    """
+    loop = get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError(
+            "공유 이벤트 루프 안에서는 동기 래퍼를 호출할 수 없습니다. "
+            "비동기 버전을 await하세요."
+        )
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def iterate_sync(iterator: AsyncIterator[T]) -> Iterator[T]:
+    """비동기 이터레이터를 공유 이벤트 루프에서 한 항목씩 진행하는 동기 이터레이터로 감쌉니다.
+
+    다음 항목은 호출자가 요청할 때만 가져오며, 호출자가 중간에 멈추면 비동기
+    제너레이터도 닫습니다.
+
+    Args:
+        iterator: 감쌀 비동기 이터레이터
+
+    Yields:
+        비동기 이터레이터의 항목
+
+    """
+    done = object()
+
+    async def _next() -> Any:
+        try:
+            return await iterator.__anext__()
+        except StopAsyncIteration:
+            return done
+
+    try:
+        while (item := run_sync(_next())) is not done:
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            run_sync(aclose())
@@ -0,0 +1,312 @@
+"""SecurityChatbot Client-side Rate Limiter
+
+Gemini API 호출 앞단에서 분당 요청 수(RPM)와 분당 토큰 수(TPM)를 제한하는
+프로세스 전역 토큰 버킷 레이트 리미터를 제공합니다.
+한도를 넘는 요청은 즉시 실패하지 않고 대기 예산(max_wait) 안에서 FIFO 순서로 대기합니다.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from collections import deque
+
+from security_chatbot.config import (
+    GEMINI_RPM_LIMIT,
+    GEMINI_TPM_LIMIT,
+    RATE_LIMIT_MAX_WAIT_SECONDS,
+)
+from security_chatbot.utils.error_handler import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# 비동기 대기자가 대기열 선두가 아닐 때 차례를 확인하는 간격 (초)
+_ASYNC_POLL_INTERVAL = 0.05
+
+_DURATION_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|s|m)?\s*$")
+
+
+def parse_duration(value: str | None) -> float | None:
+    """RetryInfo.retryDelay 형식("17s", "1.5s", "500ms")의 문자열을 초 단위로 변환합니다.
+
+    Args:
+        value: 대기 시간 문자열
+
+    Returns:
+        Optional[float]: 초 단위 대기 시간, 해석할 수 없으면 None
+
+    """
+    if not value:
+        return None
+    match = _DURATION_PATTERN.match(str(value))
+    if not match:
+        return None
+    amount = float(match.group(1))
+    unit = match.group(2) or "s"
+    return {"ms": amount / 1000, "s": amount, "m": amount * 60}[unit]
+
+
+def estimate_tokens(text: str) -> int:
+    """TPM 한도 계산을 위해 텍스트의 토큰 수를 대략적으로 추정합니다 (약 4자당 1토큰)."""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """분당 보충 속도와 최대 용량을 가지는 토큰 버킷"""
+
+    def __init__(self, per_minute: int):
+        """TokenBucket 초기화
+
+        Args:
+            per_minute: 분당 보충되는 토큰 수 (버킷 용량과 동일). 0 이하이면 무제한
+
+        """
+        self.unlimited = per_minute <= 0
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 소비하려면 기다려야 하는 시간(초)을 반환합니다."""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        # 용량보다 큰 요청은 버킷이 가득 찼을 때 허용하고 잔량을 음수로 남김
+        needed = min(amount, self.capacity)
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        """토큰을 소비합니다 (음수이면 반환)."""
+        if not self.unlimited:
+            self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class RateLimiter:
+    """RPM/TPM 토큰 버킷과 FIFO 대기열을 가진 레이트 리미터
+
+    모든 Gemini API 호출(쿼리, files.upload, import_file, Store 작업) 전에 acquire()를
+    호출하여 허가를 받습니다. 서버가 429와 함께 RetryInfo.retryDelay를 알려주면
+    pause()로 버킷 전체를 해당 시간 동안 멈춥니다.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = GEMINI_RPM_LIMIT,
+        tokens_per_minute: int = GEMINI_TPM_LIMIT,
+        max_wait_seconds: float = RATE_LIMIT_MAX_WAIT_SECONDS,
+    ):
+        """RateLimiter 초기화
+
+        Args:
+            requests_per_minute: 분당 최대 요청 수 (0 이하이면 무제한)
+            tokens_per_minute: 분당 최대 토큰 수 (0 이하이면 무제한)
+            max_wait_seconds: 요청이 대기열에서 기다릴 수 있는 기본 최대 시간 (초)
+
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_wait_seconds = max_wait_seconds
+
+        self._cond = threading.Condition()
+        self._queue: deque[object] = deque()
+        self._paused_until = 0.0
+        self._admitted = 0
+        self._rejected = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """버킷을 가득 채우고 일시정지 상태와 통계를 초기화합니다."""
+        with self._cond:
+            self._requests = TokenBucket(self.requests_per_minute)
+            self._tokens = TokenBucket(self.tokens_per_minute)
+            self._paused_until = 0.0
+            self._admitted = 0
+            self._rejected = 0
+            self._cond.notify_all()
+
+    def _wait_time_locked(self, tokens: int, now: float) -> float:
+        return max(
+            self._paused_until - now,
+            self._requests.wait_time(1, now),
+            self._tokens.wait_time(tokens, now),
+        )
+
+    def _admit_locked(self, ticket: object, tokens: int) -> None:
+        self._requests.consume(1)
+        self._tokens.consume(tokens)
+        self._queue.remove(ticket)
+        self._admitted += 1
+        self._cond.notify_all()
+
+    def _reject_locked(self, ticket: object, retry_after: float) -> RateLimitError:
+        self._queue.remove(ticket)
+        self._rejected += 1
+        self._cond.notify_all()
+        logger.warning(
+            f"레이트 리미터 대기 예산 초과로 요청 거부 (예상 대기: {retry_after:.1f}초)"
+        )
+        return RateLimitError(
+            f"API 호출 한도에 도달하여 요청을 처리할 수 없습니다. "
+            f"{retry_after:.0f}초 후 다시 시도해주세요.",
+            retry_after=retry_after,
+        )
+
+    def acquire(self, tokens: int = 0, max_wait: float | None = None) -> float:
+        """요청 허가를 받을 때까지 FIFO 순서로 대기합니다.
+
+        Args:
+            tokens: 이 요청이 사용할 것으로 예상되는 토큰 수 (TPM 계산용)
+            max_wait: 호출자의 남은 시간 예산 (초). 기본 대기 예산보다 길 수 없으며
+                None이면 기본 대기 예산 사용
+
+        Returns:
+            float: 실제로 대기한 시간 (초)
+
+        Raises:
+            RateLimitError: 대기 예산 안에 허가를 받을 수 없는 경우
+
+        """
+        budget = (
+            self.max_wait_seconds
+            if max_wait is None
+            else min(max_wait, self.max_wait_seconds)
+        )
+        start = time.monotonic()
+        deadline = start + budget
+        ticket = object()
+
+        with self._cond:
+            self._queue.append(ticket)
+            while True:
+                now = time.monotonic()
+                if self._queue[0] is ticket:
+                    wait = self._wait_time_locked(tokens, now)
+                    if wait <= 0:
+                        self._admit_locked(ticket, tokens)
+                        return now - start
+                    if now + wait > deadline:
+                        raise self._reject_locked(ticket, wait)
+                elif now >= deadline:
+                    raise self._reject_locked(ticket, self._wait_time_locked(tokens, now))
+                else:
+                    wait = deadline - now
+                self._cond.wait(timeout=min(wait, deadline - now))
+
+    async def acquire_async(self, tokens: int = 0, max_wait: float | None = None) -> float:
+        """acquire()의 asyncio 버전입니다. 이벤트 루프를 막지 않고 대기합니다.
+
+        Args:
+            tokens: 이 요청이 사용할 것으로 예상되는 토큰 수
+            max_wait: 호출자의 남은 시간 예산 (초). 기본 대기 예산보다 길 수 없으며
+                None이면 기본 대기 예산 사용
+
+        Returns:
+            float: 실제로 대기한 시간 (초)
+
+        Raises:
+            RateLimitError: 대기 예산 안에 허가를 받을 수 없는 경우
+
+        """
+        budget = (
+            self.max_wait_seconds
+            if max_wait is None
+            else min(max_wait, self.max_wait_seconds)
+        )
+        start = time.monotonic()
+        deadline = start + budget
+        ticket = object()
+
+        with self._cond:
+            self._queue.append(ticket)
+        try:
+            while True:
+                with self._cond:
+                    now = time.monotonic()
+                    if self._queue[0] is ticket:
+                        wait = self._wait_time_locked(tokens, now)
+                        if wait <= 0:
+                            self._admit_locked(ticket, tokens)
+                            return now - start
+                        if now + wait > deadline:
+                            raise self._reject_locked(ticket, wait)
+                    elif now >= deadline:
+                        raise self._reject_locked(
+                            ticket, self._wait_time_locked(tokens, now)
+                        )
+                    else:
+                        wait = _ASYNC_POLL_INTERVAL
+                await asyncio.sleep(min(wait, deadline - now))
+        except asyncio.CancelledError:
+            with self._cond:
+                if ticket in self._queue:
+                    self._queue.remove(ticket)
+                    self._cond.notify_all()
+            raise
+
+    def settle(self, estimated_tokens: int, actual_tokens: int | None) -> None:
+        """응답의 실제 토큰 사용량으로 추정치와의 차이를 보정합니다.
+
+        Args:
+            estimated_tokens: acquire() 시 전달한 추정 토큰 수
+            actual_tokens: 응답 usage_metadata의 실제 토큰 수 (없으면 보정하지 않음)
+
+        """
+        if actual_tokens is None:
+            return
+        with self._cond:
+            self._tokens.consume(actual_tokens - estimated_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """서버가 권장한 재시도 대기 시간 동안 모든 요청의 허가를 멈춥니다.
+
+        Args:
+            seconds: 일시정지할 시간 (초)
+
+        """
+        with self._cond:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                logger.warning(f"서버 요청에 따라 레이트 리미터를 {seconds:.1f}초간 일시정지")
+            self._cond.notify_all()
+
+    def get_stats(self) -> dict[str, float]:
+        """현재 대기열 깊이와 버킷 상태를 반환합니다.
+
+        Returns:
+            Dict[str, float]: queue_depth, paused_for(남은 일시정지 시간),
+                              available_requests, available_tokens (무제한이면 None),
+                              admitted, rejected
+
+        """
+        with self._cond:
+            now = time.monotonic()
+            self._requests.wait_time(0, now)
+            self._tokens.wait_time(0, now)
+            return {
+                "queue_depth": len(self._queue),
+                "paused_for": max(0.0, self._paused_until - now),
+                "available_requests": (
+                    None if self._requests.unlimited else self._requests.tokens
+                ),
+                "available_tokens": None if self._tokens.unlimited else self._tokens.tokens,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+            }
+
+    def get_queue_depth(self) -> int:
+        """허가를 기다리고 있는 요청 수를 반환합니다."""
+        with self._cond:
+            return len(self._queue)
+
+
+# 프로세스 전역에서 공유하는 레이트 리미터 인스턴스
+rate_limiter = RateLimiter()
@@ -0,0 +1,188 @@
+"""SecurityChatbot Single-flight Request Coalescing
+
+같은 키로 동시에 들어온 요청들이 하나의 실제 실행 결과를 공유하도록 합니다.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """진행 중인 단일 실행과 그 결과를 기다리는 대기자들이 공유하는 상태"""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self.result: Any = None
+        self.error: Exception | None = None
+
+    def wait(self) -> Any:
+        """실행이 끝날 때까지 대기한 뒤 결과를 반환하거나 예외를 다시 발생시킵니다."""
+        self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """동일 키의 동시 요청을 하나의 실행으로 합치는 클래스입니다.
+
+    첫 번째 호출자(leader)만 실제 함수를 실행하고, 실행 중에 같은 키로 들어온
+    호출자들은 그 결과(또는 예외)를 그대로 전달받습니다. 실행이 끝나면 키가 해제되므로
+    이후 요청은 새로 실행됩니다 (결과 캐싱은 하지 않음).
+    """
+
+    def __init__(self):
+        """SingleFlight 인스턴스를 초기화합니다."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._async_calls: dict[tuple[int, Hashable], asyncio.Future] = {}
+        self._total = 0
+        self._collapsed = 0
+
+    def begin(self, key: Hashable) -> tuple[_Call, bool]:
+        """키에 대한 실행을 시작하거나 진행 중인 실행에 합류합니다.
+
+        Args:
+            key: 요청을 식별하는 키
+
+        Returns:
+            tuple[_Call, bool]: 공유 실행 상태와 leader 여부.
+                leader는 반드시 finish()를 호출해야 합니다.
+
+        """
+        with self._lock:
+            self._total += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self._collapsed += 1
+                return call, False
+            call = _Call()
+            self._calls[key] = call
+            return call, True
+
+    def finish(
+        self,
+        key: Hashable,
+        call: _Call,
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """leader의 실행 결과를 기록하고 대기 중인 호출자들을 깨웁니다.
+
+        Args:
+            key: begin()에 전달한 키
+            call: begin()이 반환한 공유 실행 상태
+            result: 실행 결과
+            error: 실행 중 발생한 예외 (있는 경우). KeyboardInterrupt, GeneratorExit처럼
+                Exception이 아닌 제어 흐름 예외는 leader에게만 해당하므로 대기자에게는
+                RuntimeError로 바꾸어 전달합니다.
+
+        """
+        if error is not None and not isinstance(error, Exception):
+            error = RuntimeError(f"합쳐진 요청의 실행이 중단되었습니다: {error!r}")
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        call.result = result
+        call.error = error
+        call._done.set()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """키에 대해 func를 한 번만 실행하고 그 결과를 모든 동시 호출자에게 반환합니다.
+
+        Args:
+            key: 요청을 식별하는 키
+            func: 실제로 실행할 함수
+
+        Returns:
+            func의 실행 결과 (동시 호출자들은 같은 결과를 받음)
+
+        Raises:
+            func에서 발생한 예외 (모든 동시 호출자에게 전달됨)
+
+        """
+        call, is_leader = self.begin(key)
+        if not is_leader:
+            logger.debug(f"진행 중인 동일 요청에 합류: {key}")
+            return call.wait()
+
+        try:
+            result = func()
+        except BaseException as e:
+            self.finish(key, call, error=e)
+            raise
+        self.finish(key, call, result=result)
+        return result
+
+    async def do_async(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """do()의 asyncio 버전입니다. 같은 이벤트 루프 안의 동시 호출을 합칩니다.
+
+        Args:
+            key: 요청을 식별하는 키
+            func: 실제로 실행할 코루틴 함수
+
+        Returns:
+            func의 실행 결과
+
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+
+        with self._lock:
+            self._total += 1
+            future = self._async_calls.get(loop_key)
+            is_leader = future is None
+            if is_leader:
+                future = loop.create_future()
+                self._async_calls[loop_key] = future
+            else:
+                self._collapsed += 1
+
+        if not is_leader:
+            return await asyncio.shield(future)
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._async_calls.pop(loop_key, None)
+
+    def get_stats(self) -> dict[str, int]:
+        """요청 합치기 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: total(전체 요청 수), executions(실제 실행 수),
+                            collapsed(다른 요청에 합쳐진 수), in_flight(진행 중인 실행 수)
+
+        """
+        with self._lock:
+            return {
+                "total": self._total,
+                "executions": self._total - self._collapsed,
+                "collapsed": self._collapsed,
+                "in_flight": len(self._calls) + len(self._async_calls),
+            }
+
+    def reset_stats(self) -> None:
+        """요청 합치기 통계를 초기화합니다."""
+        with self._lock:
+            self._total = 0
+            self._collapsed = 0
@@ -0,0 +1,39 @@
+"""테스트용 Gemini SDK 클라이언트 대역
+
+create_autospec(genai.Client)는 property로 노출되는 하위 서비스(files, operations,
+file_search_stores 등)의 시그니처를 검사하지 않으므로, 하위 서비스까지 실제 SDK
+클래스로 autospec한 클라이언트를 만듭니다. 존재하지 않는 메서드를 부르거나 인자
+형태가 SDK와 다르면 테스트가 AttributeError/TypeError로 실패합니다.
+"""
+
+from unittest.mock import MagicMock, create_autospec
+
+from google import genai
+from google.genai import client as genai_client
+from google.genai import documents, file_search_stores, files, models, operations
+
+
+def _file_search_stores(stores_cls: type, documents_cls: type) -> MagicMock:
+    stores = create_autospec(stores_cls, instance=True)
+    stores.documents = create_autospec(documents_cls, instance=True)
+    return stores
+
+
+def autospec_client() -> MagicMock:
+    """하위 서비스까지 SDK 시그니처로 autospec한 genai.Client 대역을 만듭니다."""
+    client = create_autospec(genai.Client, instance=True)
+    client.files = create_autospec(files.Files, instance=True)
+    client.models = create_autospec(models.Models, instance=True)
+    client.operations = create_autospec(operations.Operations, instance=True)
+    client.file_search_stores = _file_search_stores(
+        file_search_stores.FileSearchStores, documents.Documents
+    )
+
+    client.aio = create_autospec(genai_client.AsyncClient, instance=True)
+    client.aio.files = create_autospec(files.AsyncFiles, instance=True)
+    client.aio.models = create_autospec(models.AsyncModels, instance=True)
+    client.aio.operations = create_autospec(operations.AsyncOperations, instance=True)
+    client.aio.file_search_stores = _file_search_stores(
+        file_search_stores.AsyncFileSearchStores, documents.AsyncDocuments
+    )
+    return client
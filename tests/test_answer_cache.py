@@ -0,0 +1,186 @@
+"""answer_cache.py 모듈 테스트
+"""
+
+import logging
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from security_chatbot.rag.answer_cache import (
+    AnswerCache,
+    normalize_query,
+    store_name_from_resource,
+)
+
+logging.disable(logging.CRITICAL)
+
+STORE = "fileSearchStores/test-store-123"
+RESPONSE = {"content": "90일마다 변경", "citations": ["policy.pdf"], "success": True}
+
+
+def _record_in_worker_process(db_path: str, resource_name: str) -> None:
+    """별도 프로세스(수집 워커)에서 문서 변경을 기록합니다."""
+    AnswerCache(ttl_seconds=60, db_path=db_path).record_corpus_change(
+        STORE, resource_name
+    )
+
+
+class TestAnswerCache(unittest.TestCase):
+    """AnswerCache 클래스 테스트"""
+
+    def setUp(self):
+        self.cache = AnswerCache(max_entries=2, ttl_seconds=60)
+
+    def test_normalize_query(self):
+        """질의 정규화 테스트"""
+        self.assertEqual(
+            normalize_query("  Password   Rotation requirement?? "),
+            "password rotation requirement",
+        )
+
+    def test_store_name_from_resource(self):
+        """코퍼스 파일 리소스 이름에서 Store 이름 추출 테스트"""
+        self.assertEqual(
+            store_name_from_resource(f"{STORE}/corpusFiles/file-1"), STORE
+        )
+        self.assertIsNone(store_name_from_resource("files/abc"))
+
+    def test_hit_and_miss_counters(self):
+        """정규화된 질의로 캐시 적중 및 hit/miss 통계 테스트"""
+        self.assertIsNone(self.cache.get("password rotation requirement?", STORE))
+        self.cache.put("password rotation requirement?", STORE, RESPONSE)
+
+        cached = self.cache.get("Password rotation  requirement", STORE)
+
+        self.assertEqual(cached["content"], RESPONSE["content"])
+        self.assertTrue(cached["cached"])
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_failed_response_not_cached(self):
+        """실패 응답은 캐시되지 않는지 테스트"""
+        self.cache.put("q", STORE, {"content": "", "success": False})
+        self.assertIsNone(self.cache.get("q", STORE))
+
+    @patch("security_chatbot.rag.answer_cache.time.time")
+    def test_ttl_expiry(self, mock_time):
+        """TTL 만료 후 캐시 miss 테스트"""
+        mock_time.return_value = 1000.0
+        self.cache.put("q", STORE, RESPONSE)
+        mock_time.return_value = 1061.0
+
+        self.assertIsNone(self.cache.get("q", STORE))
+
+    def test_lru_eviction(self):
+        """최대 항목 수 초과 시 가장 오래 사용되지 않은 항목 제거 테스트"""
+        self.cache.put("q1", STORE, RESPONSE)
+        self.cache.put("q2", STORE, RESPONSE)
+        self.cache.get("q1", STORE)
+        self.cache.put("q3", STORE, RESPONSE)
+
+        self.assertIsNotNone(self.cache.get("q1", STORE))
+        self.assertIsNone(self.cache.get("q2", STORE))
+
+    def test_corpus_change_invalidates_store(self):
+        """문서 추가/삭제 시 해당 Store의 캐시만 무효화되는지 테스트"""
+        other_store = "fileSearchStores/other"
+        self.cache.put("q", STORE, RESPONSE)
+        self.cache.put("q", other_store, RESPONSE)
+        before = self.cache.get_version(STORE)
+
+        self.cache.record_corpus_change(STORE, f"{STORE}/corpusFiles/new")
+
+        self.assertEqual(self.cache.get_version(STORE), before + 1)
+        self.assertIsNone(self.cache.get("q", STORE))
+        self.assertIsNotNone(self.cache.get("q", other_store))
+
+        # 같은 변경을 다시 기록해도 버전은 되돌아가지 않음
+        self.cache.record_corpus_change(STORE, f"{STORE}/corpusFiles/new")
+        self.assertEqual(self.cache.get_version(STORE), before + 2)
+
+    def test_sqlite_persistence(self):
+        """SQLite 영속화 저장소를 통해 프로세스 재시작 후에도 캐시가 유지되는지 테스트"""
+        db_dir = tempfile.mkdtemp()
+        db_path = os.path.join(db_dir, "answers.db")
+
+        first = AnswerCache(ttl_seconds=60, db_path=db_path)
+        first.record_corpus_change(STORE, f"{STORE}/corpusFiles/a")
+        first.put("q", STORE, RESPONSE)
+
+        second = AnswerCache(ttl_seconds=60, db_path=db_path)
+
+        self.assertEqual(second.get("q", STORE)["content"], RESPONSE["content"])
+        self.assertEqual(second.get_version(STORE), first.get_version(STORE))
+
+    def test_corpus_change_in_other_process_invalidates_cache(self):
+        """같은 DB를 쓰는 다른 프로세스의 문서 변경이 이 프로세스의 캐시를 무효화하는지 테스트"""
+        db_dir = tempfile.mkdtemp()
+        db_path = os.path.join(db_dir, "answers.db")
+        app = AnswerCache(ttl_seconds=60, db_path=db_path)
+        worker = AnswerCache(ttl_seconds=60, db_path=db_path)
+        app.put("q", STORE, RESPONSE)
+        self.assertIsNotNone(app.get("q", STORE))
+
+        worker.record_corpus_change(STORE, f"{STORE}/documents/new")
+
+        self.assertIsNone(app.get("q", STORE))
+        self.assertEqual(app.get_version(STORE), worker.get_version(STORE))
+
+        # 두 프로세스의 변경이 모두 누적됨 (한쪽이 다른 쪽의 기록을 덮어쓰지 않음)
+        app.record_corpus_change(STORE, f"{STORE}/documents/other")
+        worker.record_corpus_change(STORE, f"{STORE}/documents/new")
+        self.assertEqual(worker.get_version(STORE), 3)
+
+    def test_change_recorded_by_worker_and_app_stays_invalidated(self):
+        """워커 프로세스와 앱이 같은 업로드를 각각 기록해도 이전 답변이 되살아나지 않는지 테스트"""
+        db_path = os.path.join(tempfile.mkdtemp(), "answers.db")
+        app = AnswerCache(ttl_seconds=60, db_path=db_path)
+        replica = AnswerCache(ttl_seconds=60, db_path=db_path)
+        replica.put("q", STORE, RESPONSE)
+        document = f"{STORE}/documents/new"
+
+        worker = multiprocessing.get_context("spawn").Process(
+            target=_record_in_worker_process, args=(db_path, document)
+        )
+        worker.start()
+        worker.join(timeout=60)
+        self.assertEqual(worker.exitcode, 0)
+        # 앱이 완료된 작업을 동기화하며 같은 문서를 다시 기록해도, 다른 레플리카가
+        # 메모리에 들고 있는 업로드 전 답변은 다시 적중하지 않음
+        app.record_corpus_change(STORE, document)
+
+        self.assertIsNone(replica.get("q", STORE))
+
+
+class TestQueryWithRagCache(unittest.TestCase):
+    """query_with_rag의 캐시 연동 테스트"""
+
+    def setUp(self):
+        from security_chatbot.rag.answer_cache import answer_cache
+
+        answer_cache.clear()
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_repeated_query_served_from_cache(self, mock_client_manager):
+        """같은 질문을 반복하면 Gemini를 한 번만 호출하는지 테스트"""
+        from security_chatbot.rag.query_handler import query_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.text = "테스트 응답"
+        mock_response.candidates = []
+        mock_client.models.generate_content = AsyncMock(return_value=mock_response)
+
+        first = query_with_rag("비밀번호 변경 주기?", STORE)
+        second = query_with_rag("비밀번호 변경 주기", STORE)
+
+        self.assertTrue(first["success"])
+        self.assertTrue(second["cached"])
+        mock_client.models.generate_content.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
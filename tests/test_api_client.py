@@ -34,9 +34,39 @@ class TestGeminiClientManager(unittest.TestCase):
 
         client = GeminiClientManager.get_client()
 
-        mock_genai.Client.assert_called_once_with(api_key="fake_api_key")
+        mock_genai.Client.assert_called_once()
+        self.assertEqual(mock_genai.Client.call_args.kwargs["api_key"], "fake_api_key")
+        self.assertIn("http_options", mock_genai.Client.call_args.kwargs)
         self.assertEqual(client, mock_client)
 
+    @patch(f"{API_CLIENT_MODULE}.GEMINI_API_KEY", "fake_api_key")
+    @patch(f"{API_CLIENT_MODULE}.genai")
+    def test_get_client_reused_across_threads(self, mock_genai):
+        """여러 스레드에서 호출해도 클라이언트가 한 번만 생성되는지 테스트"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_genai.Client.return_value = MagicMock()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(
+                executor.map(lambda _: GeminiClientManager.get_client(), range(32))
+            )
+
+        mock_genai.Client.assert_called_once()
+        self.assertTrue(all(c is clients[0] for c in clients))
+
+    def test_build_http_options_pool_limits(self):
+        """커넥션 풀 크기가 httpx Limits에 반영되는지 테스트"""
+        options = GeminiClientManager.build_http_options(
+            pool_size=7, keepalive_seconds=30, timeout_seconds=12
+        )
+
+        limits = options.client_args["limits"]
+        self.assertEqual(limits.max_connections, 7)
+        self.assertEqual(limits.max_keepalive_connections, 7)
+        self.assertEqual(limits.keepalive_expiry, 30)
+        self.assertEqual(options.timeout, 12000)
+
     @patch(f"{API_CLIENT_MODULE}.GEMINI_API_KEY", "")
     def test_get_client_no_api_key(self):
         """API 키가 없을 때 ValueError 발생 테스트"""
@@ -53,6 +83,10 @@ class TestGeminiClientManager(unittest.TestCase):
         result = GeminiClientManager.verify_connection()
 
         self.assertTrue(result)
+        # Store 목록 전체가 아닌 첫 페이지(1개)만 요청
+        mock_client.file_search_stores.list.assert_called_once_with(
+            config={"page_size": 1}
+        )
 
 
 if __name__ == "__main__":
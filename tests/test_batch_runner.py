@@ -0,0 +1,151 @@
+"""batch_runner.py 모듈 테스트
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from security_chatbot.rag.batch_runner import (
+    load_completed_ids,
+    load_questions,
+    run_batch,
+)
+
+logging.disable(logging.CRITICAL)
+
+STORE = "fileSearchStores/compliance"
+
+
+def _answer(question, store_name, auto_retry=True):
+    return {
+        "content": f"답변: {question}",
+        "citations": ["policy.pdf"],
+        "success": True,
+        "error": None,
+        "token_usage": {"prompt_tokens": 8, "output_tokens": 2, "total_tokens": 10},
+    }
+
+
+class TestBatchRunner(unittest.TestCase):
+    """배치 질문 실행기 테스트"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.test_dir, "results.jsonl")
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.test_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def _read_results(self):
+        with open(self.output_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_load_questions_csv_and_jsonl(self):
+        """CSV와 JSONL 질문 파일을 읽고 id가 없으면 행 번호로 만드는지 테스트"""
+        csv_path = self._write("q.csv", "id,question\nAC-1,접근 통제 정책?\n,로그 보관 기간?\n")
+        jsonl_path = self._write("q.jsonl", '{"id": "IR-1", "question": "사고 보고 절차?"}\n')
+
+        self.assertEqual(
+            load_questions(csv_path),
+            [
+                {"id": "AC-1", "question": "접근 통제 정책?"},
+                {"id": "q2", "question": "로그 보관 기간?"},
+            ],
+        )
+        self.assertEqual(load_questions(jsonl_path)[0]["id"], "IR-1")
+
+    def test_duplicate_ids_rejected(self):
+        """중복된 질문 ID가 있으면 ValueError가 발생하는지 테스트"""
+        path = self._write("q.csv", "id,question\nA,질문1\nA,질문2\n")
+
+        with self.assertRaises(ValueError):
+            load_questions(path)
+
+    @patch("security_chatbot.rag.batch_runner.query_with_rag", side_effect=_answer)
+    def test_run_batch_writes_results(self, mock_query):
+        """모든 질문의 결과가 JSONL로 기록되고 요약이 반환되는지 테스트"""
+        path = self._write("q.csv", "question\n" + "".join(f"질문 {i}\n" for i in range(5)))
+
+        summary = run_batch(path, self.output_path, STORE, concurrency=2)
+
+        results = self._read_results()
+        self.assertEqual(len(results), 5)
+        self.assertEqual(summary["succeeded"], 5)
+        self.assertEqual(summary["total_tokens"], 50)
+        self.assertEqual(results[0]["citations"], ["policy.pdf"])
+        self.assertIn("latency_seconds", results[0])
+
+    @patch("security_chatbot.rag.batch_runner.query_with_rag")
+    def test_concurrency_limit(self, mock_query):
+        """동시에 실행되는 질문 수가 concurrency를 넘지 않는지 테스트"""
+        active = []
+        peak = [0]
+        lock = threading.Lock()
+
+        def slow_answer(question, store_name, auto_retry=True):
+            with lock:
+                active.append(question)
+                peak[0] = max(peak[0], len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(question)
+            return _answer(question, store_name)
+
+        mock_query.side_effect = slow_answer
+        path = self._write("q.csv", "question\n" + "".join(f"질문 {i}\n" for i in range(8)))
+
+        run_batch(path, self.output_path, STORE, concurrency=3)
+
+        self.assertLessEqual(peak[0], 3)
+        self.assertEqual(mock_query.call_count, 8)
+
+    @patch("security_chatbot.rag.batch_runner.query_with_rag", side_effect=_answer)
+    def test_resume_skips_answered_ids(self, mock_query):
+        """이전 실행에서 성공한 ID는 건너뛰고, 실패/잘린 줄은 다시 실행하는지 테스트"""
+        path = self._write("q.csv", "id,question\nA,질문A\nB,질문B\nC,질문C\n")
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"id": "A", "success": True}) + "\n")
+            f.write(json.dumps({"id": "B", "success": False}) + "\n")
+            f.write('{"id": "C", "succ')  # 중단으로 잘린 줄
+
+        summary = run_batch(path, self.output_path, STORE)
+
+        self.assertEqual(summary["skipped"], 1)
+        asked = sorted(c.args[0] for c in mock_query.call_args_list)
+        self.assertEqual(asked, ["질문B", "질문C"])
+        self.assertEqual(load_completed_ids(self.output_path), {"A", "B", "C"})
+
+
+    @patch("security_chatbot.rag.batch_runner.query_with_rag", side_effect=_answer)
+    def test_resume_after_line_cut_inside_utf8_character(self, mock_query):
+        """한글 문자 중간에서 잘린 마지막 줄이 있어도 이어서 실행하는지 테스트"""
+        path = self._write("q.csv", "id,question\nA,질문A\nB,질문B\n")
+        record = json.dumps({"id": "B", "answer": "답변"}, ensure_ascii=False)
+        with open(self.output_path, "wb") as f:
+            f.write(json.dumps({"id": "A", "success": True}).encode() + b"\n")
+            f.write(record.encode("utf-8")[:-4])  # "변"의 UTF-8 바이트 중간에서 잘림
+
+        summary = run_batch(path, self.output_path, STORE)
+
+        self.assertEqual(summary["skipped"], 1)
+        self.assertEqual([c.args[0] for c in mock_query.call_args_list], ["질문B"])
+        self.assertEqual(load_completed_ids(self.output_path), {"A", "B"})
+        with open(self.output_path, "rb") as f:
+            last_line = f.read().splitlines()[-1]
+        self.assertEqual(json.loads(last_line)["id"], "B")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""catalog_reconciler.py 모듈 테스트
+"""
+
+import logging
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from google.api_core.exceptions import ServiceUnavailable
+from google.genai import types
+
+from security_chatbot.rag.catalog_reconciler import reconcile_catalog
+from security_chatbot.rag.document_catalog import DocumentCatalog
+
+logging.disable(logging.CRITICAL)
+
+STORE = "fileSearchStores/test-store-123"
+DATE = "2026-01-01T09:00:00"
+
+
+def _document(name, display_name=None, size_bytes=100):
+    return types.Document(
+        name=f"{STORE}/documents/{name}",
+        display_name=display_name,
+        size_bytes=size_bytes,
+        create_time=datetime(2026, 1, 2, tzinfo=timezone.utc),
+    )
+
+
+class TestReconcileCatalog(unittest.TestCase):
+    """reconcile_catalog 함수 테스트"""
+
+    def setUp(self):
+        self.catalog = DocumentCatalog(db_path=":memory:")
+        self.addCleanup(self.catalog.close)
+        self.store_manager = MagicMock()
+
+        patcher = patch("security_chatbot.rag.catalog_reconciler.upload_manifest")
+        self.addCleanup(patcher.stop)
+        self.mock_manifest = patcher.start()
+
+    def _add(self, name, resource_names):
+        return self.catalog.add(STORE, name, 100, DATE, resource_names)
+
+    def _set_pages(self, *pages):
+        self.store_manager.iter_document_pages.return_value = iter(pages)
+
+    def test_adds_missing_and_removes_stale(self):
+        """Store에만 있는 문서는 추가하고 카탈로그에만 있는 문서는 제거하는지 테스트"""
+        self._add("kept.pdf", [f"{STORE}/documents/kept"])
+        self._add("gone.pdf", [f"{STORE}/documents/gone"])
+        self._set_pages(
+            [_document("kept"), _document("new", "external.md", 2048)],
+            [_document("untitled")],
+        )
+
+        summary = reconcile_catalog(STORE, self.catalog, self.store_manager, 2)
+
+        self.store_manager.iter_document_pages.assert_called_once_with(STORE, 2)
+        self.assertEqual(
+            {key: summary[key] for key in ("listed", "added", "removed", "pages")},
+            {"listed": 3, "added": 2, "removed": 1, "pages": 2},
+        )
+        self.assertEqual(
+            sorted(doc["name"] for doc in self.catalog.list_documents(STORE)),
+            ["external.md", "kept.pdf", "untitled"],
+        )
+        added = self.catalog.find_by_resource_name(STORE, f"{STORE}/documents/new")
+        self.assertEqual(added["size_bytes"], 2048)
+        self.assertTrue(added["upload_date"].startswith("2026-01-0"))
+        self.mock_manifest.forget_corpus_file.assert_called_once_with(
+            f"{STORE}/documents/gone"
+        )
+
+    def test_lists_every_shard(self):
+        """shard로 나뉜 Store는 모든 shard의 목록을 대조하는지 테스트"""
+        shard = "fileSearchStores/test-store-456"
+        self.catalog.add_shard(STORE, shard)
+        self._add("moved.pdf", [f"{shard}/documents/moved"])
+        def pages(name, page_size):
+            if name == shard:
+                return iter([[types.Document(name=f"{shard}/documents/moved")]])
+            return iter([[]])
+
+        self.store_manager.iter_document_pages.side_effect = pages
+
+        summary = reconcile_catalog(STORE, self.catalog, self.store_manager)
+
+        listed = self.store_manager.iter_document_pages.call_args_list
+        self.assertEqual([call.args[0] for call in listed], [STORE, shard])
+        self.assertEqual((summary["added"], summary["removed"]), (0, 0))
+
+    def test_split_document_keeps_remaining_parts(self):
+        """분할 문서는 Store에 남은 조각만 유지하는지 테스트"""
+        doc = self.catalog.add(
+            STORE,
+            "audit.md",
+            100,
+            DATE,
+            [f"{STORE}/documents/p1", f"{STORE}/documents/p2"],
+            split=True,
+        )
+        self._set_pages([_document("p2")])
+
+        reconcile_catalog(STORE, self.catalog, self.store_manager)
+
+        self.assertEqual(
+            self.catalog.get(doc["id"])["resource_names"], [f"{STORE}/documents/p2"]
+        )
+
+    def test_listing_error_keeps_catalog_entries(self):
+        """목록이 중간에 끊기면 아무것도 제거하지 않는지 테스트"""
+        self._add("gone.pdf", [f"{STORE}/documents/gone"])
+
+        def pages():
+            yield [_document("new", "external.md")]
+            raise ServiceUnavailable("Service unavailable.")
+
+        self.store_manager.iter_document_pages.return_value = pages()
+
+        with self.assertRaises(ServiceUnavailable):
+            reconcile_catalog(STORE, self.catalog, self.store_manager)
+
+        self.assertEqual(self.catalog.count(STORE), 2)
+        self.mock_manifest.forget_corpus_file.assert_not_called()
+
+    def test_documents_added_during_reconcile_are_kept(self):
+        """대조 중에 업로드된 문서는 목록에 없더라도 제거하지 않는지 테스트"""
+
+        def pages():
+            yield []
+            time.sleep(0.01)
+            self._add("fresh.pdf", [f"{STORE}/documents/fresh"])
+            yield []
+
+        self.store_manager.iter_document_pages.return_value = pages()
+
+        summary = reconcile_catalog(STORE, self.catalog, self.store_manager)
+
+        self.assertEqual(summary["removed"], 0)
+        self.assertEqual(self.catalog.list_documents(STORE)[0]["name"], "fresh.pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
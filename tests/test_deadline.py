@@ -0,0 +1,186 @@
+"""deadline.py 모듈 테스트
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from google.api_core.exceptions import ServiceUnavailable
+
+from security_chatbot.utils.deadline import Deadline, timeout_metrics
+
+logging.disable(logging.CRITICAL)
+
+
+class TestDeadline(unittest.TestCase):
+    """Deadline 클래스 테스트"""
+
+    def setUp(self):
+        timeout_metrics.reset()
+
+    def test_child_never_exceeds_parent(self):
+        """하위 예산이 상위 예산의 마감 시각을 넘지 않는지 테스트"""
+        parent = Deadline(1, "상위 작업")
+
+        self.assertLessEqual(parent.child(60).remaining(), 1)
+        self.assertLessEqual(parent.child(0.5).remaining(), 0.5)
+
+    def test_http_options_carry_remaining_budget(self):
+        """남은 예산이 HTTP 타임아웃(밀리초)으로 전달되는지 테스트"""
+        options = Deadline(30).http_options()
+
+        self.assertGreater(options.timeout, 29000)
+        self.assertLessEqual(options.timeout, 30000)
+
+    def test_expired_deadline_raises(self):
+        """예산이 소진된 뒤 호출하면 TimeoutError가 발생하고 지표에 기록되는지 테스트"""
+        deadline = Deadline(0, "만료 작업")
+
+        with self.assertRaises(TimeoutError):
+            deadline.http_options()
+
+        self.assertEqual(timeout_metrics.get_stats()["by_operation"], {"만료 작업": 1})
+
+    def test_run_returns_result(self):
+        """예산 안에 끝난 호출의 결과를 반환하는지 테스트"""
+        self.assertEqual(Deadline(5).run(lambda x: x * 2, 21), 42)
+
+    def test_run_times_out_hung_call(self):
+        """멈춘 호출을 기다리지 않고 예산이 끝나면 TimeoutError를 발생시키는지 테스트"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            Deadline(0.2, "멈춘 호출").run(release.wait, 10)
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(timeout_metrics.get_stats()["total"], 1)
+
+    def test_queue_wait_counted_against_call_budget(self):
+        """풀이 가득 차 대기한 시간도 예산에 포함되어 원래 마감 시각을 넘지 않는지 테스트"""
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        busy = executor.submit(time.sleep, 0.3)
+
+        start = time.monotonic()
+        with patch("security_chatbot.utils.deadline._executor", executor):
+            # 대기열 0.3초 + 실행 0.3초 > 예산 0.5초
+            with self.assertRaises(TimeoutError):
+                Deadline(0.5, "대기 후 호출").run(lambda: time.sleep(0.3) or "ok")
+
+        self.assertLess(time.monotonic() - start, 0.7)
+        busy.result()
+        self.assertEqual(timeout_metrics.get_stats()["total"], 1)
+
+    def test_call_that_never_starts_is_cancelled(self):
+        """예산 안에 시작하지 못한 호출은 취소되고 실행되지 않는지 테스트"""
+        executor = ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        self.addCleanup(executor.shutdown)
+        self.addCleanup(release.set)
+        executor.submit(release.wait, 10)
+        called = MagicMock()
+
+        with patch("security_chatbot.utils.deadline._executor", executor):
+            with self.assertRaises(TimeoutError):
+                Deadline(0.2, "시작 못한 호출").run(called)
+
+        release.set()
+        executor.shutdown(wait=True)
+        called.assert_not_called()
+        self.assertEqual(timeout_metrics.get_stats()["total"], 1)
+
+    def test_http_timeout_converted(self):
+        """HTTP 타임아웃 예외가 TimeoutError로 변환되는지 테스트"""
+        def _raise():
+            raise httpx.ReadTimeout("read timed out")
+
+        with self.assertRaises(TimeoutError):
+            Deadline(5, "HTTP 호출").run(_raise)
+
+        self.assertEqual(timeout_metrics.get_stats()["by_operation"], {"HTTP 호출": 1})
+
+    def test_run_async_cancels_slow_coroutine(self):
+        """비동기 호출이 예산을 넘으면 취소되는지 테스트"""
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(Deadline(0.1).run_async(slow()))
+
+        self.assertEqual(cancelled, [True])
+
+
+class TestDeadlinePropagation(unittest.TestCase):
+    """쿼리/업로드 경로의 시간 예산 전파 테스트"""
+
+    def setUp(self):
+        from security_chatbot.rag.answer_cache import answer_cache
+
+        answer_cache.clear()
+        timeout_metrics.reset()
+
+    @patch(
+        "security_chatbot.rag.query_handler.rate_limiter",
+        MagicMock(acquire_async=AsyncMock()),
+    )
+    @patch("security_chatbot.rag.query_handler.API_TIMEOUT_SECONDS", 0.2)
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_hung_query_returns_timeout_response(self, mock_client_manager):
+        """응답하지 않는 쿼리가 세션을 막지 않고 실패 응답으로 끝나는지 테스트"""
+        from security_chatbot.rag.query_handler import query_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        mock_client.models.generate_content = AsyncMock(side_effect=hang)
+
+        start = time.monotonic()
+        response = query_with_rag("멈춘 질문", "test-store", auto_retry=False)
+
+        self.assertFalse(response["success"])
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(timeout_metrics.get_stats()["by_operation"], {"RAG 쿼리": 1})
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        self.assertLessEqual(config.http_options.timeout, 1000)
+
+    @patch(
+        "security_chatbot.rag.document_manager.rate_limiter",
+        MagicMock(acquire_async=AsyncMock()),
+    )
+    @patch(
+        "security_chatbot.rag.document_manager.asyncio.sleep", new_callable=AsyncMock
+    )
+    def test_backoff_never_exceeds_deadline(self, mock_sleep):
+        """백오프 대기가 남은 예산을 넘으면 재시도하지 않는지 테스트"""
+        from security_chatbot.rag.document_manager import AsyncDocumentManager
+
+        manager = AsyncDocumentManager(
+            store_name="fileSearchStores/test", client=MagicMock()
+        )
+        func = AsyncMock(side_effect=ServiceUnavailable("unavailable"))
+
+        with self.assertRaises(ServiceUnavailable):
+            asyncio.run(manager._retry_with_backoff(func, deadline=Deadline(0.5)))
+
+        func.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+
+if __name__ == "__main__":
+    unittest.main()
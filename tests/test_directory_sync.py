@@ -0,0 +1,203 @@
+"""directory_sync.py 모듈 테스트
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from security_chatbot.rag.directory_sync import SyncManifest, sync_directory
+
+logging.disable(logging.CRITICAL)
+
+STORE = "fileSearchStores/test-store-123"
+
+
+class TestDirectorySync(unittest.TestCase):
+    """sync_directory 함수 테스트"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+        self.manifest = SyncManifest(db_path=":memory:")
+        self.addCleanup(self.manifest.close)
+
+        self.uploaded: list[list[str]] = []
+        self.failing: set[str] = set()
+        self.doc_manager = MagicMock()
+        self.doc_manager.upload_files_batch.side_effect = self._fake_batch
+        self.doc_manager.resolve_documents.side_effect = self._fake_resolve
+        self.store_manager = MagicMock()
+        self.store_manager.delete_corpus_file.return_value = True
+
+    def _fake_batch(self, file_paths, **kwargs):
+        """파일 내용을 코퍼스 파일 이름으로 쓰는 가짜 배치 업로드"""
+        self.uploaded.append([Path(path).name for path in file_paths])
+        results = {"success": [], "failed": [], "total": len(file_paths)}
+        for path in file_paths:
+            if Path(path).name in self.failing:
+                results["failed"].append(
+                    {"file_path": path, "error": "503", "stage": "upload"}
+                )
+                continue
+            content = Path(path).read_text()
+            results["success"].append(
+                {"corpus_file_name": f"{STORE}/corpusFiles/{content}"}
+            )
+        return results
+
+    def _fake_resolve(self, results):
+        """인덱싱에 실패하는 파일 내용이 아니면 모두 인덱싱된 것으로 처리"""
+        return [
+            {
+                **result,
+                "indexing": (
+                    "failed" if result["corpus_file_name"].endswith("bad") else "done"
+                ),
+            }
+            for result in results
+        ]
+
+    def _write(self, rel_path: str, content: str, mtime: int | None = None) -> None:
+        path = Path(self.root) / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+
+    def _sync(self):
+        return sync_directory(
+            self.root,
+            STORE,
+            self.manifest,
+            document_manager=self.doc_manager,
+            store_manager=self.store_manager,
+        )
+
+    def test_only_new_supported_files_are_uploaded(self):
+        """지원 형식만 업로드하고, 변경이 없으면 다시 실행해도 API를 호출하지 않는지 테스트"""
+        self._write("a.txt", "a1")
+        self._write("sub/b.md", "b1")
+        self._write("image.png", "png")
+        self._write(".hidden/c.txt", "c1")
+
+        first = self._sync()
+        second = self._sync()
+
+        self.assertEqual(self.uploaded, [["a.txt", "b.md"]])
+        self.assertEqual((first["scanned"], first["uploaded"]), (2, 2))
+        self.assertEqual((second["unchanged"], second["uploaded"]), (2, 0))
+        self.doc_manager.upload_files_batch.assert_called_once()
+
+    def test_changed_touched_and_removed_files(self):
+        """변경 파일은 다시 올리고 이전 문서 삭제, touch만 된 파일은 갱신, 사라진 파일은 삭제"""
+        self._write("changed.txt", "v1", mtime=1_000_000_000)
+        self._write("touched.txt", "same", mtime=1_000_000_000)
+        self._write("removed.txt", "gone")
+        self._sync()
+
+        self._write("changed.txt", "v2", mtime=2_000_000_000)
+        self._write("touched.txt", "same", mtime=2_000_000_000)
+        os.remove(Path(self.root) / "removed.txt")
+        summary = self._sync()
+
+        self.assertEqual(self.uploaded[-1], ["changed.txt"])
+        self.assertEqual(
+            (summary["uploaded"], summary["touched"], summary["deleted"]), (1, 1, 2)
+        )
+        deleted = {
+            call.args[0] for call in self.store_manager.delete_corpus_file.call_args_list
+        }
+        self.assertEqual(
+            deleted, {f"{STORE}/corpusFiles/v1", f"{STORE}/corpusFiles/gone"}
+        )
+        self.assertEqual(self._sync()["unchanged"], 2)
+
+    def test_failed_upload_is_retried_next_run(self):
+        self._write("a.txt", "a1")
+        self.failing.add("a.txt")
+
+        first = self._sync()
+        self.failing.clear()
+        second = self._sync()
+
+        self.assertEqual(first["failed"][0]["rel_path"], "a.txt")
+        self.assertEqual(second["uploaded"], 1)
+
+    def test_failed_indexing_is_retried_next_run(self):
+        """인덱싱에 실패한 파일은 기록하지 않고 다음 실행에서 다시 올리는지 테스트"""
+        self._write("a.txt", "bad")
+
+        first = self._sync()
+        self._write("a.txt", "a2")
+        second = self._sync()
+
+        self.assertEqual(
+            [(f["rel_path"], f["action"]) for f in first["failed"]],
+            [("a.txt", "index")],
+        )
+        self.assertEqual(first["uploaded"], 0)
+        self.assertEqual(second["uploaded"], 1)
+        self.assertEqual(self.uploaded, [["a.txt"], ["a.txt"]])
+
+    def test_shared_corpus_file_kept_while_referenced(self):
+        """내용이 같아 같은 문서를 가리키는 파일이 남아 있으면 문서를 삭제하지 않는지 테스트"""
+        self._write("a.txt", "same")
+        self._write("copy/a.txt", "same")
+        self._sync()
+
+        os.remove(Path(self.root) / "copy" / "a.txt")
+        summary = self._sync()
+
+        self.assertEqual(summary["deleted"], 0)
+        self.store_manager.delete_corpus_file.assert_not_called()
+
+    def test_failed_delete_is_retried_next_run(self):
+        self._write("a.txt", "a1")
+        self._sync()
+        os.remove(Path(self.root) / "a.txt")
+        self.store_manager.delete_corpus_file.return_value = False
+
+        first = self._sync()
+        self.store_manager.delete_corpus_file.return_value = True
+        second = self._sync()
+
+        self.assertEqual(first["failed"][0]["action"], "delete")
+        self.assertEqual(second["deleted"], 1)
+        self.assertEqual(self._sync()["deleted"], 0)
+
+    def test_mislabeled_file_is_reported_without_upload(self):
+        """내용이 확장자와 맞지 않는 파일은 업로드하지 않고 검증 실패로 보고하는지 테스트"""
+        self._write("a.txt", "a1")
+        self._write("fake.pdf", "not a pdf")
+
+        summary = self._sync()
+
+        self.assertEqual(self.uploaded, [["a.txt"]])
+        self.assertEqual(
+            [(f["rel_path"], f["action"]) for f in summary["failed"]],
+            [("fake.pdf", "validate")],
+        )
+
+    def test_dry_run_changes_nothing(self):
+        self._write("a.txt", "a1")
+
+        summary = sync_directory(
+            self.root,
+            STORE,
+            self.manifest,
+            document_manager=self.doc_manager,
+            store_manager=self.store_manager,
+            dry_run=True,
+        )
+
+        self.assertEqual(summary["plan"]["upload"][0]["rel_path"], "a.txt")
+        self.doc_manager.upload_files_batch.assert_not_called()
+        self.assertEqual(self._sync()["uploaded"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
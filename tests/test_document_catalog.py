@@ -0,0 +1,191 @@
+"""document_catalog.py 모듈 테스트
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from security_chatbot.rag.document_catalog import DocumentCatalog
+
+logging.disable(logging.CRITICAL)
+
+STORE = "fileSearchStores/test-store-123"
+OTHER_STORE = "fileSearchStores/other-store-456"
+DATE = "2026-01-01T09:00:00"
+
+
+class TestDocumentCatalog(unittest.TestCase):
+    """DocumentCatalog 클래스 테스트"""
+
+    def setUp(self):
+        self.catalog = DocumentCatalog(db_path=":memory:")
+        self.addCleanup(self.catalog.close)
+
+    def _add(self, name, resource_names, store=STORE, **kwargs):
+        return self.catalog.add(store, name, 100, DATE, resource_names, **kwargs)
+
+    def test_add_and_lookup(self):
+        """이름, 해시, 조각 리소스 이름으로 문서를 찾고 Store별로 분리되는지 테스트"""
+        policy = self._add("policy.pdf", [f"{STORE}/corpusFiles/c1"], sha256="a" * 64)
+        split = self._add(
+            "audit.md",
+            [f"{STORE}/corpusFiles/p1", f"{STORE}/corpusFiles/p2"],
+            split=True,
+        )
+        self._add("other.txt", [f"{OTHER_STORE}/corpusFiles/c9"], store=OTHER_STORE)
+
+        self.assertEqual(
+            self.catalog.find_by_resource_name(STORE, f"{STORE}/corpusFiles/p2")["id"],
+            split["id"],
+        )
+        self.assertEqual(split["resource_names"][0], f"{STORE}/corpusFiles/p1")
+        self.assertTrue(split["split"])
+        self.assertEqual(
+            self.catalog.find_by_sha256(STORE, "a" * 64)["name"], "policy.pdf"
+        )
+        self.assertIsNone(
+            self.catalog.find_by_resource_name(
+                OTHER_STORE, f"{STORE}/corpusFiles/c1"
+            )
+        )
+        self.assertEqual(
+            [doc["name"] for doc in self.catalog.list_documents(STORE)],
+            ["policy.pdf", "audit.md"],
+        )
+        self.assertEqual(self.catalog.count(OTHER_STORE), 1)
+        self.assertFalse(policy["split"])
+
+    def test_partial_part_removal_and_remove(self):
+        """남은 조각만 유지하고, 조각이 모두 사라지거나 제거하면 문서도 사라지는지 테스트"""
+        doc = self._add(
+            "audit.md",
+            [f"{STORE}/corpusFiles/p1", f"{STORE}/corpusFiles/p2"],
+            split=True,
+        )
+        other = self._add("a.txt", [f"{STORE}/corpusFiles/a"])
+
+        self.catalog.set_resource_names(doc["id"], [f"{STORE}/corpusFiles/p2"])
+        self.assertEqual(
+            self.catalog.get(doc["id"])["resource_names"], [f"{STORE}/corpusFiles/p2"]
+        )
+        self.assertIsNone(
+            self.catalog.find_by_resource_name(STORE, f"{STORE}/corpusFiles/p1")
+        )
+
+        self.catalog.set_resource_names(doc["id"], [])
+        self.assertIsNone(self.catalog.get(doc["id"]))
+        self.assertTrue(self.catalog.remove(other["id"]))
+        self.assertFalse(self.catalog.remove(other["id"]))
+        self.assertEqual(self.catalog.count(STORE), 0)
+
+    def test_remove_keeps_documents_with_same_name(self):
+        """같은 이름의 문서가 여러 개일 때 지정한 문서만 제거하는지 테스트"""
+        first = self._add("policy.pdf", [f"{STORE}/corpusFiles/c1"])
+        second = self._add("policy.pdf", [f"{STORE}/corpusFiles/c2"])
+
+        self.assertTrue(self.catalog.remove(first["id"]))
+
+        self.assertEqual(
+            [doc["id"] for doc in self.catalog.list_documents(STORE)], [second["id"]]
+        )
+        self.assertIsNone(
+            self.catalog.find_by_resource_name(STORE, f"{STORE}/corpusFiles/c1")
+        )
+
+    def test_re_adding_corpus_file_moves_it_to_new_document(self):
+        """같은 코퍼스 파일로 다시 추가하면 이전 문서를 대체하는지 테스트"""
+        self._add("old.txt", [f"{STORE}/corpusFiles/c1"])
+        self._add("new.txt", [f"{STORE}/corpusFiles/c1"])
+
+        self.assertEqual(
+            [doc["name"] for doc in self.catalog.list_documents(STORE)], ["new.txt"]
+        )
+
+    def test_store_tracking_and_forget(self):
+        self.catalog.record_store(STORE, "Security Docs")
+        self._add("a.txt", [f"{STORE}/corpusFiles/a"])
+
+        self.assertEqual(self.catalog.latest_store("Security Docs"), STORE)
+        self.assertEqual(self.catalog.store_display_name(STORE), "Security Docs")
+        self.catalog.forget_store(STORE)
+        self.assertIsNone(self.catalog.latest_store("Security Docs"))
+        self.assertIsNone(self.catalog.store_display_name(STORE))
+        self.assertEqual(self.catalog.count(STORE), 0)
+
+    def test_shards_are_listed_in_order_and_forgotten_with_store(self):
+        self.catalog.record_store(STORE, "Security Docs")
+        self.catalog.add_shard(STORE, f"{STORE}-3")
+        self.catalog.add_shard(STORE, f"{STORE}-2")
+        self.catalog.add_shard(STORE, f"{STORE}-3")
+
+        self.assertEqual(
+            self.catalog.list_shards(STORE), [STORE, f"{STORE}-3", f"{STORE}-2"]
+        )
+        self.assertEqual(self.catalog.list_shards(OTHER_STORE), [OTHER_STORE])
+        self.catalog.forget_store(STORE)
+        self.assertEqual(self.catalog.list_shards(STORE), [STORE])
+
+    def test_list_page_sorts_and_paginates(self):
+        for i, size in enumerate([300, 100, 200]):
+            self.catalog.add(
+                STORE,
+                f"doc{i}.txt",
+                size,
+                f"2026-01-0{i + 1}T09:00:00",
+                [f"{STORE}/corpusFiles/c{i}"],
+            )
+
+        newest, total = self.catalog.list_page(STORE, limit=2)
+        second_page, _ = self.catalog.list_page(STORE, limit=2, offset=2)
+        by_size, _ = self.catalog.list_page(STORE, sort_by="size", descending=False)
+
+        self.assertEqual(total, 3)
+        self.assertEqual([doc["name"] for doc in newest], ["doc2.txt", "doc1.txt"])
+        self.assertEqual([doc["name"] for doc in second_page], ["doc0.txt"])
+        self.assertEqual([doc["size_bytes"] for doc in by_size], [100, 200, 300])
+        with self.assertRaises(ValueError):
+            self.catalog.list_page(STORE, sort_by="sha256")
+
+    def test_list_page_search(self):
+        """검색어 길이와 관계없이 파일명의 부분 문자열(대소문자 무시)을 찾는지 테스트"""
+        names = ["보안정책_Policy.pdf", "incident_report.md", "정책.txt"]
+        for i, name in enumerate(names):
+            self._add(name, [f"{STORE}/corpusFiles/c{i}"])
+        self._add("POLICY.md", [f"{OTHER_STORE}/corpusFiles/c9"], store=OTHER_STORE)
+
+        def search(query):
+            return sorted(
+                doc["name"] for doc in self.catalog.list_page(STORE, query)[0]
+            )
+
+        self.assertEqual(search("policy"), ["보안정책_Policy.pdf"])
+        self.assertEqual(search("t_rep"), ["incident_report.md"])
+        # 트라이그램보다 짧은 두 글자 검색어도 파일명 중간에서 찾음
+        self.assertEqual(search("정책"), ["보안정책_Policy.pdf", "정책.txt"])
+        self.assertEqual(search("re"), ["incident_report.md"])
+        self.assertEqual(search("%"), [])
+        self.assertEqual(search('50%"'), [])
+
+        # 트라이그램 인덱스가 없으면 LIKE 부분 문자열 검색
+        self.catalog._has_trigram_index = False
+        self.assertEqual(search("정책"), ["보안정책_Policy.pdf", "정책.txt"])
+
+    def test_shared_between_connections(self):
+        """같은 DB 파일을 여는 다른 인스턴스(다른 세션/레플리카)에서도 보이는지 테스트"""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir, True)
+        db_path = os.path.join(test_dir, "catalog.db")
+        first = DocumentCatalog(db_path=db_path)
+        self.addCleanup(first.close)
+        second = DocumentCatalog(db_path=db_path)
+        self.addCleanup(second.close)
+
+        first.add(STORE, "a.txt", 10, DATE, [f"{STORE}/corpusFiles/a"])
+
+        self.assertEqual(second.list_documents(STORE)[0]["name"], "a.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,7 @@ import logging
 import os
 import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from google import genai
 from google.api_core.exceptions import (
@@ -14,27 +14,52 @@ from google.api_core.exceptions import (
     NotFound,
     ServiceUnavailable,
 )
-from google.genai import types
+from google.genai import errors, types
 
 from security_chatbot.rag.document_manager import (
+    MAGIC_BYTES,
     MAX_FILE_SIZE_BYTES,
+    AsyncDocumentManager,
     DocumentManager,
+    validation_cache,
 )
+from security_chatbot.rag.text_extraction import TextExtractor
+from security_chatbot.rag.upload_manifest import upload_manifest
+from tests.sdk_doubles import autospec_client
 
 logging.disable(logging.CRITICAL)
 
 
+def _signature(filename: str) -> bytes:
+    """확장자에 맞는 파일 시그니처 (내용 검사를 통과하도록 파일 앞에 붙임)"""
+    return MAGIC_BYTES.get(os.path.splitext(filename)[1].lower(), (b"",))[0]
+
+
+def _import_operation(store_name: str, part: str, done: bool):
+    """import_file이 반환하는 Operation (끝났으면 생성된 문서 이름을 응답에 담음)"""
+    return types.ImportFileOperation(
+        name=f"{store_name}/operations/{part}",
+        done=done,
+        response=(
+            types.ImportFileResponse(document_name=f"{store_name}/documents/{part}")
+            if done
+            else None
+        ),
+    )
+
+
 class TestDocumentManager(unittest.TestCase):
 
     def setUp(self):
         self.mock_client = MagicMock(spec=genai.Client)
-        self.mock_files = MagicMock()
-        self.mock_file_search_stores = MagicMock()
-        self.mock_operations = MagicMock()
+        self.mock_files = MagicMock(upload=AsyncMock())
+        self.mock_file_search_stores = MagicMock(import_file=AsyncMock())
+        self.mock_operations = MagicMock(get=AsyncMock())
 
-        self.mock_client.files = self.mock_files
-        self.mock_client.file_search_stores = self.mock_file_search_stores
-        self.mock_client.operations = self.mock_operations
+        # 동기 DocumentManager도 비동기 클라이언트(client.aio)로 호출함
+        self.mock_client.aio.files = self.mock_files
+        self.mock_client.aio.file_search_stores = self.mock_file_search_stores
+        self.mock_client.aio.operations = self.mock_operations
 
         patcher = patch(
             "security_chatbot.utils.api_client.GeminiClientManager.get_client",
@@ -48,6 +73,10 @@ class TestDocumentManager(unittest.TestCase):
 
         self.test_dir = tempfile.mkdtemp()
         self.addCleanup(lambda: self._cleanup_temp_dir())
+        upload_manifest.clear()
+        self.addCleanup(upload_manifest.clear)
+        validation_cache.clear()
+        self.addCleanup(validation_cache.clear)
 
     def _cleanup_temp_dir(self):
         import shutil
@@ -57,8 +86,10 @@ class TestDocumentManager(unittest.TestCase):
 
     def _create_temp_file(self, filename: str, size: int = 1024) -> str:
         file_path = os.path.join(self.test_dir, filename)
+        # 파일마다 내용이 달라야 중복 업로드로 처리되지 않음
+        content = _signature(filename) + filename.encode() + b"X" * size
         with open(file_path, "wb") as f:
-            f.write(b"X" * size)
+            f.write(content[:size])
         return file_path
 
     def test_init_success(self):
@@ -112,6 +143,37 @@ class TestDocumentManager(unittest.TestCase):
             self.manager.validate_file(file_path)
         self.assertIn("지원되지 않는 파일 형식", str(ctx.exception))
 
+    def test_validate_file_rejects_mislabeled_content(self):
+        """확장자와 실제 내용이 다른 파일(이름만 바꾼 HWP, 바이너리 텍스트)을 거부하는지 테스트"""
+        renamed = os.path.join(self.test_dir, "renamed.pdf")
+        with open(renamed, "wb") as f:
+            f.write(MAGIC_BYTES[".hwp"][0] + b"X" * 64)
+        binary = os.path.join(self.test_dir, "dump.txt")
+        with open(binary, "wb") as f:
+            f.write(b"abc\x00\x01\x02" * 16)
+
+        with self.assertRaises(ValueError) as ctx:
+            self.manager.validate_file(renamed)
+        self.assertIn("application/x-hwp", str(ctx.exception))
+        with self.assertRaises(ValueError) as ctx:
+            self.manager.validate_file(binary)
+        self.assertIn("바이너리", str(ctx.exception))
+
+    def test_validate_file_reuses_cached_record(self):
+        """크기와 수정 시각이 같으면 파일을 다시 읽지 않고, 바뀌면 다시 검증하는지 테스트"""
+        file_path = self._create_temp_file("cached.txt", 256)
+        first = self.manager.validate_file(file_path)
+
+        with patch("builtins.open", side_effect=AssertionError("re-read")):
+            second = self.manager.validate_file(file_path)
+        self.assertEqual(second, first)
+
+        with open(file_path, "ab") as f:
+            f.write(b"more")
+        third = self.manager.validate_file(file_path)
+        self.assertEqual(third["file_size"], 260)
+        self.assertNotEqual(third["sha256"], first["sha256"])
+
     def test_upload_file_success(self):
         file_path = self._create_temp_file("test.pdf", 1024)
         mock_uploaded_file = types.File(
@@ -165,34 +227,323 @@ class TestDocumentManager(unittest.TestCase):
         self.assertEqual(len(results["success"]), 1)
         self.assertEqual(len(results["failed"]), 1)
 
-    def test_retry_with_backoff_success_first_try(self):
-        mock_func = MagicMock(return_value="success")
-        result = self.manager._retry_with_backoff(mock_func, "arg1", kwarg1="value1")
-        self.assertEqual(result, "success")
-        self.assertEqual(mock_func.call_count, 1)
+    def test_upload_files_batch_pipelined(self):
+        """업로드와 import 단계가 겹쳐 진행되고 단계별 동시성이 지켜지는지 테스트"""
+        import asyncio
+
+        files = [self._create_temp_file(f"doc{i}.txt", 128) for i in range(6)]
+        active = {"upload": 0, "import": 0}
+        peak = {"upload": 0, "import": 0}
+        events = []
+
+        async def track(stage, result):
+            active[stage] += 1
+            peak[stage] = max(peak[stage], active[stage])
+            events.append(stage)
+            await asyncio.sleep(0.02)
+            active[stage] -= 1
+            return result
+
+        corpus_file = MagicMock()
+        corpus_file.name = f"{self.store_name}/corpusFiles/c1"
+        async def upload(**kwargs):
+            return await track("upload", types.File(name="files/f", display_name="doc"))
+
+        async def import_file(**kwargs):
+            return await track("import", corpus_file)
+
+        self.mock_files.upload.side_effect = upload
+        self.mock_file_search_stores.import_file.side_effect = import_file
+
+        results = self.manager.upload_files_batch(
+            files + ["/non/existent/file.pdf"],
+            upload_concurrency=3,
+            import_concurrency=1,
+        )
 
-    @patch("time.sleep")
-    def test_retry_with_backoff_success_after_retry(self, mock_sleep):
-        mock_func = MagicMock()
-        mock_func.side_effect = [ServiceUnavailable("Service unavailable"), "success"]
-        result = self.manager._retry_with_backoff(mock_func)
-        self.assertEqual(result, "success")
-        self.assertEqual(mock_func.call_count, 2)
+        self.assertEqual(len(results["success"]), 6)
+        self.assertEqual(results["failed"][0]["stage"], "validate")
+        self.assertLessEqual(peak["upload"], 3)
+        self.assertEqual(peak["import"], 1)
+        # 마지막 업로드가 시작되기 전에 첫 import가 시작됨 (파이프라인)
+        self.assertLess(events.index("import"), len(events) - 1 - events[::-1].index("upload"))
+        self.assertIn("import_wait", results["success"][0]["timings"])
+        self.assertIn("total", results["success"][0]["timings"])
 
-    @patch("time.sleep")
-    def test_retry_with_backoff_max_retries_exceeded(self, mock_sleep):
-        mock_func = MagicMock()
-        mock_func.side_effect = ServiceUnavailable("Service unavailable")
-        with self.assertRaises(ServiceUnavailable):
-            self.manager._retry_with_backoff(mock_func)
-        self.assertEqual(mock_func.call_count, 3)
+    def test_validate_file_computes_sha256(self):
+        import hashlib
 
-    def test_retry_with_backoff_non_retryable_error(self):
-        mock_func = MagicMock()
-        mock_func.side_effect = InvalidArgument("Invalid argument")
-        with self.assertRaises(InvalidArgument):
-            self.manager._retry_with_backoff(mock_func)
-        self.assertEqual(mock_func.call_count, 1)
+        file_path = self._create_temp_file("test.pdf", 1024)
+        with open(file_path, "rb") as f:
+            expected = hashlib.sha256(f.read()).hexdigest()
+        self.assertEqual(self.manager.validate_file(file_path)["sha256"], expected)
+
+    def test_upload_file_skips_duplicate_content(self):
+        """같은 내용의 파일은 다시 업로드하지 않고 기존 코퍼스 파일을 재사용하는지 테스트"""
+        original = self._create_temp_file("policy.pdf", 1024)
+        copy = os.path.join(self.test_dir, "policy-copy.pdf")
+        with open(original, "rb") as src, open(copy, "wb") as dst:
+            dst.write(src.read())
+        corpus_file = MagicMock()
+        corpus_file.name = f"{self.store_name}/corpusFiles/c1"
+        self.mock_files.upload.return_value = types.File(name="files/f")
+        self.mock_file_search_stores.import_file.return_value = corpus_file
+
+        first = self.manager.upload_file(original)
+        second = self.manager.upload_file(copy)
+
+        self.assertFalse(first["deduplicated"])
+        self.assertTrue(second["deduplicated"])
+        self.assertEqual(second["corpus_file_name"], corpus_file.name)
+        self.assertEqual(second["duplicate_of"], "policy.pdf")
+        self.assertEqual(self.mock_files.upload.call_count, 1)
+        stats = upload_manifest.get_stats()
+        self.assertEqual(stats["bytes_saved"], 1024)
+        self.assertEqual(stats["api_calls_saved"], 2)
+
+    def test_upload_files_batch_dedupes_within_batch(self):
+        """같은 배치 안의 동일한 파일은 한 번만 업로드되는지 테스트"""
+        original = self._create_temp_file("a.txt", 256)
+        copy = os.path.join(self.test_dir, "b.txt")
+        with open(original, "rb") as src, open(copy, "wb") as dst:
+            dst.write(src.read())
+        other = self._create_temp_file("c.txt", 256)
+        corpus_file = MagicMock()
+        corpus_file.name = f"{self.store_name}/corpusFiles/c1"
+        self.mock_files.upload.return_value = types.File(name="files/f")
+        self.mock_file_search_stores.import_file.return_value = corpus_file
+
+        results = self.manager.upload_files_batch([original, copy, other])
+
+        self.assertEqual(len(results["success"]), 3)
+        self.assertEqual(self.mock_files.upload.call_count, 2)
+        deduplicated = [r for r in results["success"] if r["deduplicated"]]
+        self.assertEqual(len(deduplicated), 1)
+        self.assertEqual(deduplicated[0]["corpus_file_name"], corpus_file.name)
+
+    def test_validate_stream_rejects_mismatched_signature(self):
+        """확장자와 내용의 시그니처가 맞지 않으면 거부하는지 테스트"""
+        import io
+
+        with self.assertRaises(ValueError) as ctx:
+            self.manager.validate_stream(io.BytesIO(b"not a pdf"), "fake.pdf")
+        self.assertIn("형식과 일치하지 않습니다", str(ctx.exception))
+
+    @patch("security_chatbot.rag.document_manager.MAX_FILE_SIZE_BYTES", 16)
+    def test_validate_stream_size_exceeded(self):
+        with self.assertRaises(ValueError) as ctx:
+            self.manager.validate_stream(memoryview(b"X" * 17), "large.txt")
+        self.assertIn("파일 크기가 제한을 초과", str(ctx.exception))
+
+    def test_upload_stream_from_file_object(self):
+        """파일 객체를 임시 파일 없이 그대로 업로드하고 해시가 경로 업로드와 같은지 테스트"""
+        import io
+
+        content = b"%PDF-1.7 policy"
+        source = io.BytesIO(content)
+        source.seek(5)
+        corpus_file = MagicMock()
+        corpus_file.name = f"{self.store_name}/corpusFiles/c1"
+        self.mock_file_search_stores.import_file.return_value = corpus_file
+        sent = []
+        self.mock_files.upload.side_effect = lambda file, config: (
+            sent.append(file.read()) or types.File(name="files/f")
+        )
+
+        result = self.manager.upload_stream(source, "policy.pdf")
+
+        self.assertEqual(sent, [content])
+        self.assertEqual(result["corpus_file_name"], corpus_file.name)
+        file_path = os.path.join(self.test_dir, "policy.pdf")
+        with open(file_path, "wb") as f:
+            f.write(content)
+        self.assertEqual(self.manager.validate_file(file_path)["sha256"], result["sha256"])
+
+    @patch(
+        "security_chatbot.rag.document_manager.asyncio.sleep", new_callable=AsyncMock
+    )
+    def test_upload_stream_from_memoryview_rewinds_on_retry(self, mock_sleep):
+        """memoryview 업로드가 재시도 시 처음부터 다시 전송되는지 테스트"""
+        content = b"# Security policy\n" * 100
+        corpus_file = MagicMock()
+        corpus_file.name = f"{self.store_name}/corpusFiles/c1"
+        self.mock_file_search_stores.import_file.return_value = corpus_file
+        sent = []
+
+        def upload(file, config):
+            sent.append(file.read())
+            if len(sent) == 1:
+                raise ServiceUnavailable("Service unavailable")
+            return types.File(name="files/f")
+
+        self.mock_files.upload.side_effect = upload
+
+        result = self.manager.upload_stream(memoryview(content), "policy.md")
+
+        self.assertEqual(sent, [content, content])
+        self.assertEqual(result["file"].name, "files/f")
+
+    def test_upload_file_sends_extracted_text(self):
+        """텍스트 추출이 켜져 있으면 정규화한 텍스트를 text/plain으로 올리는지 테스트"""
+        file_path = os.path.join(self.test_dir, "policy.txt")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("제1조   목적\r\n\r\n\r\n\r\n보안   정책" + " " * 2000)
+        self.manager.extract_text = True
+        self.manager.text_extractor = TextExtractor(max_workers=0)
+        sent = {}
+
+        def upload(file, config):
+            sent["content"] = file.read()
+            sent["config"] = config
+            return types.File(name="files/text-123")
+
+        self.mock_files.upload.side_effect = upload
+        self.mock_file_search_stores.import_file.return_value.name = "corpus/1"
+
+        result = self.manager.upload_file(file_path)
+
+        self.assertEqual(sent["content"].decode(), "제1조 목적\n\n보안 정책")
+        self.assertEqual(sent["config"]["mime_type"], "text/plain")
+        self.assertEqual(sent["config"]["display_name"], "policy.txt")
+        self.assertTrue(result["text_extracted"])
+        self.assertEqual(result["original_bytes"], os.path.getsize(file_path))
+        self.assertEqual(result["uploaded_bytes"], len(sent["content"]))
+
+    def test_upload_file_keeps_original_when_not_extractable(self):
+        """추출할 수 없는 형식(HWP)은 원본을 그대로 올리는지 테스트"""
+        file_path = self._create_temp_file("report.hwp", 1024)
+        self.manager.extract_text = True
+        self.manager.text_extractor = TextExtractor(max_workers=0)
+        self.mock_files.upload.return_value = types.File(name="files/hwp-123")
+        self.mock_file_search_stores.import_file.return_value.name = "corpus/2"
+
+        result = self.manager.upload_file(file_path)
+
+        config = self.mock_files.upload.call_args.kwargs["config"]
+        self.assertEqual(config["mime_type"], "application/x-hwp")
+        self.assertFalse(result["text_extracted"])
+        self.assertEqual(result["uploaded_bytes"], 1024)
+
+    @patch(
+        "security_chatbot.rag.document_manager.rate_limiter",
+        MagicMock(acquire_async=AsyncMock()),
+    )
+    @patch("security_chatbot.rag.document_manager.SPLIT_PART_MAX_BYTES", 1024)
+    @patch("security_chatbot.rag.document_manager.MAX_FILE_SIZE_BYTES", 2048)
+    def test_upload_file_splits_oversized_document(self):
+        """크기 제한을 넘는 문서를 조각으로 나누어 하나의 문서로 업로드하는지 테스트"""
+        file_path = os.path.join(self.test_dir, "audit.txt")
+        with open(file_path, "w") as f:
+            f.writelines(f"event {i:09d}\n" for i in range(256))
+        uploaded_names = []
+
+        def upload(file, config):
+            uploaded_names.append(config["display_name"])
+            return types.File(name=f"files/{config['display_name']}")
+
+        def import_file(file_search_store_name, file_name, config):
+            corpus_file = MagicMock()
+            corpus_file.name = f"corpus/{file_name.split('/')[-1]}"
+            return corpus_file
+
+        self.mock_files.upload.side_effect = upload
+        self.mock_file_search_stores.import_file.side_effect = import_file
+
+        result = self.manager.upload_file(file_path)
+
+        self.assertTrue(result["split"])
+        self.assertEqual(len(result["parts"]), 4)
+        self.assertEqual(
+            sorted(uploaded_names), [f"audit.part{i:03d}.txt" for i in range(1, 5)]
+        )
+        self.assertEqual(
+            result["corpus_file_names"],
+            [f"corpus/audit.part{i:03d}.txt" for i in range(1, 5)],
+        )
+        self.assertEqual(result["corpus_file_name"], "corpus/audit.part001.txt")
+
+    @patch(
+        "security_chatbot.rag.document_manager.rate_limiter",
+        MagicMock(acquire_async=AsyncMock()),
+    )
+    @patch("security_chatbot.rag.document_manager.AsyncFileSearchStoreManager")
+    @patch("security_chatbot.rag.document_manager.SPLIT_PART_MAX_BYTES", 1024)
+    @patch("security_chatbot.rag.document_manager.MAX_FILE_SIZE_BYTES", 2048)
+    def test_failed_split_upload_discards_uploaded_parts(self, mock_store_manager):
+        """조각 하나가 실패하면 이미 등록된 조각을 삭제하고 오류를 내는지 테스트"""
+        file_path = os.path.join(self.test_dir, "audit.txt")
+        with open(file_path, "w") as f:
+            f.writelines(f"event {i:09d}\n" for i in range(192))
+
+        def upload(file, config):
+            if config["display_name"] == "audit.part002.txt":
+                raise InvalidArgument("broken part")
+            return types.File(name=f"files/{config['display_name']}")
+
+        def import_file(file_search_store_name, file_name, config):
+            part = file_name.removeprefix("files/")
+            return _import_operation(self.store_name, part, done=True)
+
+        self.mock_files.upload.side_effect = upload
+        self.mock_file_search_stores.import_file.side_effect = import_file
+        delete = mock_store_manager.return_value.delete_corpus_file = AsyncMock(
+            return_value=True
+        )
+
+        with self.assertRaises(GoogleAPIError):
+            self.manager.upload_file(file_path)
+
+        # 삭제는 인덱싱이 끝나 생성된 문서 이름으로 요청
+        self.assertEqual(
+            sorted(call.args[0] for call in delete.call_args_list),
+            [
+                f"{self.store_name}/documents/audit.part001.txt",
+                f"{self.store_name}/documents/audit.part003.txt",
+            ],
+        )
+
+    @patch(
+        "security_chatbot.rag.document_manager.rate_limiter",
+        MagicMock(acquire_async=AsyncMock()),
+    )
+    @patch(
+        "security_chatbot.rag.store_manager.rate_limiter",
+        MagicMock(acquire_async=AsyncMock()),
+    )
+    @patch("security_chatbot.rag.document_manager.SPLIT_PART_MAX_BYTES", 1024)
+    @patch("security_chatbot.rag.document_manager.MAX_FILE_SIZE_BYTES", 2048)
+    def test_failed_split_rollback_is_reported(self):
+        """조각 롤백이 SDK의 documents.delete를 쓰고, 삭제 실패를 알리는지 테스트"""
+        client = autospec_client()
+        manager = DocumentManager(store_name=self.store_name, client=client)
+        file_path = os.path.join(self.test_dir, "audit.txt")
+        with open(file_path, "w") as f:
+            f.writelines(f"event {i:09d}\n" for i in range(192))
+
+        def upload(file, config):
+            if config["display_name"] == "audit.part002.txt":
+                raise InvalidArgument("broken part")
+            return types.File(name=f"files/{config['display_name']}")
+
+        def import_file(file_search_store_name, file_name, config):
+            part = file_name.removeprefix("files/")
+            return _import_operation(self.store_name, part, done=False)
+
+        client.aio.files.upload.side_effect = upload
+        client.aio.file_search_stores.import_file.side_effect = import_file
+        client.aio.operations.get.side_effect = lambda operation: (
+            _import_operation(
+                self.store_name, operation.name.rsplit("/", 1)[-1], done=True
+            )
+        )
+        delete = client.aio.file_search_stores.documents.delete
+        delete.side_effect = errors.ServerError(503, {"error": {"message": "busy"}})
+
+        with self.assertRaises(GoogleAPIError) as raised:
+            manager.upload_file(file_path)
+
+        self.assertEqual(delete.call_count, 2)
+        self.assertIn("삭제하지 못해 Store에 남아 있습니다", str(raised.exception))
 
     def test_wait_for_indexing_success(self):
         operation_name = "operations/test-operation-123"
@@ -205,16 +556,25 @@ class TestDocumentManager(unittest.TestCase):
         )
         self.assertTrue(result)
 
-    @patch("time.sleep")
-    def test_wait_for_indexing_timeout(self, mock_sleep):
+    @patch(
+        "security_chatbot.rag.operation_tracker.asyncio.sleep", new_callable=AsyncMock
+    )
+    @patch("security_chatbot.rag.operation_tracker.time")
+    def test_wait_for_indexing_timeout(self, mock_time, mock_sleep):
+        # 대기한 만큼만 흐르는 시계
+        clock = [0.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda seconds: clock.append(clock.pop() + seconds)
         operation_name = "operations/test-operation-123"
         mock_operation = MagicMock()
+        mock_operation.name = operation_name
         mock_operation.done = False
         self.mock_operations.get.return_value = mock_operation
         result = self.manager.wait_for_indexing(
             operation_name, timeout=5, poll_interval=2
         )
         self.assertFalse(result)
+        self.assertLessEqual(clock[0], 5)
 
     def test_wait_for_indexing_error(self):
         operation_name = "operations/test-operation-123"
@@ -232,5 +592,271 @@ class TestDocumentManager(unittest.TestCase):
         self.assertFalse(result)
 
 
+class TestRetryWithBackoff(unittest.IsolatedAsyncioTestCase):
+    """AsyncDocumentManager._retry_with_backoff 테스트"""
+
+    def setUp(self):
+        self.manager = AsyncDocumentManager(
+            store_name="fileSearchStores/test-store-123", client=MagicMock()
+        )
+        patcher = patch(
+            "security_chatbot.rag.document_manager.asyncio.sleep", new=AsyncMock()
+        )
+        self.mock_sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_retry_with_backoff_success_first_try(self):
+        mock_func = AsyncMock(return_value="success")
+        result = await self.manager._retry_with_backoff(
+            mock_func, "arg1", kwarg1="value1"
+        )
+        self.assertEqual(result, "success")
+        mock_func.assert_awaited_once_with("arg1", kwarg1="value1")
+
+    async def test_retry_with_backoff_success_after_retry(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = [ServiceUnavailable("Service unavailable"), "success"]
+        result = await self.manager._retry_with_backoff(mock_func)
+        self.assertEqual(result, "success")
+        self.assertEqual(mock_func.await_count, 2)
+
+    async def test_retry_with_backoff_max_retries_exceeded(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = ServiceUnavailable("Service unavailable")
+        with self.assertRaises(ServiceUnavailable):
+            await self.manager._retry_with_backoff(mock_func)
+        self.assertEqual(mock_func.await_count, 3)
+
+    @patch(
+        "security_chatbot.rag.document_manager.rate_limiter",
+        MagicMock(acquire_async=AsyncMock()),
+    )
+    async def test_retry_with_backoff_retries_sdk_server_error(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = [
+            errors.ServerError(503, {"error": {"message": "unavailable"}}),
+            "success",
+        ]
+        result = await self.manager._retry_with_backoff(mock_func)
+        self.assertEqual(result, "success")
+        self.assertEqual(mock_func.await_count, 2)
+
+    @patch("security_chatbot.rag.document_manager.rate_limiter")
+    async def test_retry_with_backoff_honors_sdk_quota_retry_delay(self, mock_limiter):
+        mock_limiter.acquire_async = AsyncMock()
+        quota_error = errors.ClientError(
+            429,
+            {
+                "error": {
+                    "message": "quota exceeded",
+                    "details": [
+                        {
+                            "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                            "retryDelay": "17s",
+                        }
+                    ],
+                }
+            },
+        )
+        mock_func = AsyncMock(side_effect=[quota_error, "success"])
+
+        result = await self.manager._retry_with_backoff(mock_func)
+
+        self.assertEqual(result, "success")
+        mock_limiter.pause.assert_called_once_with(17.0)
+        self.mock_sleep.assert_awaited_once_with(17.0)
+
+    @patch(
+        "security_chatbot.rag.document_manager.rate_limiter",
+        MagicMock(acquire_async=AsyncMock()),
+    )
+    async def test_retry_with_backoff_sdk_client_error_not_retried(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = errors.ClientError(
+            400, {"error": {"message": "bad request"}}
+        )
+        with self.assertRaises(errors.ClientError):
+            await self.manager._retry_with_backoff(mock_func)
+        self.assertEqual(mock_func.await_count, 1)
+
+    async def test_retry_with_backoff_non_retryable_error(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = InvalidArgument("Invalid argument")
+        with self.assertRaises(InvalidArgument):
+            await self.manager._retry_with_backoff(mock_func)
+        self.assertEqual(mock_func.await_count, 1)
+
+
+@patch(
+    "security_chatbot.rag.document_manager.rate_limiter",
+    MagicMock(acquire_async=AsyncMock()),
+)
+@patch(
+    "security_chatbot.rag.operation_tracker.rate_limiter",
+    MagicMock(acquire_async=AsyncMock()),
+)
+class TestResolveDocuments(unittest.TestCase):
+    """인덱싱이 끝난 업로드 결과를 문서 이름으로 바꾸는 resolve_documents 테스트"""
+
+    store_name = "fileSearchStores/test-store-123"
+
+    def setUp(self):
+        self.client = autospec_client()
+        self.manager = DocumentManager(store_name=self.store_name, client=self.client)
+        self.client.aio.files.upload.side_effect = lambda file, config: types.File(
+            name=f"files/{config['display_name']}"
+        )
+        self.client.aio.file_search_stores.import_file.side_effect = (
+            lambda file_search_store_name, file_name, config: _import_operation(
+                self.store_name, file_name.removeprefix("files/"), done=False
+            )
+        )
+        self.test_dir = tempfile.mkdtemp()
+        upload_manifest.clear()
+        self.addCleanup(upload_manifest.clear)
+        validation_cache.clear()
+        self.addCleanup(validation_cache.clear)
+
+    def _upload(self, name: str) -> dict:
+        file_path = os.path.join(self.test_dir, name)
+        with open(file_path, "w") as f:
+            f.write(f"{name} contents")
+        return self.manager.upload_file(file_path)
+
+    def test_records_document_names_after_indexing(self):
+        """인덱싱이 끝나면 결과와 매니페스트가 문서 이름을 가리키는지 테스트"""
+        result = self._upload("policy.txt")
+        duplicate = self.manager.upload_file(os.path.join(self.test_dir, "policy.txt"))
+        self.assertEqual(
+            result["corpus_file_name"], f"{self.store_name}/operations/policy.txt"
+        )
+        self.client.aio.operations.get.side_effect = lambda operation: (
+            _import_operation(
+                self.store_name, operation.name.rsplit("/", 1)[-1], done=True
+            )
+        )
+
+        self.manager.resolve_documents([result, duplicate])
+
+        document_name = f"{self.store_name}/documents/policy.txt"
+        self.assertEqual(result["indexing"], "done")
+        self.assertEqual(result["corpus_file_name"], document_name)
+        # 아직 인덱싱 중인 업로드를 재사용한 중복 결과도 문서 이름으로 바뀜
+        self.assertEqual(duplicate["corpus_file_name"], document_name)
+        entry = upload_manifest.lookup(self.store_name, result["sha256"])
+        self.assertEqual(entry["corpus_file_name"], document_name)
+
+    def test_failed_indexing_is_forgotten(self):
+        """인덱싱에 실패한 업로드는 다시 올릴 수 있도록 매니페스트에서 제거되는지 테스트"""
+        result = self._upload("broken.txt")
+        self.client.aio.operations.get.return_value = types.ImportFileOperation(
+            name=result["corpus_file_name"], done=True, error={"message": "bad file"}
+        )
+
+        self.manager.resolve_documents([result])
+
+        self.assertEqual(result["indexing"], "failed")
+        self.assertIsNone(upload_manifest.lookup(self.store_name, result["sha256"]))
+
+
+@patch(
+    "security_chatbot.rag.document_manager.rate_limiter",
+    MagicMock(acquire_async=AsyncMock()),
+)
+@patch(
+    "security_chatbot.rag.operation_tracker.rate_limiter",
+    MagicMock(acquire_async=AsyncMock()),
+)
+class TestAsyncDocumentManager(unittest.IsolatedAsyncioTestCase):
+    """비동기 클라이언트(client.aio)로 업로드하는 AsyncDocumentManager 테스트"""
+
+    store_name = "fileSearchStores/test-store-123"
+
+    def setUp(self):
+        self.mock_client = autospec_client()
+        self.mock_aio = self.mock_client.aio
+        self.mock_aio.files.upload.side_effect = lambda file, config: types.File(
+            name=f"files/{config['display_name']}"
+        )
+        self.mock_aio.file_search_stores.import_file.side_effect = (
+            lambda file_search_store_name, file_name, config: _import_operation(
+                self.store_name, file_name.removeprefix("files/"), done=False
+            )
+        )
+        self.manager = AsyncDocumentManager(
+            store_name=self.store_name, client=self.mock_client
+        )
+        self.test_dir = tempfile.mkdtemp()
+        upload_manifest.clear()
+        self.addCleanup(upload_manifest.clear)
+        validation_cache.clear()
+        self.addCleanup(validation_cache.clear)
+
+    def _create_temp_file(self, filename: str) -> str:
+        file_path = os.path.join(self.test_dir, filename)
+        with open(file_path, "wb") as f:
+            f.write(_signature(filename) + filename.encode() + b"X" * 128)
+        return file_path
+
+    async def test_upload_files_batch_concurrent(self):
+        files = [self._create_temp_file(f"doc{i}.txt") for i in range(3)]
+        files.append("/non/existent/file.pdf")
+
+        results = await self.manager.upload_files_batch(
+            files, upload_concurrency=2, import_concurrency=2
+        )
+
+        self.assertEqual(results["total"], 4)
+        self.assertEqual(len(results["success"]), 3)
+        self.assertEqual(len(results["failed"]), 1)
+        self.assertEqual(self.mock_aio.files.upload.await_count, 3)
+        self.mock_client.files.upload.assert_not_called()
+
+    @patch(
+        "security_chatbot.rag.document_manager.asyncio.sleep", new_callable=AsyncMock
+    )
+    async def test_upload_file_retries_sdk_server_error(self, mock_sleep):
+        """일시적 서버 오류를 이벤트 루프를 막지 않고 기다린 뒤 재시도하는지 테스트"""
+        file_path = self._create_temp_file("retry.pdf")
+        self.mock_aio.files.upload.side_effect = [
+            errors.ServerError(500, {"error": {"message": "internal"}}),
+            types.File(name="files/test-file", display_name="retry.pdf"),
+        ]
+
+        result = await self.manager.upload_file(file_path)
+
+        self.assertEqual(result["file"].name, "files/test-file")
+        mock_sleep.assert_awaited_once()
+
+    async def test_resolve_documents_records_document_names(self):
+        """업로드 결과를 인덱싱 후 문서 이름으로 바꾸는지 테스트"""
+        result = await self.manager.upload_file(self._create_temp_file("policy.txt"))
+        self.mock_aio.operations.get.side_effect = (
+            lambda operation: _import_operation(
+                self.store_name, operation.name.rsplit("/", 1)[-1], done=True
+            )
+        )
+
+        await self.manager.resolve_documents([result])
+
+        document_name = f"{self.store_name}/documents/policy.txt"
+        self.assertEqual(result["corpus_file_name"], document_name)
+        entry = upload_manifest.lookup(self.store_name, result["sha256"])
+        self.assertEqual(entry["corpus_file_name"], document_name)
+
+    async def test_wait_for_indexing_polls_with_sdk_signature(self):
+        """인덱싱 대기가 operations.get(operation)으로 폴링하는지 테스트"""
+        operation = _import_operation(self.store_name, "op-1", done=False)
+        self.mock_aio.operations.get.return_value = _import_operation(
+            self.store_name, "op-1", done=True
+        )
+
+        self.assertTrue(await self.manager.wait_for_indexing(operation, timeout=5))
+
+        self.mock_aio.operations.get.assert_awaited_once_with(operation)
+        self.mock_client.operations.get.assert_not_called()
+
+
+
 if __name__ == "__main__":
     unittest.main()
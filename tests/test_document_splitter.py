@@ -0,0 +1,85 @@
+"""document_splitter.py 모듈 테스트
+"""
+
+import io
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from security_chatbot.rag import document_splitter
+from security_chatbot.rag.document_splitter import (
+    can_split,
+    part_file_name,
+    split_document,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+class TestDocumentSplitter(unittest.TestCase):
+    """split_document 함수 테스트"""
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+
+    def _parts(self, paths: list[str]) -> list[bytes]:
+        return [Path(path).read_bytes() for path in paths]
+
+    def test_text_split_on_line_boundaries(self):
+        """텍스트를 줄 경계에서 나누고, 조각을 이어 붙이면 원본과 같은지 테스트"""
+        content = b"".join(f"log line {i:04d}\n".encode() for i in range(100))
+
+        paths = split_document(io.BytesIO(content), "audit.txt", self.output_dir, 100)
+
+        parts = self._parts(paths)
+        self.assertEqual(b"".join(parts), content)
+        self.assertTrue(all(len(part) <= 100 for part in parts))
+        self.assertTrue(all(part.endswith(b"\n") for part in parts))
+        self.assertEqual(Path(paths[1]).name, "audit.part002.txt")
+
+    def test_markdown_prefers_heading_boundaries(self):
+        """Markdown은 조각이 절반 이상 찼으면 제목 앞에서 나누는지 테스트"""
+        section = "# 제목\n" + "본문 내용입니다.\n" * 3
+        content = (section * 4).encode()
+
+        paths = split_document(
+            io.BytesIO(content), "policy.md", self.output_dir, len(section.encode()) + 30
+        )
+
+        parts = self._parts(paths)
+        self.assertEqual(len(parts), 4)
+        self.assertTrue(all(part.startswith("# 제목".encode()) for part in parts))
+
+    def test_long_line_split_on_utf8_boundary(self):
+        content = ("가" * 100).encode()
+
+        paths = split_document(io.BytesIO(content), "one-line.txt", self.output_dir, 32)
+
+        parts = self._parts(paths)
+        self.assertEqual(b"".join(parts), content)
+        for part in parts:
+            part.decode("utf-8")
+
+    def test_unsplittable_formats(self):
+        self.assertFalse(can_split("report.hwp"))
+        with self.assertRaises(ValueError):
+            split_document(io.BytesIO(b"x"), "report.hwpx", self.output_dir, 10)
+
+    def test_pdf_requires_pypdf(self):
+        original = document_splitter.PdfReader
+        document_splitter.PdfReader = None
+        self.addCleanup(setattr, document_splitter, "PdfReader", original)
+
+        self.assertFalse(can_split("scan.pdf"))
+        with self.assertRaises(ValueError):
+            split_document(io.BytesIO(b"%PDF-1.7"), "scan.pdf", self.output_dir, 10)
+
+    def test_part_file_name(self):
+        self.assertEqual(part_file_name("감사 로그.md", 12), "감사 로그.part012.md")
+
+
+if __name__ == "__main__":
+    unittest.main()
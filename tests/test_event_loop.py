@@ -0,0 +1,97 @@
+"""event_loop.py 모듈 테스트
+"""
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from security_chatbot.utils.event_loop import get_loop, iterate_sync, run_sync
+
+
+class TestRunSync(unittest.TestCase):
+    """run_sync 테스트"""
+
+    def test_runs_on_shared_loop_thread(self):
+        """코루틴이 호출 스레드가 아닌 공유 이벤트 루프 스레드에서 실행되는지 테스트"""
+
+        async def current_thread():
+            return threading.current_thread().name
+
+        self.assertEqual(run_sync(current_thread()), "gemini-event-loop")
+        self.assertIs(get_loop(), get_loop())
+
+    def test_propagates_exception(self):
+        async def fail():
+            raise ValueError("실패")
+
+        with self.assertRaises(ValueError):
+            run_sync(fail())
+
+    def test_calls_from_many_threads_run_concurrently(self):
+        """여러 스레드의 호출이 하나의 루프에서 동시에 진행되는지 테스트"""
+        started = 0
+        all_started = asyncio.Event()
+
+        async def wait_for_others():
+            nonlocal started
+            started += 1
+            if started == 4:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=5)
+            return True
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(run_sync, wait_for_others()) for _ in range(4)]
+            results = [future.result() for future in futures]
+
+        self.assertEqual(results, [True] * 4)
+
+    def test_rejects_call_from_inside_loop(self):
+        """공유 루프 안에서 동기 래퍼를 부르면 교착 대신 RuntimeError가 나는지 테스트"""
+
+        async def nested():
+            return 1
+
+        async def outer():
+            with self.assertRaises(RuntimeError):
+                run_sync(nested())
+            return True
+
+        self.assertTrue(run_sync(outer()))
+
+
+class TestIterateSync(unittest.TestCase):
+    """iterate_sync 테스트"""
+
+    def test_fetches_lazily_and_closes_early(self):
+        """항목을 요청할 때만 가져오고, 중간에 멈추면 비동기 제너레이터를 닫는지 테스트"""
+        fetched = []
+        closed = []
+
+        async def numbers():
+            try:
+                for i in range(5):
+                    fetched.append(i)
+                    yield i
+            finally:
+                closed.append(True)
+
+        iterator = iterate_sync(numbers())
+        self.assertEqual(next(iterator), 0)
+        self.assertEqual(next(iterator), 1)
+        iterator.close()
+
+        self.assertEqual(fetched, [0, 1])
+        self.assertEqual(closed, [True])
+
+    def test_exhausts_iterator(self):
+        async def numbers():
+            for i in range(3):
+                yield i
+
+        self.assertEqual(list(iterate_sync(numbers())), [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,282 @@
+"""ingestion_queue.py / ingestion_worker.py 모듈 테스트
+"""
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from google.api_core.exceptions import ServiceUnavailable
+
+from security_chatbot.rag.ingestion_queue import (
+    JOB_DEAD,
+    JOB_DONE,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    IngestionQueue,
+)
+from security_chatbot.rag.ingestion_worker import run_worker
+
+logging.disable(logging.CRITICAL)
+
+STORE = "fileSearchStores/test-store-123"
+
+
+class TestIngestionQueue(unittest.TestCase):
+    """IngestionQueue 클래스 테스트"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, True)
+        self.db_path = os.path.join(self.test_dir, "queue.db")
+        self.queue = IngestionQueue(db_path=self.db_path, max_attempts=2)
+        self.addCleanup(self.queue.close)
+        self.file_path = os.path.join(self.test_dir, "policy.pdf")
+        with open(self.file_path, "wb") as f:
+            f.write(b"%PDF-1.7" + b"X" * 100)
+
+    def test_claim_is_exclusive_and_survives_reopen(self):
+        """등록한 작업이 다른 연결(프로세스)에서도 보이고 한 번만 가져가지는지 테스트"""
+        job_id = self.queue.enqueue(STORE, self.file_path, batch_id="b1")
+        other = IngestionQueue(db_path=self.db_path)
+        self.addCleanup(other.close)
+
+        job = other.claim("worker-1")
+
+        self.assertEqual(job["id"], job_id)
+        self.assertEqual(job["status"], JOB_RUNNING)
+        self.assertEqual(job["attempts"], 1)
+        self.assertEqual(job["file_size"], 108)
+        self.assertIsNone(self.queue.claim("worker-2"))
+
+    def test_retry_backoff_then_dead_letter(self):
+        """실패한 작업이 대기 후 재시도되고, 시도 횟수를 넘으면 dead-letter로 가는지 테스트"""
+        job_id = self.queue.enqueue(STORE, self.file_path)
+
+        self.queue.claim("w")
+        self.assertEqual(self.queue.fail(job_id, "w", "503"), JOB_QUEUED)
+        # 재시도 대기 시간이 지나기 전에는 가져갈 수 없음
+        self.assertIsNone(self.queue.claim("w"))
+
+        with patch(
+            "security_chatbot.rag.ingestion_queue.time.time",
+            return_value=self.queue.get_job(job_id)["updated_at"] + 60,
+        ):
+            self.assertEqual(self.queue.claim("w")["attempts"], 2)
+            self.assertEqual(self.queue.fail(job_id, "w", "503"), JOB_DEAD)
+
+        self.assertEqual(self.queue.list_jobs(status=JOB_DEAD)[0]["last_error"], "503")
+        self.assertTrue(self.queue.retry_dead(job_id))
+        self.assertEqual(self.queue.claim("w")["attempts"], 1)
+
+    def test_non_retryable_failure_goes_to_dead_letter(self):
+        job_id = self.queue.enqueue(STORE, self.file_path)
+        self.queue.claim("w")
+        status = self.queue.fail(job_id, "w", "invalid", retryable=False)
+
+        self.assertEqual(status, JOB_DEAD)
+
+    def test_expired_lease_is_reclaimed(self):
+        """워커가 죽어 임대 시간이 지난 실행 중 작업을 다른 워커가 가져가는지 테스트"""
+        queue = IngestionQueue(db_path=self.db_path, lease_seconds=0)
+        self.addCleanup(queue.close)
+        job_id = queue.enqueue(STORE, self.file_path)
+        queue.claim("crashed-worker")
+
+        with patch(
+            "security_chatbot.rag.ingestion_queue.time.time",
+            return_value=queue.get_job(job_id)["updated_at"] + 1,
+        ):
+            job = queue.claim("worker-2")
+
+        self.assertEqual(job["id"], job_id)
+        self.assertEqual(job["attempts"], 2)
+
+    def test_expired_lease_after_last_attempt_goes_to_dead_letter(self):
+        """마지막 시도에서 워커가 죽은 작업은 다시 가져가지 않고 dead-letter로 가는지 테스트"""
+        queue = IngestionQueue(db_path=self.db_path, max_attempts=1, lease_seconds=0)
+        self.addCleanup(queue.close)
+        job_id = queue.enqueue(STORE, self.file_path)
+        queue.claim("crashed-worker")
+
+        with patch(
+            "security_chatbot.rag.ingestion_queue.time.time",
+            return_value=queue.get_job(job_id)["updated_at"] + 1,
+        ):
+            self.assertIsNone(queue.claim("worker-2"))
+
+        job = queue.get_job(job_id)
+        self.assertEqual(job["status"], JOB_DEAD)
+        self.assertEqual(job["attempts"], 1)
+
+    def test_renew_extends_lease(self):
+        """임대를 갱신한 작업은 갱신 시점부터 임대 시간이 지나야 다시 가져가지는지 테스트"""
+        queue = IngestionQueue(db_path=self.db_path, lease_seconds=10)
+        self.addCleanup(queue.close)
+        job_id = queue.enqueue(STORE, self.file_path)
+        claimed_at = queue.claim("worker-1")["updated_at"]
+        clock = "security_chatbot.rag.ingestion_queue.time.time"
+
+        with patch(clock, return_value=claimed_at + 8):
+            self.assertTrue(queue.renew(job_id, "worker-1"))
+            self.assertFalse(queue.renew(job_id, "worker-2"))
+        with patch(clock, return_value=claimed_at + 15):
+            self.assertIsNone(queue.claim("worker-2"))
+        with patch(clock, return_value=claimed_at + 19):
+            self.assertEqual(queue.claim("worker-2")["id"], job_id)
+        self.assertFalse(queue.renew(job_id, "worker-1"))
+
+    def test_worker_that_lost_its_lease_cannot_record_result(self):
+        """임대를 잃은 워커의 완료/실패 기록이 새 워커의 작업을 덮어쓰지 않는지 테스트"""
+        queue = IngestionQueue(db_path=self.db_path, lease_seconds=0)
+        self.addCleanup(queue.close)
+        job_id = queue.enqueue(STORE, self.file_path)
+        queue.claim("slow-worker")
+        with patch(
+            "security_chatbot.rag.ingestion_queue.time.time",
+            return_value=queue.get_job(job_id)["updated_at"] + 1,
+        ):
+            queue.claim("worker-2")
+
+        result = {"corpus_file_name": "c1"}
+        self.assertFalse(queue.complete(job_id, "slow-worker", result))
+        self.assertEqual(queue.fail(job_id, "slow-worker", "503"), JOB_RUNNING)
+        job = queue.get_job(job_id)
+        self.assertEqual((job["status"], job["result"]), (JOB_RUNNING, None))
+
+        self.assertTrue(queue.complete(job_id, "worker-2", result))
+        self.assertEqual(queue.get_job(job_id)["status"], JOB_DONE)
+
+    def test_progress(self):
+        first = self.queue.enqueue(STORE, self.file_path, batch_id="b1")
+        self.queue.enqueue(STORE, self.file_path, batch_id="b1")
+        self.queue.enqueue(STORE, self.file_path, batch_id="b2")
+        self.queue.claim("w")
+        self.queue.complete(first, "w", {"corpus_file_name": "c1"})
+
+        progress = self.queue.get_progress("b1")
+
+        self.assertEqual(
+            (progress["total"], progress["done"], progress["queued"]), (2, 1, 1)
+        )
+        self.assertEqual(progress["bytes_done"], 108)
+        self.assertEqual(progress["percent"], 50.0)
+        self.assertEqual(self.queue.get_job(first)["result"], {"corpus_file_name": "c1"})
+
+
+class TestIngestionWorker(unittest.TestCase):
+    """run_worker 테스트"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, True)
+        self.queue = IngestionQueue(
+            db_path=os.path.join(self.test_dir, "queue.db"), max_attempts=2
+        )
+        self.addCleanup(self.queue.close)
+        self.spool_dir = os.path.join(self.test_dir, "spool")
+
+        patcher = patch("security_chatbot.rag.ingestion_worker.DocumentManager")
+        self.mock_manager_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_manager = self.mock_manager_class.return_value
+        self.mock_manager.resolve_documents.side_effect = lambda results: [
+            {**result, "indexing": "done"} for result in results
+        ]
+
+    def test_processes_spooled_upload_and_removes_spool_file(self):
+        """스풀된 업로드를 처리하고 성공하면 스풀 파일을 삭제하는지 테스트"""
+        job_id = self.queue.enqueue_upload(
+            STORE, io.BytesIO(b"%PDF-1.7 data"), "policy.pdf", "b1", self.spool_dir
+        )
+        spool_path = self.queue.get_job(job_id)["file_path"]
+        self.mock_manager.upload_file.return_value = {
+            "corpus_file_name": f"{STORE}/corpusFiles/c1",
+            "sha256": "a" * 64,
+            "deduplicated": False,
+        }
+
+        summary = run_worker(self.queue, once=True)
+
+        self.assertEqual(summary, {"processed": 1, "retried": 0, "dead": 0})
+        self.mock_manager.upload_file.assert_called_once_with(
+            spool_path, display_name="policy.pdf"
+        )
+        job = self.queue.get_job(job_id)
+        self.assertEqual(job["status"], JOB_DONE)
+        self.assertEqual(job["result"]["corpus_file_name"], f"{STORE}/corpusFiles/c1")
+        self.assertFalse(os.path.exists(spool_path))
+
+    def test_failures_are_retried_or_dead_lettered(self):
+        """일시적 오류는 재시도 예약, 검증 오류는 바로 dead-letter로 처리되는지 테스트"""
+        transient = self.queue.enqueue_upload(
+            STORE, io.BytesIO(b"a"), "a.txt", "b1", self.spool_dir
+        )
+        invalid = self.queue.enqueue_upload(
+            STORE, io.BytesIO(b"b"), "b.txt", "b1", self.spool_dir
+        )
+        self.mock_manager.upload_file.side_effect = [
+            ServiceUnavailable("Service unavailable"),
+            ValueError("지원되지 않는 파일 형식"),
+        ]
+
+        summary = run_worker(self.queue, once=True)
+
+        self.assertEqual(summary, {"processed": 0, "retried": 1, "dead": 1})
+        self.assertEqual(self.queue.get_job(transient)["status"], JOB_QUEUED)
+        self.assertEqual(self.queue.get_job(invalid)["status"], JOB_DEAD)
+        # 실패한 작업의 스풀 파일은 재시도를 위해 남겨 둠
+        self.assertTrue(os.path.exists(self.queue.get_job(invalid)["file_path"]))
+
+    def test_indexing_failure_is_retried(self):
+        """인덱싱에 실패한 업로드는 완료로 기록하지 않고 재시도 예약하는지 테스트"""
+        job_id = self.queue.enqueue_upload(
+            STORE, io.BytesIO(b"a"), "a.txt", "b1", self.spool_dir
+        )
+        self.mock_manager.upload_file.return_value = {
+            "corpus_file_name": f"{STORE}/operations/op-1",
+            "deduplicated": False,
+        }
+        self.mock_manager.resolve_documents.side_effect = lambda results: [
+            {**result, "indexing": "failed"} for result in results
+        ]
+
+        summary = run_worker(self.queue, once=True)
+
+        self.assertEqual(summary, {"processed": 0, "retried": 1, "dead": 0})
+        self.assertEqual(self.queue.get_job(job_id)["status"], JOB_QUEUED)
+
+    def test_lease_is_renewed_while_job_runs(self):
+        """임대 시간보다 오래 걸리는 작업을 다른 워커가 가져가지 않는지 테스트"""
+        db_path = os.path.join(self.test_dir, "lease.db")
+        queue = IngestionQueue(db_path=db_path, lease_seconds=0.3)
+        other = IngestionQueue(db_path=db_path, lease_seconds=0.3)
+        self.addCleanup(queue.close)
+        self.addCleanup(other.close)
+        job_id = queue.enqueue_upload(
+            STORE, io.BytesIO(b"a"), "a.txt", "b1", self.spool_dir
+        )
+        stolen = []
+
+        def slow_upload(*args, **kwargs):
+            time.sleep(0.6)
+            stolen.append(other.claim("worker-2"))
+            return {"corpus_file_name": f"{STORE}/corpusFiles/c1"}
+
+        self.mock_manager.upload_file.side_effect = slow_upload
+
+        summary = run_worker(
+            queue, worker_id="worker-1", once=True, renew_interval=0.05
+        )
+
+        self.assertEqual(stolen, [None])
+        self.assertEqual(summary, {"processed": 1, "retried": 0, "dead": 0})
+        self.assertEqual(queue.get_job(job_id)["status"], JOB_DONE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@
 
 import logging
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -19,6 +19,9 @@ class TestRAGIntegration(unittest.TestCase):
         logging.disable(logging.CRITICAL)
 
     def setUp(self):
+        from security_chatbot.rag.answer_cache import answer_cache
+
+        answer_cache.clear()
         self.test_store_name = "fileSearchStores/test-store-123"
 
     @patch("security_chatbot.rag.query_handler.GeminiClientManager")
@@ -34,7 +37,7 @@ class TestRAGIntegration(unittest.TestCase):
 
         mock_store = MagicMock()
         mock_store.name = self.test_store_name
-        mock_client.file_search_stores.create.return_value = mock_store
+        mock_client.aio.file_search_stores.create = AsyncMock(return_value=mock_store)
 
         store_manager = FileSearchStoreManager()
         created_store = store_manager.create_store(display_name="Test Store")
@@ -42,20 +45,20 @@ class TestRAGIntegration(unittest.TestCase):
         self.assertIsNotNone(created_store)
 
         # RAG 쿼리
-        mock_query_client.get_client.return_value = mock_client
+        mock_query_client.get_async_client.return_value = mock_client.aio
 
         mock_response = MagicMock()
         mock_response.text = "테스트 응답"
         mock_response.candidates = [MagicMock()]
         mock_response.candidates[0].grounding_metadata.grounding_chunks = []
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         result = query_with_rag("테스트 질문", self.test_store_name)
 
         self.assertTrue(result["success"])
 
         # Store 삭제
-        mock_client.file_search_stores.delete.return_value = None
+        mock_client.aio.file_search_stores.delete = AsyncMock(return_value=None)
         delete_result = store_manager.delete_store(self.test_store_name)
 
         self.assertTrue(delete_result)
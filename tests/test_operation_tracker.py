@@ -0,0 +1,242 @@
+"""operation_tracker.py 모듈 테스트
+"""
+
+import logging
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from google.api_core.exceptions import NotFound
+from google.genai import errors, types
+
+from security_chatbot.rag.operation_tracker import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    OperationTracker,
+)
+from tests.sdk_doubles import autospec_client
+
+logging.disable(logging.CRITICAL)
+
+
+def _operation(done: bool, error=None, name: str = "op") -> MagicMock:
+    operation = MagicMock()
+    operation.name = name
+    operation.done = done
+    operation.error = error
+    return operation
+
+
+class _FakeClock:
+    """time.sleep이 기다린 만큼만 흐르는 가짜 monotonic 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@patch(
+    "security_chatbot.rag.operation_tracker.rate_limiter",
+    MagicMock(acquire_async=AsyncMock()),
+)
+class TestOperationTracker(unittest.TestCase):
+    """OperationTracker 클래스 테스트"""
+
+    def setUp(self):
+        self.clock = _FakeClock()
+        for name in ("monotonic", "sleep"):
+            patcher = patch(
+                f"security_chatbot.rag.operation_tracker.time.{name}",
+                getattr(self.clock, name),
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.client = MagicMock()
+        self.operations = self.client.aio.operations
+        # Operation 이름별로 done이 되기까지 필요한 조회 횟수
+        self.polls_until_done = {"op/a": 1, "op/b": 3, "op/c": 5}
+        self.poll_counts = {name: 0 for name in self.polls_until_done}
+
+        def get(operation):
+            name = operation.name
+            self.poll_counts[name] += 1
+            done = self.poll_counts[name] >= self.polls_until_done[name]
+            return _operation(done, name=name)
+
+        self.operations.get = AsyncMock(side_effect=get)
+        self.tracker = OperationTracker(
+            client=self.client, initial_interval=0.5, max_interval=2.0
+        )
+
+    def test_waits_for_many_operations_in_one_loop(self):
+        """여러 Operation을 한 루프에서 기다리며 완료 콜백을 호출하는지 테스트"""
+        completed = []
+        for name in self.polls_until_done:
+            self.tracker.track(name, on_complete=lambda s: completed.append(s["name"]))
+
+        self.assertTrue(self.tracker.wait(timeout=60))
+
+        self.assertEqual(completed, ["op/a", "op/b", "op/c"])
+        self.assertEqual(self.poll_counts, self.polls_until_done)
+        progress = self.tracker.get_progress()
+        self.assertEqual((progress["done"], progress["pending"]), (3, 0))
+        self.assertEqual(progress["percent"], 100.0)
+
+    def test_poll_interval_backs_off_to_cap(self):
+        """폴링 간격이 짧게 시작하여 상한까지 늘어나는지 테스트"""
+        self.tracker.track("op/c")
+
+        self.tracker.wait(timeout=60)
+
+        self.assertEqual(self.clock.sleeps, [0.5, 1.0, 2.0, 2.0])
+
+    def test_timeout_leaves_operations_pending(self):
+        self.tracker.track("op/c")
+
+        self.assertFalse(self.tracker.wait(timeout=2))
+        self.assertEqual(self.tracker.get_progress()["pending"], 1)
+
+    def test_timeout_counts_time_spent_polling(self):
+        """조회 호출에 걸린 시간도 대기 시간에 포함되는지 테스트"""
+        get = self.operations.get.side_effect
+
+        def slow_get(operation):
+            self.clock.now += 3.0
+            return get(operation)
+
+        self.operations.get.side_effect = slow_get
+        self.tracker.track("op/c")
+
+        self.assertFalse(self.tracker.wait(timeout=5))
+        self.assertEqual(self.poll_counts["op/c"], 2)
+        self.assertLess(sum(self.clock.sleeps), 5)
+
+    def test_failed_and_missing_operations(self):
+        """인덱싱 오류와 찾을 수 없는 Operation을 실패로 처리하는지 테스트"""
+        self.operations.get.side_effect = [
+            _operation(True, error="Indexing failed"),
+            NotFound("Operation not found"),
+        ]
+        self.tracker.track("op/a")
+        self.tracker.track("op/b")
+
+        self.assertFalse(self.tracker.wait(timeout=10))
+
+        self.assertEqual(self.tracker.get_status("op/a")["status"], STATUS_FAILED)
+        self.assertEqual(self.tracker.get_status("op/a")["error"], "Indexing failed")
+        self.assertEqual(self.tracker.get_progress()["failed"], 2)
+
+    def test_already_done_operation_needs_no_poll(self):
+        """이미 끝난 Operation 객체는 조회 없이 완료 처리되는지 테스트"""
+        operation = _operation(True)
+        operation.name = "op/done"
+        completed = []
+
+        self.tracker.track(operation, label="doc.pdf", on_complete=completed.append)
+
+        self.assertEqual(completed[0]["status"], STATUS_DONE)
+        self.assertEqual(completed[0]["label"], "doc.pdf")
+        self.assertTrue(self.tracker.wait())
+        self.operations.get.assert_not_called()
+
+    def test_callbacks_run_in_calling_thread(self):
+        """완료 콜백이 이벤트 루프가 아닌 wait()를 호출한 스레드에서 실행되는지 테스트"""
+        import threading
+
+        threads = []
+        self.tracker.track(
+            "op/b", on_complete=lambda s: threads.append(threading.current_thread())
+        )
+
+        self.assertTrue(self.tracker.wait(timeout=60))
+
+        self.assertEqual(threads, [threading.current_thread()])
+
+
+@patch(
+    "security_chatbot.rag.operation_tracker.rate_limiter",
+    MagicMock(acquire_async=AsyncMock()),
+)
+class TestOperationTrackerAsync(unittest.IsolatedAsyncioTestCase):
+    """wait_async 테스트"""
+
+    async def test_wait_async_polls_until_done(self):
+        """이벤트 루프를 막지 않고 모든 Operation이 끝날 때까지 기다리는지 테스트"""
+        client = autospec_client()
+        client.aio.operations.get.side_effect = [
+            types.ImportFileOperation(name="op/a", done=False),
+            types.ImportFileOperation(name="op/a", done=True),
+        ]
+        tracker = OperationTracker(client=client, initial_interval=0.01)
+        completed = []
+        tracker.track("op/a", on_complete=completed.append)
+
+        self.assertTrue(await tracker.wait_async(timeout=5))
+
+        self.assertEqual(client.aio.operations.get.await_count, 2)
+        self.assertEqual([s["status"] for s in completed], [STATUS_DONE])
+        client.operations.get.assert_not_called()
+
+
+@patch(
+    "security_chatbot.rag.operation_tracker.rate_limiter",
+    MagicMock(acquire_async=AsyncMock()),
+)
+class TestOperationTrackerSdkSignature(unittest.TestCase):
+    """실제 SDK 클라이언트의 호출 시그니처로 OperationTracker를 테스트"""
+
+    def setUp(self):
+        self.client = autospec_client()
+        self.tracker = OperationTracker(client=self.client)
+
+    def test_polls_with_operation_object(self):
+        """operations.get에 이름이 아닌 Operation 객체를 넘기는지 테스트"""
+        operation = types.ImportFileOperation(name="op/a", done=False)
+        self.client.aio.operations.get.return_value = types.ImportFileOperation(
+            name="op/a", done=True
+        )
+
+        self.tracker.track(operation)
+
+        self.assertTrue(self.tracker.wait(timeout=10))
+        self.client.aio.operations.get.assert_awaited_once_with(operation)
+
+    def test_wraps_operation_name_in_operation(self):
+        """이름만 등록해도 Operation 객체로 감싸서 조회하는지 테스트"""
+        self.client.aio.operations.get.return_value = types.ImportFileOperation(
+            name="op/a", done=True
+        )
+
+        self.tracker.track("op/a")
+
+        self.assertTrue(self.tracker.wait(timeout=10))
+        polled = self.client.aio.operations.get.call_args.args[0]
+        self.assertIsInstance(polled, types.ImportFileOperation)
+        self.assertEqual(polled.name, "op/a")
+
+    def test_sdk_api_errors_fail_operation(self):
+        """SDK의 APIError가 wait() 밖으로 새지 않고 실패로 처리되는지 테스트"""
+        self.client.aio.operations.get.side_effect = [
+            errors.ClientError(404, {"error": {"message": "not found"}}),
+            errors.ServerError(500, {"error": {"message": "internal"}}),
+        ]
+        self.tracker.track("op/a")
+        self.tracker.track("op/b")
+
+        self.assertFalse(self.tracker.wait(timeout=10))
+
+        self.assertEqual(self.tracker.get_progress()["failed"], 2)
+        self.assertEqual(
+            self.tracker.get_status("op/a")["error"], "Operation을 찾을 수 없습니다."
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
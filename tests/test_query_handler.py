@@ -3,7 +3,7 @@
 
 import logging
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 logging.disable(logging.CRITICAL)
 
@@ -15,6 +15,11 @@ class TestQueryHandler(unittest.TestCase):
     def setUpClass(cls):
         logging.disable(logging.CRITICAL)
 
+    def setUp(self):
+        from security_chatbot.rag.answer_cache import answer_cache
+
+        answer_cache.clear()
+
     def test_parse_grounding_metadata_with_citations(self):
         """출처 정보 파싱 테스트"""
         from security_chatbot.rag.query_handler import parse_grounding_metadata
@@ -52,11 +57,11 @@ class TestQueryHandler(unittest.TestCase):
         from security_chatbot.rag.query_handler import query_with_rag
 
         mock_client = MagicMock()
-        mock_client_manager.get_client.return_value = mock_client
+        mock_client_manager.get_async_client.return_value = mock_client
 
         mock_response = MagicMock()
         mock_response.text = "테스트 응답"
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.models.generate_content = AsyncMock(return_value=mock_response)
 
         mock_parse.return_value = ["Doc 1"]
         mock_format.return_value = {
@@ -71,6 +76,413 @@ class TestQueryHandler(unittest.TestCase):
         self.assertTrue(result["success"])
         self.assertEqual(result["content"], "테스트 응답")
 
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    @patch("security_chatbot.rag.query_handler.parse_grounding_metadata")
+    def test_stream_query_with_rag_chunks_then_final(
+        self, mock_parse, mock_client_manager
+    ):
+        """스트리밍 쿼리가 부분 텍스트 후 최종 응답을 전달하는지 테스트"""
+        from security_chatbot.rag.query_handler import stream_query_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_client.return_value = mock_client
+
+        first, last = MagicMock(), MagicMock()
+        first.text = "첫 번째 "
+        first.candidates = []
+        last.text = "응답"
+        mock_client.models.generate_content_stream.return_value = iter([first, last])
+        mock_parse.return_value = ["Doc 1"]
+
+        events = list(stream_query_with_rag("테스트 질문", "test-store"))
+
+        self.assertEqual([e["type"] for e in events], ["chunk", "chunk", "final"])
+        final = events[-1]["response"]
+        self.assertTrue(final["success"])
+        self.assertEqual(final["content"], "첫 번째 응답")
+        self.assertEqual(final["citations"], ["Doc 1"])
+        mock_parse.assert_called_once_with(last)
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_stream_query_with_rag_error(self, mock_client_manager):
+        """스트리밍 쿼리 실패 시 실패 응답이 최종 이벤트로 전달되는지 테스트"""
+        from security_chatbot.rag.query_handler import stream_query_with_rag
+
+        mock_client_manager.get_client.side_effect = ValueError("API 키 없음")
+
+        events = list(stream_query_with_rag("테스트 질문", "test-store"))
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["type"], "final")
+        self.assertFalse(events[0]["response"]["success"])
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_closed_stream_leader_fails_waiters_with_query_error(
+        self, mock_client_manager
+    ):
+        """leader 스트림이 중간에 닫혀도 대기자에게 GeneratorExit이 전달되지 않는지 테스트"""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from security_chatbot.rag.query_handler import (
+            query_coalescer,
+            stream_query_with_rag,
+        )
+
+        query_coalescer.reset_stats()
+        chunk = MagicMock()
+        chunk.text = "부분 "
+        chunk.candidates = []
+        client = mock_client_manager.get_client.return_value
+        client.models.generate_content_stream.return_value = iter([chunk, chunk])
+
+        leader = stream_query_with_rag("닫히는 질문", "test-store")
+        self.assertEqual(next(leader)["type"], "chunk")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            follower = executor.submit(
+                lambda: list(stream_query_with_rag("닫히는 질문", "test-store"))
+            )
+            while query_coalescer.get_stats()["collapsed"] < 1:
+                time.sleep(0.01)
+            leader.close()
+            events = follower.result(timeout=5)
+
+        self.assertEqual([event["type"] for event in events], ["final"])
+        self.assertFalse(events[0]["response"]["success"])
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_concurrent_identical_queries_coalesced(self, mock_client_manager):
+        """동시에 들어온 동일 질문이 하나의 Gemini 호출을 공유하는지 테스트"""
+        import asyncio
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from security_chatbot.rag.query_handler import query_coalescer, query_with_rag
+
+        query_coalescer.reset_stats()
+        release = threading.Event()
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.text = "공유 응답"
+        mock_response.candidates = []
+
+        async def slow_generate(**kwargs):
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+            return mock_response
+
+        mock_client.models.generate_content = AsyncMock(side_effect=slow_generate)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(query_with_rag, "사고 에스컬레이션 SLA?", "test-store")
+                for _ in range(4)
+            ]
+            while query_coalescer.get_stats()["total"] < 4:
+                time.sleep(0.01)
+            release.set()
+            results = [f.result() for f in futures]
+
+        self.assertTrue(all(r["content"] == "공유 응답" for r in results))
+        mock_client.models.generate_content.assert_awaited_once()
+        self.assertEqual(query_coalescer.get_stats()["collapsed"], 3)
+
+
+def _quota_error(retry_delay="2s"):
+    """RetryInfo를 포함한 429 ClientError를 생성합니다."""
+    from google.genai import errors
+
+    return errors.ClientError(
+        429,
+        {
+            "error": {
+                "code": 429,
+                "message": "Resource exhausted",
+                "status": "RESOURCE_EXHAUSTED",
+                "details": [
+                    {
+                        "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                        "retryDelay": retry_delay,
+                    }
+                ],
+            }
+        },
+    )
+
+
+@patch(
+    "security_chatbot.rag.query_handler.rate_limiter",
+    MagicMock(acquire_async=AsyncMock()),
+)
+@patch("security_chatbot.rag.query_handler.random.uniform", return_value=0.0)
+@patch("security_chatbot.rag.query_handler.time.sleep")
+class TestQueryAutoRetry(unittest.TestCase):
+    """사용량 초과(429) 시 자동 재시도 테스트"""
+
+    def setUp(self):
+        from security_chatbot.rag.answer_cache import answer_cache
+
+        answer_cache.clear()
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_query_retries_after_advised_delay(
+        self, mock_client_manager, mock_sleep, mock_uniform
+    ):
+        """RetryInfo의 대기 시간만큼 기다린 뒤 재시도하여 성공하는지 테스트"""
+        from security_chatbot.rag.query_handler import query_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.text = "재시도 후 응답"
+        mock_response.candidates = []
+        mock_client.models.generate_content = AsyncMock(
+            side_effect=[_quota_error("2s"), mock_response]
+        )
+        on_retry = MagicMock()
+
+        with patch(
+            "security_chatbot.rag.query_handler.asyncio.sleep", new=AsyncMock()
+        ) as mock_async_sleep:
+            response = query_with_rag("재시도 질문", "test-store", on_retry=on_retry)
+
+        self.assertTrue(response["success"])
+        self.assertEqual(mock_client.models.generate_content.await_count, 2)
+        on_retry.assert_called_once_with(2.0, 1)
+        mock_async_sleep.assert_awaited_once_with(2.0)
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_no_retry_past_deadline(self, mock_client_manager, mock_sleep, mock_uniform):
+        """권장 대기 시간이 쿼리 마감 시각을 넘으면 재시도하지 않는지 테스트"""
+        from security_chatbot.rag.query_handler import query_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+        mock_client.models.generate_content = AsyncMock(
+            side_effect=_quota_error("3600s")
+        )
+
+        with patch(
+            "security_chatbot.rag.query_handler.asyncio.sleep", new=AsyncMock()
+        ) as mock_async_sleep:
+            response = query_with_rag("마감 질문", "test-store")
+
+        self.assertEqual(response["error_type"], "quota_exceeded")
+        mock_client.models.generate_content.assert_awaited_once()
+        mock_async_sleep.assert_not_awaited()
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_stream_emits_countdown_then_answer(
+        self, mock_client_manager, mock_sleep, mock_uniform
+    ):
+        """스트리밍 쿼리가 오류 대신 카운트다운 이벤트를 보낸 뒤 답변하는지 테스트"""
+        from security_chatbot.rag.query_handler import stream_query_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_client.return_value = mock_client
+        chunk = MagicMock()
+        chunk.text = "재시도 후 스트리밍 응답"
+        chunk.candidates = []
+        mock_client.models.generate_content_stream.side_effect = [
+            _quota_error("2s"),
+            iter([chunk]),
+        ]
+
+        # 가짜 시계: sleep 호출만큼 시간이 흐름
+        clock = [0.0]
+        mock_sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
+        with patch(
+            "security_chatbot.rag.query_handler.time.monotonic",
+            side_effect=lambda: clock[0],
+        ):
+            events = list(stream_query_with_rag("스트리밍 재시도 질문", "test-store"))
+
+        retry_events = [e for e in events if e["type"] == "retry"]
+        self.assertEqual([e["remaining"] for e in retry_events], [2, 1])
+        self.assertTrue(events[-1]["response"]["success"])
+
+
+def _grounded_response(text, sources):
+    """(출처, Store) 목록으로 grounding metadata가 포함된 응답을 생성합니다."""
+    from google.genai import types
+
+    chunks = [
+        types.GroundingChunk(
+            retrieved_context=types.GroundingChunkRetrievedContext(
+                title=source, file_search_store=store
+            )
+        )
+        for source, store in sources
+    ]
+    return types.GenerateContentResponse(
+        candidates=[
+            types.Candidate(
+                content=types.Content(role="model", parts=[types.Part(text=text)]),
+                grounding_metadata=types.GroundingMetadata(grounding_chunks=chunks),
+            )
+        ]
+    )
+
+
+@patch(
+    "security_chatbot.rag.query_handler.rate_limiter",
+    MagicMock(acquire_async=AsyncMock()),
+)
+class TestMultiStoreQuery(unittest.TestCase):
+    """여러 Store 동시 검색 테스트"""
+
+    POLICIES = "fileSearchStores/policies"
+    INCIDENTS = "fileSearchStores/incidents"
+
+    def setUp(self):
+        from security_chatbot.rag.answer_cache import answer_cache
+
+        answer_cache.clear()
+
+    def test_merge_citations_dedupes_by_source(self):
+        """같은 출처가 여러 Store에서 나오면 하나로 병합되는지 테스트"""
+        from security_chatbot.rag.query_handler import merge_citations
+
+        merged = merge_citations(
+            [
+                {"source": "policy.pdf", "store": self.POLICIES},
+                {"source": "ir-2024.pdf", "store": self.INCIDENTS},
+                {"source": "policy.pdf", "store": self.INCIDENTS},
+                {"source": "policy.pdf", "store": self.POLICIES},
+            ]
+        )
+
+        self.assertEqual(
+            merged,
+            [
+                {"source": "policy.pdf", "stores": [self.POLICIES, self.INCIDENTS]},
+                {"source": "ir-2024.pdf", "stores": [self.INCIDENTS]},
+            ],
+        )
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_fan_out_queries_each_store(self, mock_client_manager):
+        """Store마다 동시에 쿼리하고 출처를 Store별로 태그하는지 테스트"""
+        from security_chatbot.rag.query_handler import query_multi_store_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+
+        async def generate(model, contents, config):
+            store = config.tools[0].file_search.file_search_store_names[0]
+            if store == self.POLICIES:
+                return _grounded_response("정책 답변", [("policy.pdf", None)])
+            return _grounded_response("사고 답변", [("policy.pdf", None), ("ir.pdf", None)])
+
+        mock_client.models.generate_content = AsyncMock(side_effect=generate)
+
+        response = query_multi_store_with_rag(
+            "비밀번호 정책 위반 사고?", [self.POLICIES, self.INCIDENTS]
+        )
+
+        self.assertTrue(response["success"])
+        self.assertEqual(mock_client.models.generate_content.await_count, 2)
+        self.assertIn("[policies]", response["content"])
+        self.assertIn("[incidents]", response["content"])
+        self.assertEqual(response["citations"], ["policy.pdf", "ir.pdf"])
+        self.assertEqual(
+            response["tagged_citations"][0]["stores"], [self.POLICIES, self.INCIDENTS]
+        )
+        self.assertEqual(set(response["store_latencies"]), {self.POLICIES, self.INCIDENTS})
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_single_call_uses_all_stores(self, mock_client_manager):
+        """한 번의 호출 모드에서 모든 Store가 File Search 도구에 전달되는지 테스트"""
+        from security_chatbot.rag.query_handler import query_multi_store_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+        mock_client.models.generate_content = AsyncMock(
+            return_value=_grounded_response(
+                "통합 답변",
+                [("policy.pdf", self.POLICIES), ("ir.pdf", self.INCIDENTS)],
+            )
+        )
+
+        response = query_multi_store_with_rag(
+            "질문", [self.POLICIES, self.INCIDENTS], fan_out=False
+        )
+
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        self.assertEqual(
+            config.tools[0].file_search.file_search_store_names,
+            [self.POLICIES, self.INCIDENTS],
+        )
+        self.assertEqual(response["content"], "통합 답변")
+        self.assertEqual(
+            response["tagged_citations"],
+            [
+                {"source": "policy.pdf", "stores": [self.POLICIES]},
+                {"source": "ir.pdf", "stores": [self.INCIDENTS]},
+            ],
+        )
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_sharded_store_searches_all_shards(self, mock_client_manager):
+        """shard로 나뉜 Store는 모든 shard를 한 번에 검색하고 논리 Store 기준으로 캐시하는지 테스트"""
+        from security_chatbot.rag.answer_cache import answer_cache
+        from security_chatbot.rag.query_handler import query_with_rag
+
+        shard = "fileSearchStores/policies-2"
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+        mock_client.models.generate_content = AsyncMock(
+            return_value=_grounded_response("답변", [("policy.pdf", shard)])
+        )
+        shard_names = [self.POLICIES, shard]
+
+        first = query_with_rag("질문", self.POLICIES, shard_names=shard_names)
+        second = query_with_rag("질문", self.POLICIES, shard_names=shard_names)
+        # 다른 shard의 문서 변경은 논리 Store에 기록되어 캐시를 무효화
+        answer_cache.record_corpus_change(self.POLICIES, f"{shard}/documents/new")
+        query_with_rag("질문", self.POLICIES, shard_names=shard_names)
+
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        self.assertEqual(
+            config.tools[0].file_search.file_search_store_names, shard_names
+        )
+        self.assertTrue(first["success"])
+        self.assertTrue(second.get("cached"))
+        self.assertEqual(mock_client.models.generate_content.await_count, 2)
+
+
+class TestQueryWithRagAsync(unittest.IsolatedAsyncioTestCase):
+    """query_with_rag_async 테스트"""
+
+    def setUp(self):
+        from security_chatbot.rag.answer_cache import answer_cache
+
+        answer_cache.clear()
+
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    async def test_query_with_rag_async_concurrent(self, mock_client_manager):
+        """비동기 쿼리 여러 개를 동시에 실행하는 테스트"""
+        import asyncio
+
+        from security_chatbot.rag.query_handler import query_with_rag_async
+
+        mock_aio = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_aio
+        mock_response = MagicMock()
+        mock_response.text = "비동기 응답"
+        mock_response.candidates = []
+        mock_aio.models.generate_content = AsyncMock(return_value=mock_response)
+
+        results = await asyncio.gather(
+            *(query_with_rag_async(f"질문 {i}", "test-store") for i in range(3))
+        )
+
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertEqual(mock_aio.models.generate_content.await_count, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
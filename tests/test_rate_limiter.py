@@ -0,0 +1,199 @@
+"""rate_limiter.py 모듈 테스트
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from security_chatbot.utils.error_handler import RateLimitError
+from security_chatbot.utils.rate_limiter import (
+    RateLimiter,
+    estimate_tokens,
+    parse_duration,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """RateLimiter 클래스 테스트"""
+
+    def test_parse_duration(self):
+        """RetryInfo.retryDelay 문자열 변환 테스트"""
+        self.assertEqual(parse_duration("17s"), 17.0)
+        self.assertEqual(parse_duration("1.5s"), 1.5)
+        self.assertEqual(parse_duration("500ms"), 0.5)
+        self.assertIsNone(parse_duration(None))
+        self.assertIsNone(parse_duration("soon"))
+
+    def test_estimate_tokens(self):
+        """토큰 수 추정 테스트"""
+        self.assertEqual(estimate_tokens(""), 1)
+        self.assertEqual(estimate_tokens("a" * 40), 10)
+
+    def test_admits_within_capacity(self):
+        """한도 안의 요청은 대기 없이 허가되는지 테스트"""
+        limiter = RateLimiter(requests_per_minute=3, tokens_per_minute=0)
+
+        waits = [limiter.acquire() for _ in range(3)]
+
+        self.assertTrue(all(w < 0.05 for w in waits))
+        stats = limiter.get_stats()
+        self.assertEqual(stats["admitted"], 3)
+        self.assertIsNone(stats["available_tokens"])
+
+    def test_rejects_when_wait_exceeds_budget(self):
+        """대기 예산을 넘는 요청은 RateLimitError로 거부되는지 테스트"""
+        limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=0)
+        limiter.acquire()
+
+        with self.assertRaises(RateLimitError) as ctx:
+            limiter.acquire(max_wait=0.1)
+
+        self.assertGreater(ctx.exception.retry_after, 50)
+        self.assertEqual(limiter.get_stats()["rejected"], 1)
+        self.assertEqual(limiter.get_queue_depth(), 0)
+
+    def test_token_limit(self):
+        """TPM 한도를 넘는 토큰 요청이 대기하는지 테스트"""
+        limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=600)
+        limiter.acquire(tokens=600)
+
+        with self.assertRaises(RateLimitError):
+            limiter.acquire(tokens=100, max_wait=1)
+
+    def test_waiting_request_admitted_after_refill(self):
+        """버킷이 보충되면 대기 중인 요청이 허가되는지 테스트"""
+        # 분당 600회 = 0.1초마다 1회 보충
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=0)
+        limiter._requests.tokens = 0
+
+        waited = limiter.acquire(max_wait=1)
+
+        self.assertGreater(waited, 0.05)
+
+    def test_pause_blocks_admission(self):
+        """서버 지시에 따른 일시정지 동안 요청이 허가되지 않는지 테스트"""
+        limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=0)
+        limiter.pause(5)
+
+        with self.assertRaises(RateLimitError) as ctx:
+            limiter.acquire(max_wait=0.1)
+
+        self.assertGreater(ctx.exception.retry_after, 4)
+        self.assertGreater(limiter.get_stats()["paused_for"], 4)
+
+    def test_queue_depth_reported(self):
+        """대기 중인 요청 수가 queue_depth로 보고되는지 테스트"""
+        limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=0)
+        limiter.pause(0.3)
+
+        worker = threading.Thread(target=limiter.acquire, kwargs={"max_wait": 2})
+        worker.start()
+        while limiter.get_queue_depth() == 0:
+            time.sleep(0.01)
+        self.assertEqual(limiter.get_stats()["queue_depth"], 1)
+        worker.join(timeout=2)
+
+        self.assertEqual(limiter.get_queue_depth(), 0)
+        self.assertEqual(limiter.get_stats()["admitted"], 1)
+
+    def test_settle_adjusts_token_bucket(self):
+        """실제 토큰 사용량으로 추정치가 보정되는지 테스트"""
+        limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=1000)
+        limiter.acquire(tokens=100)
+
+        limiter.settle(100, 400)
+
+        self.assertLess(limiter.get_stats()["available_tokens"], 610)
+
+    def test_acquire_async(self):
+        """asyncio 대기자들이 FIFO 순서로 허가되는지 테스트"""
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=0)
+        limiter._requests.tokens = 1
+        order = []
+
+        async def acquire(index):
+            await limiter.acquire_async(max_wait=2)
+            order.append(index)
+
+        async def run():
+            await asyncio.gather(*(acquire(i) for i in range(3)))
+
+        asyncio.run(run())
+
+        self.assertEqual(order, [0, 1, 2])
+        self.assertEqual(limiter.get_queue_depth(), 0)
+
+
+class TestRateLimitedQuery(unittest.TestCase):
+    """query_with_rag의 레이트 리미터 연동 테스트"""
+
+    def setUp(self):
+        from security_chatbot.rag.answer_cache import answer_cache
+
+        answer_cache.clear()
+
+    @patch("security_chatbot.rag.query_handler.rate_limiter")
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_rejected_query_returns_quota_response(
+        self, mock_client_manager, mock_limiter
+    ):
+        """대기 예산 초과 시 quota_exceeded 응답을 반환하고 API를 호출하지 않는지 테스트"""
+        from security_chatbot.rag.query_handler import query_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+        mock_limiter.acquire_async = AsyncMock(
+            side_effect=RateLimitError("한도 초과", retry_after=12)
+        )
+
+        response = query_with_rag(
+            "레이트 리미터 질문", "fileSearchStores/test", auto_retry=False
+        )
+
+        self.assertFalse(response["success"])
+        self.assertEqual(response["error_type"], "quota_exceeded")
+        self.assertEqual(response["retry_delay"], "12s")
+        mock_client.models.generate_content.assert_not_called()
+
+    @patch("security_chatbot.rag.query_handler.rate_limiter")
+    @patch("security_chatbot.rag.query_handler.GeminiClientManager")
+    def test_quota_error_pauses_limiter(self, mock_client_manager, mock_limiter):
+        """429 응답의 retryDelay만큼 레이트 리미터가 일시정지되는지 테스트"""
+        from google.genai import errors
+
+        from security_chatbot.rag.query_handler import query_with_rag
+
+        mock_client = MagicMock()
+        mock_client_manager.get_async_client.return_value = mock_client
+        mock_limiter.acquire_async = AsyncMock()
+        mock_client.models.generate_content = AsyncMock()
+        mock_client.models.generate_content.side_effect = errors.ClientError(
+            429,
+            {
+                "error": {
+                    "code": 429,
+                    "message": "Resource exhausted",
+                    "status": "RESOURCE_EXHAUSTED",
+                    "details": [
+                        {
+                            "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                            "retryDelay": "17s",
+                        }
+                    ],
+                }
+            },
+        )
+
+        response = query_with_rag("429 질문", "fileSearchStores/test", auto_retry=False)
+
+        self.assertEqual(response["error_type"], "quota_exceeded")
+        mock_limiter.pause.assert_called_once_with(17.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,272 @@
+"""resumable_upload.py 모듈 테스트
+
+연결을 전송 도중에 끊는 로컬 대역(stand-in) 업로드 서버를 상대로 검증합니다.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+from google.genai import errors, types
+
+from security_chatbot.rag.resumable_upload import (
+    CHUNK_GRANULARITY,
+    ResumableUploader,
+    UploadCheckpointStore,
+)
+from security_chatbot.utils.deadline import Deadline
+
+logging.disable(logging.CRITICAL)
+
+FILE_SIZE = CHUNK_GRANULARITY * 4 + 1000
+
+
+class _StandInUploadServer(ThreadingHTTPServer):
+    """Files API resumable 업로드 프로토콜을 흉내 내는 로컬 서버
+
+    drop_uploads에 지정한 순번의 청크 요청은 본문 절반만 읽고 응답 없이 연결을 끊습니다.
+    drop_final_response가 True이면 마지막 청크를 모두 받아 업로드를 완료한 뒤
+    응답 없이 연결을 끊습니다.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, drop_uploads: set[int], drop_final_response: bool = False):
+        super().__init__(("127.0.0.1", 0), _StandInHandler)
+        self.drop_uploads = drop_uploads
+        self.drop_final_response = drop_final_response
+        self.final_file = None
+        self.start_status = 200
+        self.received = bytearray()
+        self.starts = 0
+        self.upload_requests = 0
+        self.bytes_sent_by_client = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server: _StandInUploadServer = self.server
+        command = self.headers.get("X-Goog-Upload-Command", "")
+        length = int(self.headers.get("Content-Length", "0"))
+
+        if command == "start":
+            self.rfile.read(length)
+            server.starts += 1
+            if server.start_status != 200:
+                error = {"code": server.start_status, "message": "denied"}
+                self._respond(server.start_status, body={"error": error})
+                return
+            self._respond(200, {"X-Goog-Upload-URL": f"{server.url}/session/1"})
+        elif command == "query" and server.final_file:
+            self._respond(
+                200, {"X-Goog-Upload-Status": "final"}, body={"file": server.final_file}
+            )
+        elif command == "query":
+            self._respond(
+                200,
+                {
+                    "X-Goog-Upload-Status": "active",
+                    "X-Goog-Upload-Size-Received": str(len(server.received)),
+                },
+            )
+        else:
+            server.upload_requests += 1
+            offset = int(self.headers["X-Goog-Upload-Offset"])
+            if offset != len(server.received):
+                self.rfile.read(length)
+                self._respond(400)
+                return
+            if server.upload_requests in server.drop_uploads:
+                # 전송 도중 연결 끊김: 받은 일부는 버리고 응답 없이 종료
+                server.bytes_sent_by_client += len(self.rfile.read(length // 2))
+                self.close_connection = True
+                self.connection.shutdown(2)
+                return
+            chunk = self.rfile.read(length)
+            server.bytes_sent_by_client += len(chunk)
+            server.received.extend(chunk)
+            if "finalize" in command:
+                size = str(len(server.received))
+                server.final_file = {"name": "files/resumed", "sizeBytes": size}
+                if server.drop_final_response:
+                    self.close_connection = True
+                    self.connection.shutdown(2)
+                    return
+                self._respond(200, body={"file": server.final_file})
+            else:
+                self._respond(200, {"X-Goog-Upload-Status": "active"})
+
+    def _respond(self, status, headers=None, body=None):
+        payload = json.dumps(body or {}).encode()
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class TestResumableUploader(unittest.TestCase):
+    """ResumableUploader 테스트"""
+
+    def setUp(self):
+        self.content = os.urandom(FILE_SIZE)
+        self.validation = {
+            "file_name": "large.pdf",
+            "file_size": FILE_SIZE,
+            "mime_type": "application/pdf",
+            "sha256": hashlib.sha256(self.content).hexdigest(),
+        }
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.checkpoint_dir, True)
+        sleep_patcher = patch("security_chatbot.rag.resumable_upload.time.sleep")
+        sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def _start_server(
+        self, drop_uploads: set[int], drop_final_response: bool = False
+    ) -> _StandInUploadServer:
+        server = _StandInUploadServer(drop_uploads, drop_final_response)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def _uploader(self, server: _StandInUploadServer, **kwargs) -> ResumableUploader:
+        return ResumableUploader(
+            api_key="test-key",
+            endpoint=f"{server.url}/upload/v1beta/files",
+            chunk_size=CHUNK_GRANULARITY,
+            checkpoints=UploadCheckpointStore(self.checkpoint_dir),
+            **kwargs,
+        )
+
+    def test_resumes_after_dropped_connections(self):
+        """연결이 끊긴 청크만 다시 보내고 전체를 처음부터 재전송하지 않는지 테스트"""
+        server = self._start_server(drop_uploads={2, 5})
+
+        result = self._uploader(server).upload(
+            io.BytesIO(self.content), self.validation, "large.pdf", Deadline(30)
+        )
+
+        self.assertEqual(result.name, "files/resumed")
+        self.assertEqual(bytes(server.received), self.content)
+        self.assertEqual(server.starts, 1)
+        # 끊긴 청크 2개의 절반만 추가로 전송됨
+        self.assertEqual(server.bytes_sent_by_client, FILE_SIZE + CHUNK_GRANULARITY)
+        self.assertEqual(os.listdir(self.checkpoint_dir), [])
+
+    def test_resumes_from_checkpoint_after_restart(self):
+        """업로더가 포기한 뒤 새 인스턴스(프로세스 재시작)가 체크포인트에서 이어서 보내는지 테스트"""
+        server = self._start_server(drop_uploads={3})
+
+        with self.assertRaises(errors.ServerError):
+            self._uploader(server, max_attempts=1).upload(
+                io.BytesIO(self.content), self.validation, "large.pdf", Deadline(30)
+            )
+        checkpoint = UploadCheckpointStore(self.checkpoint_dir).load(
+            self.validation["sha256"]
+        )
+        self.assertEqual(checkpoint["offset"], 2 * CHUNK_GRANULARITY)
+
+        result = self._uploader(server).upload(
+            io.BytesIO(self.content), self.validation, "large.pdf", Deadline(30)
+        )
+
+        self.assertEqual(result.name, "files/resumed")
+        self.assertEqual(bytes(server.received), self.content)
+        self.assertEqual(server.starts, 1)
+        self.assertIsNone(
+            UploadCheckpointStore(self.checkpoint_dir).load(self.validation["sha256"])
+        )
+
+    def test_lost_final_response_returns_uploaded_file(self):
+        """마지막 청크의 응답만 잃은 경우 다시 보내지 않고 완료된 File을 받는지 테스트"""
+        server = self._start_server(drop_uploads=set(), drop_final_response=True)
+
+        result = self._uploader(server).upload(
+            io.BytesIO(self.content), self.validation, "large.pdf", Deadline(30)
+        )
+
+        self.assertEqual(result.name, "files/resumed")
+        self.assertEqual(server.starts, 1)
+        self.assertEqual(server.bytes_sent_by_client, FILE_SIZE)
+        self.assertEqual(os.listdir(self.checkpoint_dir), [])
+
+    def test_checkpoint_of_finished_upload_returns_uploaded_file(self):
+        """이전 실행이 완료한 업로드의 체크포인트로 재시작하면 새로 보내지 않는지 테스트"""
+        server = self._start_server(drop_uploads=set())
+        server.final_file = {"name": "files/resumed", "sizeBytes": str(FILE_SIZE)}
+        UploadCheckpointStore(self.checkpoint_dir).save(
+            self.validation["sha256"],
+            {
+                "upload_url": f"{server.url}/session/1",
+                "offset": FILE_SIZE - 1000,
+                "file_size": FILE_SIZE,
+            },
+        )
+
+        result = self._uploader(server).upload(
+            io.BytesIO(self.content), self.validation, "large.pdf", Deadline(30)
+        )
+
+        self.assertEqual(result.name, "files/resumed")
+        self.assertEqual((server.starts, server.upload_requests), (0, 0))
+
+    def test_non_retryable_http_error_raises_sdk_error(self):
+        """재개할 수 없는 HTTP 오류가 SDK와 같은 genai 예외로 전달되는지 테스트"""
+        server = self._start_server(drop_uploads=set())
+        server.start_status = 403
+
+        with self.assertRaises(errors.ClientError) as raised:
+            self._uploader(server).upload(
+                io.BytesIO(self.content), self.validation, "large.pdf", Deadline(30)
+            )
+
+        self.assertEqual(raised.exception.code, 403)
+
+
+class TestDocumentManagerResumableUpload(unittest.TestCase):
+    """DocumentManager의 대용량 파일 청크 업로드 연동 테스트"""
+
+    @patch("security_chatbot.rag.document_manager.RESUMABLE_UPLOAD_THRESHOLD_BYTES", 10)
+    def test_large_file_uses_resumable_uploader(self):
+        import asyncio
+
+        from security_chatbot.rag.document_manager import DocumentManager
+
+        client = MagicMock()
+        manager = DocumentManager(store_name="fileSearchStores/test", client=client)
+        # 동기 래퍼에서 교체한 업로더를 비동기 엔진이 사용
+        manager.resumable_uploader = MagicMock()
+        manager.resumable_uploader.upload.return_value = types.File(name="files/big")
+        validation = {"file_size": 11, "mime_type": "text/plain", "sha256": "a" * 64}
+
+        uploaded = asyncio.run(
+            manager.engine._upload_stage(
+                "big.txt", validation, "big.txt", Deadline(30)
+            )
+        )
+
+        self.assertEqual(uploaded.name, "files/big")
+        client.aio.files.upload.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""single_flight.py 모듈 테스트
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from security_chatbot.utils.single_flight import SingleFlight
+
+logging.disable(logging.CRITICAL)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """SingleFlight 클래스 테스트"""
+
+    def setUp(self):
+        self.flight = SingleFlight()
+
+    def test_concurrent_calls_share_one_execution(self):
+        """동시에 들어온 같은 키의 호출이 한 번만 실행되는지 테스트"""
+        executions = []
+        release = threading.Event()
+
+        def slow_func():
+            executions.append(1)
+            release.wait(timeout=5)
+            return {"content": "공유 결과"}
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(self.flight.do, "key", slow_func) for _ in range(5)]
+            # 모든 호출자가 합류할 때까지 대기
+            while self.flight.get_stats()["total"] < 5:
+                time.sleep(0.01)
+            release.set()
+            results = [f.result() for f in futures]
+
+        self.assertEqual(len(executions), 1)
+        self.assertTrue(all(r == {"content": "공유 결과"} for r in results))
+        stats = self.flight.get_stats()
+        self.assertEqual(stats["executions"], 1)
+        self.assertEqual(stats["collapsed"], 4)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_error_propagates_to_waiters(self):
+        """leader의 예외가 대기자에게도 전달되는지 테스트"""
+        call, is_leader = self.flight.begin("key")
+        follower_call, follower_is_leader = self.flight.begin("key")
+        self.assertTrue(is_leader)
+        self.assertFalse(follower_is_leader)
+
+        self.flight.finish("key", call, error=RuntimeError("실패"))
+
+        with self.assertRaises(RuntimeError):
+            follower_call.wait()
+
+    def test_control_flow_exception_not_raised_in_waiters(self):
+        """leader의 KeyboardInterrupt 등은 대기자에게 RuntimeError로 전달되는지 테스트"""
+        call, _ = self.flight.begin("key")
+        follower_call, _ = self.flight.begin("key")
+
+        self.flight.finish("key", call, error=KeyboardInterrupt())
+
+        with self.assertRaises(RuntimeError):
+            follower_call.wait()
+
+    def test_sequential_calls_not_coalesced(self):
+        """실행이 끝난 뒤의 호출은 새로 실행되는지 테스트"""
+        self.flight.do("key", lambda: 1)
+        self.flight.do("key", lambda: 2)
+
+        self.assertEqual(self.flight.get_stats()["executions"], 2)
+
+    def test_do_async_coalesces(self):
+        """asyncio 동시 호출이 하나의 실행으로 합쳐지는지 테스트"""
+        executions = []
+
+        async def slow_coro():
+            executions.append(1)
+            await asyncio.sleep(0.05)
+            return "결과"
+
+        async def run():
+            return await asyncio.gather(
+                *(self.flight.do_async("key", slow_coro) for _ in range(3))
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, ["결과"] * 3)
+        self.assertEqual(len(executions), 1)
+        self.assertEqual(self.flight.get_stats()["collapsed"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,29 +5,40 @@ import logging
 import unittest
 from unittest.mock import MagicMock, patch
 
-from google import genai
 from google.api_core.exceptions import (
     AlreadyExists,
     InvalidArgument,
     NotFound,
     PermissionDenied,
 )
-from google.genai import types
+from google.genai import errors, types
 
 # 테스트 대상 모듈 임포트
-from security_chatbot.rag.store_manager import FileSearchStoreManager
+from security_chatbot.rag.store_manager import (
+    AsyncFileSearchStoreManager,
+    FileSearchStoreManager,
+    store_cache,
+)
+from tests.sdk_doubles import autospec_client
 
 # 로깅 레벨 설정 (테스트 시 불필요한 로그 출력 방지)
 logging.disable(logging.CRITICAL)
 
 
+def _pager(items, next_page_token=None):
+    """한 페이지를 가진 SDK Pager 대역을 만듭니다."""
+    return MagicMock(
+        page=items, config={"page_token": next_page_token} if next_page_token else {}
+    )
+
+
 class TestFileSearchStoreManager(unittest.TestCase):
 
     def setUp(self):
         """각 테스트 실행 전 Mock 클라이언트 설정"""
-        self.mock_client = MagicMock(spec=genai.Client)
-        self.mock_file_search_stores = MagicMock()
-        self.mock_client.file_search_stores = self.mock_file_search_stores
+        self.mock_client = autospec_client()
+        # 동기 매니저도 비동기 클라이언트(client.aio)로 호출함
+        self.mock_file_search_stores = self.mock_client.aio.file_search_stores
 
         # GeminiClientManager.get_client가 mock_client를 반환하도록 패치
         patcher = patch(
@@ -37,6 +48,8 @@ class TestFileSearchStoreManager(unittest.TestCase):
         self.addCleanup(patcher.stop)
         patcher.start()
 
+        store_cache.clear()
+        self.addCleanup(store_cache.clear)
         self.manager = FileSearchStoreManager()
 
     def test_create_store_success(self):
@@ -119,7 +132,7 @@ class TestFileSearchStoreManager(unittest.TestCase):
 
     def test_list_stores_success_empty(self):
         """스토어 목록 조회 성공 (빈 목록) 테스트"""
-        self.mock_file_search_stores.list.return_value = iter([])
+        self.mock_file_search_stores.list.return_value = _pager([])
 
         stores = self.manager.list_stores()
 
@@ -135,7 +148,7 @@ class TestFileSearchStoreManager(unittest.TestCase):
         mock_store_2 = types.FileSearchStore(
             name="fileSearchStores/s2", display_name="Store 2"
         )
-        self.mock_file_search_stores.list.return_value = iter(
+        self.mock_file_search_stores.list.return_value = _pager(
             [mock_store_1, mock_store_2]
         )
 
@@ -159,6 +172,75 @@ class TestFileSearchStoreManager(unittest.TestCase):
         self.assertEqual(len(stores), 0)
         self.mock_file_search_stores.list.assert_called_once()
 
+    def test_get_store_uses_cache_until_deleted(self):
+        """조회한 Store는 캐시에서 반환하고, 삭제하면 다시 조회하는지 테스트"""
+        store_name = "fileSearchStores/test-store-123"
+        self.mock_file_search_stores.get.return_value = types.FileSearchStore(
+            name=store_name, display_name="My Test Store"
+        )
+
+        self.manager.get_store(store_name)
+        cached = FileSearchStoreManager().get_store(store_name)
+        self.manager.delete_store(store_name)
+        self.manager.get_store(store_name)
+
+        self.assertEqual(cached.display_name, "My Test Store")
+        self.assertEqual(self.mock_file_search_stores.get.call_count, 2)
+
+    def test_list_stores_cached_and_invalidated_by_create(self):
+        """목록을 캐시하고, 목록의 Store 조회에도 사용하며, 생성하면 무효화하는지 테스트"""
+        store_1 = types.FileSearchStore(name="fileSearchStores/s1")
+        store_2 = types.FileSearchStore(name="fileSearchStores/s2")
+        self.mock_file_search_stores.list.side_effect = [
+            _pager([store_1]),
+            _pager([store_1, store_2]),
+        ]
+        self.mock_file_search_stores.create.return_value = store_2
+
+        self.manager.list_stores()
+        self.manager.list_stores()
+        self.manager.get_store("fileSearchStores/s1")
+        self.manager.create_store("Store 2")
+        stores = self.manager.list_stores()
+
+        self.assertEqual(
+            [store.name for store in stores],
+            ["fileSearchStores/s1", "fileSearchStores/s2"],
+        )
+        self.assertEqual(self.mock_file_search_stores.list.call_count, 2)
+        self.mock_file_search_stores.get.assert_not_called()
+
+    def test_cache_disabled_with_zero_ttl(self):
+        """TTL이 0이면 매번 API를 호출하는지 테스트"""
+        self.mock_file_search_stores.get.return_value = types.FileSearchStore(
+            name="fileSearchStores/s1"
+        )
+
+        with patch.object(store_cache, "ttl_seconds", 0):
+            self.manager.get_store("fileSearchStores/s1")
+            self.manager.get_store("fileSearchStores/s1")
+
+        self.assertEqual(self.mock_file_search_stores.get.call_count, 2)
+
+    def test_iter_stores_fetches_pages_on_demand(self):
+        """다음 페이지는 앞 페이지를 다 소비했을 때만 요청하는지 테스트"""
+        self.mock_file_search_stores.list.side_effect = [
+            _pager([types.FileSearchStore(name="fileSearchStores/s1")], "token-2"),
+            _pager([types.FileSearchStore(name="fileSearchStores/s2")]),
+        ]
+
+        iterator = self.manager.iter_stores(page_size=1)
+        first = next(iterator)
+
+        self.assertEqual(first.name, "fileSearchStores/s1")
+        self.mock_file_search_stores.list.assert_called_once_with(
+            config={"page_size": 1}
+        )
+        self.assertEqual([store.name for store in iterator], ["fileSearchStores/s2"])
+        self.mock_file_search_stores.list.assert_called_with(
+            config={"page_size": 1, "page_token": "token-2"}
+        )
+
     def test_delete_store_success(self):
         """스토어 삭제 성공 테스트"""
         mock_store_name = "fileSearchStores/test-store-to-delete"
@@ -199,6 +281,138 @@ class TestFileSearchStoreManager(unittest.TestCase):
         self.assertFalse(result)
         self.mock_file_search_stores.delete.assert_called_once()
 
+    def test_iter_document_pages_follows_page_tokens(self):
+        """다음 페이지 토큰을 따라 페이지를 하나씩 요청하는지 테스트"""
+        store_name = "fileSearchStores/test-store-123"
+        pages = [
+            ([types.Document(name=f"{store_name}/documents/a")], "token-2"),
+            ([types.Document(name=f"{store_name}/documents/b")], None),
+        ]
+        self.mock_file_search_stores.documents.list.side_effect = [
+            _pager(docs, token) for docs, token in pages
+        ]
+
+        iterator = self.manager.iter_document_pages(store_name, page_size=1)
+        first = next(iterator)
+
+        # 첫 페이지를 처리하는 동안에는 다음 페이지를 요청하지 않음
+        self.mock_file_search_stores.documents.list.assert_called_once_with(
+            parent=store_name, config={"page_size": 1}
+        )
+        self.assertEqual(first[0].name, f"{store_name}/documents/a")
+        self.assertEqual(
+            [[doc.name for doc in page] for page in iterator],
+            [[f"{store_name}/documents/b"]],
+        )
+        self.mock_file_search_stores.documents.list.assert_called_with(
+            parent=store_name, config={"page_size": 1, "page_token": "token-2"}
+        )
+
+    def test_iter_document_pages_raises_on_error(self):
+        """목록 조회 실패를 빈 결과로 숨기지 않고 전달하는지 테스트"""
+        self.mock_file_search_stores.documents.list.side_effect = PermissionDenied(
+            "Cannot list documents."
+        )
+
+        with self.assertRaises(PermissionDenied):
+            list(self.manager.iter_document_pages("fileSearchStores/test-store-123"))
+
+
+class TestAsyncFileSearchStoreManager(unittest.IsolatedAsyncioTestCase):
+    """비동기 클라이언트(client.aio)로 호출하는 AsyncFileSearchStoreManager 테스트"""
+
+    def setUp(self):
+        self.mock_client = autospec_client()
+        self.mock_stores = self.mock_client.aio.file_search_stores
+        self.manager = AsyncFileSearchStoreManager(client=self.mock_client)
+        store_cache.clear()
+        self.addCleanup(store_cache.clear)
+
+    async def test_create_store_success(self):
+        """비동기 스토어 생성 성공 테스트"""
+        self.mock_stores.create.return_value = types.FileSearchStore(
+            name="fileSearchStores/s1", display_name="Store 1"
+        )
+
+        store = await self.manager.create_store(display_name="Store 1")
+
+        self.assertEqual(store.name, "fileSearchStores/s1")
+        # 생성한 Store는 캐시되므로 다시 조회하지 않음
+        self.assertIs(await self.manager.get_store("fileSearchStores/s1"), store)
+        self.mock_stores.create.assert_awaited_once_with(
+            config={"display_name": "Store 1"}
+        )
+        self.mock_stores.get.assert_not_called()
+        self.mock_client.file_search_stores.create.assert_not_called()
+
+    async def test_delete_store_not_found(self):
+        """비동기 스토어 삭제 시 찾을 수 없는 경우 테스트"""
+        self.mock_stores.delete.side_effect = NotFound("Store not found.")
+
+        result = await self.manager.delete_store("fileSearchStores/missing")
+
+        self.assertFalse(result)
+
+    async def test_iter_documents_fetches_pages_on_demand(self):
+        """문서를 하나씩 내주며 앞 페이지를 다 소비했을 때만 다음 페이지를 요청하는지 테스트"""
+        store_name = "fileSearchStores/test-store-123"
+        self.mock_stores.documents.list.side_effect = [
+            _pager([types.Document(name=f"{store_name}/documents/a")], "token-2"),
+            _pager([types.Document(name=f"{store_name}/documents/b")]),
+        ]
+
+        iterator = self.manager.iter_documents(store_name, page_size=1)
+        first = await anext(iterator)
+
+        self.assertEqual(first.name, f"{store_name}/documents/a")
+        self.mock_stores.documents.list.assert_awaited_once()
+        self.assertEqual(
+            [document.name async for document in iterator],
+            [f"{store_name}/documents/b"],
+        )
+        self.assertEqual(self.mock_stores.documents.list.await_count, 2)
+
+
+@patch("security_chatbot.rag.store_manager.upload_manifest", MagicMock())
+class TestDeleteCorpusFile(unittest.IsolatedAsyncioTestCase):
+    """실제 SDK 시그니처로 코퍼스 파일(문서) 삭제를 테스트"""
+
+    document_name = "fileSearchStores/test-store-123/documents/doc-1"
+
+    def setUp(self):
+        self.client = autospec_client()
+        store_cache.clear()
+        self.addCleanup(store_cache.clear)
+
+    def test_deletes_document_with_chunks(self):
+        """documents.delete를 문서 리소스 이름과 force 설정으로 호출하는지 테스트"""
+        manager = FileSearchStoreManager(client=self.client)
+
+        self.assertTrue(manager.delete_corpus_file(self.document_name))
+
+        self.client.aio.file_search_stores.documents.delete.assert_awaited_once_with(
+            name=self.document_name, config={"force": True}
+        )
+
+    def test_missing_document(self):
+        """SDK의 404 오류를 삭제 실패로 처리하는지 테스트"""
+        self.client.aio.file_search_stores.documents.delete.side_effect = (
+            errors.ClientError(404, {"error": {"message": "not found"}})
+        )
+        manager = FileSearchStoreManager(client=self.client)
+
+        self.assertFalse(manager.delete_corpus_file(self.document_name))
+
+    async def test_async_deletes_document_with_chunks(self):
+        """비동기 버전이 client.aio의 documents.delete로 삭제하는지 테스트"""
+        manager = AsyncFileSearchStoreManager(client=self.client)
+
+        self.assertTrue(await manager.delete_corpus_file(self.document_name))
+
+        self.client.aio.file_search_stores.documents.delete.assert_awaited_once_with(
+            name=self.document_name, config={"force": True}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
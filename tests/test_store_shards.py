@@ -0,0 +1,143 @@
+"""store_shards.py 모듈 테스트
+"""
+
+import logging
+import unittest
+from unittest.mock import MagicMock, patch
+
+from google.genai import types
+
+from security_chatbot.rag.document_catalog import DocumentCatalog
+from security_chatbot.rag.store_manager import FileSearchStoreManager, store_cache
+from security_chatbot.rag.store_shards import ShardedStore
+from tests.sdk_doubles import autospec_client
+
+logging.disable(logging.CRITICAL)
+
+STORE = "fileSearchStores/security-docs"
+SHARD = "fileSearchStores/security-docs-2"
+
+
+def _store(name, size_bytes=0, documents=0):
+    return types.FileSearchStore(
+        name=name, size_bytes=size_bytes, active_documents_count=documents
+    )
+
+
+class TestShardedStore(unittest.TestCase):
+    """ShardedStore 클래스 테스트"""
+
+    def setUp(self):
+        self.catalog = DocumentCatalog(db_path=":memory:")
+        self.addCleanup(self.catalog.close)
+        self.store_manager = MagicMock()
+        self.stores = {STORE: _store(STORE)}
+        self.store_manager.get_store.side_effect = self.stores.get
+        self.store_manager.create_store.return_value = _store(SHARD)
+
+        patcher = patch("security_chatbot.rag.store_shards.answer_cache")
+        self.addCleanup(patcher.stop)
+        self.mock_answer_cache = patcher.start()
+
+    def _sharded(self, max_bytes=1000, max_documents=0):
+        return ShardedStore(
+            STORE,
+            self.catalog,
+            display_name="Security Docs",
+            store_manager=self.store_manager,
+            max_bytes=max_bytes,
+            max_documents=max_documents,
+        )
+
+    def test_uses_current_shard_until_full(self):
+        """기준을 넘기 전에는 현재 shard를, 넘으면 새 shard를 만들어 사용하는지 테스트"""
+        sharded = self._sharded()
+        self.stores[STORE] = _store(STORE, size_bytes=600)
+
+        self.assertEqual(sharded.select_shard(400), STORE)
+        self.store_manager.create_store.assert_not_called()
+
+        self.assertEqual(sharded.select_shard(401), SHARD)
+        self.store_manager.create_store.assert_called_once_with(
+            display_name="Security Docs (shard 2)"
+        )
+        self.assertEqual(sharded.shard_names, [STORE, SHARD])
+
+        # 새 shard가 비어 있으면 이후 업로드도 새 shard로
+        self.stores[SHARD] = _store(SHARD)
+        self.assertEqual(self._sharded().select_shard(5000), SHARD)
+        self.assertEqual(self.store_manager.create_store.call_count, 1)
+
+    def test_document_count_threshold(self):
+        self.stores[STORE] = _store(STORE, documents=3)
+
+        self.assertEqual(self._sharded(max_documents=4).select_shard(), STORE)
+        self.assertEqual(self._sharded(max_documents=3).select_shard(), SHARD)
+
+    def test_empty_shard_accepts_oversized_document_and_disabled_limits(self):
+        """빈 shard는 큰 문서도 받아들이고, 기준이 모두 0이면 Store를 조회하지 않는지 테스트"""
+        self.assertEqual(self._sharded().select_shard(5000), STORE)
+
+        self.stores[STORE] = _store(STORE, size_bytes=10**9)
+        self.store_manager.get_store.reset_mock()
+        self.assertEqual(self._sharded(max_bytes=0).select_shard(10**9), STORE)
+        self.store_manager.get_store.assert_not_called()
+
+    def test_keeps_full_shard_when_creation_fails(self):
+        self.stores[STORE] = _store(STORE, size_bytes=1000)
+        self.store_manager.create_store.return_value = None
+
+        self.assertEqual(self._sharded().select_shard(1), STORE)
+        self.assertEqual(self.catalog.list_shards(STORE), [STORE])
+
+    def test_delete_routes_to_owning_shard(self):
+        """코퍼스 파일은 속한 shard에서 삭제하고, 다른 shard의 변경을 논리 Store에 기록하는지 테스트"""
+        self.catalog.add_shard(STORE, SHARD)
+        sharded = self._sharded()
+
+        self.assertTrue(sharded.delete_corpus_file(f"{SHARD}/documents/a"))
+        self.assertTrue(sharded.delete_corpus_file(f"{STORE}/documents/b"))
+        self.assertFalse(
+            sharded.delete_corpus_file("fileSearchStores/unrelated/documents/c")
+        )
+
+        self.assertEqual(self.store_manager.delete_corpus_file.call_count, 2)
+        self.mock_answer_cache.record_corpus_change.assert_called_once_with(
+            STORE, f"{SHARD}/documents/a"
+        )
+
+    @patch("security_chatbot.rag.store_manager.upload_manifest", MagicMock())
+    @patch("security_chatbot.rag.store_manager.answer_cache", MagicMock())
+    def test_delete_routes_through_sdk_documents_delete(self):
+        """실제 SDK 시그니처로 shard의 문서 삭제가 documents.delete로 가는지 테스트"""
+        self.catalog.add_shard(STORE, SHARD)
+        client = autospec_client()
+        self.addCleanup(store_cache.clear)
+        sharded = ShardedStore(
+            STORE,
+            self.catalog,
+            store_manager=FileSearchStoreManager(client=client),
+        )
+
+        self.assertTrue(sharded.delete_corpus_file(f"{SHARD}/documents/a"))
+        self.assertFalse(
+            sharded.delete_corpus_file("fileSearchStores/unrelated/documents/c")
+        )
+
+        client.aio.file_search_stores.documents.delete.assert_awaited_once_with(
+            name=f"{SHARD}/documents/a", config={"force": True}
+        )
+
+    def test_delete_all_deletes_every_shard(self):
+        self.catalog.add_shard(STORE, SHARD)
+        self.store_manager.delete_store.side_effect = [True, False]
+
+        self.assertFalse(self._sharded().delete_all())
+        self.assertEqual(
+            [call.args[0] for call in self.store_manager.delete_store.call_args_list],
+            [STORE, SHARD],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""text_extraction.py 모듈 테스트
+"""
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from security_chatbot.rag import text_extraction
+from security_chatbot.rag.text_extraction import (
+    TextExtractor,
+    extract_text,
+    normalize_text,
+)
+
+logging.disable(logging.CRITICAL)
+
+HWPX_SECTION = """<?xml version="1.0" encoding="UTF-8"?>
+<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"
+        xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">
+  <hp:p><hp:run><hp:t>{first}</hp:t></hp:run></hp:p>
+  <hp:p><hp:run><hp:t>{second}</hp:t></hp:run></hp:p>
+</hs:sec>
+"""
+
+
+def _hwpx(sections: list[tuple[str, str]]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("mimetype", "application/hwp+zip")
+        # 섹션 번호 순서대로 읽는지 확인하기 위해 거꾸로 기록
+        for index in reversed(range(len(sections))):
+            first, second = sections[index]
+            archive.writestr(
+                f"Contents/section{index}.xml",
+                HWPX_SECTION.format(first=first, second=second),
+            )
+    return buffer.getvalue()
+
+
+class TestTextExtraction(unittest.TestCase):
+    """텍스트 추출 함수 테스트"""
+
+    def test_normalize_text(self):
+        text = "\ufeff제1조\t\t목적 \r\n\x00\r\n\r\n\r\n  보안\u3000정책  \n"
+
+        self.assertEqual(normalize_text(text), "제1조 목적\n\n보안 정책")
+
+    def test_extract_hwpx_sections_in_order(self):
+        data = _hwpx([("제1조 목적", "본 규정은"), ("제2조 정의", "용어의 뜻은")])
+
+        self.assertEqual(
+            extract_text(data, "policy.hwpx"),
+            "제1조 목적\n본 규정은\n제2조 정의\n용어의 뜻은",
+        )
+
+    def test_extract_plain_text_falls_back_to_cp949(self):
+        self.assertEqual(extract_text("보안 정책".encode("cp949"), "a.txt"), "보안 정책")
+
+    def test_unsupported_format_returns_none(self):
+        self.assertIsNone(extract_text(b"HWP Document File", "report.hwp"))
+
+    def test_pdf_without_pypdf_returns_none(self):
+        original = text_extraction.PdfReader
+        text_extraction.PdfReader = None
+        self.addCleanup(setattr, text_extraction, "PdfReader", original)
+
+        self.assertIsNone(extract_text(b"%PDF-1.7", "scan.pdf"))
+
+
+class TestTextExtractor(unittest.TestCase):
+    """TextExtractor 클래스 테스트"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, True)
+
+    def test_extracts_paths_in_process_pool(self):
+        """프로세스 풀에서 파일 경로의 텍스트를 추출하는지 테스트"""
+        extractor = TextExtractor(max_workers=2)
+        self.addCleanup(extractor.shutdown)
+        paths = []
+        for index in range(3):
+            path = os.path.join(self.test_dir, f"doc{index}.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"# 문서   {index}\n\n\n\n본문")
+            paths.append(path)
+
+        texts = [extractor.extract(path, os.path.basename(path)) for path in paths]
+
+        self.assertEqual(texts, [f"# 문서 {index}\n\n본문" for index in range(3)])
+        # 멀티스레드 프로세스를 fork하지 않도록 spawn으로 시작
+        self.assertEqual(extractor._get_pool()._mp_context.get_start_method(), "spawn")
+
+    def test_stream_is_rewound_and_errors_return_none(self):
+        """스트림은 읽은 뒤 처음으로 되돌리고, 깨진 문서는 None을 반환하는지 테스트"""
+        extractor = TextExtractor(max_workers=0)
+        stream = io.BytesIO(b"not a zip archive")
+
+        self.assertIsNone(extractor.extract(stream, "broken.hwpx"))
+        self.assertEqual(stream.tell(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""upload_manifest.py 모듈 테스트
+"""
+
+import logging
+import os
+import tempfile
+import unittest
+
+from security_chatbot.rag.upload_manifest import UploadManifest
+
+logging.disable(logging.CRITICAL)
+
+STORE = "fileSearchStores/test-store-123"
+SHA = "a" * 64
+CORPUS_FILE = f"{STORE}/corpusFiles/c1"
+
+
+class TestUploadManifest(unittest.TestCase):
+    """UploadManifest 클래스 테스트"""
+
+    def setUp(self):
+        self.manifest = UploadManifest()
+
+    def test_lookup_is_scoped_to_store(self):
+        """같은 해시라도 다른 Store에서는 조회되지 않는지 테스트"""
+        self.manifest.record(STORE, SHA, CORPUS_FILE, "policy.pdf", 1024)
+
+        entry = self.manifest.lookup(STORE, SHA)
+
+        self.assertEqual(entry["corpus_file_name"], CORPUS_FILE)
+        self.assertEqual(entry["file_name"], "policy.pdf")
+        self.assertIsNone(self.manifest.lookup("fileSearchStores/other", SHA))
+
+    def test_forget_corpus_file_and_store(self):
+        """문서/Store 삭제 시 해당 항목이 제거되는지 테스트"""
+        self.manifest.record(STORE, SHA, CORPUS_FILE, "policy.pdf", 1024)
+        self.manifest.record(STORE, "b" * 64, f"{STORE}/corpusFiles/c2", "b.pdf", 10)
+
+        self.manifest.forget_corpus_file(CORPUS_FILE)
+        self.assertIsNone(self.manifest.lookup(STORE, SHA))
+        self.assertIsNotNone(self.manifest.lookup(STORE, "b" * 64))
+
+        self.manifest.forget_store(STORE)
+        self.assertEqual(self.manifest.get_stats()["entries"], 0)
+
+    def test_dedupe_stats(self):
+        """절약한 업로드 바이트와 API 호출 수 통계 테스트"""
+        self.manifest.record_duplicate(1024)
+        self.manifest.record_duplicate(2048)
+
+        stats = self.manifest.get_stats()
+
+        self.assertEqual(stats["duplicates_skipped"], 2)
+        self.assertEqual(stats["bytes_saved"], 3072)
+        self.assertEqual(stats["api_calls_saved"], 4)
+
+    def test_sqlite_persistence(self):
+        """SQLite 영속화 저장소를 통해 프로세스 재시작 후에도 매니페스트가 유지되는지 테스트"""
+        db_path = os.path.join(tempfile.mkdtemp(), "manifest.db")
+
+        first = UploadManifest(db_path=db_path)
+        first.record(STORE, SHA, CORPUS_FILE, "policy.pdf", 1024)
+
+        second = UploadManifest(db_path=db_path)
+
+        self.assertEqual(second.lookup(STORE, SHA)["corpus_file_name"], CORPUS_FILE)
+
+    def test_sqlite_lookup_sees_other_instance_changes(self):
+        """다른 프로세스(인스턴스)가 나중에 기록하거나 제거한 항목이 바로 조회에 반영되는지 테스트"""
+        db_path = os.path.join(tempfile.mkdtemp(), "manifest.db")
+        app = UploadManifest(db_path=db_path)
+        worker = UploadManifest(db_path=db_path)
+        self.assertIsNone(app.lookup(STORE, SHA))
+
+        worker.record(STORE, SHA, CORPUS_FILE, "policy.pdf", 1024)
+        self.assertEqual(app.lookup(STORE, SHA)["corpus_file_name"], CORPUS_FILE)
+        self.assertEqual(app.get_stats()["entries"], 1)
+
+        worker.forget_corpus_file(CORPUS_FILE)
+        self.assertIsNone(app.lookup(STORE, SHA))
+
+    def test_rename_corpus_file(self):
+        """import Operation 이름으로 기록한 항목을 문서 이름으로 바꾸는지 테스트"""
+        db_path = os.path.join(tempfile.mkdtemp(), "manifest.db")
+        manifest = UploadManifest(db_path=db_path)
+        operation = f"{STORE}/operations/op-1"
+        manifest.record(STORE, SHA, operation, "policy.pdf", 1024)
+
+        manifest.rename_corpus_file(operation, CORPUS_FILE)
+
+        self.assertEqual(manifest.lookup(STORE, SHA)["corpus_file_name"], CORPUS_FILE)
+        reopened = UploadManifest(db_path=db_path)
+        self.assertEqual(reopened.lookup(STORE, SHA)["corpus_file_name"], CORPUS_FILE)
+
+
+if __name__ == "__main__":
+    unittest.main()